@@ -65,6 +65,7 @@ export * from './result-error';
 export * from './run';
 export * from './run-artifact';
 export * from './run-list';
+export * from './run-memo-stats';
 export * from './run-metrics-event';
 export * from './run-node-status';
 export * from './run-ref';
@@ -21,6 +21,9 @@ import type { ResultError } from './result-error';
 import type { RunArtifact } from './run-artifact';
 // May contain unused imports in some cases
 // @ts-ignore
+import type { RunMemoStats } from './run-memo-stats';
+// May contain unused imports in some cases
+// @ts-ignore
 import type { RunNodeStatus } from './run-node-status';
 // May contain unused imports in some cases
 // @ts-ignore
@@ -36,6 +39,7 @@ export interface Run {
     'error'?: ResultError;
     'artifacts'?: Array<RunArtifact>;
     'nodes'?: Array<RunNodeStatus>;
+    'memo'?: RunMemoStats | null;
 }
 
 
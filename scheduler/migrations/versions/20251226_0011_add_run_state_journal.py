@@ -0,0 +1,38 @@
+"""Add run-state journal table for scheduler crash recovery."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20251226_0011"
+down_revision = "a8aeb8475e38"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "run_state_journal",
+        sa.Column(
+            "id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            primary_key=True,
+            autoincrement=True,
+        ),
+        sa.Column("run_id", sa.String(length=64), nullable=False),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_run_state_journal_run_id_id",
+        "run_state_journal",
+        ["run_id", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_run_state_journal_run_id_id", table_name="run_state_journal")
+    op.drop_table("run_state_journal")
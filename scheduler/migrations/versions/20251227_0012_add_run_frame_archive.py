@@ -0,0 +1,39 @@
+"""Add archive table for folded container frame iterations."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20251227_0012"
+down_revision = "20251226_0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "run_frame_archive",
+        sa.Column(
+            "id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            primary_key=True,
+            autoincrement=True,
+        ),
+        sa.Column("run_id", sa.String(length=64), nullable=False),
+        sa.Column("frame_id", sa.String(length=512), nullable=False),
+        sa.Column("iteration", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_run_frame_archive_run_frame_iteration",
+        "run_frame_archive",
+        ["run_id", "frame_id", "iteration"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_run_frame_archive_run_frame_iteration", table_name="run_frame_archive")
+    op.drop_table("run_frame_archive")
@@ -0,0 +1,36 @@
+"""Add archive table for finished runs evicted from memory."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20251228_0013"
+down_revision = "20251227_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "run_archive",
+        sa.Column("run_id", sa.String(length=64), primary_key=True),
+        sa.Column("tenant", sa.String(length=128), nullable=False),
+        sa.Column("client_id", sa.String(length=255), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("definition_hash", sa.String(length=128), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+    )
+    op.create_index("ix_run_archive_created_at_run_id", "run_archive", ["created_at", "run_id"])
+    op.create_index("ix_run_archive_status_created_at", "run_archive", ["status", "created_at"])
+    op.create_index("ix_run_archive_client_id_created_at", "run_archive", ["client_id", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_run_archive_client_id_created_at", table_name="run_archive")
+    op.drop_index("ix_run_archive_status_created_at", table_name="run_archive")
+    op.drop_index("ix_run_archive_created_at_run_id", table_name="run_archive")
+    op.drop_table("run_archive")
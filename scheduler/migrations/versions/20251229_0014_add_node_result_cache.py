@@ -0,0 +1,31 @@
+"""Add cache table for memoized node results."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20251229_0014"
+down_revision = "20251228_0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "node_result_cache",
+        sa.Column("cache_key", sa.String(length=64), primary_key=True),
+        sa.Column("package_name", sa.String(length=255), nullable=False),
+        sa.Column("package_version", sa.String(length=64), nullable=False),
+        sa.Column("node_type", sa.String(length=255), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+    )
+    op.create_index("ix_node_result_cache_expires_at", "node_result_cache", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_node_result_cache_expires_at", table_name="node_result_cache")
+    op.drop_table("node_result_cache")
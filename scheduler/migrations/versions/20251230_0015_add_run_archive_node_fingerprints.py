@@ -0,0 +1,20 @@
+"""Keep node definition fingerprints of archived runs for incremental re-runs."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20251230_0015"
+down_revision = "20251229_0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("run_archive", sa.Column("node_fingerprints", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("run_archive", "node_fingerprints")
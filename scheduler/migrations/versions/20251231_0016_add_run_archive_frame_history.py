@@ -0,0 +1,20 @@
+"""Keep frame history summaries of archived runs for the frames endpoint."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20251231_0016"
+down_revision = "20251230_0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("run_archive", sa.Column("frame_history", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("run_archive", "frame_history")
@@ -23,8 +23,9 @@ from fastapi import (  # noqa: F401
 )
 
 from scheduler_api.models.extra_models import TokenModel  # noqa: F401
+from scheduler_api.models.error import Error
 from pydantic import Field, StrictStr
-from typing import Optional
+from typing import Any, Dict, Optional
 from typing_extensions import Annotated
 from scheduler_api.security_api import get_token_bearerAuth
 
@@ -54,3 +55,24 @@ async def sse_global_events(
     if not BaseEventsApi.subclasses:
         raise HTTPException(status_code=500, detail="Not implemented")
     return await BaseEventsApi.subclasses[0]().sse_global_events(client_session_id, last_event_id)
+
+
+@router.get(
+    "/api/v1/events/connections",
+    responses={
+        200: {"model": Dict[str, Any], "description": "OK"},
+        403: {"model": Error, "description": "Authenticated but lacks required permissions"},
+    },
+    tags=["Events"],
+    summary="SSE connection metrics (admin)",
+    response_model_by_alias=True,
+)
+async def list_event_connections(
+    token_bearerAuth: TokenModel = Security(
+        get_token_bearerAuth
+    ),
+) -> Dict[str, Any]:
+    """Queue depth, dropped events, resyncs and delivery lag for every open SSE connection."""
+    if not BaseEventsApi.subclasses:
+        raise HTTPException(status_code=500, detail="Not implemented")
+    return await BaseEventsApi.subclasses[0]().list_event_connections()
@@ -3,7 +3,7 @@
 from typing import ClassVar, Dict, List, Tuple  # noqa: F401
 
 from pydantic import Field, StrictStr
-from typing import Optional
+from typing import Any, Dict, Optional
 from typing_extensions import Annotated
 from scheduler_api.security_api import get_token_bearerAuth
 
@@ -19,3 +19,10 @@ class BaseEventsApi:
         last_event_id: Annotated[Optional[StrictStr], Field(description="Resume SSE from a specific monotonic event id")],
     ) -> str:
         ...
+
+
+    async def list_event_connections(
+        self,
+    ) -> Dict[str, Any]:
+        """Queue depth, dropped events, resyncs and delivery lag for every open SSE connection."""
+        ...
@@ -24,7 +24,7 @@ from fastapi import (  # noqa: F401
 
 from scheduler_api.models.extra_models import TokenModel  # noqa: F401
 from pydantic import Field, StrictStr
-from typing import Optional
+from typing import Any, Dict, Optional
 from typing_extensions import Annotated
 from scheduler_api.models.error import Error
 from scheduler_api.models.run import Run
@@ -130,6 +130,30 @@ async def cancel_run(
     return await BaseRunsApi.subclasses[0]().cancel_run(runId)
 
 
+@router.post(
+    "/api/v1/runs/{runId}/rerun",
+    responses={
+        202: {"model": RunRef, "description": "Accepted"},
+        400: {"model": Error, "description": "Invalid input"},
+        404: {"model": Error, "description": "Resource not found"},
+    },
+    tags=["Runs"],
+    summary="Start a run that reuses unchanged results of a previous run",
+    response_model_by_alias=True,
+)
+async def rerun_run(
+    runId: StrictStr = Path(..., description=""),
+    run_start_request: RunStartRequest = Body(None, description=""),
+    token_bearerAuth: TokenModel = Security(
+        get_token_bearerAuth
+    ),
+) -> RunRef:
+    """Starts the submitted workflow as a new run. Root nodes whose definition, incoming edges and upstream nodes are unchanged since run &#x60;runId&#x60;, and that succeeded there, start out succeeded with the previous results; only changed nodes and their descendants are dispatched."""
+    if not BaseRunsApi.subclasses:
+        raise HTTPException(status_code=500, detail="Not implemented")
+    return await BaseRunsApi.subclasses[0]().rerun_run(runId, run_start_request)
+
+
 @router.get(
     "/api/v1/runs/{runId}/definition",
     responses={
@@ -149,3 +173,27 @@ async def get_run_definition(
     if not BaseRunsApi.subclasses:
         raise HTTPException(status_code=500, detail="Not implemented")
     return await BaseRunsApi.subclasses[0]().get_run_definition(runId)
+
+
+@router.get(
+    "/api/v1/runs/{runId}/frames",
+    responses={
+        200: {"model": Dict[str, Any], "description": "OK"},
+        404: {"model": Error, "description": "Resource not found"},
+    },
+    tags=["Runs"],
+    summary="Completed iterations of a container frame",
+    response_model_by_alias=True,
+)
+async def get_run_frames(
+    runId: StrictStr = Path(..., description=""),
+    frame_id: StrictStr = Query(None, description="", alias="frameId"),
+    iteration: Optional[Annotated[int, Field(ge=1)]] = Query(None, description="", alias="iteration", ge=1),
+    token_bearerAuth: TokenModel = Security(
+        get_token_bearerAuth
+    ),
+) -> Dict[str, Any]:
+    """Without &#x60;iteration&#x60;, returns the frame&#39;s history summary: iteration count, status counts, total duration, artifacts and the iterations still held in memory. With &#x60;iteration&#x60;, returns that iteration&#39;s node details, loading folded iterations from the frame archive."""
+    if not BaseRunsApi.subclasses:
+        raise HTTPException(status_code=500, detail="Not implemented")
+    return await BaseRunsApi.subclasses[0]().get_run_frames(runId, frame_id, iteration)
@@ -3,7 +3,7 @@
 from typing import ClassVar, Dict, List, Tuple  # noqa: F401
 
 from pydantic import Field, StrictStr
-from typing import Optional
+from typing import Any, Dict, Optional
 from typing_extensions import Annotated
 from scheduler_api.models.error import Error
 from scheduler_api.models.run import Run
@@ -57,3 +57,22 @@ class BaseRunsApi:
         runId: StrictStr,
     ) -> Workflow:
         ...
+
+
+    async def rerun_run(
+        self,
+        runId: StrictStr,
+        run_start_request: RunStartRequest,
+    ) -> RunRef:
+        """Starts the submitted workflow as a new run. Root nodes whose definition, incoming edges and upstream nodes are unchanged since run &#x60;runId&#x60;, and that succeeded there, start out succeeded with the previous results; only changed nodes and their descendants are dispatched."""
+        ...
+
+
+    async def get_run_frames(
+        self,
+        runId: StrictStr,
+        frame_id: StrictStr,
+        iteration: Optional[Annotated[int, Field(ge=1)]],
+    ) -> Dict[str, Any]:
+        """Without &#x60;iteration&#x60;, returns the frame&#39;s history summary: iteration count, status counts, total duration, artifacts and the iterations still held in memory. With &#x60;iteration&#x60;, returns that iteration&#39;s node details, loading folded iterations from the frame archive."""
+        ...
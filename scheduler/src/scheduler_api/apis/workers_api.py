@@ -24,7 +24,7 @@ from fastapi import (  # noqa: F401
 
 from scheduler_api.models.extra_models import TokenModel  # noqa: F401
 from pydantic import Field, StrictBool, StrictStr
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 from typing_extensions import Annotated
 from scheduler_api.models.command_ref import CommandRef
 from scheduler_api.models.error import Error
@@ -115,3 +115,24 @@ async def send_worker_command(
     if not BaseWorkersApi.subclasses:
         raise HTTPException(status_code=500, detail="Not implemented")
     return await BaseWorkersApi.subclasses[0]().send_worker_command(workerName, worker_command, idempotency_key)
+
+
+@router.get(
+    "/api/v1/dispatch/metrics",
+    responses={
+        200: {"model": Dict[str, Any], "description": "OK"},
+        403: {"model": Error, "description": "Authenticated but lacks required permissions"},
+    },
+    tags=["Workers"],
+    summary="Dispatch pipeline metrics (admin)",
+    response_model_by_alias=True,
+)
+async def get_dispatch_metrics(
+    token_bearerAuth: TokenModel = Security(
+        get_token_bearerAuth
+    ),
+) -> Dict[str, Any]:
+    """Queue depth, in-flight dispatches, pending acks, retries and dispatch latency."""
+    if not BaseWorkersApi.subclasses:
+        raise HTTPException(status_code=500, detail="Not implemented")
+    return await BaseWorkersApi.subclasses[0]().get_dispatch_metrics()
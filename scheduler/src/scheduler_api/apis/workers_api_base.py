@@ -3,7 +3,7 @@
 from typing import ClassVar, Dict, List, Tuple  # noqa: F401
 
 from pydantic import Field, StrictBool, StrictStr
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 from typing_extensions import Annotated
 from scheduler_api.models.command_ref import CommandRef
 from scheduler_api.models.error import Error
@@ -51,3 +51,10 @@ class BaseWorkersApi:
         idempotency_key: Annotated[Optional[Annotated[str, Field(max_length=64)]], Field(description="Optional idempotency key for safe retries; if reused with a different body, return 409")],
     ) -> CommandRef:
         ...
+
+
+    async def get_dispatch_metrics(
+        self,
+    ) -> Dict[str, Any]:
+        """Queue depth, in-flight dispatches, pending acks, retries and dispatch latency."""
+        ...
@@ -6,7 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from scheduler_api import main as generated_main
 from scheduler_api.catalog import catalog
-from scheduler_api.core import router as control_router
+from scheduler_api.core import biz_facade, router as control_router
 from scheduler_api.db.migrations import upgrade_database
 from scheduler_api.db.seed_data import seed_demo_workflow
 
@@ -32,3 +32,13 @@ def _startup() -> None:
     upgrade_database()
     catalog.reload()
     seed_demo_workflow()
+
+
+@app.on_event("startup")
+async def _recover_runs() -> None:
+    await biz_facade.recover_runs()
+
+
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    await biz_facade.shutdown()
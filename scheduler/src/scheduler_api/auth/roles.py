@@ -12,6 +12,7 @@ WORKFLOW_VIEW_ROLES = {"admin", "workflow.viewer", "workflow.editor"}
 WORKFLOW_EDIT_ROLES = {"admin", "workflow.editor"}
 RUN_VIEW_ROLES = {"admin", "run.viewer"}
 AUDIT_VIEW_ROLES = {"admin"}
+OPS_VIEW_ROLES = {"admin"}
 
 
 def require_roles(*required: str) -> TokenModel:
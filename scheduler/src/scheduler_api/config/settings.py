@@ -43,6 +43,10 @@ class SchedulerApiSettings(BaseSettings):
         default=86400,
         description="TTL for upload sessions in seconds (0 disables cleanup).",
     )
+    resource_binding_cache_ttl_seconds: NonNegativeInt = Field(
+        default=30,
+        description="TTL for cached grant/resource lookups used to bind resources to dispatched tasks (0 disables caching).",
+    )
 
 
 class SchedulerSettings(BaseSettings):
@@ -75,6 +79,10 @@ class SchedulerSettings(BaseSettings):
         default=64,
         description="Sliding window size for session sequencing/ack bitmaps.",
     )
+    session_ack_interval_ms: NonNegativeInt = Field(
+        default=10,
+        description="Max interval (milliseconds) between cumulative acks for sequenced worker frames (0 acks every frame).",
+    )
     dispatch_worker_strategy: str = Field(
         default="default",
         description="Worker selection strategy for dispatch (default, least_inflight, least_latency, random).",
@@ -83,6 +91,86 @@ class SchedulerSettings(BaseSettings):
         default=90,
         description="Max heartbeat age (seconds) for eligible workers.",
     )
+    dispatch_concurrency: PositiveInt = Field(
+        default=16,
+        description="Number of dispatcher coroutines sending dispatches to workers concurrently.",
+    )
+    dispatch_lane_concurrency: NonNegativeInt = Field(
+        default=8,
+        description="Max in-flight dispatches per tenant/package lane (0 = bounded only by dispatch_concurrency).",
+    )
+    dispatch_batch_linger_ms: NonNegativeInt = Field(
+        default=2,
+        description="Window (milliseconds) for coalescing dispatches bound for the same worker into one biz.exec.dispatch.batch frame (0 disables).",
+    )
+    dispatch_batch_max_size: PositiveInt = Field(
+        default=64,
+        description="Max dispatches per batch frame; a full batch is sent without waiting out the linger window.",
+    )
+    run_journal_enabled: bool = Field(
+        default=True,
+        description="Persist run-state transitions to the database so in-flight runs survive restarts.",
+    )
+    run_journal_batch_size: PositiveInt = Field(
+        default=256,
+        description="Maximum number of journal entries written per database commit.",
+    )
+    run_journal_flush_interval_ms: PositiveInt = Field(
+        default=50,
+        description="Upper bound (milliseconds) a journal entry waits before being committed.",
+    )
+    run_journal_feedback_checkpoint_seconds: NonNegativeInt = Field(
+        default=5,
+        description="Minimum interval between feedback checkpoints per node (0 checkpoints every feedback).",
+    )
+    event_coalesce_window_ms: NonNegativeInt = Field(
+        default=50,
+        description="Window (milliseconds) for merging streaming feedback events per run before SSE publication (0 disables).",
+    )
+    frame_history_size: PositiveInt = Field(
+        default=3,
+        description="Completed iterations kept in memory with full node details per container frame; older ones are folded into summaries.",
+    )
+    frame_archive_enabled: bool = Field(
+        default=True,
+        description="Spill node details of folded frame iterations to the database so they can be fetched through the run API.",
+    )
+    run_retention_seconds: NonNegativeInt = Field(
+        default=3600,
+        description="Seconds a finished run stays in memory after it finished or was last read before eviction (0 disables).",
+    )
+    run_retention_max_finished: NonNegativeInt = Field(
+        default=1000,
+        description="Maximum number of finished runs kept in memory; the least recently used are evicted first (0 disables).",
+    )
+    run_archive_enabled: bool = Field(
+        default=True,
+        description="Archive finished runs to the database so run listing and lookup keep serving them after eviction.",
+    )
+    result_offload_threshold_bytes: NonNegativeInt = Field(
+        default=1024 * 1024,
+        description="Node-result values larger than this (serialised JSON bytes) are stored as resources and passed downstream by reference (0 disables).",
+    )
+    result_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse stored results of nodes whose manifest sets config.memoize instead of dispatching them again.",
+    )
+    result_cache_ttl_seconds: NonNegativeInt = Field(
+        default=7 * 24 * 3600,
+        description="Age after which memoized node results are ignored and pruned (0 keeps them forever).",
+    )
+    plan_cache_size: NonNegativeInt = Field(
+        default=256,
+        description="Number of compiled workflow plans (keyed by definition hash) kept for reuse by new runs (0 disables).",
+    )
+    sse_queue_size: PositiveInt = Field(
+        default=1000,
+        description="Maximum number of events buffered per SSE connection before the overflow policy applies.",
+    )
+    sse_overflow_policy: Literal["snapshot", "disconnect", "coalesce"] = Field(
+        default="snapshot",
+        description="What to do when an SSE client falls behind: resend run snapshots, disconnect, or drop superseded state events.",
+    )
 
     def allowed_worker_tokens(self) -> Set[str]:
         tokens: Set[str] = set()
@@ -12,12 +12,17 @@ from shared.models.biz.exec.error import ExecErrorPayload
 from shared.models.biz.exec.feedback import ExecFeedbackPayload
 from shared.models.biz.exec.next.request import ExecMiddlewareNextRequest
 from shared.models.biz.exec.next.response import ExecMiddlewareNextResponse
+from shared.models.biz.exec.payload.request import ExecPayloadRequest
+from shared.models.biz.exec.payload.response import ExecPayloadResponse
 from shared.models.biz.exec.result import ExecResultPayload
+from shared.models.biz.exec.result_batch import ExecResultBatchPayload
 from shared.models.biz.pkg.event import PackageEvent
 from shared.models.session import Role, Sender, WsEnvelope
 
+from ..dispatch.next_responses import build_next_response_envelope, send_next_responses
 from ..engine import status
 from ..facade import biz_facade
+from ..services.payload_offload import PayloadUnavailableError
 from scheduler_api.core.network.server import ControlPlaneServer
 from scheduler_api.core.network.manager import WorkerSession
 
@@ -29,6 +34,9 @@ def register_handlers(server: ControlPlaneServer) -> None:
     async def _on_exec_result(envelope: WsEnvelope, session) -> None:
         await _handle_exec_result(server, envelope, session)
 
+    async def _on_exec_result_batch(envelope: WsEnvelope, session) -> None:
+        await _handle_exec_result_batch(server, envelope, session)
+
     async def _on_exec_feedback(envelope: WsEnvelope, session) -> None:
         await _handle_exec_feedback(envelope)
 
@@ -38,6 +46,9 @@ def register_handlers(server: ControlPlaneServer) -> None:
     async def _on_exec_next_response(envelope: WsEnvelope, session) -> None:
         await _handle_exec_next_response(server, envelope)
 
+    async def _on_exec_payload_request(envelope: WsEnvelope, session) -> None:
+        await _handle_exec_payload_request(server, envelope, session)
+
     async def _on_exec_error(envelope: WsEnvelope, session) -> None:
         await _handle_exec_error(envelope)
 
@@ -48,9 +59,11 @@ def register_handlers(server: ControlPlaneServer) -> None:
         await _handle_control_ack(envelope)
 
     server.register_handler("biz.exec.result", _on_exec_result)
+    server.register_handler("biz.exec.result.batch", _on_exec_result_batch)
     server.register_handler("biz.exec.feedback", _on_exec_feedback)
     server.register_handler("biz.exec.next.request", _on_exec_next_request)
     server.register_handler("biz.exec.next.response", _on_exec_next_response)
+    server.register_handler("biz.exec.payload.request", _on_exec_payload_request)
     server.register_handler("biz.exec.error", _on_exec_error)
     server.register_handler("biz.pkg.event", _on_pkg_event)
     server.register_handler("control.ack", _on_control_ack)
@@ -69,20 +82,7 @@ async def _process_result(server: ControlPlaneServer, envelope: WsEnvelope, resu
     try:
         record, _ready, next_responses = await biz_facade.record_result(result)
         if next_responses:
-            for target_worker, resp in next_responses:
-                if not target_worker:
-                    continue
-                resp_envelope = WsEnvelope(
-                    type="biz.exec.next.response",
-                    id=str(uuid4()),
-                    ts=datetime.now(timezone.utc),
-                    corr=resp.requestId,
-                    seq=None,
-                    tenant=record.tenant if record else "default",
-                    sender=Sender(role=Role.scheduler, id=server.scheduler_id),
-                    payload=resp.model_dump(by_alias=True, exclude_none=True),
-                )
-                await server.send_envelope(target_worker, resp_envelope)
+            await send_next_responses(server, next_responses, tenant=record.tenant if record else "default")
         artifacts_count = len(record.artifacts) if record else 0
         LOGGER.info(
             "Result received corr=%s status=%s run=%s artifacts=%s",
@@ -118,6 +118,23 @@ async def _handle_exec_result(server: ControlPlaneServer, envelope: WsEnvelope,
     asyncio.create_task(_process_result(server, envelope, result))
 
 
+async def _handle_exec_result_batch(server: ControlPlaneServer, envelope: WsEnvelope, session) -> None:
+    batch = ExecResultBatchPayload.model_validate(envelope.payload)
+    LOGGER.info("Result batch received id=%s size=%s", envelope.id, len(batch.items))
+    for index, item in enumerate(batch.items):
+        # Each item is processed as the standalone biz.exec.result it stands in for.
+        item_envelope = envelope.model_copy(
+            update={
+                "type": "biz.exec.result",
+                "id": f"{envelope.id}#{index}",
+                "corr": item.corr,
+                "seq": item.seq,
+                "payload": item.result.model_dump(by_alias=True, exclude_none=True),
+            }
+        )
+        asyncio.create_task(_process_result(server, item_envelope, item.result))
+
+
 async def _handle_exec_feedback(envelope: WsEnvelope) -> None:
     feedback = ExecFeedbackPayload.model_validate(envelope.payload)
     await biz_facade.record_feedback(feedback)
@@ -147,15 +164,10 @@ async def _handle_exec_next_request(server: ControlPlaneServer, envelope: WsEnve
                 middlewareId=next_req.middlewareId,
                 error={"code": error or "next_unavailable", "message": message},
             )
-            resp_envelope = WsEnvelope(
-                type="biz.exec.next.response",
-                id=str(uuid4()),
-                ts=datetime.now(timezone.utc),
-                corr=next_req.requestId,
-                seq=None,
+            resp_envelope = build_next_response_envelope(
+                err_payload,
                 tenant=envelope.tenant,
-                sender=Sender(role=Role.scheduler, id=server.scheduler_id),
-                payload=err_payload.model_dump(by_alias=True, exclude_none=True),
+                scheduler_id=server.scheduler_id,
             )
             await server.send_envelope(session, resp_envelope)
     except Exception:  # noqa: BLE001
@@ -185,15 +197,10 @@ async def _handle_exec_next_response(server: ControlPlaneServer, envelope: WsEnv
                 next_resp.runId,
             )
         else:
-            resp_envelope = WsEnvelope(
-                type="biz.exec.next.response",
-                id=str(uuid4()),
-                ts=datetime.now(timezone.utc),
-                corr=next_resp.requestId,
-                seq=None,
+            resp_envelope = build_next_response_envelope(
+                next_resp,
                 tenant=envelope.tenant,
-                sender=Sender(role=Role.scheduler, id=server.scheduler_id),
-                payload=next_resp.model_dump(by_alias=True, exclude_none=True),
+                scheduler_id=server.scheduler_id,
             )
             await server.send_envelope(target_worker, resp_envelope)
     except Exception:  # noqa: BLE001
@@ -204,6 +211,40 @@ async def _handle_exec_next_response(server: ControlPlaneServer, envelope: WsEnv
         )
 
 
+async def _handle_exec_payload_request(server: ControlPlaneServer, envelope: WsEnvelope, session) -> None:
+    request = ExecPayloadRequest.model_validate(envelope.payload)
+    LOGGER.debug(
+        "Received biz.exec.payload.request run=%s resource=%s request=%s",
+        request.runId,
+        request.resourceId,
+        request.requestId,
+    )
+    if session:
+        asyncio.create_task(_serve_payload(server, envelope, session, request))
+
+
+async def _serve_payload(server: ControlPlaneServer, envelope: WsEnvelope, session, request: ExecPayloadRequest) -> None:
+    response = ExecPayloadResponse(requestId=request.requestId, runId=request.runId, resourceId=request.resourceId)
+    try:
+        response.value = await biz_facade.read_payload(request.resourceId)
+    except PayloadUnavailableError:
+        response.error = {"code": "payload_not_found", "message": f"payload {request.resourceId} is not available"}
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.exception("Failed to read payload resource=%s run=%s", request.resourceId, request.runId)
+        response.error = {"code": "payload_unavailable", "message": str(exc)}
+    resp_envelope = WsEnvelope(
+        type="biz.exec.payload.response",
+        id=str(uuid4()),
+        ts=datetime.now(timezone.utc),
+        corr=request.requestId,
+        seq=None,
+        tenant=envelope.tenant,
+        sender=Sender(role=Role.scheduler, id=server.scheduler_id),
+        payload=response.model_dump(by_alias=True, exclude_none=True),
+    )
+    await server.send_envelope(session, resp_envelope)
+
+
 async def _handle_exec_error(envelope: WsEnvelope) -> None:
     error_payload = ExecErrorPayload.model_validate(envelope.payload)
     details = error_payload.context.details if error_payload.context else {}
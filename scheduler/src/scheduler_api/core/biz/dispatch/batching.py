@@ -0,0 +1,126 @@
+"""Micro-batching of dispatches bound for the same worker session."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from shared.models.biz.exec.dispatch import ExecDispatchPayload
+
+from ...network.manager import WorkerSession
+from ..domain.models import DispatchRequest
+
+LOGGER = logging.getLogger(__name__)
+
+DISPATCH_BATCH_TYPE = "biz.exec.dispatch.batch"
+
+BatchItem = Tuple[DispatchRequest, ExecDispatchPayload]
+BatchSender = Callable[[WorkerSession, List[BatchItem]], Awaitable[None]]
+
+
+def supports_batches(session: WorkerSession) -> bool:
+    """Whether the worker advertised ``biz.exec.dispatch.batch`` in its payload types."""
+
+    return DISPATCH_BATCH_TYPE in (session.payload_types or [])
+
+
+@dataclass
+class _PendingBatch:
+    session: WorkerSession
+    items: List[BatchItem] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class DispatchBatcher:
+    """Buffers dispatches per worker session and hands them to ``send`` together.
+
+    A batch is flushed ``linger_seconds`` after its first dispatch arrived, or
+    as soon as it holds ``max_size`` dispatches. Sending runs in its own task so
+    dispatcher coroutines never wait out the linger window.
+    """
+
+    def __init__(self, send: BatchSender, *, linger_seconds: float, max_size: int) -> None:
+        self._send = send
+        self._linger_seconds = max(linger_seconds, 0.0)
+        self._max_size = max(max_size, 1)
+        # keyed by id(session): sessions are unhashable and stay referenced while buffered
+        self._batches: Dict[int, _PendingBatch] = {}
+        self._tasks: Set[asyncio.Task[None]] = set()
+        self._flushed = 0
+
+    def __len__(self) -> int:
+        return sum(len(batch.items) for batch in self._batches.values())
+
+    @property
+    def flushed(self) -> int:
+        """Number of batches handed to ``send`` so far."""
+
+        return self._flushed
+
+    def add(self, session: WorkerSession, request: DispatchRequest, payload: ExecDispatchPayload) -> None:
+        key = id(session)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _PendingBatch(session=session)
+            batch.timer = asyncio.get_running_loop().call_later(self._linger_seconds, self._flush, key)
+        batch.items.append((request, payload))
+        if len(batch.items) >= self._max_size:
+            self._flush(key)
+
+    def discard_run(self, run_id: str) -> List[DispatchRequest]:
+        """Drop buffered dispatches of ``run_id``; returns them so their slots can be freed."""
+
+        dropped: List[DispatchRequest] = []
+        for key, batch in list(self._batches.items()):
+            kept = [item for item in batch.items if item[0].run_id != run_id]
+            if len(kept) == len(batch.items):
+                continue
+            dropped.extend(request for request, _ in batch.items if request.run_id == run_id)
+            batch.items = kept
+            if not kept:
+                if batch.timer is not None:
+                    batch.timer.cancel()
+                del self._batches[key]
+        return dropped
+
+    async def stop(self) -> List[DispatchRequest]:
+        """Cancel pending sends; returns still-buffered dispatches so they can be re-queued."""
+
+        unsent: List[DispatchRequest] = []
+        for batch in self._batches.values():
+            if batch.timer is not None:
+                batch.timer.cancel()
+            unsent.extend(request for request, _ in batch.items)
+        self._batches.clear()
+        tasks, self._tasks = list(self._tasks), set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return unsent
+
+    def _flush(self, key: int) -> None:
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        self._flushed += 1
+        task = asyncio.get_running_loop().create_task(
+            self._send(batch.session, batch.items),
+            name="scheduler-dispatch-batch",
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._finalise)
+
+    def _finalise(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            LOGGER.error("Dispatch batch send failed", exc_info=exc)
+
+
+__all__ = ["DISPATCH_BATCH_TYPE", "DispatchBatcher", "supports_batches"]
@@ -0,0 +1,208 @@
+"""Lane bookkeeping for the dispatch pipeline."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from ..domain.models import DispatchRequest
+
+LaneKey = Tuple[str, str]
+
+
+def lane_key(request: DispatchRequest) -> LaneKey:
+    return (request.tenant, request.package_name)
+
+
+@dataclass
+class _Lane:
+    entries: Deque[Tuple[float, DispatchRequest]] = field(default_factory=deque)
+    inflight: int = 0
+
+
+class DispatchLanes:
+    """FIFO lanes per (tenant, package) served round-robin, plus a retry delay heap.
+
+    A lane is only eligible while it has queued work and fewer than
+    ``lane_concurrency`` requests in flight, so a package whose workers are
+    slow or missing cannot occupy the whole dispatch pool. Retries wait in a
+    heap keyed by their next-attempt time instead of sleeping in a dispatcher,
+    and requests blocked only by full workers are parked until a slot frees.
+    Not thread-safe; the orchestrator only touches it from the event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        lane_concurrency: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._lane_concurrency = lane_concurrency
+        self._clock = clock
+        self._lanes: Dict[LaneKey, _Lane] = {}
+        self._ready: Deque[LaneKey] = deque()
+        self._delayed: List[Tuple[float, int, DispatchRequest]] = []
+        self._parked: List[DispatchRequest] = []
+        self._sequence = itertools.count()
+        self._queued = 0
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    @property
+    def delayed(self) -> int:
+        return len(self._delayed)
+
+    @property
+    def parked(self) -> int:
+        return len(self._parked)
+
+    @property
+    def lane_count(self) -> int:
+        return len(self._lanes)
+
+    def push(self, request: DispatchRequest) -> None:
+        key = lane_key(request)
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = _Lane()
+        was_idle = not lane.entries
+        lane.entries.append((self._clock(), request))
+        self._queued += 1
+        if was_idle and self._has_capacity(lane):
+            self._ready.append(key)
+
+    def push_delayed(self, request: DispatchRequest, delay: float) -> float:
+        """Hold ``request`` back for ``delay`` seconds; returns its due time."""
+
+        due = self._clock() + max(delay, 0.0)
+        heapq.heappush(self._delayed, (due, next(self._sequence), request))
+        return due
+
+    def park(self, request: DispatchRequest) -> None:
+        """Hold ``request`` until :meth:`release_parked` (all eligible workers are full)."""
+
+        self._parked.append(request)
+
+    def release_parked(self) -> int:
+        parked, self._parked = self._parked, []
+        for request in parked:
+            self.push(request)
+        return len(parked)
+
+    def next_due(self) -> Optional[float]:
+        return self._delayed[0][0] if self._delayed else None
+
+    def release_due(self) -> int:
+        """Move every retry whose next-attempt time has passed back into its lane."""
+
+        now = self._clock()
+        released = 0
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, request = heapq.heappop(self._delayed)
+            self.push(request)
+            released += 1
+        return released
+
+    def pop(self) -> Optional[Tuple[DispatchRequest, float]]:
+        """Take the next request round-robin across eligible lanes.
+
+        Returns the request with the clock value it was queued at. The caller
+        must hand it back through :meth:`complete` once the attempt finishes.
+        """
+
+        if not self._ready:
+            return None
+        key = self._ready.popleft()
+        lane = self._lanes[key]
+        queued_at, request = lane.entries.popleft()
+        self._queued -= 1
+        lane.inflight += 1
+        if lane.entries and self._has_capacity(lane):
+            self._ready.append(key)
+        return request, queued_at
+
+    def complete(self, request: DispatchRequest) -> bool:
+        """Release the in-flight slot held by ``request``.
+
+        Returns ``True`` when its lane became eligible again.
+        """
+
+        key = lane_key(request)
+        lane = self._lanes.get(key)
+        if lane is None:
+            return False
+        was_full = not self._has_capacity(lane)
+        lane.inflight = max(lane.inflight - 1, 0)
+        if not lane.entries:
+            if lane.inflight == 0:
+                del self._lanes[key]
+            return False
+        if was_full:
+            self._ready.append(key)
+            return True
+        return False
+
+    def discard_run(self, run_id: str) -> int:
+        """Drop queued, delayed and parked requests belonging to ``run_id``."""
+
+        removed = 0
+        for key, lane in list(self._lanes.items()):
+            kept = deque(entry for entry in lane.entries if entry[1].run_id != run_id)
+            dropped = len(lane.entries) - len(kept)
+            if not dropped:
+                continue
+            removed += dropped
+            self._queued -= dropped
+            lane.entries = kept
+            if not kept:
+                try:
+                    self._ready.remove(key)
+                except ValueError:
+                    pass
+                if lane.inflight == 0:
+                    del self._lanes[key]
+        parked = [request for request in self._parked if request.run_id != run_id]
+        removed += len(self._parked) - len(parked)
+        self._parked = parked
+        delayed = [item for item in self._delayed if item[2].run_id != run_id]
+        if len(delayed) != len(self._delayed):
+            removed += len(self._delayed) - len(delayed)
+            heapq.heapify(delayed)
+            self._delayed = delayed
+        return removed
+
+    def _has_capacity(self, lane: _Lane) -> bool:
+        return self._lane_concurrency <= 0 or lane.inflight < self._lane_concurrency
+
+
+class LatencyWindow:
+    """Rolling window of latency samples (seconds) summarised in milliseconds."""
+
+    def __init__(self, size: int = 1024) -> None:
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._count = 0
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self._count += 1
+
+    def summary(self) -> Dict[str, float]:
+        if not self._samples:
+            return {"count": self._count, "p50Ms": 0.0, "p95Ms": 0.0, "maxMs": 0.0}
+        ordered = sorted(self._samples)
+        last = len(ordered) - 1
+        return {
+            "count": self._count,
+            "p50Ms": round(ordered[last // 2] * 1000, 3),
+            "p95Ms": round(ordered[int(last * 0.95)] * 1000, 3),
+            "maxMs": round(ordered[last] * 1000, 3),
+        }
+
+
+__all__ = ["DispatchLanes", "LaneKey", "LatencyWindow", "lane_key"]
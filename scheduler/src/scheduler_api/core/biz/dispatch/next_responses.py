@@ -0,0 +1,57 @@
+"""Delivery of ``biz.exec.next.response`` frames back to waiting middleware workers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Protocol, Tuple
+from uuid import uuid4
+
+from shared.models.biz.exec.next.response import ExecMiddlewareNextResponse
+from shared.models.session import Role, Sender, WsEnvelope
+
+from ...network.manager import WorkerSession
+
+
+class EnvelopeSender(Protocol):
+    """Anything that can push an envelope to a worker (gateway or control-plane server)."""
+
+    @property
+    def scheduler_id(self) -> str: ...
+
+    async def send_envelope(self, worker: WorkerSession | str, payload: dict | WsEnvelope) -> None: ...
+
+
+def build_next_response_envelope(
+    response: ExecMiddlewareNextResponse,
+    *,
+    tenant: str,
+    scheduler_id: str,
+) -> WsEnvelope:
+    return WsEnvelope(
+        type="biz.exec.next.response",
+        id=str(uuid4()),
+        ts=datetime.now(timezone.utc),
+        corr=response.requestId,
+        seq=None,
+        tenant=tenant,
+        sender=Sender(role=Role.scheduler, id=scheduler_id),
+        payload=response.model_dump(by_alias=True, exclude_none=True),
+    )
+
+
+async def send_next_responses(
+    sender: EnvelopeSender,
+    next_responses: Iterable[Tuple[Optional[str], ExecMiddlewareNextResponse]],
+    *,
+    tenant: str,
+) -> None:
+    """Send each response to its waiting worker, skipping entries with no known target."""
+
+    for target_worker, response in next_responses:
+        if not target_worker:
+            continue
+        envelope = build_next_response_envelope(response, tenant=tenant, scheduler_id=sender.scheduler_id)
+        await sender.send_envelope(target_worker, envelope)
+
+
+__all__ = ["build_next_response_envelope", "send_next_responses"]
@@ -5,18 +5,26 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+import time
 from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import uuid4
 
 from shared.models.biz.exec.error import ExecErrorPayload
 from shared.models.biz.exec.dispatch import Affinity, ExecDispatchPayload, Constraints, ResourceRef
+from shared.models.biz.exec.dispatch_batch import ExecDispatchBatchItem, ExecDispatchBatchPayload
 from shared.models.session import Role
 from shared.models.session.register import Status as PackageStatus
 from shared.protocol import build_envelope
 
 from ...network.manager import WorkerSession
 from ...network.gateway import worker_gateway
+from ...network.index import load_score
+from .batching import DISPATCH_BATCH_TYPE, BatchItem, DispatchBatcher, supports_batches
+from .lanes import DispatchLanes, LatencyWindow
+from .slots import WorkerSlots
+from ..engine.deadlines import DeadlineScheduler
 from ..services.run_state_service import DispatchRequest, FINAL_STATUSES, run_state_service
 from scheduler_api.config.settings import get_settings
 from scheduler_api.models.workflow_node import WorkflowNode
@@ -27,6 +35,15 @@ WorkerSelectionStrategy = Callable[[list[WorkerSession]], WorkerSession]
 
 
 class RunOrchestrator:
+    """Dispatches ready nodes to workers through a pool of lane-aware dispatchers.
+
+    Requests are queued per (tenant, package) lane and served round-robin by
+    ``concurrency`` dispatcher coroutines. Retries are parked in a delay heap
+    released by a single timer, so backoff never stalls a dispatcher. With a
+    ``batch_linger_seconds`` window, dispatches for the same worker are sent as
+    one ``biz.exec.dispatch.batch`` frame acknowledged by a single ack.
+    """
+
     def __init__(
         self,
         *,
@@ -35,23 +52,89 @@ class RunOrchestrator:
         max_retry_seconds: float = 30.0,
         ack_timeout_seconds: float = 5.0,
         selection_strategy: Optional[WorkerSelectionStrategy] = None,
+        concurrency: int = 16,
+        lane_concurrency: int = 8,
+        batch_linger_seconds: float = 0.0,
+        batch_max_size: int = 64,
     ) -> None:
-        self._queue: asyncio.Queue[DispatchRequest] = asyncio.Queue()
-        self._loop_task: Optional[asyncio.Task[None]] = None
+        self._lanes = DispatchLanes(lane_concurrency=lane_concurrency)
+        self._ready: Optional[asyncio.Condition] = None
+        self._timer_wakeup: Optional[asyncio.Event] = None
+        self._dispatchers: List[asyncio.Task[None]] = []
+        self._timer_task: Optional[asyncio.Task[None]] = None
+        self._concurrency = max(concurrency, 1)
+        self._slots = WorkerSlots(on_change=worker_gateway.refresh_load)
+        self._slot_freed = False
+        self._parked_release_at: Optional[float] = None
+        self._inflight = 0
+        self._retries = 0
+        self._queue_wait = LatencyWindow()
+        self._dispatch_latency = LatencyWindow()
         self._max_attempts = max_attempts
         self._base_retry_seconds = base_retry_seconds
         self._max_retry_seconds = max_retry_seconds
         self._ack_timeout_seconds = ack_timeout_seconds
-        self._pending_acks: Dict[str, DispatchRequest] = {}
-        self._ack_waiters: Dict[str, asyncio.Task[None]] = {}
-        self._ack_lock = asyncio.Lock()
+        # dispatches awaiting a worker ack, expired by one deadline task
+        self._pending_acks: DeadlineScheduler[str, DispatchRequest] = DeadlineScheduler(
+            lambda request: request.ack_deadline,
+            name="scheduler-dispatcher-acks",
+        )
         self._selection_strategy = selection_strategy or self._default_selection_strategy
+        self._batching = batch_linger_seconds > 0 and batch_max_size > 1
+        self._batcher = DispatchBatcher(
+            self._send_dispatches,
+            linger_seconds=batch_linger_seconds,
+            max_size=batch_max_size,
+        )
+        # batch envelope id -> member dispatch ids still awaiting that ack, and the reverse
+        self._batch_members: Dict[str, Set[str]] = {}
+        self._batch_of: Dict[str, str] = {}
+        # sent dispatch ids not yet in _pending_acks -> whether their ack already arrived
+        self._untracked: Dict[str, bool] = {}
 
     def ensure_started(self) -> None:
-        if self._loop_task and not self._loop_task.done():
+        if self._timer_task and not self._timer_task.done():
             return
         loop = asyncio.get_running_loop()
-        self._loop_task = loop.create_task(self._runner(), name="scheduler-dispatcher")
+        self._ready = asyncio.Condition()
+        self._timer_wakeup = asyncio.Event()
+        self._dispatchers = [
+            loop.create_task(self._runner(), name=f"scheduler-dispatcher-{index}")
+            for index in range(self._concurrency)
+        ]
+        self._timer_task = loop.create_task(self._retry_timer(), name="scheduler-dispatcher-retry")
+        self._pending_acks.start(self._handle_ack_timeouts)
+
+    async def stop(self) -> None:
+        tasks = [*self._dispatchers, *([self._timer_task] if self._timer_task else [])]
+        self._dispatchers = []
+        self._timer_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Buffered dispatches were never sent: free their slots and queue them for the next start.
+        for request in await self._batcher.stop():
+            self.release_slot(request.task_id)
+            self._lanes.push(request)
+        await self._pending_acks.stop()
+
+    def metrics(self) -> Dict[str, object]:
+        """Queue depth and latency figures for the dispatch pipeline."""
+
+        return {
+            "queued": self._lanes.queued,
+            "delayed": self._lanes.delayed,
+            "lanes": self._lanes.lane_count,
+            "parked": self._lanes.parked,
+            "inflight": self._inflight,
+            "reservedSlots": len(self._slots),
+            "pendingAcks": len(self._pending_acks),
+            "batched": len(self._batcher),
+            "batches": self._batcher.flushed,
+            "retries": self._retries,
+            "queueWait": self._queue_wait.summary(),
+            "dispatchLatency": self._dispatch_latency.summary(),
+        }
 
     def set_selection_strategy(self, strategy: WorkerSelectionStrategy) -> None:
         """Override the worker selection strategy used during dispatch."""
@@ -62,50 +145,84 @@ class RunOrchestrator:
         if not requests:
             return
         self.ensure_started()
-        for request in requests:
-            await self._queue.put(request)
+        assert self._ready is not None
+        async with self._ready:
+            for request in requests:
+                self._lanes.push(request)
+            self._ready.notify(len(requests))
 
     async def cancel_run(self, run_id: str) -> None:
-        # Flush queued dispatches for this run
-        if not self._queue.empty():
-            retained: List[DispatchRequest] = []
-            while not self._queue.empty():
-                request = await self._queue.get()
-                if request.run_id != run_id:
-                    retained.append(request)
-                self._queue.task_done()
-            for request in retained:
-                await self._queue.put(request)
-
-        # Cancel pending ack waiters for this run to avoid retries/timeouts
-        async with self._ack_lock:
-            for dispatch_id, request in list(self._pending_acks.items()):
-                if request.run_id != run_id:
-                    continue
-                self._pending_acks.pop(dispatch_id, None)
-                waiter = self._ack_waiters.pop(dispatch_id, None)
-                if waiter:
-                    waiter.cancel()
-
-    async def register_ack(self, dispatch_id: str) -> None:
-        async with self._ack_lock:
-            waiter = self._ack_waiters.pop(dispatch_id, None)
-            request = self._pending_acks.pop(dispatch_id, None)
-        if waiter:
-            waiter.cancel()
-            await asyncio.gather(waiter, return_exceptions=True)
+        # Flush queued and backing-off dispatches for this run
+        self._lanes.discard_run(run_id)
+        self._batcher.discard_run(run_id)
+        if self._slots.release_run(run_id):
+            self._wake_parked()
+
+        # Drop pending ack deadlines for this run to avoid retries/timeouts
+        for dispatch_id in [
+            dispatch_id for dispatch_id, request in self._pending_acks.items() if request.run_id == run_id
+        ]:
+            self._pending_acks.cancel(dispatch_id)
+            self._forget_batch_member(dispatch_id)
+
+    def release_slot(self, task_id: Optional[str]) -> None:
+        """Free the worker slot held by ``task_id`` once it finished, failed or was cancelled."""
+
+        if self._slots.release(task_id):
+            self._wake_parked()
+
+    def _wake_parked(self) -> None:
+        if self._lanes.parked and self._timer_wakeup is not None:
+            self._slot_freed = True
+            self._timer_wakeup.set()
+
+    def _park(self, request: DispatchRequest) -> None:
+        self._lanes.park(request)
+        if self._parked_release_at is None:
+            # Fallback for capacity that appears without a release (new or re-registered workers).
+            self._parked_release_at = time.monotonic() + self._base_retry_seconds
+            if self._timer_wakeup is not None:
+                self._timer_wakeup.set()
+
+    async def register_ack(self, ack_id: str) -> None:
+        """Handle a worker ack for a dispatch or for a whole batch frame."""
+
+        members = self._batch_members.pop(ack_id, None)
+        if members is None:
+            await self._acknowledge(ack_id)
+            return
+        for dispatch_id in members:
+            self._batch_of.pop(dispatch_id, None)
+            await self._acknowledge(dispatch_id)
+
+    def _forget_batch_member(self, dispatch_id: str) -> None:
+        batch_id = self._batch_of.pop(dispatch_id, None)
+        if batch_id is None:
+            return
+        members = self._batch_members.get(batch_id)
+        if members is not None:
+            members.discard(dispatch_id)
+            if not members:
+                del self._batch_members[batch_id]
+
+    async def _acknowledge(self, dispatch_id: str) -> None:
+        request = self._pending_acks.cancel(dispatch_id)
         if not request:
+            if dispatch_id in self._untracked:
+                # Acked before mark_dispatched finished; applied once the dispatch is tracked.
+                self._untracked[dispatch_id] = True
+                return
             LOGGER.debug("Ack received for unknown dispatch_id=%s", dispatch_id)
             return
 
         request.dispatch_id = None
         request.ack_deadline = None
         try:
-                await run_state_service.mark_acknowledged(
-                    request.run_id,
-                    node_id=request.node_id,
-                    dispatch_id=dispatch_id,
-                )
+            await run_state_service.mark_acknowledged(
+                request.run_id,
+                node_id=request.node_id,
+                dispatch_id=dispatch_id,
+            )
         except Exception:  # noqa: BLE001
             LOGGER.exception(
                 "Failed to mark dispatch acknowledged run=%s node=%s dispatch=%s",
@@ -115,8 +232,17 @@ class RunOrchestrator:
             )
 
     async def _runner(self) -> None:
+        assert self._ready is not None
         while True:
-            request = await self._queue.get()
+            async with self._ready:
+                item = self._lanes.pop()
+                while item is None:
+                    await self._ready.wait()
+                    item = self._lanes.pop()
+            request, queued_at = item
+            started = time.monotonic()
+            self._queue_wait.observe(started - queued_at)
+            self._inflight += 1
             try:
                 await self._dispatch(request)
             except Exception:  # noqa: BLE001
@@ -125,9 +251,39 @@ class RunOrchestrator:
                     request.run_id,
                     request.node_id,
                 )
+                self._slots.release(request.task_id)
                 await self._handle_retry(request, "internal error")
             finally:
-                self._queue.task_done()
+                self._inflight -= 1
+                self._dispatch_latency.observe(time.monotonic() - started)
+                if self._lanes.complete(request):
+                    async with self._ready:
+                        self._ready.notify()
+
+    async def _retry_timer(self) -> None:
+        assert self._ready is not None and self._timer_wakeup is not None
+        while True:
+            deadlines = [
+                deadline
+                for deadline in (self._lanes.next_due(), self._parked_release_at)
+                if deadline is not None
+            ]
+            timeout = max(min(deadlines) - time.monotonic(), 0.0) if deadlines else None
+            try:
+                await asyncio.wait_for(self._timer_wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._timer_wakeup.clear()
+            released = self._lanes.release_due()
+            if self._slot_freed or (
+                self._parked_release_at is not None and time.monotonic() >= self._parked_release_at
+            ):
+                self._slot_freed = False
+                self._parked_release_at = None
+                released += self._lanes.release_parked()
+            if released:
+                async with self._ready:
+                    self._ready.notify(released)
 
     async def _dispatch(self, request: DispatchRequest) -> None:
         record = await run_state_service.get(request.run_id)
@@ -140,7 +296,17 @@ class RunOrchestrator:
             )
             return
 
-        session = self._select_worker(request)
+        admit = self._slots.admits(request)
+        session = self._select_worker(request, admit=admit)
+        if not session and admit is not None and self._select_worker(request) is not None:
+            LOGGER.debug(
+                "Dispatch waiting for a free worker slot run=%s node=%s type=%s",
+                request.run_id,
+                request.node_id,
+                request.node_type,
+            )
+            self._park(request)
+            return
         if not session:
             LOGGER.info(
                 "Dispatch pending: no worker available run=%s node=%s attempts=%s",
@@ -151,9 +317,11 @@ class RunOrchestrator:
             await self._handle_retry(request, "worker unavailable")
             return
 
+        self._slots.reserve(session, request)
         try:
             payload = self._build_payload(request)
         except ValueError as exc:
+            self._slots.release(request.task_id)
             LOGGER.error(
                 "Dropping dispatch for run=%s node=%s due to invalid metadata: %s",
                 request.run_id,
@@ -178,31 +346,92 @@ class RunOrchestrator:
                 task_id=request.task_id,
             )
             return
-        envelope = build_envelope(
-            "biz.exec.dispatch",
-            payload,
-            tenant=request.tenant,
-            sender_role=Role.scheduler,
-            sender_id=worker_gateway.scheduler_id,
-            corr=request.task_id,
-            seq=request.seq,
-            request_ack=True,
-        )
-        dispatch_id = envelope["id"]
+        if self._batching and supports_batches(session):
+            self._batcher.add(session, request, payload)
+            return
+        await self._send_dispatches(session, [(request, payload)])
+
+    async def _send_dispatches(self, session: WorkerSession, items: List[BatchItem]) -> None:
+        """Send ``items`` to ``session`` in one frame and start their ack deadlines.
+
+        A single item goes out as a plain ``biz.exec.dispatch``; several become a
+        ``biz.exec.dispatch.batch`` whose items carry their own dispatch ids, so
+        results, errors and retries stay per dispatch.
+        """
+
+        first = items[0][0]
+        if len(items) == 1:
+            envelope = build_envelope(
+                "biz.exec.dispatch",
+                items[0][1],
+                tenant=first.tenant,
+                sender_role=Role.scheduler,
+                sender_id=worker_gateway.scheduler_id,
+                corr=first.task_id,
+                seq=first.seq,
+                request_ack=True,
+            )
+            dispatch_ids = [envelope["id"]]
+        else:
+            dispatch_ids = [str(uuid4()) for _ in items]
+            batch = ExecDispatchBatchPayload(
+                items=[
+                    ExecDispatchBatchItem(
+                        dispatch_id=dispatch_id,
+                        corr=request.task_id,
+                        seq=request.seq,
+                        dispatch=payload,
+                    )
+                    for dispatch_id, (request, payload) in zip(dispatch_ids, items)
+                ]
+            )
+            envelope = build_envelope(
+                DISPATCH_BATCH_TYPE,
+                batch,
+                tenant=first.tenant,
+                sender_role=Role.scheduler,
+                sender_id=worker_gateway.scheduler_id,
+                request_ack=True,
+            )
+            batch_id = envelope["id"]
+            self._batch_members[batch_id] = set(dispatch_ids)
+            self._batch_of.update((dispatch_id, batch_id) for dispatch_id in dispatch_ids)
+        for dispatch_id, (request, _) in zip(dispatch_ids, items):
+            self._slots.bind_dispatch(request.task_id, dispatch_id)
+        # Registered before sending: the worker may ack while members are still being marked.
+        self._untracked.update((dispatch_id, False) for dispatch_id in dispatch_ids)
         try:
             await worker_gateway.send_envelope(session, envelope)
         except Exception as exc:  # noqa: BLE001
-            LOGGER.warning(
-                "Dispatch failed run=%s node=%s worker=%s error=%s",
-                request.run_id,
-                request.node_id,
-                session.worker_name,
-                exc,
-            )
-            await self._handle_retry(request, str(exc))
+            for dispatch_id, (request, _) in zip(dispatch_ids, items):
+                self._untracked.pop(dispatch_id, None)
+                LOGGER.warning(
+                    "Dispatch failed run=%s node=%s worker=%s error=%s",
+                    request.run_id,
+                    request.node_id,
+                    session.worker_name,
+                    exc,
+                )
+                self._forget_batch_member(dispatch_id)
+                self.release_slot(request.task_id)
+                await self._handle_retry(request, str(exc))
             return
 
         ack_deadline = datetime.now(timezone.utc) + timedelta(seconds=self._ack_timeout_seconds)
+        try:
+            for dispatch_id, (request, _) in zip(dispatch_ids, items):
+                await self._track_dispatch(session, request, dispatch_id, ack_deadline)
+        finally:
+            for dispatch_id in dispatch_ids:
+                self._untracked.pop(dispatch_id, None)
+
+    async def _track_dispatch(
+        self,
+        session: WorkerSession,
+        request: DispatchRequest,
+        dispatch_id: str,
+        ack_deadline: datetime,
+    ) -> None:
         record = await run_state_service.mark_dispatched(
             request.run_id,
             worker_name=session.worker_name,
@@ -219,17 +448,14 @@ class RunOrchestrator:
         )
         if not record or record.status in FINAL_STATUSES:
             LOGGER.info("Dropping dispatch for run=%s node=%s (status=%s)", request.run_id, request.node_id, record.status if record else "unknown")
+            self._forget_batch_member(dispatch_id)
+            self.release_slot(request.task_id)
             return
 
-        async with self._ack_lock:
-            request.dispatch_id = dispatch_id
-            request.ack_deadline = ack_deadline
-            self._pending_acks[dispatch_id] = request
-            waiter = asyncio.create_task(
-                self._await_ack(dispatch_id),
-                name=f"scheduler-dispatcher-ack-{dispatch_id}",
-            )
-            self._ack_waiters[dispatch_id] = waiter
+        request.dispatch_id = dispatch_id
+        request.ack_deadline = ack_deadline
+        self._pending_acks[dispatch_id] = request
+        acked_early = self._untracked.pop(dispatch_id, False)
 
         request.attempts = 0
         LOGGER.info(
@@ -239,52 +465,69 @@ class RunOrchestrator:
             session.worker_name,
             dispatch_id,
         )
+        if acked_early:
+            await self._acknowledge(dispatch_id)
 
-    async def _await_ack(self, dispatch_id: str) -> None:
-        try:
-            await asyncio.sleep(self._ack_timeout_seconds)
-        except asyncio.CancelledError:
-            return
-
-        async with self._ack_lock:
-            request = self._pending_acks.pop(dispatch_id, None)
-            self._ack_waiters.pop(dispatch_id, None)
-
-        if not request:
-            return
-
-        LOGGER.warning(
-            "Dispatch ack timeout run=%s node=%s dispatch_id=%s",
-            request.run_id,
-            request.node_id,
-            dispatch_id,
-        )
-
-        try:
-            await run_state_service.reset_after_ack_timeout(
-                request.run_id,
-                node_id=request.node_id,
-                dispatch_id=dispatch_id,
-            )
-        except Exception:  # noqa: BLE001
-            LOGGER.exception(
-                "Failed to reset node state after ack timeout run=%s node=%s dispatch_id=%s",
+    async def _handle_ack_timeouts(self, expired: List[Tuple[str, DispatchRequest]]) -> None:
+        for dispatch_id, request in expired:
+            LOGGER.warning(
+                "Dispatch ack timeout run=%s node=%s dispatch_id=%s",
                 request.run_id,
                 request.node_id,
                 dispatch_id,
             )
+            self._forget_batch_member(dispatch_id)
+            self.release_slot(request.task_id)
 
-        request.dispatch_id = None
-        request.ack_deadline = None
-        await self._handle_retry(request, "ack timeout")
+            try:
+                await run_state_service.reset_after_ack_timeout(
+                    request.run_id,
+                    node_id=request.node_id,
+                    dispatch_id=dispatch_id,
+                )
+            except Exception:  # noqa: BLE001
+                LOGGER.exception(
+                    "Failed to reset node state after ack timeout run=%s node=%s dispatch_id=%s",
+                    request.run_id,
+                    request.node_id,
+                    dispatch_id,
+                )
+
+            request.dispatch_id = None
+            request.ack_deadline = None
+            await self._handle_retry(request, "ack timeout")
 
-    def _select_worker(self, request: DispatchRequest) -> Optional[WorkerSession]:
+    def _select_worker(
+        self,
+        request: DispatchRequest,
+        *,
+        admit: Optional[Callable[[WorkerSession], bool]] = None,
+    ) -> Optional[WorkerSession]:
         package_name = request.package_name
         package_version = request.package_version
         preferred = request.preferred_worker_name
         max_heartbeat_age = float(_settings.dispatch_worker_max_heartbeat_age_seconds or 0)
         if max_heartbeat_age <= 0:
             max_heartbeat_age = None
+        if self._selection_strategy is RunOrchestrator._default_selection_strategy:
+            # Default ordering is maintained incrementally by the worker index.
+            session = None
+            if preferred:
+                session = worker_gateway.select_least_loaded(
+                    tenant=request.tenant,
+                    package_name=package_name,
+                    package_version=package_version,
+                    worker_name=preferred,
+                    max_heartbeat_age_seconds=max_heartbeat_age,
+                    admit=admit,
+                )
+            return session or worker_gateway.select_least_loaded(
+                tenant=request.tenant,
+                package_name=package_name,
+                package_version=package_version,
+                max_heartbeat_age_seconds=max_heartbeat_age,
+                admit=admit,
+            )
         if preferred:
             preferred_sessions = worker_gateway.query(
                 tenant=request.tenant,
@@ -295,6 +538,8 @@ class RunOrchestrator:
                 package_version=package_version,
                 max_heartbeat_age_seconds=max_heartbeat_age,
             )
+            if admit is not None:
+                preferred_sessions = [session for session in preferred_sessions if admit(session)]
             if preferred_sessions:
                 return self._selection_strategy(preferred_sessions)
         sessions = worker_gateway.query(
@@ -305,26 +550,15 @@ class RunOrchestrator:
             package_version=package_version,
             max_heartbeat_age_seconds=max_heartbeat_age,
         )
+        if admit is not None:
+            sessions = [session for session in sessions if admit(session)]
         if not sessions:
             return None
         return self._selection_strategy(sessions)
 
     @staticmethod
     def _default_selection_strategy(sessions: list[WorkerSession]) -> WorkerSession:
-        def score(session: WorkerSession) -> tuple[int, int, int, float]:
-            heartbeat = session.heartbeat
-            if heartbeat is None:
-                health_rank = 1
-            elif heartbeat.healthy:
-                health_rank = 0
-            else:
-                health_rank = 2
-            inflight = heartbeat.metrics.inflight if heartbeat else 1_000_000
-            latency = heartbeat.metrics.latency_ms if heartbeat and heartbeat.metrics.latency_ms is not None else 1_000_000
-            age_seconds = (datetime.now(timezone.utc) - session.last_heartbeat).total_seconds()
-            return (health_rank, inflight, latency, age_seconds)
-
-        return min(sessions, key=score)
+        return min(sessions, key=load_score)
 
     @staticmethod
     def _lowest_inflight_strategy(sessions: list[WorkerSession]) -> WorkerSession:
@@ -459,8 +693,12 @@ class RunOrchestrator:
             return
 
         delay = min(self._base_retry_seconds * (2 ** (request.attempts - 1)), self._max_retry_seconds)
-        await asyncio.sleep(delay)
-        await self._queue.put(request)
+        self.ensure_started()
+        self._retries += 1
+        due = self._lanes.push_delayed(request, delay)
+        if self._lanes.next_due() == due and self._timer_wakeup is not None:
+            # New earliest deadline; let the timer re-arm.
+            self._timer_wakeup.set()
 
 
 def _resolve_selection_strategy(name: str) -> WorkerSelectionStrategy:
@@ -481,4 +719,8 @@ def _resolve_selection_strategy(name: str) -> WorkerSelectionStrategy:
 _settings = get_settings()
 run_orchestrator = RunOrchestrator(
     selection_strategy=_resolve_selection_strategy(_settings.dispatch_worker_strategy),
+    concurrency=_settings.dispatch_concurrency,
+    lane_concurrency=_settings.dispatch_lane_concurrency,
+    batch_linger_seconds=_settings.dispatch_batch_linger_ms / 1000.0,
+    batch_max_size=_settings.dispatch_batch_max_size,
 )
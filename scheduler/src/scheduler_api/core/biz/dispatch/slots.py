@@ -0,0 +1,106 @@
+"""Scheduler-side accounting of worker concurrency slots."""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ...network.manager import WorkerSession
+from ..domain.models import DispatchRequest
+
+
+def occupies_slot(request: DispatchRequest) -> bool:
+    """Whether ``request`` takes one of the worker's advertised slots.
+
+    Dispatches issued through ``next()`` (the host, or a middleware after the
+    first) run nested inside the calling middleware and share its slot; the
+    worker exempts them as well, otherwise a chain could deadlock itself.
+    """
+
+    if not request.middleware_chain or not request.host_node_id:
+        return True
+    return request.node_id != request.host_node_id and not (request.chain_index or 0) > 0
+
+
+def has_free_slot(session: WorkerSession, node_type: str) -> bool:
+    """Check ``capabilities.concurrency`` of ``session`` against its reservations."""
+
+    capabilities = session.capabilities
+    if capabilities is None:
+        return True
+    concurrency = capabilities.concurrency
+    reserved = session.reserved_slots
+    if len(reserved) >= concurrency.max_parallel:
+        return False
+    limit = (concurrency.per_node_limits or {}).get(node_type)
+    if limit and sum(1 for reserved_type in reserved.values() if reserved_type == node_type) >= limit:
+        return False
+    return True
+
+
+class WorkerSlots:
+    """Tracks which dispatches hold a slot on which worker session.
+
+    Reservations are stored on the session (``reserved_slots``) so they follow
+    it across resumes and are dropped when the worker re-handshakes; this
+    ledger maps task ids (and the dispatch envelope id, which workers echo as
+    ``corr`` on errors) back to their session so results can release them.
+    """
+
+    def __init__(self, on_change: Optional[Callable[[WorkerSession], None]] = None) -> None:
+        # task_id -> (run_id, session, dispatch_id)
+        self._owners: Dict[str, Tuple[str, WorkerSession, Optional[str]]] = {}
+        self._dispatch_ids: Dict[str, str] = {}
+        self._on_change = on_change
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def admits(self, request: DispatchRequest) -> Optional[Callable[[WorkerSession], bool]]:
+        """Predicate selecting sessions with room for ``request`` (``None`` if it needs no slot)."""
+
+        if not occupies_slot(request):
+            return None
+        node_type = request.node_type
+        return lambda session: has_free_slot(session, node_type)
+
+    def reserve(self, session: WorkerSession, request: DispatchRequest) -> None:
+        if not occupies_slot(request):
+            return
+        self.release(request.task_id)
+        session.reserved_slots[request.task_id] = request.node_type
+        self._owners[request.task_id] = (request.run_id, session, None)
+        self._changed(session)
+
+    def bind_dispatch(self, task_id: str, dispatch_id: str) -> None:
+        owner = self._owners.get(task_id)
+        if owner is not None:
+            self._owners[task_id] = (owner[0], owner[1], dispatch_id)
+            self._dispatch_ids[dispatch_id] = task_id
+
+    def release(self, task_id: Optional[str]) -> Optional[WorkerSession]:
+        """Release by task id or dispatch id; returns the session that regained a slot."""
+
+        if not task_id:
+            return None
+        task_id = self._dispatch_ids.pop(task_id, task_id)
+        owner = self._owners.pop(task_id, None)
+        if owner is None:
+            return None
+        _, session, dispatch_id = owner
+        if dispatch_id is not None:
+            self._dispatch_ids.pop(dispatch_id, None)
+        if session.reserved_slots.pop(task_id, None) is not None:
+            self._changed(session)
+        return session
+
+    def release_run(self, run_id: str) -> List[WorkerSession]:
+        task_ids = [task_id for task_id, owner in self._owners.items() if owner[0] == run_id]
+        released = [self.release(task_id) for task_id in task_ids]
+        return [session for session in released if session is not None]
+
+    def _changed(self, session: WorkerSession) -> None:
+        if self._on_change is not None:
+            self._on_change(session)
+
+
+__all__ = ["WorkerSlots", "has_free_slot", "occupies_slot"]
@@ -10,10 +10,11 @@ from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkf
 from scheduler_api.models.workflow_subgraph import WorkflowSubgraph
 
 from .graph import build_edge_bindings_for_workflow
-from .middleware import extract_middleware_entries
+from .middleware import extract_middleware_entries, index_middleware_chains
 from .models import (
     FrameDefinition,
     FrameRuntimeState,
+    FrameTemplate,
     NodeState,
     RunRecord,
     WorkflowScopeIndex,
@@ -165,6 +166,18 @@ def build_container_frames(
 
 
 def initialise_frame_runtime(record: RunRecord, frame: FrameDefinition) -> FrameRuntimeState:
+    """Return fresh runtime state for ``frame``, cloned from its cached template."""
+
+    template = record.frame_templates.get(frame.frame_id)
+    if template is None or template.definition is not frame:
+        template = FrameTemplate.from_runtime(build_frame_runtime("", frame))
+        record.frame_templates[frame.frame_id] = template
+    return template.instantiate(record.run_id)
+
+
+def build_frame_runtime(run_id: str, frame: FrameDefinition) -> FrameRuntimeState:
+    """Parse ``frame``'s subgraph into runtime state (nodes, dependencies, bindings)."""
+
     workflow = frame.workflow
     nodes: Dict[str, NodeState] = {}
     task_index: Dict[str, NodeState] = {}
@@ -217,7 +230,7 @@ def initialise_frame_runtime(record: RunRecord, frame: FrameDefinition) -> Frame
             package_name=package_name,
             package_version=package_version,
             parameters=parameters,
-            concurrency_key=f"{record.run_id}:{task_namespace}:{node_id}",
+            concurrency_key=f"{run_id}:{task_namespace}:{node_id}",
             frame_id=frame.frame_id,
             container_node_id=frame.container_node_id,
             subgraph_id=frame.subgraph_id,
@@ -244,7 +257,7 @@ def initialise_frame_runtime(record: RunRecord, frame: FrameDefinition) -> Frame
                 package_name=str(mw_package.get("name", "")) if isinstance(mw_package, dict) else "",
                 package_version=str(mw_package.get("version", "")) if isinstance(mw_package, dict) else "",
                 parameters=copy.deepcopy(mw_def.get("parameters", {}) if isinstance(mw_def, dict) else {}),
-                concurrency_key=f"{record.run_id}:{task_namespace}:{mw_id}",
+                concurrency_key=f"{run_id}:{task_namespace}:{mw_id}",
                 middlewares=[],
                 middleware_defs=[],
                 frame_id=frame.frame_id,
@@ -286,7 +299,9 @@ def initialise_frame_runtime(record: RunRecord, frame: FrameDefinition) -> Frame
         edge_bindings=edge_bindings,
         status="running",
         started_at=_utc_now(),
+        middleware_chains=index_middleware_chains(nodes.values()),
     )
+    frame_state.ready.track(nodes)
     return frame_state
 
 
@@ -294,11 +309,20 @@ def activate_frame(record: RunRecord, frame: FrameDefinition) -> FrameRuntimeSta
     frame_state = initialise_frame_runtime(record, frame)
     record.active_frames[frame.frame_id] = frame_state
     record.frame_stack.append(frame.frame_id)
+    for task_id in frame_state.task_index:
+        record.frame_tasks[task_id] = frame.frame_id
     return frame_state
 
 
 def pop_frame(record: RunRecord, frame_id: str) -> None:
-    record.active_frames.pop(frame_id, None)
+    frame_state = record.active_frames.pop(frame_id, None)
+    if frame_state is not None:
+        for task_id in frame_state.task_index:
+            if record.frame_tasks.get(task_id) == frame_id:
+                del record.frame_tasks[task_id]
+        for node in frame_state.nodes.values():
+            if node.dispatch_id and record.dispatch_index.get(node.dispatch_id) == (frame_id, node.node_id):
+                del record.dispatch_index[node.dispatch_id]
     if record.frame_stack and record.frame_stack[-1] == frame_id:
         record.frame_stack.pop()
         return
@@ -214,6 +214,7 @@ def apply_middleware_output_bindings(host_state: NodeState, middleware_state: No
                 host_state.result = {}
             target_container = host_state.result
         _set_nested_value(target_container, path, value)
+        host_state.touch()
 
 
 def apply_frame_edge_bindings(frame: FrameRuntimeState, node: NodeState) -> None:
@@ -260,3 +261,4 @@ def apply_edge_bindings_for_graph(
                 target_container = {}
                 target_node.result = target_container
         _set_nested_value(target_container, entry.target_path, value)
+        target_node.touch()
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
+# middleware node id -> (host node id, full chain, position of the middleware in it)
+MiddlewareChain = Tuple[str, Tuple[str, ...], int]
+
 
 def extract_middleware_entries(raw: Optional[Any]) -> Tuple[List[str], List[Dict[str, Any]]]:
     ids: List[str] = []
@@ -40,3 +43,15 @@ def extract_middleware_entries(raw: Optional[Any]) -> Tuple[List[str], List[Dict
             ids.append(mw_id)
             defs.append({"id": mw_id})
     return ids, defs
+
+
+def index_middleware_chains(nodes: Iterable[Any]) -> Dict[str, MiddlewareChain]:
+    """Map every middleware id to the first host (in node order) that chains it."""
+
+    index: Dict[str, MiddlewareChain] = {}
+    for node in nodes:
+        chain = tuple(getattr(node, "middlewares", None) or ())
+        for position, mw_id in enumerate(chain):
+            if mw_id not in index:
+                index[mw_id] = (node.node_id, chain, position)
+    return index
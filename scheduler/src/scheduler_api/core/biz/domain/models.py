@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import copy
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from dataclasses import FrozenInstanceError, dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
 from scheduler_api.models.list_runs200_response_items_inner import ListRuns200ResponseItemsInner
 from scheduler_api.models.list_runs200_response_items_inner_artifacts_inner import (
@@ -13,12 +17,14 @@ from scheduler_api.models.list_runs200_response_items_inner_artifacts_inner impo
 from scheduler_api.models.list_runs200_response_items_inner_error import (
     ListRuns200ResponseItemsInnerError,
 )
+from scheduler_api.models.list_runs200_response_items_inner_memo import ListRuns200ResponseItemsInnerMemo
 from scheduler_api.models.list_runs200_response_items_inner_nodes_inner import (
     ListRuns200ResponseItemsInnerNodesInner,
 )
 from scheduler_api.models.start_run202_response import StartRun202Response
 from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
 from ..events.format import format_artifact, format_node
+from .middleware import MiddlewareChain, index_middleware_chains
 
 
 def _utc_now() -> datetime:
@@ -27,6 +33,29 @@ def _utc_now() -> datetime:
 
 FINAL_STATUSES = {"succeeded", "failed", "cancelled", "skipped"}
 
+# (created_at, run_id): the order runs are listed and paged in
+RunKey = Tuple[datetime, str]
+
+# NodeState fields holding mutable containers that the engine edits in place;
+# snapshots deep-copy only these and share every other value.
+_NODE_CONTAINER_FIELDS = (
+    "parameters",
+    "resource_refs",
+    "affinity",
+    "artifacts",
+    "result",
+    "metadata",
+    "middleware_defs",
+)
+_NODE_LIST_FIELDS = ("dependencies", "dependents", "middlewares")
+# NodeState fields that decide whether a node can be dispatched; assigning any
+# of them puts the node back into its run's (or frame's) ready set.
+_NODE_READINESS_FIELDS = frozenset(
+    {"status", "pending_dependencies", "enqueued", "chain_blocked", "middlewares", "metadata"}
+)
+# NodeState fields that feed the run rollup (status, start time, artifacts, error).
+_NODE_ROLLUP_FIELDS = frozenset({"status", "started_at", "artifacts", "error"})
+
 
 @dataclass(frozen=True)
 class BindingScopeHint:
@@ -211,6 +240,297 @@ class NodeState:
     middlewares: List[str] = field(default_factory=list)
     middleware_defs: List[Dict[str, Any]] = field(default_factory=list)
     chain_blocked: bool = False
+    revision: int = field(default=0, init=False, repr=False, compare=False)
+    _snapshot: Optional["NodeState"] = field(default=None, init=False, repr=False, compare=False)
+    _snapshot_revision: int = field(default=-1, init=False, repr=False, compare=False)
+    _frozen: bool = field(default=False, init=False, repr=False, compare=False)
+    _ready_set: Optional["ReadySet"] = field(default=None, init=False, repr=False, compare=False)
+    _rollup: Optional["RunRollup"] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        state = self.__dict__
+        if state.get("_frozen"):
+            raise FrozenInstanceError(f"cannot assign to field {name!r} of a node snapshot")
+        rollup = state.get("_rollup") if name in _NODE_ROLLUP_FIELDS else None
+        previous = state.get(name) if rollup is not None else None
+        object.__setattr__(self, name, value)
+        if rollup is not None:
+            rollup.observe(self, name, previous)
+        if not name.startswith("_") and name != "revision":
+            state["revision"] = state.get("revision", 0) + 1
+            if name in _NODE_READINESS_FIELDS:
+                ready_set = state.get("_ready_set")
+                if ready_set is not None:
+                    ready_set.mark(state["node_id"])
+
+    def touch(self) -> None:
+        """Mark the node changed after an in-place edit of one of its containers."""
+
+        self.revision += 1
+
+    def snapshot(self) -> "NodeState":
+        """Return a frozen copy, reusing the previous one while the node is unchanged."""
+
+        if self._frozen:
+            return self
+        cached = self._snapshot
+        if cached is not None and self._snapshot_revision == self.revision:
+            return cached
+        view = copy.copy(self)
+        state = view.__dict__
+        for name in _NODE_CONTAINER_FIELDS:
+            value = state[name]
+            if value is not None:
+                state[name] = copy.deepcopy(value)
+        for name in _NODE_LIST_FIELDS:
+            state[name] = list(state[name])
+        state["_snapshot"] = None
+        state["_snapshot_revision"] = -1
+        state["_ready_set"] = None
+        state["_rollup"] = None
+        state["_frozen"] = True
+        self._snapshot = view
+        self._snapshot_revision = self.revision
+        return view
+
+
+class ReadySet:
+    """Nodes whose dispatch readiness may have changed since the last collection.
+
+    Tracked nodes report themselves whenever one of the fields that gate
+    dispatch is assigned, so the engine only re-checks those candidates instead
+    of scanning the whole graph. :meth:`drain` hands them back in workflow order.
+    """
+
+    __slots__ = ("_order", "_pending")
+
+    def __init__(self) -> None:
+        self._order: Dict[str, int] = {}
+        self._pending: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def track(self, nodes: Dict[str, "NodeState"]) -> None:
+        """Adopt ``nodes`` (in order) and mark every one of them as a candidate."""
+
+        for node_id, node in nodes.items():
+            self._order.setdefault(node_id, len(self._order))
+            node._ready_set = self
+            self._pending.add(node_id)
+
+    def mark(self, node_id: str) -> None:
+        self._pending.add(node_id)
+
+    def drain(self) -> List[str]:
+        pending = self._pending
+        self._pending = set()
+        order = self._order
+        return sorted(pending, key=lambda node_id: order.get(node_id, len(order)))
+
+
+class RunRollup:
+    """Running aggregates over a run's root nodes, kept current on every assignment.
+
+    Tracked nodes report changes to ``status``, ``started_at``, ``artifacts``
+    and ``error``, so :meth:`RunRecord.refresh_rollup` reads counters instead
+    of rescanning the graph: a count per status, a lazily pruned min-heap of
+    start times, ordinals of the nodes carrying artifacts or errors, and the
+    concatenated artifact list, extended in place while nodes finish in
+    workflow order and rebuilt only when an earlier node changes its artifacts.
+    """
+
+    __slots__ = (
+        "_nodes",
+        "_order",
+        "_status_counts",
+        "_started",
+        "_with_artifacts",
+        "_with_error",
+        "_stale",
+        "artifacts",
+    )
+
+    def __init__(self) -> None:
+        # node ordinal -> node, in workflow order
+        self._nodes: List["NodeState"] = []
+        self._order: Dict[str, int] = {}
+        self._status_counts: Dict[str, int] = {}
+        self._started: List[Tuple[datetime, int]] = []
+        self._with_artifacts: List[int] = []
+        self._with_error: List[int] = []
+        self.artifacts: List[Dict[str, Any]] = []
+        self._stale = False
+
+    def track(self, nodes: Dict[str, "NodeState"]) -> None:
+        for node_id, node in nodes.items():
+            if node_id in self._order:
+                continue
+            ordinal = len(self._order)
+            self._order[node_id] = ordinal
+            self._nodes.append(node)
+            node._rollup = self
+            self._count(node.status, 1)
+            if node.started_at is not None:
+                heapq.heappush(self._started, (node.started_at, ordinal))
+            if node.error is not None:
+                insort(self._with_error, ordinal)
+            if node.artifacts:
+                self._add_artifacts(ordinal, node.artifacts)
+
+    def observe(self, node: "NodeState", name: str, previous: Any) -> None:
+        ordinal = self._order[node.node_id]
+        if name == "status":
+            self._count(previous, -1)
+            self._count(node.status, 1)
+        elif name == "started_at":
+            if node.started_at is not None:
+                heapq.heappush(self._started, (node.started_at, ordinal))
+        elif name == "error":
+            if (previous is None) != (node.error is None):
+                if node.error is None:
+                    self._with_error.pop(bisect_left(self._with_error, ordinal))
+                else:
+                    insort(self._with_error, ordinal)
+        elif name == "artifacts":
+            # ``previous`` may be the same list edited in place, so check membership instead.
+            index = bisect_left(self._with_artifacts, ordinal)
+            if index < len(self._with_artifacts) and self._with_artifacts[index] == ordinal:
+                self._with_artifacts.pop(index)
+                self._stale = True
+            if node.artifacts:
+                self._add_artifacts(ordinal, node.artifacts)
+
+    @property
+    def statuses(self) -> Set[str]:
+        return {status for status, count in self._status_counts.items() if count}
+
+    @property
+    def unfinished(self) -> int:
+        return sum(count for status, count in self._status_counts.items() if status not in FINAL_STATUSES)
+
+    def earliest_start(self) -> Optional[datetime]:
+        heap = self._started
+        nodes = self._nodes
+        while heap:
+            started_at, ordinal = heap[0]
+            if nodes[ordinal].started_at == started_at:
+                return started_at
+            heapq.heappop(heap)
+        return None
+
+    def first_error(self) -> Optional[ListRuns200ResponseItemsInnerError]:
+        if not self._with_error:
+            return None
+        return self._nodes[self._with_error[0]].error
+
+    def collect_artifacts(self) -> List[Dict[str, Any]]:
+        if self._stale:
+            nodes = self._nodes
+            self.artifacts = [
+                artifact for ordinal in self._with_artifacts for artifact in nodes[ordinal].artifacts
+            ]
+            self._stale = False
+        return self.artifacts
+
+    def _count(self, status: str, delta: int) -> None:
+        self._status_counts[status] = self._status_counts.get(status, 0) + delta
+
+    def _add_artifacts(self, ordinal: int, artifacts: List[Dict[str, Any]]) -> None:
+        if self._with_artifacts and ordinal < self._with_artifacts[-1]:
+            self._stale = True
+        elif not self._stale:
+            self.artifacts.extend(artifacts)
+        insort(self._with_artifacts, ordinal)
+
+
+class RunListIndex:
+    """Run keys kept sorted per ``(status, client_id)`` filter for keyset listing.
+
+    Every run sits in four sorted lists: all runs, its status, its client and
+    the pair of both, with ``None`` standing for "any". Indexed records report
+    their own status changes, so :meth:`page` is a bisect plus a slice of the
+    list matching the filters, whatever the number of runs.
+    """
+
+    __slots__ = ("_entries", "_lists")
+
+    def __init__(self) -> None:
+        # run_id -> (key, status, client_id) as currently indexed
+        self._entries: Dict[str, Tuple[RunKey, str, str]] = {}
+        self._lists: Dict[Tuple[Optional[str], Optional[str]], List[RunKey]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, record: "RunRecord") -> None:
+        self.remove(record.run_id)
+        key = (record.created_at, record.run_id)
+        self._entries[record.run_id] = (key, record.status, record.client_id)
+        for filters in self._filters(record.status, record.client_id):
+            insort(self._lists.setdefault(filters, []), key)
+        record._list_index = self
+
+    def remove(self, run_id: str) -> None:
+        entry = self._entries.pop(run_id, None)
+        if entry is None:
+            return
+        key, status, client_id = entry
+        for filters in self._filters(status, client_id):
+            self._discard(filters, key)
+
+    def observe(self, record: "RunRecord") -> None:
+        entry = self._entries.get(record.run_id)
+        if entry is None or entry[1] == record.status:
+            return
+        key, previous, client_id = entry
+        self._discard((previous, None), key)
+        self._discard((previous, client_id), key)
+        insort(self._lists.setdefault((record.status, None), []), key)
+        insort(self._lists.setdefault((record.status, client_id), []), key)
+        self._entries[record.run_id] = (key, record.status, client_id)
+
+    def page(
+        self,
+        *,
+        after: Optional[RunKey],
+        limit: int,
+        status: Optional[str] = None,
+        client_id: Optional[str] = None,
+    ) -> List[str]:
+        """Ids of the first ``limit`` matching runs ordered after ``after``."""
+
+        keys = self._lists.get((status or None, client_id or None), [])
+        start = bisect_right(keys, after) if after else 0
+        return [run_id for _created_at, run_id in keys[start : start + limit]]
+
+    def count(
+        self,
+        *,
+        after: Optional[RunKey],
+        until: Optional[RunKey] = None,
+        status: Optional[str] = None,
+        client_id: Optional[str] = None,
+    ) -> int:
+        """Number of matching runs ordered after ``after`` and up to ``until`` inclusive."""
+
+        keys = self._lists.get((status or None, client_id or None), [])
+        end = bisect_right(keys, until) if until else len(keys)
+        return max(end - (bisect_right(keys, after) if after else 0), 0)
+
+    @staticmethod
+    def _filters(status: str, client_id: str) -> Tuple[Tuple[Optional[str], Optional[str]], ...]:
+        return ((None, None), (status, None), (None, client_id), (status, client_id))
+
+    def _discard(self, filters: Tuple[Optional[str], Optional[str]], key: RunKey) -> None:
+        keys = self._lists.get(filters)
+        if not keys:
+            return
+        index = bisect_left(keys, key)
+        if index < len(keys) and keys[index] == key:
+            del keys[index]
+        if not keys:
+            del self._lists[filters]
 
 
 @dataclass
@@ -233,6 +553,8 @@ class FrameRuntimeState:
     status: str = "idle"
     started_at: Optional[datetime] = None
     finished_at: Optional[datetime] = None
+    ready: ReadySet = field(default_factory=ReadySet, repr=False, compare=False)
+    middleware_chains: Dict[str, MiddlewareChain] = field(default_factory=dict, repr=False, compare=False)
 
     @property
     def frame_id(self) -> str:
@@ -246,6 +568,215 @@ class FrameRuntimeState:
     def parent_frame_id(self) -> Optional[str]:
         return self.definition.parent_frame_id
 
+    def snapshot(self) -> "FrameRuntimeState":
+        # Definition, scope index and edge bindings are built once per frame and never edited.
+        view = copy.copy(self)
+        view.nodes = {node_id: node.snapshot() for node_id, node in self.nodes.items()}
+        view.task_index = {
+            task_id: view.nodes.get(node.node_id) or node.snapshot()
+            for task_id, node in self.task_index.items()
+        }
+        return view
+
+
+@dataclass(frozen=True)
+class NodeTemplate:
+    """Definition-derived part of a ``NodeState``; copied into every run or frame activation."""
+
+    node_id: str
+    task_id: str
+    # concurrency_key without the leading run id
+    concurrency_scope: str
+    node_type: str
+    package_name: str
+    package_version: str
+    parameters: Dict[str, Any]
+    middlewares: Tuple[str, ...]
+    middleware_defs: Tuple[Dict[str, Any], ...]
+    metadata: Optional[Dict[str, Any]]
+    chain_blocked: bool
+    dependencies: Tuple[str, ...]
+    dependents: Tuple[str, ...]
+    pending_dependencies: int
+    frame_id: Optional[str] = None
+    container_node_id: Optional[str] = None
+    subgraph_id: Optional[str] = None
+    frame_alias: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_node(cls, node: NodeState, *, run_id: str = "") -> "NodeTemplate":
+        return cls(
+            node_id=node.node_id,
+            task_id=node.task_id,
+            concurrency_scope=node.concurrency_key[len(run_id) + 1 :],
+            node_type=node.node_type,
+            package_name=node.package_name,
+            package_version=node.package_version,
+            parameters=node.parameters,
+            middlewares=tuple(node.middlewares),
+            middleware_defs=tuple(node.middleware_defs),
+            metadata=node.metadata,
+            chain_blocked=node.chain_blocked,
+            dependencies=tuple(node.dependencies),
+            dependents=tuple(node.dependents),
+            pending_dependencies=node.pending_dependencies,
+            frame_id=node.frame_id,
+            container_node_id=node.container_node_id,
+            subgraph_id=node.subgraph_id,
+            frame_alias=node.frame_alias,
+        )
+
+    def instantiate(self, run_id: str) -> NodeState:
+        return NodeState(
+            node_id=self.node_id,
+            task_id=self.task_id,
+            node_type=self.node_type,
+            package_name=self.package_name,
+            package_version=self.package_version,
+            parameters=copy.deepcopy(self.parameters),
+            concurrency_key=f"{run_id}:{self.concurrency_scope}",
+            metadata=copy.deepcopy(self.metadata),
+            dependencies=list(self.dependencies),
+            dependents=list(self.dependents),
+            pending_dependencies=self.pending_dependencies,
+            frame_id=self.frame_id,
+            container_node_id=self.container_node_id,
+            subgraph_id=self.subgraph_id,
+            frame_alias=self.frame_alias,
+            middlewares=list(self.middlewares),
+            middleware_defs=copy.deepcopy(list(self.middleware_defs)),
+            chain_blocked=self.chain_blocked,
+        )
+
+
+@dataclass(frozen=True)
+class FrameTemplate:
+    """Everything a frame activation needs that does not change between activations.
+
+    Built from the first activation of a frame definition; later activations
+    only clone the node templates instead of re-parsing the subgraph.
+    """
+
+    definition: FrameDefinition
+    nodes: Tuple[NodeTemplate, ...]
+    scope_index: WorkflowScopeIndex
+    edge_bindings: Dict[str, List[EdgeBinding]]
+    middleware_chains: Dict[str, MiddlewareChain]
+
+    @classmethod
+    def from_runtime(cls, frame: FrameRuntimeState, *, run_id: str = "") -> "FrameTemplate":
+        return cls(
+            definition=frame.definition,
+            nodes=tuple(NodeTemplate.from_node(node, run_id=run_id) for node in frame.nodes.values()),
+            scope_index=frame.scope_index,
+            edge_bindings=frame.edge_bindings,
+            middleware_chains=frame.middleware_chains,
+        )
+
+    def instantiate(self, run_id: str) -> FrameRuntimeState:
+        nodes = {template.node_id: template.instantiate(run_id) for template in self.nodes}
+        frame_state = FrameRuntimeState(
+            definition=self.definition,
+            nodes=nodes,
+            task_index={node.task_id: node for node in nodes.values()},
+            scope_index=self.scope_index,
+            edge_bindings=self.edge_bindings,
+            status="running",
+            started_at=_utc_now(),
+            middleware_chains=self.middleware_chains,
+        )
+        frame_state.ready.track(nodes)
+        return frame_state
+
+
+@dataclass
+class FrameIteration:
+    """One completed activation of a frame with the final snapshots of its nodes."""
+
+    iteration: int
+    status: str
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    nodes: Dict[str, NodeState]
+
+    @property
+    def duration_ms(self) -> Optional[int]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return int((self.finished_at - self.started_at).total_seconds() * 1000)
+
+    def to_summary(self) -> Dict[str, Any]:
+        return {
+            "iteration": self.iteration,
+            "status": self.status,
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at,
+            "durationMs": self.duration_ms,
+        }
+
+    def to_detail(self, record: "RunRecord") -> Dict[str, Any]:
+        detail = self.to_summary()
+        detail["nodes"] = [format_node(node, record=record) for node in self.nodes.values()]
+        return detail
+
+
+@dataclass
+class FrameHistory:
+    """Completed iterations of one frame.
+
+    The newest ``limit`` iterations stay in memory with full node snapshots;
+    older ones are folded into the running totals below and handed back by
+    :meth:`record` so the caller can spill their details elsewhere.
+    """
+
+    frame_id: str
+    container_node_id: str
+    limit: int
+    recent: Deque[FrameIteration] = field(default_factory=deque)
+    iterations: int = 0
+    folded: int = 0
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    duration_ms: int = 0
+    artifacts: List[Dict[str, Any]] = field(default_factory=list)
+
+    def record(self, frame: "FrameRuntimeState", nodes: Dict[str, NodeState]) -> List[FrameIteration]:
+        self.iterations += 1
+        iteration = FrameIteration(
+            iteration=self.iterations,
+            status=frame.status,
+            started_at=frame.started_at,
+            finished_at=frame.finished_at,
+            nodes=nodes,
+        )
+        self.status_counts[iteration.status] = self.status_counts.get(iteration.status, 0) + 1
+        self.duration_ms += iteration.duration_ms or 0
+        for node in nodes.values():
+            self.artifacts.extend(node.artifacts or [])
+        self.recent.append(iteration)
+        evicted: List[FrameIteration] = []
+        while len(self.recent) > self.limit:
+            evicted.append(self.recent.popleft())
+        self.folded += len(evicted)
+        return evicted
+
+    def find(self, iteration: int) -> Optional[FrameIteration]:
+        for candidate in self.recent:
+            if candidate.iteration == iteration:
+                return candidate
+        return None
+
+    def to_summary(self) -> Dict[str, Any]:
+        return {
+            "frameId": self.frame_id,
+            "containerNodeId": self.container_node_id,
+            "iterations": self.iterations,
+            "foldedIterations": self.folded,
+            "statusCounts": dict(self.status_counts),
+            "durationMs": self.duration_ms,
+            "artifacts": [format_artifact(artifact) for artifact in self.artifacts],
+            "recent": [iteration.to_summary() for iteration in self.recent],
+        }
+
 
 @dataclass
 class RunRecord:
@@ -269,6 +800,9 @@ class RunRecord:
     result_payload: Optional[Dict[str, Any]] = None
     duration_ms: Optional[int] = None
     artifacts: List[Dict[str, Any]] = field(default_factory=list)
+    # nodes completed from / dispatched past the memoized-result cache
+    memo_hits: int = 0
+    memo_misses: int = 0
     nodes: Dict[str, NodeState] = field(default_factory=dict)
     task_index: Dict[str, NodeState] = field(default_factory=dict)
     edge_bindings: Dict[str, List[EdgeBinding]] = field(default_factory=dict)
@@ -278,6 +812,76 @@ class RunRecord:
     active_frames: Dict[str, "FrameRuntimeState"] = field(default_factory=dict)
     frame_stack: List[str] = field(default_factory=list)
     completed_frames: Dict[str, Dict[str, NodeState]] = field(default_factory=dict)
+    # frame_id -> bounded per-iteration history; completed_frames keeps the latest iteration
+    frame_history: Dict[str, FrameHistory] = field(default_factory=dict)
+    # task_id -> frame_id for nodes of active frames (root nodes live in task_index)
+    frame_tasks: Dict[str, str] = field(default_factory=dict)
+    # dispatch_id -> (frame_id, node_id) for nodes with a dispatch in flight
+    dispatch_index: Dict[str, Tuple[Optional[str], str]] = field(default_factory=dict)
+    # root nodes to re-check on the next collection (frames keep their own)
+    ready: ReadySet = field(default_factory=ReadySet, repr=False, compare=False)
+    rollup: RunRollup = field(default_factory=RunRollup, repr=False, compare=False)
+    # middleware id -> (host, chain, position) over root nodes; built once with the graph
+    middleware_chains: Dict[str, MiddlewareChain] = field(default_factory=dict, repr=False, compare=False)
+    # frame_id -> runtime template reused by later activations of that frame
+    frame_templates: Dict[str, FrameTemplate] = field(default_factory=dict, repr=False, compare=False)
+    # node_id -> definition fingerprint of root nodes; shared with the plan
+    node_fingerprints: Dict[str, str] = field(default_factory=dict, repr=False, compare=False)
+    version: int = field(default=0, compare=False)
+    _frozen: bool = field(default=False, init=False, repr=False, compare=False)
+    _list_index: Optional[RunListIndex] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.nodes:
+            self.attach_nodes(self.nodes)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        state = self.__dict__
+        if state.get("_frozen"):
+            raise FrozenInstanceError(f"cannot assign to field {name!r} of a run snapshot")
+        object.__setattr__(self, name, value)
+        if name == "status" and state.get("_list_index") is not None:
+            state["_list_index"].observe(self)
+
+    def touch(self) -> None:
+        """Advance the record version; call once per state transition."""
+
+        self.version += 1
+
+    def snapshot(self) -> "RunRecord":
+        """Return a frozen view that shares unchanged state with the live record.
+
+        The workflow definition, frame definitions, scope index and edge
+        bindings are immutable once built and are shared by reference. Nodes
+        are copied through ``NodeState.snapshot`` so only nodes touched since
+        the previous snapshot are copied again.
+        """
+
+        view = copy.copy(self)
+        state = view.__dict__
+        nodes = {node_id: node.snapshot() for node_id, node in self.nodes.items()}
+        state["nodes"] = nodes
+        state["task_index"] = {
+            task_id: nodes.get(node.node_id) or node.snapshot()
+            for task_id, node in self.task_index.items()
+        }
+        state["frames"] = dict(self.frames)
+        state["frames_by_parent"] = dict(self.frames_by_parent)
+        state["active_frames"] = {
+            frame_id: frame.snapshot() for frame_id, frame in self.active_frames.items()
+        }
+        state["frame_stack"] = list(self.frame_stack)
+        state["frame_tasks"] = dict(self.frame_tasks)
+        state["dispatch_index"] = dict(self.dispatch_index)
+        # Archived frame nodes are stored as snapshots already.
+        state["completed_frames"] = {
+            frame_id: dict(frame_nodes) for frame_id, frame_nodes in self.completed_frames.items()
+        }
+        state["artifacts"] = list(self.artifacts)
+        state["result_payload"] = copy.deepcopy(self.result_payload)
+        state["_list_index"] = None
+        state["_frozen"] = True
+        return view
 
     def to_summary(self) -> ListRuns200ResponseItemsInner:
         artifacts = [
@@ -321,6 +925,9 @@ class RunRecord:
             error=self.error,
             artifacts=artifacts,
             nodes=nodes,
+            memo=ListRuns200ResponseItemsInnerMemo(hits=self.memo_hits, misses=self.memo_misses)
+            if self.memo_hits or self.memo_misses
+            else None,
         )
 
     def to_start_response(self) -> StartRun202Response:
@@ -332,11 +939,30 @@ class RunRecord:
             createdAt=self.created_at,
         )
 
+    def attach_nodes(
+        self,
+        nodes: Dict[str, NodeState],
+        *,
+        middleware_chains: Optional[Dict[str, MiddlewareChain]] = None,
+    ) -> None:
+        """Install the root node graph, index its middleware chains and start tracking it."""
+
+        self.nodes = nodes
+        self.ready = ReadySet()
+        self.ready.track(nodes)
+        self.rollup = RunRollup()
+        self.rollup.track(nodes)
+        if middleware_chains is None:
+            middleware_chains = index_middleware_chains(nodes.values())
+        self.middleware_chains = middleware_chains
+
     def get_node(self, node_id: str, *, task_id: Optional[str] = None) -> NodeState:
         node = self.nodes.get(node_id)
         if not node:
             node = NodeState(node_id=node_id, task_id=task_id or node_id)
             self.nodes[node_id] = node
+            self.ready.track({node_id: node})
+            self.rollup.track({node_id: node})
             if node.task_id:
                 self.task_index[node.task_id] = node
         if task_id:
@@ -348,14 +974,31 @@ class RunRecord:
         return node
 
     def find_node_by_task(self, task_id: str) -> Optional[NodeState]:
-        for node in self.nodes.values():
-            if node.task_id == task_id:
-                return node
-        return None
+        node = self.task_index.get(task_id)
+        return node if node is not None and node.task_id == task_id else None
+
+    def bind_dispatch(self, node: NodeState, dispatch_id: Optional[str]) -> None:
+        """Set ``node.dispatch_id`` and keep ``dispatch_index`` in step."""
+
+        if node.dispatch_id and self.dispatch_index.get(node.dispatch_id, (None, None))[1] == node.node_id:
+            self.dispatch_index.pop(node.dispatch_id, None)
+        node.dispatch_id = dispatch_id
+        if dispatch_id:
+            self.dispatch_index[dispatch_id] = (node.frame_id, node.node_id)
+
+    def clear_dispatch(self, node: NodeState) -> None:
+        self.bind_dispatch(node, None)
+
+    @property
+    def settled(self) -> bool:
+        """Finished, with no node still running and no dispatch in flight."""
+
+        return self.status in FINAL_STATUSES and not self.rollup.unfinished and not self.dispatch_index
 
     def refresh_rollup(self) -> None:
         if self.nodes:
-            statuses = {node.status for node in self.nodes.values()}
+            rollup = self.rollup
+            statuses = rollup.statuses
             if "failed" in statuses:
                 self.status = "failed"
             elif statuses.issubset({"queued"}):
@@ -370,10 +1013,10 @@ class RunRecord:
             else:
                 self.status = "running"
 
-            started_nodes = [node.started_at for node in self.nodes.values() if node.started_at]
-            if started_nodes:
-                self.started_at = min(started_nodes)
-            finished = all(node.status in FINAL_STATUSES for node in self.nodes.values())
+            earliest_start = rollup.earliest_start()
+            if earliest_start:
+                self.started_at = earliest_start
+            finished = rollup.unfinished == 0
             if not finished and self.status == "failed":
                 finished = True
             if finished:
@@ -382,13 +1025,8 @@ class RunRecord:
             else:
                 self.finished_at = None
 
-            self.artifacts = [
-                artifact
-                for node in self.nodes.values()
-                for artifact in (node.artifacts or [])
-            ]
+            self.artifacts = rollup.collect_artifacts()
             if self.status == "failed":
-                failed_error = next((node.error for node in self.nodes.values() if node.error), None)
-                self.error = failed_error
+                self.error = rollup.first_error()
             elif self.status == "succeeded":
                 self.error = None
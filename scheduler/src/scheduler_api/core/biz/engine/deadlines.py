@@ -0,0 +1,169 @@
+"""Deadline tracking shared by dispatch acks and middleware next requests."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from collections.abc import MutableMapping
+from datetime import datetime, timezone
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+ExpiryHandler = Callable[[List[Tuple[K, V]]], Awaitable[None]]
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class DeadlineScheduler(MutableMapping, Generic[K, V]):
+    """Mapping whose entries expire at a deadline derived from their value.
+
+    Deadlines live in a min-heap next to the entry table. Removing an entry
+    (``pop``/``del``/``cancel``) is a dict operation; its heap slot is left
+    behind and skipped when it surfaces, and the heap is rebuilt once stale
+    slots outnumber live entries. ``pop_expired`` removes every due entry in
+    one pass, and ``start`` drives expiry from a single coroutine that sleeps
+    until the earliest deadline.
+    """
+
+    def __init__(
+        self,
+        deadline_of: Callable[[V], Optional[datetime]],
+        *,
+        clock: Callable[[], datetime] = _utc_now,
+        name: str = "deadline-scheduler",
+    ) -> None:
+        self._deadline_of = deadline_of
+        self._clock = clock
+        self._name = name
+        self._entries: Dict[K, Tuple[int, V]] = {}
+        self._heap: List[Tuple[float, int, K]] = []
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    # mapping protocol -------------------------------------------------
+
+    def __getitem__(self, key: K) -> V:
+        return self._entries[key][1]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        token = next(self._sequence)
+        self._entries[key] = (token, value)
+        deadline = self._deadline_of(value)
+        if deadline is None:
+            return
+        when = deadline.timestamp()
+        earliest = self._heap[0][0] if self._heap else None
+        heapq.heappush(self._heap, (when, token, key))
+        if self._wakeup is not None and (earliest is None or when < earliest):
+            self._wakeup.set()
+
+    def __delitem__(self, key: K) -> None:
+        del self._entries[key]
+        self._maybe_compact()
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._heap.clear()
+
+    # deadlines --------------------------------------------------------
+
+    def cancel(self, key: K) -> Optional[V]:
+        return self.pop(key, None)
+
+    def next_deadline(self) -> Optional[float]:
+        """Epoch seconds of the earliest live deadline, if any."""
+
+        self._discard_stale_head()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_expired(self, now: Optional[datetime] = None) -> List[Tuple[K, V]]:
+        """Remove and return every entry whose deadline has passed, earliest first."""
+
+        cutoff = (now or self._clock()).timestamp()
+        expired: List[Tuple[K, V]] = []
+        while self._heap and self._heap[0][0] < cutoff:
+            _, token, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != token:
+                continue
+            del self._entries[key]
+            expired.append((key, entry[1]))
+        return expired
+
+    def start(self, on_expired: ExpiryHandler[K, V]) -> None:
+        """Run ``on_expired`` with each batch of due entries from one background task."""
+
+        if self._task and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._runner(on_expired), name=self._name)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        self._wakeup = None
+        if task:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _runner(self, on_expired: ExpiryHandler[K, V]) -> None:
+        assert self._wakeup is not None
+        wakeup = self._wakeup
+        while True:
+            deadline = self.next_deadline()
+            timeout = None if deadline is None else max(deadline - self._clock().timestamp(), 0.0)
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            expired = self.pop_expired()
+            if not expired:
+                continue
+            try:
+                await on_expired(expired)
+            except Exception:  # noqa: BLE001
+                LOGGER.exception("%s failed to handle %d expired entries", self._name, len(expired))
+
+    def _discard_stale_head(self) -> None:
+        while self._heap:
+            _, token, key = self._heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == token:
+                return
+            heapq.heappop(self._heap)
+
+    def _maybe_compact(self) -> None:
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = [item for item in self._heap if self._entries.get(item[2], (None,))[0] == item[1]]
+            heapq.heapify(self._heap)
+
+
+__all__ = ["DeadlineScheduler", "ExpiryHandler"]
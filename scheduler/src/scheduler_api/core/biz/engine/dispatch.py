@@ -14,6 +14,7 @@ from ..domain.models import (
     NodeState,
     RunRecord,
 )
+from .lookup import find_middleware_chain
 
 
 def is_middleware_node(node: NodeState) -> bool:
@@ -62,32 +63,11 @@ def resolve_middleware_chain(
     record: RunRecord,
     node: NodeState,
 ) -> Optional[Tuple[str, List[str], int]]:
-    target_id = node.node_id
-
-    def _scan(nodes: Dict[str, NodeState]) -> Optional[Tuple[str, List[str], int]]:
-        for candidate in nodes.values():
-            chain = getattr(candidate, "middlewares", []) or []
-            if target_id in chain:
-                try:
-                    return candidate.node_id, chain, chain.index(target_id)
-                except ValueError:
-                    continue
+    found = find_middleware_chain(record, node.node_id, frame_id=node.frame_id)
+    if not found:
         return None
-
-    if node.frame_id and node.frame_id in record.active_frames:
-        frame = record.active_frames.get(node.frame_id)
-        if frame:
-            found = _scan(frame.nodes)
-            if found:
-                return found
-    found = _scan(record.nodes)
-    if found:
-        return found
-    for frame in record.active_frames.values():
-        found = _scan(frame.nodes)
-        if found:
-            return found
-    return None
+    host_node_id, chain, index = found
+    return host_node_id, list(chain), index
 
 
 def build_dispatch_request_for_node(
@@ -120,7 +100,11 @@ def collect_ready_for_record(
     state_events: Optional[List[Tuple[RunRecord, NodeState]]] = None,
 ) -> List[DispatchRequest]:
     ready: List[DispatchRequest] = []
-    for node in record.nodes.values():
+    # Only nodes whose gating fields changed since the last pass can have become ready.
+    for node_id in record.ready.drain():
+        node = record.nodes.get(node_id)
+        if node is None:
+            continue
         if is_container_node(node):
             if not is_container_ready(node):
                 continue
@@ -150,7 +134,10 @@ def collect_ready_for_frame(
     state_events: Optional[List[Tuple[RunRecord, NodeState]]] = None,
 ) -> List[DispatchRequest]:
     ready: List[DispatchRequest] = []
-    for node in frame.nodes.values():
+    for node_id in frame.ready.drain():
+        node = frame.nodes.get(node_id)
+        if node is None:
+            continue
         if is_container_node(node):
             if not is_container_ready(node):
                 continue
@@ -218,9 +205,10 @@ def start_container_execution(
     frame_state = activate_frame(record, frame_definition)
     if state_events is not None:
         # Emit a fresh state event for the container and all subgraph nodes so UIs see them queued again.
-        state_events.append((copy.deepcopy(record), copy.deepcopy(container_node)))
+        record_snapshot = record.snapshot()
+        state_events.append((record_snapshot, container_node.snapshot()))
         for node in frame_state.nodes.values():
-            state_events.append((copy.deepcopy(record), copy.deepcopy(node)))
+            state_events.append((record_snapshot, node.snapshot()))
     return collect_ready_for_frame(record, frame_state, state_events=state_events)
 
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 from datetime import datetime
 from typing import Callable, Dict, List, Optional, Set, Tuple
 
@@ -64,6 +63,7 @@ def complete_frame_if_needed(
     get_parent_graph: Callable[[RunRecord, Optional[str]], Tuple[Dict[str, NodeState], Optional[FrameRuntimeState]]],
     pop_frame: Callable[[RunRecord, str], None],
     build_dispatch_request_for_node: Callable[[RunRecord, NodeState], DispatchRequest],
+    archive_frame: Callable[[RunRecord, FrameRuntimeState, Dict[str, NodeState]], None],
     utc_now: Callable[[], datetime],
     final_statuses: Set[str],
 ) -> Tuple[List[DispatchRequest], Optional[NodeState], List[Tuple[Optional[str], ExecMiddlewareNextResponse]]]:
@@ -89,7 +89,7 @@ def complete_frame_if_needed(
     container_node.finished_at = now
     container_node.enqueued = False
     container_node.pending_ack = False
-    container_node.dispatch_id = None
+    record.clear_dispatch(container_node)
     container_node.ack_deadline = None
     container_node.worker_name = None
     container_node.error = None
@@ -114,9 +114,9 @@ def complete_frame_if_needed(
     if container_node.result is None or not isinstance(container_node.result, dict):
         container_node.result = {}
 
-    record.completed_frames[frame.frame_id] = {
-        node_id: copy.deepcopy(node_state) for node_id, node_state in frame.nodes.items()
-    }
+    frame_nodes = {node_id: node_state.snapshot() for node_id, node_state in frame.nodes.items()}
+    record.completed_frames[frame.frame_id] = frame_nodes
+    archive_frame(record, frame, frame_nodes)
     pop_frame(record, frame.frame_id)
     ready: List[DispatchRequest] = []
     next_responses: List[Tuple[Optional[str], ExecMiddlewareNextResponse]] = []
@@ -5,15 +5,16 @@ from __future__ import annotations
 import copy
 import hashlib
 import json
-from typing import Dict
+from typing import Any, Dict, List, Optional
 
 from scheduler_api.models.start_run_request import StartRunRequest
 from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
 
-from ..domain.frames import build_container_frames
+from ..domain.frames import CONTAINER_PARAMS_KEY, build_container_frames
 from ..domain.graph import build_edge_bindings
 from ..domain.middleware import extract_middleware_entries
-from ..domain.models import NodeState, RunRecord, WorkflowScopeIndex
+from ..domain.models import NodeState, NodeTemplate, RunRecord, WorkflowScopeIndex
+from .plan import CompiledPlan, PlanCache
 
 
 def compute_definition_hash(workflow: StartRunRequestWorkflow) -> str:
@@ -23,6 +24,40 @@ def compute_definition_hash(workflow: StartRunRequestWorkflow) -> str:
     return hashlib.sha256(canonical).hexdigest()
 
 
+# Node fields that only affect how the node is drawn.
+_LAYOUT_NODE_FIELDS = frozenset({"position", "label"})
+
+
+def compute_node_fingerprints(workflow: StartRunRequestWorkflow) -> Dict[str, str]:
+    """Per-node counterpart of :func:`compute_definition_hash` for the root graph.
+
+    A node's fingerprint covers its definition (package, type, parameters,
+    bindings, middlewares) and its incoming edges; containers also cover the
+    workflow's subgraphs. Upstream changes are not folded in, so callers
+    compare fingerprints along the dependency graph themselves.
+    """
+
+    payload = workflow.to_dict()
+    incoming: Dict[str, List[Any]] = {}
+    for edge in payload.get("edges") or []:
+        source = edge.get("source") or {}
+        target = edge.get("target") or {}
+        incoming.setdefault(str(target.get("node")), []).append(
+            [str(source.get("node")), source.get("port"), target.get("port")]
+        )
+    fingerprints: Dict[str, str] = {}
+    for node in payload.get("nodes") or []:
+        node_id = str(node.get("id"))
+        document = {key: value for key, value in node.items() if key not in _LAYOUT_NODE_FIELDS}
+        document["__incoming"] = sorted(incoming.get(node_id, []), key=lambda entry: json.dumps(entry, default=str))
+        parameters = node.get("parameters")
+        if node.get("type") == "workflow.container" or (isinstance(parameters, dict) and CONTAINER_PARAMS_KEY in parameters):
+            document["__subgraphs"] = payload.get("subgraphs") or []
+        canonical = json.dumps(document, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+        fingerprints[node_id] = hashlib.sha256(canonical).hexdigest()
+    return fingerprints
+
+
 def initialise_nodes(record: RunRecord) -> None:
     nodes: Dict[str, NodeState] = {}
 
@@ -117,23 +152,56 @@ def initialise_nodes(record: RunRecord) -> None:
     _propagate_host_dependencies_to_first_middleware()
     _wire_middleware_chain_dependencies()
 
-    record.nodes = nodes
+    record.attach_nodes(nodes)
     record.scope_index = WorkflowScopeIndex(record.workflow)
     record.edge_bindings = build_edge_bindings(record, extract_middleware_entries)
 
 
-def build_run_record(*, run_id: str, request: StartRunRequest, tenant: str) -> RunRecord:
+def compile_plan(workflow: StartRunRequestWorkflow, definition_hash: str) -> CompiledPlan:
+    """Run the full graph bootstrap once and capture it as a reusable plan."""
+
+    scratch = RunRecord(
+        run_id="",
+        definition_hash=definition_hash,
+        client_id="",
+        workflow=workflow,
+        tenant="",
+    )
+    initialise_nodes(scratch)
+    frames, frames_by_parent = build_container_frames(workflow)
+    return CompiledPlan(
+        definition_hash=definition_hash,
+        workflow=workflow,
+        nodes=tuple(NodeTemplate.from_node(node) for node in scratch.nodes.values()),
+        scope_index=scratch.scope_index,
+        edge_bindings=scratch.edge_bindings,
+        middleware_chains=scratch.middleware_chains,
+        frames=frames,
+        frames_by_parent=frames_by_parent,
+        node_fingerprints=compute_node_fingerprints(workflow),
+    )
+
+
+def build_run_record(
+    *,
+    run_id: str,
+    request: StartRunRequest,
+    tenant: str,
+    plans: Optional[PlanCache] = None,
+) -> RunRecord:
     workflow = request.workflow
     definition_hash = compute_definition_hash(workflow)
+    if plans is not None:
+        plan = plans.get(definition_hash, lambda: compile_plan(workflow, definition_hash))
+    else:
+        plan = compile_plan(workflow, definition_hash)
+    # Runs of one definition share the plan's workflow, scope index, bindings and frames.
     record = RunRecord(
         run_id=run_id,
         definition_hash=definition_hash,
         client_id=request.client_id,
-        workflow=workflow,
+        workflow=plan.workflow,
         tenant=tenant,
     )
-    initialise_nodes(record)
-    frames, frames_by_parent = build_container_frames(workflow)
-    record.frames = frames
-    record.frames_by_parent = frames_by_parent
+    plan.instantiate(record)
     return record
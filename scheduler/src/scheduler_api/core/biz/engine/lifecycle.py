@@ -40,6 +40,13 @@ class ResetOutcome:
     new_status: str
 
 
+@dataclass
+class SettleOutcome:
+    record_snapshot: RunRecord
+    node_snapshot: NodeState
+    previous_status: str
+
+
 def mark_dispatched(
     record: RunRecord,
     *,
@@ -89,36 +96,17 @@ def mark_dispatched(
     node_state.error = None
     node_state.enqueued = False
     node_state.pending_ack = dispatch_id is not None
-    node_state.dispatch_id = dispatch_id
+    record.bind_dispatch(node_state, dispatch_id)
     node_state.ack_deadline = ack_deadline
     record.refresh_rollup()
     new_status = record.status
     if new_status in final_statuses:
-        filtered: PendingNextRequests = {}
-        for req_id, (
-            run_id,
-            worker_instance_id,
-            worker_name,
-            deadline,
-            pending_node_id,
-            middleware_id,
-            target_task_id,
-        ) in pending_next_requests.items():
-            if run_id == record.run_id:
-                continue
-            filtered[req_id] = (
-                run_id,
-                worker_instance_id,
-                worker_name,
-                deadline,
-                pending_node_id,
-                middleware_id,
-                target_task_id,
-            )
-        pending_next_requests.clear()
-        pending_next_requests.update(filtered)
-    record_snapshot = copy.deepcopy(record)
-    node_snapshot = copy.deepcopy(node_state)
+        for req_id in [
+            req_id for req_id, entry in pending_next_requests.items() if entry[0] == record.run_id
+        ]:
+            pending_next_requests.pop(req_id, None)
+    record_snapshot = record.snapshot()
+    node_snapshot = node_state.snapshot()
     return DispatchOutcome(
         record_snapshot=record_snapshot,
         node_snapshot=node_snapshot,
@@ -141,8 +129,8 @@ def mark_acknowledged(
     node_state.pending_ack = False
     node_state.ack_deadline = None
     record.refresh_rollup()
-    record_snapshot = copy.deepcopy(record)
-    node_snapshot = copy.deepcopy(node_state)
+    record_snapshot = record.snapshot()
+    node_snapshot = node_state.snapshot()
     return AckOutcome(
         record_snapshot=record_snapshot,
         node_snapshot=node_snapshot,
@@ -166,7 +154,7 @@ def cancel_run(
             node.enqueued = False
             node.pending_dependencies = 0
             node.pending_ack = False
-            node.dispatch_id = None
+            record.clear_dispatch(node)
             node.ack_deadline = None
             node.finished_at = timestamp
 
@@ -176,45 +164,36 @@ def cancel_run(
         _cancel_nodes(frame.nodes, timestamp)
     record.active_frames.clear()
     record.frame_stack.clear()
+    record.frame_tasks.clear()
+    record.dispatch_index.clear()
     record.status = "cancelled"
     record.finished_at = timestamp
     cancelled_next: List[Tuple[str, str, str, Optional[str], Optional[str]]] = []
-    remaining_next: PendingNextRequests = {}
     for req_id, (
         req_run_id,
         worker_instance_id,
         worker_name,
-        deadline,
+        _deadline,
         node_id,
         middleware_id,
-        target_task_id,
-    ) in pending_next_requests.items():
-        if req_run_id == run_id:
-            if worker_instance_id or worker_name:
-                cancelled_next.append(
-                    (
-                        req_id,
-                        worker_instance_id or worker_name or "",
-                        req_run_id,
-                        node_id,
-                        middleware_id,
-                    )
-                )
+        _target_task_id,
+    ) in list(pending_next_requests.items()):
+        if req_run_id != run_id:
             continue
-        remaining_next[req_id] = (
-            req_run_id,
-            worker_instance_id,
-            worker_name,
-            deadline,
-            node_id,
-            middleware_id,
-            target_task_id,
-        )
-    pending_next_requests.clear()
-    pending_next_requests.update(remaining_next)
+        pending_next_requests.pop(req_id, None)
+        if worker_instance_id or worker_name:
+            cancelled_next.append(
+                (
+                    req_id,
+                    worker_instance_id or worker_name or "",
+                    req_run_id,
+                    node_id,
+                    middleware_id,
+                )
+            )
     record.refresh_rollup()
     record.status = "cancelled"
-    record_snapshot = copy.deepcopy(record)
+    record_snapshot = record.snapshot()
     return CancelOutcome(
         record_snapshot=record_snapshot,
         cancelled_next=cancelled_next,
@@ -244,7 +223,7 @@ def reset_after_ack_timeout(
     node_state.finished_at = None
     node_state.seq = None
     node_state.pending_ack = False
-    node_state.dispatch_id = None
+    record.clear_dispatch(node_state)
     node_state.ack_deadline = None
     node_state.enqueued = True
     node_state.error = None
@@ -262,8 +241,8 @@ def reset_after_ack_timeout(
         record.package_version = None
     record.refresh_rollup()
     new_status = record.status
-    record_snapshot = copy.deepcopy(record)
-    node_snapshot = copy.deepcopy(node_state)
+    record_snapshot = record.snapshot()
+    node_snapshot = node_state.snapshot()
     return ResetOutcome(
         record_snapshot=record_snapshot,
         node_snapshot=node_snapshot,
@@ -272,6 +251,47 @@ def reset_after_ack_timeout(
     )
 
 
+def settle_in_flight_node(
+    record: RunRecord,
+    node_state: NodeState,
+    *,
+    status: str,
+    utc_now: Callable[[], datetime],
+    result: Optional[Dict[str, Any]] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    artifacts: Optional[List[Dict[str, Any]]] = None,
+    error: Optional[Any] = None,
+) -> SettleOutcome:
+    """Record the outcome of a node still in flight when its run already finished.
+
+    Only the node itself changes: dependents are not released and frames are
+    not completed, since nothing of a finished run is dispatched again.
+    """
+
+    previous_status = record.status
+    node_state.status = status
+    node_state.finished_at = utc_now()
+    if result is not None:
+        node_state.result = result
+    if metadata:
+        node_state.metadata = {**(node_state.metadata or {}), **copy.deepcopy(metadata)}
+    if artifacts is not None:
+        node_state.artifacts = artifacts
+    node_state.error = error
+    node_state.enqueued = False
+    node_state.pending_ack = False
+    record.clear_dispatch(node_state)
+    node_state.ack_deadline = None
+    record.refresh_rollup()
+    record_snapshot = record.snapshot()
+    node_snapshot = node_state.snapshot()
+    return SettleOutcome(
+        record_snapshot=record_snapshot,
+        node_snapshot=node_snapshot,
+        previous_status=previous_status,
+    )
+
+
 def reset_after_worker_cancel(
     record: RunRecord,
     node_state: NodeState,
@@ -285,7 +305,7 @@ def reset_after_worker_cancel(
     node_state.finished_at = None
     node_state.seq = None
     node_state.pending_ack = False
-    node_state.dispatch_id = None
+    record.clear_dispatch(node_state)
     node_state.ack_deadline = None
     node_state.enqueued = False
     node_state.error = None
@@ -293,34 +313,17 @@ def reset_after_worker_cancel(
     node_state.pending_dependencies = 0
     node_state.chain_blocked = False
     # Drop any pending middleware.next waiting on this task.
-    remaining_next: PendingNextRequests = {}
-    for req_id, (
-        run_id,
-        worker_instance_id,
-        worker_name,
-        deadline,
-        pending_node_id,
-        middleware_id,
-        target_task_id,
-    ) in pending_next_requests.items():
-        if run_id == record.run_id and target_task_id == node_state.task_id:
-            continue
-        remaining_next[req_id] = (
-            run_id,
-            worker_instance_id,
-            worker_name,
-            deadline,
-            pending_node_id,
-            middleware_id,
-            target_task_id,
-        )
-    pending_next_requests.clear()
-    pending_next_requests.update(remaining_next)
+    for req_id in [
+        req_id
+        for req_id, entry in pending_next_requests.items()
+        if entry[0] == record.run_id and entry[6] == node_state.task_id
+    ]:
+        pending_next_requests.pop(req_id, None)
 
     record.refresh_rollup()
     new_status = record.status
-    record_snapshot = copy.deepcopy(record)
-    node_snapshot = copy.deepcopy(node_state)
+    record_snapshot = record.snapshot()
+    node_snapshot = node_state.snapshot()
     return ResetOutcome(
         record_snapshot=record_snapshot,
         node_snapshot=node_snapshot,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Dict, Optional, Tuple
 
+from ..domain.middleware import MiddlewareChain
 from ..domain.models import FrameDefinition, FrameRuntimeState, NodeState, RunRecord
 
 
@@ -17,17 +18,10 @@ def resolve_node_state(
         root_candidate = record.task_index.get(task_id)
         if root_candidate:
             return root_candidate, None
-        for frame_id in reversed(record.frame_stack):
-            frame = record.active_frames.get(frame_id)
-            if not frame:
-                continue
-            candidate = frame.task_index.get(task_id)
-            if candidate:
-                return candidate, frame
-        for frame in record.active_frames.values():
-            candidate = frame.task_index.get(task_id)
-            if candidate:
-                return candidate, frame
+        frame = record.active_frames.get(record.frame_tasks.get(task_id, ""))
+        candidate = frame.task_index.get(task_id) if frame else None
+        if candidate:
+            return candidate, frame
     if node_id:
         root_candidate = record.nodes.get(node_id)
         if root_candidate:
@@ -50,14 +44,45 @@ def find_node_by_dispatch(
     record: RunRecord,
     dispatch_id: str,
 ) -> Tuple[Optional[NodeState], Optional[FrameRuntimeState]]:
-    for node in record.nodes.values():
-        if node.dispatch_id == dispatch_id:
-            return node, None
+    location = record.dispatch_index.get(dispatch_id)
+    if location is None:
+        return None, None
+    frame_id, node_id = location
+    if frame_id is None:
+        node, frame = record.nodes.get(node_id), None
+    else:
+        frame = record.active_frames.get(frame_id)
+        node = frame.nodes.get(node_id) if frame else None
+    if node is None or node.dispatch_id != dispatch_id:
+        return None, None
+    return node, frame
+
+
+def find_middleware_chain(
+    record: RunRecord,
+    middleware_id: str,
+    *,
+    frame_id: Optional[str] = None,
+) -> Optional[MiddlewareChain]:
+    """Return ``(host, chain, index)`` for ``middleware_id``.
+
+    The middleware's own frame is consulted first, then the root graph, then
+    every active frame.
+    """
+
+    frame = record.active_frames.get(frame_id) if frame_id else None
+    if frame:
+        found = frame.middleware_chains.get(middleware_id)
+        if found:
+            return found
+    found = record.middleware_chains.get(middleware_id)
+    if found:
+        return found
     for frame in record.active_frames.values():
-        for node in frame.nodes.values():
-            if node.dispatch_id == dispatch_id:
-                return node, frame
-    return None, None
+        found = frame.middleware_chains.get(middleware_id)
+        if found:
+            return found
+    return None
 
 
 def find_frame_for_container(
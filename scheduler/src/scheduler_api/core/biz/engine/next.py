@@ -2,28 +2,15 @@
 
 from __future__ import annotations
 
-import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Callable, List, Optional, Set, Tuple
 
 from shared.models.biz.exec.next.request import ExecMiddlewareNextRequest
 
 from ..domain.models import DispatchRequest, FrameRuntimeState, NodeState, RunRecord
-
-PendingNextRequests = Dict[
-    str,
-    Tuple[
-        str,
-        Optional[str],
-        Optional[str],
-        Optional[datetime],
-        Optional[str],
-        Optional[str],
-        Optional[str],
-    ],
-]
-
+from .lookup import find_middleware_chain
+from .pending import PendingNextRequests
 
 @dataclass
 class NextRequestOutcome:
@@ -34,25 +21,17 @@ class NextRequestOutcome:
     node_snapshot: Optional[NodeState]
 
 
-def _iter_all_nodes(record: RunRecord) -> Iterable[NodeState]:
-    for node in record.nodes.values():
-        yield node
-    for frame in record.active_frames.values():
-        for node in frame.nodes.values():
-            yield node
-
-
 def _find_chain_for_middleware(
     record: RunRecord,
     middleware_id: Optional[str],
 ) -> Tuple[Optional[str], Optional[List[str]]]:
     if not middleware_id:
         return None, None
-    for node in _iter_all_nodes(record):
-        chain_ids = getattr(node, "middlewares", []) or []
-        if middleware_id in chain_ids:
-            return node.node_id, list(chain_ids)
-    return None, None
+    found = find_middleware_chain(record, middleware_id)
+    if not found:
+        return None, None
+    host_node_id, chain, _ = found
+    return host_node_id, list(chain)
 
 
 def handle_next_request(
@@ -129,11 +108,11 @@ def handle_next_request(
             node_state.status = "queued"
             node_state.worker_name = None
             node_state.pending_ack = False
-            node_state.dispatch_id = None
+            record.clear_dispatch(node_state)
             node_state.ack_deadline = None
             node_state.enqueued = False
             node_state.finished_at = None
-            state_events.append((copy.deepcopy(record), copy.deepcopy(node_state)))
+            state_events.append((record.snapshot(), node_state.snapshot()))
         node_state.chain_blocked = False
 
     node_state.enqueued = False
@@ -180,7 +159,7 @@ def handle_next_request(
         payload.middlewareId,
         node_state.task_id,
     )
-    record_snapshot = copy.deepcopy(record)
-    node_snapshot = copy.deepcopy(node_state)
+    record_snapshot = record.snapshot()
+    node_snapshot = node_state.snapshot()
     ready.append(dispatch)
     return NextRequestOutcome(ready, None, state_events, record_snapshot, node_snapshot)
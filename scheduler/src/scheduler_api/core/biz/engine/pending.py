@@ -3,25 +3,29 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 from shared.models.biz.exec.next.response import ExecMiddlewareNextResponse
 from shared.models.biz.exec.result import ExecResultPayload
 
 from ..domain.models import NodeState
+from .deadlines import DeadlineScheduler
 
-PendingNextRequests = Dict[
+# request_id -> (run_id, worker_instance_id, worker_name, deadline, node_id, middleware_id, target_task_id)
+PendingNextEntry = Tuple[
     str,
-    Tuple[
-        str,
-        Optional[str],
-        Optional[str],
-        Optional[datetime],
-        Optional[str],
-        Optional[str],
-        Optional[str],
-    ],
+    Optional[str],
+    Optional[str],
+    Optional[datetime],
+    Optional[str],
+    Optional[str],
+    Optional[str],
 ]
+PendingNextRequests = DeadlineScheduler[str, PendingNextEntry]
+
+
+def build_pending_next_requests(*, utc_now: Callable[[], datetime]) -> PendingNextRequests:
+    return DeadlineScheduler(lambda entry: entry[3], clock=utc_now, name="middleware-next-deadlines")
 
 
 def resolve_next_response_worker(
@@ -43,44 +47,30 @@ def collect_expired_next_requests(
     pending_next_requests: PendingNextRequests,
     *,
     utc_now: Callable[[], datetime],
-) -> Tuple[
-    List[Tuple[str, str, str, Optional[str], Optional[str]]],
-    PendingNextRequests,
-]:
-    now = utc_now()
+) -> List[Tuple[str, str, str, Optional[str], Optional[str]]]:
+    """Pop every pending request past its deadline; only those with a known worker are reported."""
+
     expired: List[Tuple[str, str, str, Optional[str], Optional[str]]] = []
-    remaining: PendingNextRequests = {}
     for req_id, (
         run_id,
         worker_instance_id,
         worker_name,
-        deadline,
+        _deadline,
         node_id,
         middleware_id,
-        target_task_id,
-    ) in pending_next_requests.items():
-        if deadline and now > deadline:
-            if worker_instance_id or worker_name:
-                expired.append(
-                    (
-                        req_id,
-                        worker_instance_id or worker_name or "",
-                        run_id,
-                        node_id,
-                        middleware_id,
-                    )
+        _target_task_id,
+    ) in pending_next_requests.pop_expired(utc_now()):
+        if worker_instance_id or worker_name:
+            expired.append(
+                (
+                    req_id,
+                    worker_instance_id or worker_name or "",
+                    run_id,
+                    node_id,
+                    middleware_id,
                 )
-        else:
-            remaining[req_id] = (
-                run_id,
-                worker_instance_id,
-                worker_name,
-                deadline,
-                node_id,
-                middleware_id,
-                target_task_id,
             )
-    return expired, remaining
+    return expired
 
 
 def finalise_pending_next(
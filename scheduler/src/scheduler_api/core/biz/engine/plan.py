@@ -0,0 +1,88 @@
+"""Compiled workflow plans shared by runs of the same definition."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
+
+from ..domain.middleware import MiddlewareChain
+from ..domain.models import (
+    EdgeBinding,
+    FrameDefinition,
+    FrameTemplate,
+    NodeTemplate,
+    RunRecord,
+    WorkflowScopeIndex,
+)
+
+
+@dataclass(frozen=True)
+class CompiledPlan:
+    """Immutable result of compiling a workflow definition.
+
+    Holds the node topology with dependency counts, the scope index, parsed
+    edge bindings, the middleware chain index and the container frame
+    definitions, plus the frame runtime templates compiled as containers
+    first run. Runs share everything here by reference except the node
+    templates, which :meth:`instantiate` turns into fresh mutable state.
+    """
+
+    definition_hash: str
+    workflow: StartRunRequestWorkflow
+    nodes: Tuple[NodeTemplate, ...]
+    scope_index: WorkflowScopeIndex
+    edge_bindings: Dict[str, List[EdgeBinding]]
+    middleware_chains: Dict[str, MiddlewareChain]
+    frames: Dict[str, FrameDefinition]
+    frames_by_parent: Dict[Tuple[Optional[str], str], FrameDefinition]
+    # node_id -> fingerprint of the root node's definition, compared by incremental re-runs
+    node_fingerprints: Dict[str, str] = field(default_factory=dict, compare=False)
+    # frame_id -> runtime template, filled on first activation and shared by the plan's runs
+    frame_templates: Dict[str, FrameTemplate] = field(default_factory=dict, compare=False)
+
+    def instantiate(self, record: RunRecord) -> None:
+        """Populate ``record`` with per-run node state built from this plan."""
+
+        nodes = {template.node_id: template.instantiate(record.run_id) for template in self.nodes}
+        record.attach_nodes(nodes, middleware_chains=self.middleware_chains)
+        for node in nodes.values():
+            record.task_index[node.task_id] = node
+        record.scope_index = self.scope_index
+        record.edge_bindings = self.edge_bindings
+        record.frames = dict(self.frames)
+        record.frames_by_parent = dict(self.frames_by_parent)
+        record.frame_templates = self.frame_templates
+        record.node_fingerprints = self.node_fingerprints
+
+
+class PlanCache:
+    """LRU cache of compiled plans keyed by workflow definition hash."""
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._plans: "OrderedDict[str, CompiledPlan]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def get(self, definition_hash: str, compile_plan: Callable[[], CompiledPlan]) -> CompiledPlan:
+        plan = self._plans.get(definition_hash)
+        if plan is not None:
+            self._plans.move_to_end(definition_hash)
+            self.hits += 1
+            return plan
+        self.misses += 1
+        plan = compile_plan()
+        if self._capacity > 0:
+            self._plans[definition_hash] = plan
+            while len(self._plans) > self._capacity:
+                self._plans.popitem(last=False)
+        return plan
+
+
+__all__ = ["CompiledPlan", "PlanCache"]
@@ -0,0 +1,149 @@
+"""Incremental re-runs: reuse results of nodes unchanged since a previous run."""
+
+from __future__ import annotations
+
+import copy
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping
+
+from scheduler_api.models.list_runs200_response_items_inner import ListRuns200ResponseItemsInner
+from scheduler_api.models.list_runs200_response_items_inner_nodes_inner import (
+    ListRuns200ResponseItemsInnerNodesInner,
+)
+from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
+
+from ..domain.middleware import extract_middleware_entries
+from ..domain.models import NodeState, RunRecord
+
+REUSED_FROM_KEY = "reusedFrom"
+
+
+@dataclass(frozen=True)
+class RerunSource:
+    """What a re-run needs from the previous run: root node fingerprints and outcomes."""
+
+    run_id: str
+    fingerprints: Mapping[str, str]
+    nodes: Dict[str, ListRuns200ResponseItemsInnerNodesInner]
+
+    @classmethod
+    def from_summary(
+        cls,
+        run_id: str,
+        fingerprints: Mapping[str, str],
+        summary: ListRuns200ResponseItemsInner,
+    ) -> "RerunSource":
+        # Root nodes and middlewares keep task_id == node_id; frame nodes are re-run with their container.
+        nodes = {
+            node.node_id: node
+            for node in summary.nodes or []
+            if node.task_id == node.node_id and "__frame" not in (node.metadata or {})
+        }
+        return cls(run_id=run_id, fingerprints=fingerprints, nodes=nodes)
+
+    def succeeded(self, node_id: str) -> bool:
+        node = self.nodes.get(node_id)
+        return node is not None and node.status == "succeeded"
+
+
+def select_reusable_nodes(
+    workflow: StartRunRequestWorkflow,
+    fingerprints: Mapping[str, str],
+    source: RerunSource,
+) -> Dict[str, Dict[str, Any]]:
+    """Nodes whose previous result can be reused, keyed by node id.
+
+    A root node is reusable when its fingerprint is unchanged, it and its
+    middlewares succeeded in the previous run, and every upstream node is
+    reusable too; anything downstream of a changed node is therefore re-run.
+    Middlewares are reused together with their host.
+    """
+
+    dependencies: Dict[str, List[str]] = {node_id: [] for node_id in fingerprints}
+    dependents: Dict[str, List[str]] = {node_id: [] for node_id in fingerprints}
+    for edge in workflow.edges or []:
+        source_id = getattr(edge.source, "node", None)
+        target_id = getattr(edge.target, "node", None)
+        if source_id is None or target_id is None:
+            continue
+        source_id, target_id = str(source_id), str(target_id)
+        if target_id in dependencies:
+            dependencies[target_id].append(source_id)
+        if source_id in dependents:
+            dependents[source_id].append(target_id)
+    middlewares = {
+        str(node.id): extract_middleware_entries(getattr(node, "middlewares", []) or [])[0]
+        for node in workflow.nodes or []
+    }
+
+    # Walk the root graph in topological order; nodes on a cycle are never reached and never reused.
+    clean: Dict[str, bool] = {}
+    waiting = {node_id: len(deps) for node_id, deps in dependencies.items()}
+    queue = deque(node_id for node_id, count in waiting.items() if count == 0)
+    while queue:
+        node_id = queue.popleft()
+        clean[node_id] = (
+            fingerprints[node_id] == source.fingerprints.get(node_id)
+            and source.succeeded(node_id)
+            and all(source.succeeded(mw_id) for mw_id in middlewares.get(node_id, []))
+            and all(clean.get(dep_id, False) for dep_id in dependencies[node_id])
+        )
+        for dependent_id in dependents[node_id]:
+            waiting[dependent_id] -= 1
+            if waiting[dependent_id] == 0:
+                queue.append(dependent_id)
+
+    reused: Dict[str, Dict[str, Any]] = {}
+    for node_id, is_clean in clean.items():
+        if not is_clean:
+            continue
+        for reused_id in (node_id, *middlewares.get(node_id, [])):
+            previous = source.nodes[reused_id]
+            reused[reused_id] = {
+                "runId": source.run_id,
+                "result": previous.result,
+                "artifacts": previous.artifacts or [],
+            }
+    return reused
+
+
+def seed_reused_nodes(
+    record: RunRecord,
+    reused: Mapping[str, Mapping[str, Any]],
+    *,
+    apply_edge_bindings: Callable[[RunRecord, NodeState], None],
+    release_dependents: Callable[[RunRecord, NodeState], None],
+    utc_now: Callable[[], datetime],
+) -> List[NodeState]:
+    """Complete reused nodes of a fresh run with their previous results.
+
+    All reused nodes are marked succeeded before any is released, so releasing
+    only counts down the dependencies of nodes that still have to run; those
+    are dispatched by the next ready-node collection.
+    """
+
+    timestamp = utc_now()
+    seeded: List[NodeState] = []
+    for node_id, entry in reused.items():
+        node = record.nodes.get(node_id)
+        if node is None:
+            continue
+        node.status = "succeeded"
+        node.started_at = timestamp
+        node.finished_at = timestamp
+        node.result = copy.deepcopy(entry.get("result"))
+        node.artifacts = copy.deepcopy(list(entry.get("artifacts") or []))
+        node.metadata = {**(node.metadata or {}), REUSED_FROM_KEY: entry.get("runId")}
+        node.pending_dependencies = 0
+        node.chain_blocked = False
+        seeded.append(node)
+    for node in seeded:
+        apply_edge_bindings(record, node)
+        release_dependents(record, node)
+    record.refresh_rollup()
+    return seeded
+
+
+__all__ = ["REUSED_FROM_KEY", "RerunSource", "seed_reused_nodes", "select_reusable_nodes"]
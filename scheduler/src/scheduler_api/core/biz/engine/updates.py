@@ -103,6 +103,7 @@ def apply_feedback(
             node_state.result = {}
         result_changes = merge_result_updates(node_state.result, incoming_results)
         if result_changes:
+            node_state.touch()
             changed_state = True
             seq_counter = int(metadata.get("resultSequence", 0))
             for change in result_changes:
@@ -114,6 +115,7 @@ def apply_feedback(
     if payload.metrics:
         metrics = metadata.setdefault("metrics", {})
         metrics.update(payload.metrics)
+        node_state.touch()
         changed_state = True
 
     chunk_events: List[Dict[str, Any]] = []
@@ -137,10 +139,10 @@ def apply_feedback(
     record_snapshot: Optional[RunRecord] = None
     node_snapshot: Optional[NodeState] = None
     if changed_state or chunk_events:
-        record_snapshot = copy.deepcopy(record)
+        record_snapshot = record.snapshot()
         node_snapshot = record_snapshot.nodes.get(node_state.node_id)
         if node_snapshot is None:
-            node_snapshot = copy.deepcopy(node_state)
+            node_snapshot = node_state.snapshot()
     publish_node_state = bool(changed_state and record_snapshot and node_snapshot)
     return FeedbackOutcome(
         record_snapshot=record_snapshot,
@@ -193,17 +195,17 @@ def apply_command_error(
         node_state.error = error
         node_state.enqueued = False
         node_state.pending_ack = False
-        node_state.dispatch_id = None
+        record.clear_dispatch(node_state)
         node_state.ack_deadline = None
         node_state.worker_name = None
         if frame_state:
             frame_ready, container_node, _ = complete_frame_if_needed(record, frame_state)
             ready.extend(frame_ready)
             if container_node and frame_state.parent_frame_id is None:
-                container_snapshot = copy.deepcopy(container_node)
-        node_snapshot = copy.deepcopy(node_state)
+                container_snapshot = container_node.snapshot()
+        node_snapshot = node_state.snapshot()
     record.refresh_rollup()
-    record_snapshot = copy.deepcopy(record)
+    record_snapshot = record.snapshot()
     return CommandErrorOutcome(
         record_snapshot=record_snapshot,
         node_snapshot=node_snapshot,
@@ -255,6 +257,10 @@ def apply_record_result(
     ]
     node_state.error = None
     node_state.enqueued = False
+    # The dispatch is over; only nodes with a dispatch still in flight stay in dispatch_index.
+    node_state.pending_ack = False
+    record.clear_dispatch(node_state)
+    node_state.ack_deadline = None
     record.duration_ms = payload.duration_ms
     record.result_payload = payload.result
     if payload.error:
@@ -331,7 +337,7 @@ def apply_record_result(
                         else:
                             apply_edge_bindings(record, host_state)
                         release_dependents(record, host_state, host_frame, ready, state_events)
-                host_snapshot = copy.deepcopy(host_state)
+                host_snapshot = host_state.snapshot()
 
     container_snapshot: Optional[NodeState] = None
     if frame_state:
@@ -339,15 +345,15 @@ def apply_record_result(
         ready.extend(frame_ready)
         next_responses.extend(frame_next_responses)
         if container_node and frame_state.parent_frame_id is None:
-            container_snapshot = copy.deepcopy(container_node)
+            container_snapshot = container_node.snapshot()
 
     # Resolve pending middleware.next responses targeting this task
     next_responses.extend(finalise_pending_next(payload, node_state, status=status))
 
     record.refresh_rollup()
     new_status = record.status
-    record_snapshot = copy.deepcopy(record)
-    node_snapshot = copy.deepcopy(node_state)
+    record_snapshot = record.snapshot()
+    node_snapshot = node_state.snapshot()
     return RecordResultOutcome(
         record_snapshot=record_snapshot,
         node_snapshot=node_snapshot,
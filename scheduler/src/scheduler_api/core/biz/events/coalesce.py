@@ -0,0 +1,177 @@
+"""Run-scoped coalescing of feedback events before SSE publication."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from ..domain.models import FINAL_STATUSES, NodeState, RunRecord
+
+LOGGER = logging.getLogger(__name__)
+
+Publish = Callable[..., Awaitable[None]]
+
+_MERGEABLE_PAYLOAD_KEYS = frozenset({"text", "mimeType"})
+
+
+@dataclass
+class _Entry:
+    publish: Publish
+    record: RunRecord
+    node: NodeState
+    kwargs: Dict[str, Any]
+
+
+@dataclass
+class _RunBuffer:
+    entries: "OrderedDict[Hashable, _Entry]" = field(default_factory=OrderedDict)
+    handle: Optional[asyncio.TimerHandle] = None
+
+
+class EventCoalescer:
+    """Buffers high-frequency node events per run and publishes them in batches.
+
+    Within ``window_seconds`` of the first buffered event, repeated node-state
+    and node-snapshot updates for the same node collapse to the latest one and
+    consecutive text chunks appended to the same channel are concatenated into
+    a single delta. Each merged event takes the position of its most recent
+    contribution, so the relative order of the last update of every node and
+    channel is preserved.
+
+    Events that bypass the buffer (results, errors, run state) go through
+    :meth:`ordered`, which drains the run's buffer first; a terminal chunk or a
+    node reaching a final status flushes immediately.
+    """
+
+    def __init__(self, *, window_seconds: float) -> None:
+        self._window = window_seconds
+        self._buffers: Dict[str, _RunBuffer] = {}
+        # run_id -> (lock, number of flushes holding or waiting for it)
+        self._locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+        self._flushes: Set[asyncio.Task[None]] = set()
+        self._unique = itertools.count()
+
+    @property
+    def pending(self) -> int:
+        return sum(len(buffer.entries) for buffer in self._buffers.values())
+
+    def ordered(self, publish: Publish) -> Publish:
+        """Wrap ``publish`` so it runs after everything buffered for the same run."""
+
+        async def _publish(record: RunRecord, *args: Any, **kwargs: Any) -> None:
+            await self.flush(record.run_id)
+            await publish(record, *args, **kwargs)
+
+        return _publish
+
+    def node_state(self, publish: Publish) -> Publish:
+        async def _publish(record: RunRecord, node: NodeState) -> None:
+            await self._buffer(("state", node.node_id), _Entry(publish, record, node, {}))
+
+        return _publish
+
+    def node_snapshot(self, publish: Publish) -> Publish:
+        async def _publish(record: RunRecord, node: NodeState, *, complete: bool) -> None:
+            key: Hashable = ("snapshot", node.node_id)
+            await self._buffer(key, _Entry(publish, record, node, {"complete": complete}), flush=complete)
+
+        return _publish
+
+    def node_result_delta(self, publish: Publish) -> Publish:
+        async def _publish(record: RunRecord, node: NodeState, **kwargs: Any) -> None:
+            entry = _Entry(publish, record, node, kwargs)
+            if not _is_text_append(kwargs):
+                await self._buffer(("delta", next(self._unique)), entry, flush=bool(kwargs.get("terminal")))
+                return
+            key: Hashable = ("chunk", node.node_id, kwargs.get("path"))
+            buffer = self._buffers.get(record.run_id)
+            previous = buffer.entries.get(key) if buffer else None
+            if previous is not None and _can_merge(previous.kwargs, kwargs):
+                payload = dict(previous.kwargs["payload"])
+                payload["text"] = payload.get("text", "") + kwargs["payload"].get("text", "")
+                entry.kwargs = {**kwargs, "payload": payload}
+            elif previous is not None:
+                # Not mergeable: retire the earlier chunk under a fresh key so later ones start anew.
+                buffer.entries[("delta", next(self._unique))] = buffer.entries.pop(key)
+            await self._buffer(key, entry)
+
+        return _publish
+
+    async def flush(self, run_id: str) -> None:
+        """Publish everything buffered for ``run_id`` in order."""
+
+        buffer = self._buffers.pop(run_id, None)
+        if buffer is None and run_id not in self._locks:
+            return
+        if buffer is not None and buffer.handle is not None:
+            buffer.handle.cancel()
+        lock, users = self._locks.get(run_id) or (asyncio.Lock(), 0)
+        self._locks[run_id] = (lock, users + 1)
+        try:
+            async with lock:
+                if buffer is None:
+                    return
+                for entry in buffer.entries.values():
+                    try:
+                        await entry.publish(entry.record, entry.node, **entry.kwargs)
+                    except Exception:  # noqa: BLE001
+                        LOGGER.exception("Failed to publish coalesced event run=%s", run_id)
+        finally:
+            lock, users = self._locks[run_id]
+            if users > 1:
+                self._locks[run_id] = (lock, users - 1)
+            else:
+                del self._locks[run_id]
+
+    async def flush_all(self) -> None:
+        for run_id in list(self._buffers):
+            await self.flush(run_id)
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    async def _buffer(self, key: Hashable, entry: _Entry, *, flush: bool = False) -> None:
+        run_id = entry.record.run_id
+        buffer = self._buffers.get(run_id)
+        if buffer is None:
+            buffer = self._buffers[run_id] = _RunBuffer()
+        buffer.entries.pop(key, None)
+        buffer.entries[key] = entry
+        if flush or entry.node.status in FINAL_STATUSES:
+            await self.flush(run_id)
+            return
+        if buffer.handle is None:
+            loop = asyncio.get_running_loop()
+            buffer.handle = loop.call_later(self._window, self._schedule_flush, run_id)
+
+    def _schedule_flush(self, run_id: str) -> None:
+        buffer = self._buffers.get(run_id)
+        if buffer is not None:
+            buffer.handle = None
+        task = asyncio.create_task(self.flush(run_id))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+
+def _is_text_append(kwargs: Dict[str, Any]) -> bool:
+    payload = kwargs.get("payload")
+    return (
+        kwargs.get("operation") == "append"
+        and not kwargs.get("terminal")
+        and isinstance(payload, dict)
+        and "text" in payload
+        and payload.keys() <= _MERGEABLE_PAYLOAD_KEYS
+    )
+
+
+def _can_merge(previous: Dict[str, Any], current: Dict[str, Any]) -> bool:
+    return (
+        previous["payload"].get("mimeType") == current["payload"].get("mimeType")
+        and previous.get("chunk_meta") == current.get("chunk_meta")
+    )
+
+
+__all__ = ["EventCoalescer"]
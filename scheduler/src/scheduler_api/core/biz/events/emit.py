@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from ..domain.models import NodeState, RunRecord
+from .coalesce import EventCoalescer
 from .publish import (
     publish_node_result_delta,
     publish_node_snapshot,
@@ -30,12 +31,38 @@ class RunRegistryEmitter:
         publish_run_state: PublishRunState,
         publish_run_snapshot: PublishRunSnapshot,
         publish_node_result_delta: PublishNodeResultDelta,
+        coalescer: Optional[EventCoalescer] = None,
     ) -> None:
         self._publish_node_state = publish_node_state
         self._publish_node_snapshot = publish_node_snapshot
         self._publish_run_state = publish_run_state
         self._publish_run_snapshot = publish_run_snapshot
         self._publish_node_result_delta = publish_node_result_delta
+        self._coalescer = coalescer
+        self._feedback: RunRegistryEmitter = self
+        if coalescer is not None:
+            self._publish_node_state = coalescer.ordered(publish_node_state)
+            self._publish_node_snapshot = coalescer.ordered(publish_node_snapshot)
+            self._publish_run_state = coalescer.ordered(publish_run_state)
+            self._publish_run_snapshot = coalescer.ordered(publish_run_snapshot)
+            self._publish_node_result_delta = coalescer.ordered(publish_node_result_delta)
+            self._feedback = RunRegistryEmitter(
+                publish_node_state=coalescer.node_state(publish_node_state),
+                publish_node_snapshot=coalescer.node_snapshot(publish_node_snapshot),
+                publish_run_state=self._publish_run_state,
+                publish_run_snapshot=self._publish_run_snapshot,
+                publish_node_result_delta=coalescer.node_result_delta(publish_node_result_delta),
+            )
+
+    @property
+    def feedback(self) -> "RunRegistryEmitter":
+        """Emitter for streaming feedback; buffers through the coalescer when one is set."""
+
+        return self._feedback
+
+    async def flush(self) -> None:
+        if self._coalescer is not None:
+            await self._coalescer.flush_all()
 
     def enqueue_node_state(
         self,
@@ -149,13 +176,35 @@ class RunRegistryEmitter:
         )
 
 
-def build_run_registry_emitter() -> RunRegistryEmitter:
+def build_run_registry_emitter(*, coalesce_window_seconds: float = 0.0) -> RunRegistryEmitter:
+    coalescer = (
+        EventCoalescer(window_seconds=coalesce_window_seconds)
+        if coalesce_window_seconds > 0
+        else None
+    )
     return RunRegistryEmitter(
         publish_node_state=publish_node_state,
         publish_node_snapshot=publish_node_snapshot,
         publish_run_state=publish_run_state,
         publish_run_snapshot=publish_run_snapshot,
         publish_node_result_delta=publish_node_result_delta,
+        coalescer=coalescer,
+    )
+
+
+async def _discard(*_args: Any, **_kwargs: Any) -> None:
+    return None
+
+
+def build_silent_emitter() -> RunRegistryEmitter:
+    """Emitter that drops every event; used while replaying the run journal."""
+
+    return RunRegistryEmitter(
+        publish_node_state=_discard,
+        publish_node_snapshot=_discard,
+        publish_run_state=_discard,
+        publish_run_snapshot=_discard,
+        publish_node_result_delta=_discard,
     )
 
 
@@ -239,6 +288,7 @@ def build_feedback_tasks(
     outcome: Any,
 ) -> List[Awaitable[Any]]:
     tasks: List[Awaitable[Any]] = []
+    emitter = emitter.feedback
     if outcome.publish_node_state:
         emitter.enqueue_node_state_and_snapshot(
             tasks,
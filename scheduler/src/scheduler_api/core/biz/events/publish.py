@@ -5,7 +5,8 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, Optional
 
-from scheduler_api.sse import event_publisher
+from scheduler_api.models.list_runs200_response_items_inner import ListRuns200ResponseItemsInner
+from scheduler_api.sse import UiEventEnvelope, event_publisher
 from scheduler_api.sse.mappers import (
     node_result_delta_envelope,
     node_result_snapshot_envelope,
@@ -43,19 +44,28 @@ async def publish_run_state(record: RunRecord) -> None:
         LOGGER.exception("Failed to publish run state event run=%s", record.run_id)
 
 
-async def publish_run_snapshot(record: RunRecord) -> None:
-    if not record.client_id:
-        return
-    summary = record.to_summary()
+def run_snapshot_event(record: RunRecord) -> Optional[UiEventEnvelope]:
+    return summary_snapshot_event(record.to_summary(), tenant=record.tenant)
+
+
+def summary_snapshot_event(summary: ListRuns200ResponseItemsInner, *, tenant: str) -> Optional[UiEventEnvelope]:
+    if not summary.client_id:
+        return None
     payload = summary.model_dump(by_alias=True, exclude_none=True, mode="json")
     nodes_payload = payload.pop("nodes", None)
-    envelope = run_snapshot_envelope(
-        tenant=record.tenant,
-        client_session_id=record.client_id,
+    return run_snapshot_envelope(
+        tenant=tenant,
+        client_session_id=summary.client_id,
         run=payload,
         nodes=nodes_payload,
         occurred_at=_utc_now(),
     )
+
+
+async def publish_run_snapshot(record: RunRecord) -> None:
+    envelope = run_snapshot_event(record)
+    if envelope is None:
+        return
     try:
         await event_publisher.publish(envelope)
     except Exception:  # noqa: BLE001
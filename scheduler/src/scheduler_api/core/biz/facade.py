@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from scheduler_api.models.list_runs200_response import ListRuns200Response
+from scheduler_api.models.list_runs200_response_items_inner import ListRuns200ResponseItemsInner
 from scheduler_api.models.start_run_request import StartRunRequest
 from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
 from shared.models.biz.exec.error import ExecErrorPayload
@@ -12,9 +13,13 @@ from shared.models.biz.exec.feedback import ExecFeedbackPayload
 from shared.models.biz.exec.next.request import ExecMiddlewareNextRequest
 from shared.models.biz.exec.next.response import ExecMiddlewareNextResponse
 from shared.models.biz.exec.result import ExecResultPayload
+from scheduler_api.sse import UiEventEnvelope
 
 from .services.run_state_service import DispatchRequest, RunRecord, RunStateService, run_state_service
+from .dispatch.next_responses import send_next_responses
 from .dispatch.orchestrator import RunOrchestrator, run_orchestrator
+from ..network.gateway import worker_gateway
+from .events.publish import run_snapshot_event, summary_snapshot_event
 
 
 class ControlPlaneBizFacade:
@@ -58,15 +63,46 @@ class ControlPlaneBizFacade:
         )
         ready = await self._coordinator.collect_ready_nodes(run_id)
         if ready:
-            await self._orchestrator.enqueue(ready)
+            await self._enqueue(ready)
         return record, ready
 
-    async def get_run(self, run_id: str) -> Optional[RunRecord]:
-        return await self._coordinator.get(run_id)
+    async def rerun_run(
+        self,
+        *,
+        source_run_id: str,
+        run_id: str,
+        request: StartRunRequest,
+        tenant: str,
+    ) -> Optional[tuple[RunRecord, List[DispatchRequest]]]:
+        record = await self._coordinator.rerun_run(
+            source_run_id=source_run_id,
+            run_id=run_id,
+            request=request,
+            tenant=tenant,
+        )
+        if record is None:
+            return None
+        ready = await self._coordinator.collect_ready_nodes(run_id)
+        if ready:
+            await self._enqueue(ready)
+        return record, ready
+
+    async def get_run(self, run_id: str) -> Optional[ListRuns200ResponseItemsInner]:
+        return await self._coordinator.get_summary(run_id)
 
     async def get_workflow_with_state(self, run_id: str) -> Optional[StartRunRequestWorkflow]:
         return await self._coordinator.get_workflow_with_state(run_id)
 
+    async def get_run_frames(
+        self,
+        run_id: str,
+        frame_id: str,
+        iteration: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        if iteration is None:
+            return await self._coordinator.get_frame_history(run_id, frame_id)
+        return await self._coordinator.get_frame_iteration(run_id, frame_id, iteration)
+
     async def cancel_run(
         self,
         run_id: str,
@@ -80,11 +116,15 @@ class ControlPlaneBizFacade:
         self,
         payload: ExecResultPayload,
     ) -> tuple[Optional[RunRecord], List[DispatchRequest], List[Tuple[Optional[str], ExecMiddlewareNextResponse]]]:
+        self._orchestrator.release_slot(payload.task_id)
         record, ready, next_responses = await self._coordinator.record_result(payload.run_id, payload)
         if ready:
-            await self._orchestrator.enqueue(ready)
+            await self._enqueue(ready)
         return record, ready, next_responses
 
+    async def read_payload(self, resource_id: str) -> Any:
+        return await self._coordinator.read_payload(resource_id)
+
     async def record_feedback(self, payload: ExecFeedbackPayload) -> None:
         await self._coordinator.record_feedback(payload)
 
@@ -101,7 +141,7 @@ class ControlPlaneBizFacade:
             worker_instance_id=worker_instance_id,
         )
         if ready:
-            await self._orchestrator.enqueue(ready)
+            await self._enqueue(ready)
         return ready, error
 
     async def resolve_next_response_worker(self, request_id: str) -> Optional[str]:
@@ -117,6 +157,7 @@ class ControlPlaneBizFacade:
         node_id: Optional[str],
         task_id: Optional[str],
     ) -> Optional[RunRecord]:
+        self._orchestrator.release_slot(task_id)
         record = await self._coordinator.reset_after_worker_cancel(
             run_id,
             node_id=node_id,
@@ -125,7 +166,7 @@ class ControlPlaneBizFacade:
         if record:
             ready = await self._coordinator.collect_ready_nodes(record.run_id)
             if ready:
-                await self._orchestrator.enqueue(ready)
+                await self._enqueue(ready)
         return record
 
     async def record_command_error(
@@ -135,17 +176,55 @@ class ControlPlaneBizFacade:
         run_id: Optional[str] = None,
         task_id: Optional[str] = None,
     ) -> tuple[Optional[RunRecord], List[DispatchRequest]]:
+        self._orchestrator.release_slot(task_id)
         record, ready = await self._coordinator.record_command_error(
             payload=payload,
             run_id=run_id,
             task_id=task_id,
         )
         if ready:
-            await self._orchestrator.enqueue(ready)
+            await self._enqueue(ready)
         return record, ready
 
     async def register_ack(self, dispatch_id: str) -> None:
         await self._orchestrator.register_ack(dispatch_id)
 
+    async def recover_runs(self) -> int:
+        """Restore in-flight runs from the run-state journal and resume dispatch."""
+
+        ready = await self._coordinator.recover()
+        ready.extend(await self._coordinator.collect_ready_nodes())
+        if ready:
+            await self._enqueue(ready)
+        return len(ready)
+
+    async def run_snapshot_event(self, run_id: str, *, tenant: str) -> Optional[UiEventEnvelope]:
+        """Fresh ``run.snapshot`` envelope for SSE clients resynchronising after an overflow.
+
+        Runs already evicted from memory are rebuilt from their archived summary.
+        """
+
+        record = await self._coordinator.get(run_id)
+        if record is not None:
+            return run_snapshot_event(record)
+        summary = await self._coordinator.get_summary(run_id)
+        return summary_snapshot_event(summary, tenant=tenant) if summary else None
+
+    def dispatch_metrics(self) -> Dict[str, object]:
+        return self._orchestrator.metrics()
+
+    async def _enqueue(self, ready: List[DispatchRequest]) -> None:
+        """Hand ready nodes to the orchestrator, completing memoized ones from the result cache first."""
+
+        remaining, next_responses = await self._coordinator.complete_memoized(ready)
+        if next_responses:
+            await send_next_responses(worker_gateway, next_responses, tenant=ready[0].tenant)
+        if remaining:
+            await self._orchestrator.enqueue(remaining)
+
+    async def shutdown(self) -> None:
+        await self._orchestrator.stop()
+        await self._coordinator.close()
+
 
 biz_facade = ControlPlaneBizFacade()
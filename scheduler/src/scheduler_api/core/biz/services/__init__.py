@@ -1,11 +1,33 @@
 """Business services for the control plane."""
 
+from .frame_archive import FrameArchive, SqlFrameArchive, build_frame_archive
+from .payload_offload import PayloadStore, PayloadUnavailableError, build_payload_store
+from .result_cache import CachedResult, ResultCache, SqlResultCache, build_result_cache
+from .run_archive import ArchivedRun, RunArchive, SqlRunArchive, build_run_archive
+from .run_journal import RunJournal, SqlRunJournal, build_run_journal
 from .run_state_service import DispatchRequest, FINAL_STATUSES, RunRecord, RunStateService, run_state_service
 
 __all__ = [
+    "ArchivedRun",
+    "CachedResult",
     "DispatchRequest",
     "FINAL_STATUSES",
+    "FrameArchive",
+    "PayloadStore",
+    "PayloadUnavailableError",
+    "ResultCache",
+    "RunArchive",
+    "RunJournal",
     "RunRecord",
     "RunStateService",
+    "SqlFrameArchive",
+    "SqlResultCache",
+    "SqlRunArchive",
+    "SqlRunJournal",
+    "build_frame_archive",
+    "build_payload_store",
+    "build_result_cache",
+    "build_run_archive",
+    "build_run_journal",
     "run_state_service",
 ]
@@ -0,0 +1,173 @@
+"""Spill store for container frame iterations folded out of run memory."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from scheduler_api.config.settings import SchedulerSettings
+from scheduler_api.db.models import RunFrameArchiveRecord
+
+LOGGER = logging.getLogger(__name__)
+
+
+class FrameArchive:
+    """No-op archive used when spilling is disabled (and in tests).
+
+    Folded iterations then survive only as the counters of their frame history.
+    """
+
+    enabled = False
+
+    def append(self, run_id: str, frame_id: str, iteration: int, payload: Dict[str, Any]) -> None:
+        return None
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    async def flush(self) -> None:
+        return None
+
+    async def fetch(self, run_id: str, frame_id: str, iteration: int) -> Optional[Dict[str, Any]]:
+        return None
+
+
+class SqlFrameArchive(FrameArchive):
+    """Archive backed by the ``run_frame_archive`` table.
+
+    Like the run journal, ``append`` only buffers; a background task writes
+    batches from a worker thread so completing a frame never waits on the
+    database. ``fetch`` serves still-buffered iterations from memory.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        *,
+        session_factory: Optional[Callable[[], Session]] = None,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+    ) -> None:
+        if session_factory is None:
+            from scheduler_api.db.session import SessionLocal
+
+            session_factory = SessionLocal
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._buffer: List[Dict[str, Any]] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._write_lock = asyncio.Lock()
+
+    def append(self, run_id: str, frame_id: str, iteration: int, payload: Dict[str, Any]) -> None:
+        self._buffer.append(
+            {
+                "run_id": run_id,
+                "frame_id": frame_id,
+                "iteration": iteration,
+                "payload": payload,
+                "created_at": datetime.now(timezone.utc),
+            }
+        )
+        if self._wakeup is not None and len(self._buffer) >= self._batch_size:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._runner(), name="run-frame-archive")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._write_lock:
+            while self._buffer:
+                batch = self._buffer[: self._batch_size]
+                del self._buffer[: len(batch)]
+                try:
+                    await asyncio.to_thread(self._write_batch, batch)
+                except Exception:  # noqa: BLE001
+                    LOGGER.exception("Failed to archive %d frame iterations; will retry", len(batch))
+                    self._buffer[:0] = batch
+                    raise
+
+    async def fetch(self, run_id: str, frame_id: str, iteration: int) -> Optional[Dict[str, Any]]:
+        for entry in reversed(self._buffer):
+            if (entry["run_id"], entry["frame_id"], entry["iteration"]) == (run_id, frame_id, iteration):
+                return entry["payload"]
+        return await asyncio.to_thread(self._fetch, run_id, frame_id, iteration)
+
+    async def _runner(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:  # noqa: BLE001
+                await asyncio.sleep(self._flush_interval)
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        rows = [
+            {
+                "run_id": entry["run_id"],
+                "frame_id": entry["frame_id"],
+                "iteration": entry["iteration"],
+                "payload": json.dumps(entry["payload"], default=str, separators=(",", ":")),
+                "created_at": entry["created_at"],
+            }
+            for entry in batch
+        ]
+        with self._session_factory() as session:
+            session.execute(insert(RunFrameArchiveRecord), rows)
+            session.commit()
+
+    def _fetch(self, run_id: str, frame_id: str, iteration: int) -> Optional[Dict[str, Any]]:
+        with self._session_factory() as session:
+            payload = session.execute(
+                select(RunFrameArchiveRecord.payload)
+                .where(
+                    RunFrameArchiveRecord.run_id == run_id,
+                    RunFrameArchiveRecord.frame_id == frame_id,
+                    RunFrameArchiveRecord.iteration == iteration,
+                )
+                .order_by(RunFrameArchiveRecord.id.desc())
+                .limit(1)
+            ).scalar_one_or_none()
+        return json.loads(payload) if payload else None
+
+
+def build_frame_archive(settings: SchedulerSettings) -> FrameArchive:
+    if not settings.frame_archive_enabled:
+        return FrameArchive()
+    return SqlFrameArchive(batch_size=settings.run_journal_batch_size)
+
+
+__all__ = [
+    "FrameArchive",
+    "SqlFrameArchive",
+    "build_frame_archive",
+]
@@ -0,0 +1,123 @@
+"""Store large node-result values as resources and pass them on by reference."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Callable, Collection, Dict, Optional
+
+from scheduler_api.config.settings import SchedulerSettings
+from scheduler_api.resources import (
+    ResourceNotFoundError,
+    ResourceProvider,
+    get_resource_provider,
+    get_resource_provider_for,
+)
+from shared.protocol.payload_ref import make_payload_ref, payload_ref_id
+
+PAYLOAD_RESOURCE_KIND = "payload"
+PAYLOAD_MIME_TYPE = "application/json"
+
+
+class PayloadUnavailableError(LookupError):
+    """Raised when a payload reference does not point at a stored result value."""
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _may_exceed(value: Any, threshold: int) -> bool:
+    # Cheap pre-check so small values are never serialised; JSON spends at most six bytes per character.
+    if isinstance(value, str):
+        return len(value) * 6 + 2 > threshold
+    return isinstance(value, (dict, list)) and bool(value)
+
+
+class PayloadStore:
+    """Moves node-result values above ``threshold_bytes`` into the resource provider.
+
+    Offloaded values are replaced by ``__payloadRef`` handles (see
+    :mod:`shared.protocol.payload_ref`), so edge bindings, dispatch requests, the
+    run journal and the UI only ever copy the handle; workers fetch the value once
+    when a handler needs it. Only top-level result keys are offloaded, and keys
+    named in ``pinned`` stay inline because an edge binding reads into them.
+    Identical values share one resource. Both methods block on storage I/O.
+    """
+
+    def __init__(
+        self,
+        threshold_bytes: int,
+        *,
+        provider_factory: Callable[[], ResourceProvider] = get_resource_provider,
+        provider_for: Callable[[str], ResourceProvider] = get_resource_provider_for,
+    ) -> None:
+        self._threshold = threshold_bytes
+        self._provider_factory = provider_factory
+        self._provider_for = provider_for
+
+    @property
+    def enabled(self) -> bool:
+        return self._threshold > 0
+
+    def offload(
+        self,
+        result: Dict[str, Any],
+        *,
+        run_id: str,
+        node_id: str,
+        pinned: Collection[str] = (),
+    ) -> Optional[Dict[str, Any]]:
+        """Return a copy of ``result`` with large values replaced, or ``None`` if nothing moved."""
+
+        if not self.enabled:
+            return None
+        replaced: Dict[str, Any] = {}
+        for key, value in result.items():
+            if key in pinned or payload_ref_id(value) or not _may_exceed(value, self._threshold):
+                continue
+            data = _encode(value)
+            if len(data) <= self._threshold:
+                continue
+            resource_id = self._save(data, run_id=run_id, node_id=node_id, key=key)
+            replaced[key] = make_payload_ref(resource_id, size_bytes=len(data), mime_type=PAYLOAD_MIME_TYPE)
+        if not replaced:
+            return None
+        return {**result, **replaced}
+
+    def load(self, resource_id: str) -> Any:
+        """Read back the value behind a payload reference."""
+
+        try:
+            provider = self._provider_for(resource_id)
+            path, stored = provider.open(resource_id)
+        except (ResourceNotFoundError, ValueError) as exc:
+            raise PayloadUnavailableError(resource_id) from exc
+        if (stored.metadata or {}).get("kind") != PAYLOAD_RESOURCE_KIND:
+            raise PayloadUnavailableError(resource_id)
+        return json.loads(path.read_bytes())
+
+    def _save(self, data: bytes, *, run_id: str, node_id: str, key: str) -> str:
+        provider = self._provider_factory()
+        existing = provider.find_by_sha256(hashlib.sha256(data).hexdigest())
+        if existing is not None and (existing.metadata or {}).get("kind") == PAYLOAD_RESOURCE_KIND:
+            return existing.resource_id
+        stored = provider.save_bytes(
+            filename=f"{run_id}-{node_id}-{key}.json",
+            data=data,
+            content_type=PAYLOAD_MIME_TYPE,
+            metadata={"kind": PAYLOAD_RESOURCE_KIND, "runId": run_id, "nodeId": node_id, "key": key},
+        )
+        return stored.resource_id
+
+
+def build_payload_store(settings: SchedulerSettings) -> PayloadStore:
+    return PayloadStore(settings.result_offload_threshold_bytes)
+
+
+__all__ = [
+    "PAYLOAD_RESOURCE_KIND",
+    "PayloadStore",
+    "PayloadUnavailableError",
+    "build_payload_store",
+]
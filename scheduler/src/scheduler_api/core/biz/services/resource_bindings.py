@@ -0,0 +1,246 @@
+"""Resolve package resource requirements into dispatch parameters."""
+
+from __future__ import annotations
+
+import copy
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from scheduler_api.catalog import PackageCatalogError, catalog
+from scheduler_api.resources import (
+    ResourceBindingCache,
+    ResourceNotFoundError,
+    get_resource_grant_store,
+    get_resource_provider_for,
+)
+
+from ..domain.models import DispatchRequest
+
+RESOURCE_BINDINGS_KEY = "__resourceBindings"
+RESOURCE_BINDING_ERRORS_KEY = "__resourceBindingErrors"
+MAX_INLINE_RESOURCE_BYTES = 64 * 1024
+INLINE_RESOURCE_TYPES = {"secret", "token", "api_key", "apikey", "key", "credential"}
+
+# (request, bindings, errors) for every request that gets resource parameters
+ResolvedBindings = List[Tuple[DispatchRequest, Dict[str, Any], List[Dict[str, Any]]]]
+
+
+class ResourceCacheMiss(Exception):
+    """Raised by a cache-only resolution that would have to hit the database or disk."""
+
+
+def _should_inline_value(requirement: Any) -> bool:
+    req_type = str(getattr(requirement, "type", "") or "").strip().lower()
+    metadata = getattr(requirement, "metadata", None) or {}
+    if isinstance(metadata, dict):
+        if metadata.get("inline") is True or metadata.get("exposeValue") is True:
+            return True
+    return req_type in INLINE_RESOURCE_TYPES
+
+
+def _is_required(requirement: Any) -> bool:
+    required = getattr(requirement, "required", True)
+    return required is not False
+
+
+def _select_grant(
+    grants: List[Any],
+    *,
+    package_version: Optional[str],
+) -> Optional[Any]:
+    if not grants:
+        return None
+    eligible = [
+        grant
+        for grant in grants
+        if not getattr(grant, "package_version", None)
+        or getattr(grant, "package_version", None) == package_version
+    ]
+    if not eligible:
+        return None
+    return max(eligible, key=_grant_created_at)
+
+
+def _grant_created_at(grant: Any) -> datetime:
+    value = getattr(grant, "created_at", None)
+    if isinstance(value, datetime):
+        return value
+    return datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _read_resource_value(provider, resource_id: str) -> Optional[str]:
+    path, stored = provider.open(resource_id)
+    if stored.size_bytes and stored.size_bytes > MAX_INLINE_RESOURCE_BYTES:
+        return None
+    data = path.read_bytes()
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("utf-8", "ignore")
+    return text.strip() if text else None
+
+
+def _load_package_requirements(package_name: str, package_version: str) -> List[Any]:
+    try:
+        manifest = catalog.get_manifest(package_name, package_version)
+    except PackageCatalogError:
+        return []
+    if manifest and getattr(manifest, "requirements", None):
+        return list(getattr(manifest.requirements, "resources", []) or [])
+    return []
+
+
+def _resolve_grant(
+    store,
+    *,
+    workflow_id: str,
+    package_name: str,
+    package_version: Optional[str],
+    resource_key: str,
+) -> Optional[Any]:
+    workflow_grants = store.list(
+        workflow_id=workflow_id,
+        package_name=package_name,
+        resource_key=resource_key,
+        scope="workflow",
+    )
+    selected = _select_grant(workflow_grants, package_version=package_version)
+    if selected:
+        return selected
+    global_grants = store.list(
+        package_name=package_name,
+        resource_key=resource_key,
+        scope="global",
+    )
+    return _select_grant(global_grants, package_version=package_version)
+
+
+def _get_resource(resource_id: str) -> Optional[Any]:
+    try:
+        return get_resource_provider_for(resource_id).get(resource_id)
+    except (ResourceNotFoundError, ValueError):
+        return None
+
+
+def _get_resource_value(resource_id: str) -> Optional[str]:
+    try:
+        return _read_resource_value(get_resource_provider_for(resource_id), resource_id)
+    except (ResourceNotFoundError, ValueError):
+        return None
+
+
+def resolve_resource_bindings(
+    requests: List[DispatchRequest],
+    *,
+    workflow_ids: Dict[str, str],
+    cache: ResourceBindingCache,
+    load: bool,
+) -> ResolvedBindings:
+    """Work out the bindings and binding errors of each request.
+
+    With ``load=False`` only cached lookups are used and :class:`ResourceCacheMiss`
+    is raised on the first miss, so the call is safe on the event loop; with
+    ``load=True`` misses go to the catalog, the grant store and the resource
+    providers (blocking I/O, run it in a worker thread). Requests are not
+    modified; hand the result to :func:`apply_resource_bindings`.
+    """
+
+    grant_store = get_resource_grant_store()
+
+    def cached(key: Hashable, loader: Callable[[], Any]) -> Any:
+        found, value = cache.lookup(key)
+        if found:
+            return value
+        if not load:
+            raise ResourceCacheMiss(key)
+        generation = cache.generation
+        value = loader()
+        cache.store(key, value, generation=generation)
+        return value
+
+    resolved: ResolvedBindings = []
+    for request in requests:
+        workflow_id = workflow_ids.get(request.run_id)
+        if not workflow_id or not request.package_name or not request.package_version:
+            continue
+        requirements = cached(
+            ("requirements", request.package_name, request.package_version),
+            lambda: _load_package_requirements(request.package_name, request.package_version),
+        )
+        if not requirements:
+            continue
+        bindings: Dict[str, Any] = {}
+        errors: List[Dict[str, Any]] = []
+        for requirement in requirements:
+            resource_key = getattr(requirement, "key", None)
+            if not resource_key:
+                continue
+            resource_key = str(resource_key)
+            grant = cached(
+                ("grant", workflow_id, request.package_name, request.package_version, resource_key),
+                lambda: _resolve_grant(
+                    grant_store,
+                    workflow_id=workflow_id,
+                    package_name=request.package_name,
+                    package_version=request.package_version,
+                    resource_key=resource_key,
+                ),
+            )
+            if not grant:
+                if _is_required(requirement):
+                    errors.append({"key": resource_key, "error": "missing_grant"})
+                continue
+            resource_id = str(getattr(grant, "resource_id", "") or "")
+            if not resource_id:
+                continue
+            stored = cached(("resource", resource_id), lambda: _get_resource(resource_id))
+            if stored is None:
+                errors.append({"key": resource_key, "error": "resource_not_found", "resourceId": resource_id})
+                continue
+            binding: Dict[str, Any] = {
+                "resourceId": stored.resource_id,
+                "type": stored.type,
+                "filename": stored.filename,
+                "mimeType": stored.mime_type,
+                "sizeBytes": stored.size_bytes,
+                "metadata": copy.deepcopy(stored.metadata) if stored.metadata else {},
+            }
+            if _should_inline_value(requirement):
+                value = cached(("value", stored.resource_id), lambda: _get_resource_value(stored.resource_id))
+                if value is None:
+                    errors.append(
+                        {
+                            "key": resource_key,
+                            "error": "resource_value_unavailable",
+                            "resourceId": stored.resource_id,
+                        }
+                    )
+                else:
+                    binding["value"] = value
+            bindings[resource_key] = binding
+        if bindings or errors:
+            resolved.append((request, bindings, errors))
+    return resolved
+
+
+def apply_resource_bindings(resolved: ResolvedBindings) -> None:
+    for request, bindings, errors in resolved:
+        request.parameters = copy.deepcopy(request.parameters) if request.parameters else {}
+        if bindings:
+            existing = request.parameters.get(RESOURCE_BINDINGS_KEY)
+            if isinstance(existing, dict):
+                merged = {**existing, **bindings}
+            else:
+                merged = bindings
+            request.parameters[RESOURCE_BINDINGS_KEY] = merged
+        if errors:
+            request.parameters[RESOURCE_BINDING_ERRORS_KEY] = errors
+
+
+__all__ = [
+    "RESOURCE_BINDINGS_KEY",
+    "RESOURCE_BINDING_ERRORS_KEY",
+    "ResourceCacheMiss",
+    "apply_resource_bindings",
+    "resolve_resource_bindings",
+]
@@ -0,0 +1,261 @@
+"""Content-addressed cache of results of memoizable nodes."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from scheduler_api.catalog import PackageCatalogError, catalog
+from scheduler_api.config.settings import SchedulerSettings
+from scheduler_api.db.models import NodeResultCacheRecord
+
+from ..domain.models import DispatchRequest
+
+LOGGER = logging.getLogger(__name__)
+
+MEMOIZE_CONFIG_KEY = "memoize"
+# result metadata marking a memo hit / carrying the key a dispatch missed under
+MEMO_HIT_KEY = "memoized"
+MEMO_KEY = "memoKey"
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def memo_key(request: DispatchRequest) -> str:
+    """Hash of what determines a memoizable node's result.
+
+    Parameters are taken as dispatched, i.e. after edge bindings copied the
+    upstream results (or their payload references) in and resource bindings
+    were applied, so the key covers upstream outputs as well as node inputs.
+    """
+
+    document = {
+        "package": request.package_name,
+        "version": request.package_version,
+        "type": request.node_type,
+        "parameters": request.parameters,
+    }
+    encoded = json.dumps(document, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def node_is_memoizable(package_name: str, package_version: str, node_type: str) -> Optional[bool]:
+    """Whether the manifest opts the node into memoization (``config.memoize: true``).
+
+    Returns ``None`` when the node is not (yet) in the catalog so callers do not
+    cache the answer.
+    """
+
+    try:
+        node = catalog.resolve_node(package_name, package_version, node_type)
+    except PackageCatalogError:
+        return None
+    config = node.config or {}
+    return config.get(MEMOIZE_CONFIG_KEY) is True
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    key: str
+    package_name: str
+    package_version: str
+    node_type: str
+    result: Dict[str, Any]
+    artifacts: List[Dict[str, Any]] = field(default_factory=list)
+    created_at: datetime = field(default_factory=_utc_now)
+
+
+class ResultCache:
+    """No-op cache used when memoization is disabled (and in tests)."""
+
+    enabled = False
+
+    def append(self, entry: CachedResult) -> None:
+        return None
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    async def flush(self) -> None:
+        return None
+
+    async def fetch(self, key: str) -> Optional[CachedResult]:
+        return None
+
+
+class SqlResultCache(ResultCache):
+    """Cache backed by the ``node_result_cache`` table.
+
+    Like the run archive, ``append`` only buffers and a background task writes
+    batches from a worker thread; lookups see buffered entries first. Entries
+    older than ``ttl_seconds`` (0 keeps them forever) are ignored on read and
+    pruned on write.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        *,
+        session_factory: Optional[Callable[[], Session]] = None,
+        ttl_seconds: float = 0.0,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+    ) -> None:
+        if session_factory is None:
+            from scheduler_api.db.session import SessionLocal
+
+            session_factory = SessionLocal
+        self._session_factory = session_factory
+        self._ttl = timedelta(seconds=ttl_seconds) if ttl_seconds > 0 else None
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        # key -> entry not yet committed (including the batch being written)
+        self._pending: Dict[str, CachedResult] = {}
+        self._buffer: List[CachedResult] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._write_lock = asyncio.Lock()
+
+    def append(self, entry: CachedResult) -> None:
+        self._pending[entry.key] = entry
+        self._buffer.append(entry)
+        if self._wakeup is not None and len(self._buffer) >= self._batch_size:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._runner(), name="result-cache")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._write_lock:
+            while self._buffer:
+                batch = self._buffer[: self._batch_size]
+                del self._buffer[: len(batch)]
+                try:
+                    await asyncio.to_thread(self._write_batch, batch)
+                except Exception:  # noqa: BLE001
+                    LOGGER.exception("Failed to store %d memoized result(s); will retry", len(batch))
+                    self._buffer[:0] = batch
+                    raise
+                for entry in batch:
+                    if self._pending.get(entry.key) is entry:
+                        del self._pending[entry.key]
+
+    async def fetch(self, key: str) -> Optional[CachedResult]:
+        entry = self._pending.get(key)
+        if entry is None:
+            entry = await asyncio.to_thread(self._fetch, key)
+        if entry is None or self._expired(entry.created_at, _utc_now()):
+            return None
+        return entry
+
+    def _expired(self, created_at: datetime, now: datetime) -> bool:
+        return self._ttl is not None and created_at + self._ttl <= now
+
+    async def _runner(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:  # noqa: BLE001
+                await asyncio.sleep(self._flush_interval)
+
+    def _write_batch(self, batch: List[CachedResult]) -> None:
+        latest = {entry.key: entry for entry in batch}
+        rows = [
+            {
+                "cache_key": entry.key,
+                "package_name": entry.package_name,
+                "package_version": entry.package_version,
+                "node_type": entry.node_type,
+                "created_at": entry.created_at,
+                "expires_at": entry.created_at + self._ttl if self._ttl else None,
+                "payload": zlib.compress(
+                    json.dumps(
+                        {"result": entry.result, "artifacts": entry.artifacts},
+                        default=str,
+                    ).encode("utf-8")
+                ),
+            }
+            for entry in latest.values()
+        ]
+        with self._session_factory() as session:
+            session.execute(delete(NodeResultCacheRecord).where(NodeResultCacheRecord.cache_key.in_(list(latest))))
+            if self._ttl:
+                session.execute(delete(NodeResultCacheRecord).where(NodeResultCacheRecord.expires_at <= _utc_now()))
+            session.execute(insert(NodeResultCacheRecord), rows)
+            session.commit()
+
+    def _fetch(self, key: str) -> Optional[CachedResult]:
+        with self._session_factory() as session:
+            row = session.get(NodeResultCacheRecord, key)
+            if row is None:
+                return None
+            payload = json.loads(zlib.decompress(row.payload).decode("utf-8"))
+            return CachedResult(
+                key=row.cache_key,
+                package_name=row.package_name,
+                package_version=row.package_version,
+                node_type=row.node_type,
+                result=payload.get("result") or {},
+                artifacts=payload.get("artifacts") or [],
+                created_at=_as_utc(row.created_at),
+            )
+
+
+def build_result_cache(settings: SchedulerSettings) -> ResultCache:
+    if not settings.result_cache_enabled:
+        return ResultCache()
+    return SqlResultCache(
+        ttl_seconds=settings.result_cache_ttl_seconds,
+        batch_size=settings.run_journal_batch_size,
+    )
+
+
+__all__ = [
+    "CachedResult",
+    "MEMOIZE_CONFIG_KEY",
+    "MEMO_HIT_KEY",
+    "MEMO_KEY",
+    "ResultCache",
+    "SqlResultCache",
+    "build_result_cache",
+    "memo_key",
+    "node_is_memoizable",
+]
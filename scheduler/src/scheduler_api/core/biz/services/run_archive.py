@@ -0,0 +1,300 @@
+"""Persistent store for finished runs evicted from scheduler memory."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, delete, insert, or_, select
+from sqlalchemy.orm import Session
+
+from scheduler_api.config.settings import SchedulerSettings
+from scheduler_api.db.models import RunArchiveRecord
+from scheduler_api.models.list_runs200_response_items_inner import ListRuns200ResponseItemsInner
+
+from ..domain.models import RunKey, RunRecord
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _json_default(value: Any) -> str:
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+@dataclass(frozen=True)
+class ArchivedRun:
+    """A finished run as kept by the archive: filter columns plus its summary."""
+
+    run_id: str
+    tenant: str
+    client_id: str
+    status: str
+    definition_hash: str
+    created_at: datetime
+    finished_at: Optional[datetime]
+    summary: ListRuns200ResponseItemsInner
+    # node_id -> definition fingerprint, kept so the run can seed incremental re-runs
+    node_fingerprints: Dict[str, str] = field(default_factory=dict)
+    # frame_id -> frame history summary; iteration details live in the frame archive
+    frame_history: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def key(self) -> RunKey:
+        return (self.created_at, self.run_id)
+
+    @classmethod
+    def from_record(cls, record: RunRecord) -> "ArchivedRun":
+        return cls(
+            run_id=record.run_id,
+            tenant=record.tenant,
+            client_id=record.client_id,
+            status=record.status,
+            definition_hash=record.definition_hash,
+            created_at=record.created_at,
+            finished_at=record.finished_at,
+            summary=record.to_summary(),
+            node_fingerprints=record.node_fingerprints,
+            frame_history={frame_id: history.to_summary() for frame_id, history in record.frame_history.items()},
+        )
+
+    def to_summary(self) -> ListRuns200ResponseItemsInner:
+        return self.summary
+
+    def matches(self, *, after: Optional[RunKey], status: Optional[str], client_id: Optional[str]) -> bool:
+        return (
+            (after is None or self.key > after)
+            and (not status or self.status == status)
+            and (not client_id or self.client_id == client_id)
+        )
+
+
+class RunArchive:
+    """No-op archive used when archiving is disabled (and in tests).
+
+    Evicted runs are then simply forgotten.
+    """
+
+    enabled = False
+
+    def append(self, run: ArchivedRun) -> None:
+        return None
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    async def flush(self) -> None:
+        return None
+
+    async def fetch(self, run_id: str) -> Optional[ArchivedRun]:
+        return None
+
+    async def list(
+        self,
+        *,
+        after: Optional[RunKey],
+        limit: int,
+        status: Optional[str] = None,
+        client_id: Optional[str] = None,
+    ) -> List[ArchivedRun]:
+        return []
+
+
+class SqlRunArchive(RunArchive):
+    """Archive backed by the ``run_archive`` table.
+
+    ``append`` only buffers; a background task writes batches from a worker
+    thread. Writes replace any earlier row of the same run, so archiving a run
+    twice is harmless. Reads merge still-buffered runs with the table, which is
+    paged by the ``(created_at, run_id)`` keyset.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        *,
+        session_factory: Optional[Callable[[], Session]] = None,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+    ) -> None:
+        if session_factory is None:
+            from scheduler_api.db.session import SessionLocal
+
+            session_factory = SessionLocal
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        # run_id -> archived run not yet committed (including the batch being written)
+        self._pending: Dict[str, ArchivedRun] = {}
+        self._buffer: List[ArchivedRun] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._write_lock = asyncio.Lock()
+
+    def append(self, run: ArchivedRun) -> None:
+        self._pending[run.run_id] = run
+        self._buffer.append(run)
+        if self._wakeup is not None and len(self._buffer) >= self._batch_size:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._runner(), name="run-archive")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._write_lock:
+            while self._buffer:
+                batch = self._buffer[: self._batch_size]
+                del self._buffer[: len(batch)]
+                try:
+                    await asyncio.to_thread(self._write_batch, batch)
+                except Exception:  # noqa: BLE001
+                    LOGGER.exception("Failed to archive %d run(s); will retry", len(batch))
+                    self._buffer[:0] = batch
+                    raise
+                for run in batch:
+                    if self._pending.get(run.run_id) is run:
+                        del self._pending[run.run_id]
+
+    async def fetch(self, run_id: str) -> Optional[ArchivedRun]:
+        pending = self._pending.get(run_id)
+        if pending is not None:
+            return pending
+        return await asyncio.to_thread(self._fetch, run_id)
+
+    async def list(
+        self,
+        *,
+        after: Optional[RunKey],
+        limit: int,
+        status: Optional[str] = None,
+        client_id: Optional[str] = None,
+    ) -> List[ArchivedRun]:
+        pending = [
+            run for run in self._pending.values() if run.matches(after=after, status=status, client_id=client_id)
+        ]
+        # Every pending run may shadow one stored row, so over-fetch by that many.
+        stored = await asyncio.to_thread(self._list, after, limit + len(pending), status, client_id)
+        merged = {run.run_id: run for run in stored}
+        merged.update((run.run_id, run) for run in pending)
+        return sorted(merged.values(), key=lambda run: run.key)[:limit]
+
+    async def _runner(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:  # noqa: BLE001
+                await asyncio.sleep(self._flush_interval)
+
+    def _write_batch(self, batch: List[ArchivedRun]) -> None:
+        latest = {run.run_id: run for run in batch}
+        rows = [
+            {
+                "run_id": run.run_id,
+                "tenant": run.tenant,
+                "client_id": run.client_id,
+                "status": run.status,
+                "definition_hash": run.definition_hash,
+                "created_at": run.created_at,
+                "finished_at": run.finished_at,
+                "payload": zlib.compress(
+                    run.summary.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
+                ),
+                "node_fingerprints": json.dumps(run.node_fingerprints) if run.node_fingerprints else None,
+                "frame_history": json.dumps(run.frame_history, default=_json_default) if run.frame_history else None,
+            }
+            for run in latest.values()
+        ]
+        with self._session_factory() as session:
+            session.execute(delete(RunArchiveRecord).where(RunArchiveRecord.run_id.in_(list(latest))))
+            session.execute(insert(RunArchiveRecord), rows)
+            session.commit()
+
+    def _fetch(self, run_id: str) -> Optional[ArchivedRun]:
+        with self._session_factory() as session:
+            row = session.get(RunArchiveRecord, run_id)
+            return self._decode(row) if row else None
+
+    def _list(
+        self,
+        after: Optional[RunKey],
+        limit: int,
+        status: Optional[str],
+        client_id: Optional[str],
+    ) -> List[ArchivedRun]:
+        query = select(RunArchiveRecord)
+        if after is not None:
+            created_at, run_id = after
+            query = query.where(
+                or_(
+                    RunArchiveRecord.created_at > created_at,
+                    and_(RunArchiveRecord.created_at == created_at, RunArchiveRecord.run_id > run_id),
+                )
+            )
+        if status:
+            query = query.where(RunArchiveRecord.status == status)
+        if client_id:
+            query = query.where(RunArchiveRecord.client_id == client_id)
+        query = query.order_by(RunArchiveRecord.created_at, RunArchiveRecord.run_id).limit(limit)
+        with self._session_factory() as session:
+            return [self._decode(row) for row in session.execute(query).scalars()]
+
+    @staticmethod
+    def _decode(row: RunArchiveRecord) -> ArchivedRun:
+        summary = json.loads(zlib.decompress(row.payload).decode("utf-8"))
+        return ArchivedRun(
+            run_id=row.run_id,
+            tenant=row.tenant,
+            client_id=row.client_id,
+            status=row.status,
+            definition_hash=row.definition_hash,
+            created_at=_as_utc(row.created_at),
+            finished_at=_as_utc(row.finished_at) if row.finished_at else None,
+            summary=ListRuns200ResponseItemsInner.from_dict(summary),
+            node_fingerprints=json.loads(row.node_fingerprints) if row.node_fingerprints else {},
+            frame_history=json.loads(row.frame_history) if row.frame_history else {},
+        )
+
+
+def build_run_archive(settings: SchedulerSettings) -> RunArchive:
+    if not settings.run_archive_enabled:
+        return RunArchive()
+    return SqlRunArchive(batch_size=settings.run_journal_batch_size)
+
+
+__all__ = [
+    "ArchivedRun",
+    "RunArchive",
+    "SqlRunArchive",
+    "build_run_archive",
+]
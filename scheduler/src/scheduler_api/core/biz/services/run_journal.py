@@ -0,0 +1,212 @@
+"""Write-ahead journal of run-state transitions for crash recovery."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from scheduler_api.config.settings import SchedulerSettings
+from scheduler_api.db.models import RunJournalRecord
+
+LOGGER = logging.getLogger(__name__)
+
+JOURNAL_CLOSED = "closed"
+
+
+@dataclass
+class JournalEntry:
+    run_id: str
+    kind: str
+    payload: Dict[str, Any]
+    created_at: datetime
+
+
+class RunJournal:
+    """No-op journal used when persistence is disabled (and in tests)."""
+
+    enabled = False
+
+    def append(
+        self,
+        run_id: str,
+        kind: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        created_at: Optional[datetime] = None,
+    ) -> None:
+        return None
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    async def flush(self) -> None:
+        return None
+
+    async def load(self) -> Dict[str, List[JournalEntry]]:
+        return {}
+
+
+class SqlRunJournal(RunJournal):
+    """Journal backed by the ``run_state_journal`` table.
+
+    ``append`` only buffers in memory so the dispatch path never waits on the
+    database; a background task commits buffered entries in batches from a
+    worker thread. Entries of runs that reach a final status are deleted when
+    the ``closed`` marker is written, so the table only holds in-flight runs.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        *,
+        session_factory: Optional[Callable[[], Session]] = None,
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+    ) -> None:
+        if session_factory is None:
+            from scheduler_api.db.session import SessionLocal
+
+            session_factory = SessionLocal
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._buffer: List[Dict[str, Any]] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._write_lock = asyncio.Lock()
+
+    def append(
+        self,
+        run_id: str,
+        kind: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        created_at: Optional[datetime] = None,
+    ) -> None:
+        self._buffer.append(
+            {
+                "run_id": run_id,
+                "kind": kind,
+                "payload": payload or {},
+                "created_at": created_at or datetime.now(timezone.utc),
+            }
+        )
+        if self._wakeup is not None and len(self._buffer) >= self._batch_size:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._runner(), name="run-state-journal")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._write_lock:
+            while self._buffer:
+                batch = self._buffer[: self._batch_size]
+                del self._buffer[: len(batch)]
+                try:
+                    await asyncio.to_thread(self._write_batch, batch)
+                except Exception:  # noqa: BLE001
+                    LOGGER.exception("Failed to persist %d run journal entries; will retry", len(batch))
+                    self._buffer[:0] = batch
+                    raise
+
+    async def load(self) -> Dict[str, List[JournalEntry]]:
+        await self.flush()
+        return await asyncio.to_thread(self._load_entries)
+
+    async def _runner(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:  # noqa: BLE001
+                # Already logged; back off for one interval before retrying.
+                await asyncio.sleep(self._flush_interval)
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        rows = [
+            {
+                "run_id": entry["run_id"],
+                "kind": entry["kind"],
+                "payload": json.dumps(entry["payload"], default=str, separators=(",", ":")),
+                "created_at": entry["created_at"],
+            }
+            for entry in batch
+        ]
+        closed = {entry["run_id"] for entry in batch if entry["kind"] == JOURNAL_CLOSED}
+        with self._session_factory() as session:
+            session.execute(insert(RunJournalRecord), rows)
+            if closed:
+                session.execute(delete(RunJournalRecord).where(RunJournalRecord.run_id.in_(closed)))
+            session.commit()
+
+    def _load_entries(self) -> Dict[str, List[JournalEntry]]:
+        grouped: Dict[str, List[JournalEntry]] = defaultdict(list)
+        with self._session_factory() as session:
+            result = session.execute(
+                select(
+                    RunJournalRecord.run_id,
+                    RunJournalRecord.kind,
+                    RunJournalRecord.payload,
+                    RunJournalRecord.created_at,
+                ).order_by(RunJournalRecord.id)
+            )
+            for run_id, kind, payload, created_at in result:
+                if created_at is not None and created_at.tzinfo is None:
+                    created_at = created_at.replace(tzinfo=timezone.utc)
+                grouped[run_id].append(
+                    JournalEntry(
+                        run_id=run_id,
+                        kind=kind,
+                        payload=json.loads(payload) if payload else {},
+                        created_at=created_at,
+                    )
+                )
+        return dict(grouped)
+
+
+def build_run_journal(settings: SchedulerSettings) -> RunJournal:
+    if not settings.run_journal_enabled:
+        return RunJournal()
+    return SqlRunJournal(
+        batch_size=settings.run_journal_batch_size,
+        flush_interval=settings.run_journal_flush_interval_ms / 1000,
+    )
+
+
+__all__ = [
+    "JOURNAL_CLOSED",
+    "JournalEntry",
+    "RunJournal",
+    "SqlRunJournal",
+    "build_run_journal",
+]
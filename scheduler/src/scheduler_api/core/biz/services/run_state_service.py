@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import heapq
 import logging
-from datetime import datetime, timezone
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 from scheduler_api.models.list_runs200_response import ListRuns200Response
+from scheduler_api.models.list_runs200_response_items_inner import ListRuns200ResponseItemsInner
+from scheduler_api.models.list_runs200_response_items_inner_error import ListRuns200ResponseItemsInnerError
 from scheduler_api.models.start_run_request import StartRunRequest
 from shared.models.biz.exec.result import ExecResultPayload
 from shared.models.biz.exec.error import ExecErrorPayload
@@ -15,17 +20,30 @@ from shared.models.biz.exec.feedback import ExecFeedbackPayload
 from shared.models.biz.exec.next.request import ExecMiddlewareNextRequest
 from shared.models.biz.exec.next.response import ExecMiddlewareNextResponse
 from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
-from scheduler_api.catalog import PackageCatalogError, catalog
-from scheduler_api.resources import ResourceNotFoundError, get_resource_grant_store, get_resource_provider_for
-from ..domain.models import DispatchRequest, FrameRuntimeState, NodeState, RunRecord, FINAL_STATUSES, _utc_now
+from scheduler_api.config.settings import get_settings
+from scheduler_api.resources import get_resource_binding_cache
+from ..domain.models import (
+    DispatchRequest,
+    FrameHistory,
+    FrameRuntimeState,
+    NodeState,
+    RunKey,
+    RunListIndex,
+    RunRecord,
+    FINAL_STATUSES,
+    _utc_now,
+)
 from ..domain.bindings import _merge_result_updates
 from ..domain.graph import apply_edge_bindings, apply_frame_edge_bindings, apply_middleware_output_bindings
 from ..domain.frames import activate_frame, build_container_frames, current_frame, pop_frame
 from ..events.format import build_workflow_snapshot
-from ..engine import dispatch, frames, initialise, lifecycle, lookup, status
+from ..engine import dispatch, frames, initialise, lifecycle, lookup, rerun, status
 from ..events import emit
 from ..engine.next import handle_next_request as process_next_request
+from ..engine.plan import PlanCache
 from ..engine.pending import (
+    PendingNextRequests,
+    build_pending_next_requests,
     collect_expired_next_requests as collect_pending_next_expired,
     finalise_pending_next as finalise_pending_next_request,
     resolve_next_response_worker as resolve_pending_next_worker,
@@ -35,126 +53,139 @@ from ..engine.updates import (
     apply_feedback,
     apply_record_result,
 )
+from .frame_archive import FrameArchive, build_frame_archive
+from .payload_offload import PayloadStore, build_payload_store
+from .result_cache import MEMO_HIT_KEY, MEMO_KEY, CachedResult, ResultCache, build_result_cache
+from . import result_cache
+from .run_archive import ArchivedRun, RunArchive, build_run_archive
+from . import resource_bindings
+from .run_journal import JOURNAL_CLOSED, JournalEntry, RunJournal, build_run_journal
 
 LOGGER = logging.getLogger(__name__)
 
-RESOURCE_BINDINGS_KEY = "__resourceBindings"
-RESOURCE_BINDING_ERRORS_KEY = "__resourceBindingErrors"
-MAX_INLINE_RESOURCE_BYTES = 64 * 1024
-INLINE_RESOURCE_TYPES = {"secret", "token", "api_key", "apikey", "key", "credential"}
-
-
-def _should_inline_value(requirement: Any) -> bool:
-    req_type = str(getattr(requirement, "type", "") or "").strip().lower()
-    metadata = getattr(requirement, "metadata", None) or {}
-    if isinstance(metadata, dict):
-        if metadata.get("inline") is True or metadata.get("exposeValue") is True:
-            return True
-    return req_type in INLINE_RESOURCE_TYPES
-
-
-def _is_required(requirement: Any) -> bool:
-    required = getattr(requirement, "required", True)
-    return required is not False
-
-
-def _select_grant(
-    grants: List[Any],
-    *,
-    package_version: Optional[str],
-) -> Optional[Any]:
-    if not grants:
-        return None
-    eligible = [
-        grant
-        for grant in grants
-        if not getattr(grant, "package_version", None)
-        or getattr(grant, "package_version", None) == package_version
-    ]
-    if not eligible:
-        return None
-    return max(eligible, key=_grant_created_at)
-
-
-def _grant_created_at(grant: Any) -> datetime:
-    value = getattr(grant, "created_at", None)
-    if isinstance(value, datetime):
-        return value
-    return datetime.min.replace(tzinfo=timezone.utc)
-
-
-def _read_resource_value(provider, resource_id: str) -> Optional[str]:
-    path, stored = provider.open(resource_id)
-    if stored.size_bytes and stored.size_bytes > MAX_INLINE_RESOURCE_BYTES:
-        return None
-    data = path.read_bytes()
-    try:
-        text = data.decode("utf-8")
-    except UnicodeDecodeError:
-        text = data.decode("utf-8", "ignore")
-    return text.strip() if text else None
-
-
-def _load_package_requirements(
-    package_name: str,
-    package_version: str,
-    cache: Dict[Tuple[str, str], List[Any]],
-) -> List[Any]:
-    if not package_name or not package_version:
-        return []
-    key = (package_name, package_version)
-    cached = cache.get(key)
-    if cached is not None:
-        return cached
-    try:
-        manifest = catalog.get_manifest(package_name, package_version)
-    except PackageCatalogError:
-        cache[key] = []
-        return []
-    requirements = []
-    if manifest and getattr(manifest, "requirements", None):
-        requirements = list(getattr(manifest.requirements, "resources", []) or [])
-    cache[key] = requirements
-    return requirements
-
-
-def _resolve_grant(
-    store,
-    *,
-    workflow_id: str,
-    package_name: str,
-    package_version: Optional[str],
-    resource_key: str,
-) -> Optional[Any]:
-    workflow_grants = store.list(
-        workflow_id=workflow_id,
-        package_name=package_name,
-        resource_key=resource_key,
-        scope="workflow",
-    )
-    selected = _select_grant(workflow_grants, package_version=package_version)
-    if selected:
-        return selected
-    global_grants = store.list(
-        package_name=package_name,
-        resource_key=resource_key,
-        scope="global",
-    )
-    return _select_grant(global_grants, package_version=package_version)
-
+# Upper bound on how long an idle scheduler waits between retention sweeps.
+RETENTION_SWEEP_SECONDS = 60.0
 
 class RunStateService:
-    """Thread-safe run state service for REST and WebSocket layers."""
+    """Thread-safe run state service for REST and WebSocket layers.
+
+    State is partitioned per run: every mutation acquires only the lock of the
+    run it touches, so a busy run cannot stall acknowledgements for the others.
+    Cross-run reads never take a lock: ``snapshot`` walks a copy-on-write
+    index of run ids and ``to_list_response`` pages a sorted index that the
+    records keep current as their status changes. The middleware ``next`` table is
+    shared, but it is only mutated synchronously inside a critical section
+    (there is no ``await`` while it is being rewritten), so it needs no lock of
+    its own on a single event loop.
+
+    When a journal is attached every state transition is appended to it, and
+    ``recover`` rebuilds in-flight runs after a restart by replaying those
+    transitions through the same engine helpers.
 
-    def __init__(self) -> None:
+    Runs are written to the run archive when they finish and evicted from
+    memory once idle for the retention period or beyond the retained count;
+    ``get_summary`` and ``to_list_response`` read through to the archive.
+    Besides run activity, a background sweep started by ``recover`` enforces
+    the retention period on an idle scheduler.
+    """
+
+    def __init__(
+        self,
+        *,
+        journal: Optional[RunJournal] = None,
+        feedback_checkpoint_seconds: float = 0.0,
+        event_coalesce_seconds: float = 0.0,
+        plan_cache_size: int = 0,
+        frame_history_size: int = 3,
+        frame_archive: Optional[FrameArchive] = None,
+        run_retention_seconds: float = 0.0,
+        run_retention_max_finished: int = 0,
+        run_archive: Optional[RunArchive] = None,
+        payload_store: Optional[PayloadStore] = None,
+        result_cache: Optional[ResultCache] = None,
+    ) -> None:
         self._runs: Dict[str, RunRecord] = {}
-        self._lock = asyncio.Lock()
-        # pending middleware next requests keyed by request_id -> (run_id, worker_instance_id, worker_name, deadline, node_id, middleware_id, target_task_id)
-        self._pending_next_requests: Dict[
-            str,
-            Tuple[str, Optional[str], Optional[str], Optional[datetime], Optional[str], Optional[str], Optional[str]],
-        ] = {}
-        self._emitter = emit.build_run_registry_emitter()
+        self._run_locks: Dict[str, asyncio.Lock] = {}
+        # run ids in creation order; replaced (never mutated) so readers can iterate without locking
+        self._run_index: Tuple[str, ...] = ()
+        self._index_version = 0
+        # live runs sorted by (created_at, run_id) per status/client filter, kept current by the records
+        self._list_index = RunListIndex()
+        # pending middleware next requests keyed by request_id, expired from a deadline heap
+        self._pending_next_requests: PendingNextRequests = build_pending_next_requests(utc_now=self._now)
+        # task_id -> run that most recently dispatched it; node/frame/dispatch lookups
+        # inside a run go through RunRecord.task_index, frame_tasks and dispatch_index
+        self._task_runs: Dict[str, str] = {}
+        # compiled workflow plans keyed by definition hash; 0 compiles every run afresh
+        self._plans = PlanCache(plan_cache_size)
+        self._emitter = emit.build_run_registry_emitter(coalesce_window_seconds=event_coalesce_seconds)
+        self._journal = journal or RunJournal()
+        self._frame_history_size = max(frame_history_size, 1)
+        self._frame_archive = frame_archive or FrameArchive()
+        # finished runs still in memory -> last finish/read time, least recently used first
+        self._finished: "OrderedDict[str, datetime]" = OrderedDict()
+        # finished run -> record version last written to the run archive
+        self._archived_versions: Dict[str, int] = {}
+        self._run_retention = timedelta(seconds=run_retention_seconds)
+        self._run_retention_max_finished = run_retention_max_finished
+        self._retention_task: Optional[asyncio.Task[None]] = None
+        self._run_archive = run_archive or RunArchive()
+        # large result values become resources; 0 keeps every result inline
+        self._payload_store = payload_store or PayloadStore(0)
+        # memoized node results; task_id -> (cache key, node ident) of dispatches that missed it
+        self._result_cache = result_cache or ResultCache()
+        self._memo_keys: Dict[str, Tuple[str, Tuple[str, str, str]]] = {}
+        self._memoizable: Dict[Tuple[str, str, str], bool] = {}
+        self._feedback_checkpoint_seconds = feedback_checkpoint_seconds
+        self._feedback_checkpoints: Dict[Tuple[str, str], datetime] = {}
+        self._replaying = False
+        self._replay_clock: Optional[datetime] = None
+
+    @property
+    def journal(self) -> RunJournal:
+        return self._journal
+
+    def _now(self) -> datetime:
+        return self._replay_clock or _utc_now()
+
+    def _journal_transition(
+        self,
+        record: RunRecord,
+        kind: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        created_at: Optional[datetime] = None,
+    ) -> None:
+        if self._replaying:
+            return
+        self._journal.append(record.run_id, kind, payload, created_at=created_at)
+        if record.settled:
+            self._journal.append(record.run_id, JOURNAL_CLOSED)
+            for key in [key for key in self._feedback_checkpoints if key[0] == record.run_id]:
+                self._feedback_checkpoints.pop(key, None)
+
+    @property
+    def index_version(self) -> int:
+        """Monotonic counter bumped whenever the set of tracked runs changes."""
+
+        return self._index_version
+
+    def _lock_for(self, run_id: str) -> asyncio.Lock:
+        lock = self._run_locks.get(run_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._run_locks[run_id] = lock
+        return lock
+
+    def _find_run_id_by_task(self, task_id: str) -> Optional[str]:
+        run_id = self._task_runs.get(task_id)
+        if run_id is None:
+            return None
+        record = self._runs.get(run_id)
+        if record is None or not (record.find_node_by_task(task_id) or task_id in record.frame_tasks):
+            self._task_runs.pop(task_id, None)
+            return None
+        return run_id
 
     async def create_run(
         self,
@@ -162,67 +193,163 @@ class RunStateService:
         run_id: str,
         request: StartRunRequest,
         tenant: str,
+        reused: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> RunRecord:
-        async with self._lock:
-            record = initialise.build_run_record(run_id=run_id, request=request, tenant=tenant)
+        self._evict_finished()
+        async with self._lock_for(run_id):
+            record = initialise.build_run_record(run_id=run_id, request=request, tenant=tenant, plans=self._plans)
+            if reused:
+                rerun.seed_reused_nodes(
+                    record,
+                    reused,
+                    apply_edge_bindings=apply_edge_bindings,
+                    release_dependents=self._release_reused_dependents,
+                    utc_now=self._now,
+                )
+            self._finished.pop(run_id, None)
+            self._archived_versions.pop(run_id, None)
+            if run_id not in self._runs:
+                self._run_index = self._run_index + (run_id,)
             self._runs[run_id] = record
-            snapshot = copy.deepcopy(record)
+            self._index_version += 1
+            if self._replay_clock:
+                record.created_at = self._replay_clock
+            self._list_index.add(record)
+            snapshot = record.snapshot()
+            if self._journal.enabled:
+                created: Dict[str, Any] = {"request": request.to_dict(), "tenant": tenant}
+                if reused:
+                    created["reused"] = reused
+                self._journal_transition(record, "created", created, created_at=record.created_at)
+            self._track_finished(record)
         tasks = emit.build_run_state_tasks(self._emitter, snapshot)
         await asyncio.gather(*tasks)
         return snapshot
 
+    async def rerun_run(
+        self,
+        *,
+        source_run_id: str,
+        run_id: str,
+        request: StartRunRequest,
+        tenant: str,
+    ) -> Optional[RunRecord]:
+        """Start ``request`` as a new run that reuses unchanged results of ``source_run_id``.
+
+        Root nodes whose definition fingerprint, upstream nodes and outcome are
+        unchanged since the source run start out succeeded with the previous
+        results; only the rest is dispatched. Returns ``None`` when the source
+        run is unknown.
+        """
+
+        source = await self._rerun_source(source_run_id)
+        if source is None:
+            return None
+        workflow = request.workflow
+        fingerprints = initialise.compute_node_fingerprints(workflow)
+        reused = rerun.select_reusable_nodes(workflow, fingerprints, source)
+        return await self.create_run(run_id=run_id, request=request, tenant=tenant, reused=reused)
+
+    async def _rerun_source(self, run_id: str) -> Optional[rerun.RerunSource]:
+        if run_id in self._runs:
+            async with self._lock_for(run_id):
+                record = self._runs.get(run_id)
+                if record:
+                    self._touch_finished(run_id)
+                    return rerun.RerunSource.from_summary(run_id, record.node_fingerprints, record.to_summary())
+        archived = await self._run_archive.fetch(run_id)
+        if archived is None:
+            return None
+        # Runs archived before fingerprints were kept have none, so nothing of them is reused.
+        return rerun.RerunSource.from_summary(run_id, archived.node_fingerprints, archived.summary)
+
+    def _release_reused_dependents(self, record: RunRecord, node: NodeState) -> None:
+        # Only count dependencies down; collect_ready_nodes dispatches what became ready.
+        frames.release_dependents(
+            record,
+            node,
+            None,
+            [],
+            is_container_node=lambda _node: False,
+            is_host_with_middleware=lambda _node: False,
+            should_auto_dispatch=lambda _node: False,
+            start_container_execution=self._start_container_execution,
+            build_dispatch_request_for_node=dispatch.build_dispatch_request_for_node,
+        )
+
     async def get(self, run_id: str) -> Optional[RunRecord]:
-        async with self._lock:
+        async with self._lock_for(run_id):
             record = self._runs.get(run_id)
-            return copy.deepcopy(record) if record else None
+            return record.snapshot() if record else None
+
+    async def get_summary(self, run_id: str) -> Optional[ListRuns200ResponseItemsInner]:
+        """Summary of a run, served from the archive once it has been evicted."""
+
+        if run_id in self._runs:
+            async with self._lock_for(run_id):
+                record = self._runs.get(run_id)
+                if record:
+                    self._touch_finished(run_id)
+                    return record.to_summary()
+        archived = await self._run_archive.fetch(run_id)
+        return archived.to_summary() if archived else None
 
     async def get_by_task(self, task_id: str) -> Optional[RunRecord]:
-        async with self._lock:
-            for record in self._runs.values():
-                if record.task_id == task_id:
-                    return copy.deepcopy(record)
-                if record.find_node_by_task(task_id):
-                    return copy.deepcopy(record)
-        return None
+        run_id = self._find_run_id_by_task(task_id)
+        return await self.get(run_id) if run_id else None
 
     async def get_workflow_with_state(self, run_id: str) -> Optional[StartRunRequestWorkflow]:
-        async with self._lock:
+        async with self._lock_for(run_id):
             record = self._runs.get(run_id)
             if not record:
                 return None
-            snapshot = copy.deepcopy(record)
+            snapshot = record.snapshot()
         return build_workflow_snapshot(snapshot)
 
     async def snapshot(self) -> List[RunRecord]:
-        async with self._lock:
-            return [copy.deepcopy(record) for record in self._runs.values()]
+        # Mutations never yield while a record is half-updated, so copying each
+        # record without its lock still observes a consistent state.
+        snapshots: List[RunRecord] = []
+        for run_id in self._run_index:
+            record = self._runs.get(run_id)
+            if record:
+                snapshots.append(record.snapshot())
+        return snapshots
 
     async def collect_ready_nodes(self, run_id: Optional[str] = None) -> List[DispatchRequest]:
         state_events: List[Tuple[RunRecord, NodeState]] = []
         workflow_ids: Dict[str, str] = {}
-        async with self._lock:
-            records: Iterable[RunRecord]
-            if run_id:
-                record = self._runs.get(run_id)
-                records = [record] if record else []
-            else:
-                records = self._runs.values()
-            requests: List[DispatchRequest] = []
-            for record in records:
+        run_ids: Iterable[str] = (run_id,) if run_id else self._run_index
+        requests: List[DispatchRequest] = []
+        for candidate_id in run_ids:
+            peek = self._runs.get(candidate_id)
+            if peek is not None:
+                # Runs with no pending ready candidates have nothing to collect; skip the lock.
+                peek_frame = current_frame(peek)
+                if not (peek_frame.ready if peek_frame else peek.ready):
+                    continue
+            async with self._lock_for(candidate_id):
+                record = self._runs.get(candidate_id)
                 if not record or record.status in FINAL_STATUSES:
                     continue
                 workflow_ids[record.run_id] = record.workflow.id
+                record.touch()
+                collected_before = len(requests)
+                events_before = len(state_events)
                 active_frame = current_frame(record)
                 if active_frame:
                     requests.extend(self._collect_ready_for_frame(record, active_frame, state_events))
                 else:
                     requests.extend(self._collect_ready_for_record(record, state_events))
-        # Emit container state updates after releasing the lock.
+                if len(requests) > collected_before or len(state_events) > events_before:
+                    self._journal_transition(record, "ready")
+                self._track_finished(record)
+        # Emit container state updates after releasing the run locks.
         if state_events:
             tasks = emit.build_state_event_tasks(self._emitter, state_events)
             await asyncio.gather(*tasks)
-        if requests and workflow_ids:
-            self._apply_resource_bindings(requests, workflow_ids=workflow_ids)
+        if requests and workflow_ids and not self._replaying:
+            await self._apply_resource_bindings(requests, workflow_ids=workflow_ids)
         return requests
 
     async def mark_dispatched(
@@ -241,12 +368,13 @@ class RunStateService:
         dispatch_id: Optional[str] = None,
         ack_deadline: Optional[datetime] = None,
     ) -> Optional[RunRecord]:
-        async with self._lock:
+        async with self._lock_for(run_id):
             record = self._runs.get(run_id)
             if not record:
                 return None
             if record.status in FINAL_STATUSES:
-                return copy.deepcopy(record)
+                return record.snapshot()
+            record.touch()
             outcome = lifecycle.mark_dispatched(
                 record,
                 worker_name=worker_name,
@@ -262,9 +390,28 @@ class RunStateService:
                 ack_deadline=ack_deadline,
                 resolve_node_state=lookup.resolve_node_state,
                 pending_next_requests=self._pending_next_requests,
-                utc_now=_utc_now,
+                utc_now=self._now,
                 final_statuses=FINAL_STATUSES,
             )
+            self._task_runs[task_id] = run_id
+            if self._journal.enabled:
+                self._journal_transition(
+                    record,
+                    "dispatched",
+                    {
+                        "worker_name": worker_name,
+                        "task_id": task_id,
+                        "node_id": node_id,
+                        "node_type": node_type,
+                        "package_name": package_name,
+                        "package_version": package_version,
+                        "seq_used": seq_used,
+                        "resource_refs": resource_refs,
+                        "affinity": affinity,
+                        "dispatch_id": dispatch_id,
+                        "ack_deadline": ack_deadline.isoformat() if ack_deadline else None,
+                    },
+                )
             previous_status = outcome.previous_status
             record_snapshot = outcome.record_snapshot
             node_snapshot = outcome.node_snapshot
@@ -284,12 +431,13 @@ class RunStateService:
         node_id: str,
         dispatch_id: str,
     ) -> Optional[RunRecord]:
-        async with self._lock:
+        async with self._lock_for(run_id):
             record = self._runs.get(run_id)
             if not record:
                 return None
             if record.status in FINAL_STATUSES:
-                return copy.deepcopy(record)
+                return record.snapshot()
+            record.touch()
             outcome = lifecycle.mark_acknowledged(
                 record,
                 node_id=node_id,
@@ -297,7 +445,8 @@ class RunStateService:
                 find_node_by_dispatch=lookup.find_node_by_dispatch,
             )
             if not outcome:
-                return copy.deepcopy(record)
+                return record.snapshot()
+            self._journal_transition(record, "acked", {"node_id": node_id, "dispatch_id": dispatch_id})
             previous_status = outcome.previous_status
             record_snapshot = outcome.record_snapshot
             node_snapshot = outcome.node_snapshot
@@ -311,19 +460,22 @@ class RunStateService:
         return record_snapshot
 
     async def cancel_run(self, run_id: str) -> tuple[Optional[RunRecord], List[Tuple[str, str, str, Optional[str], Optional[str]]]]:
-        async with self._lock:
+        async with self._lock_for(run_id):
             record = self._runs.get(run_id)
             if not record:
                 return None, []
             if record.status in FINAL_STATUSES:
-                return copy.deepcopy(record), []
+                return record.snapshot(), []
+            record.touch()
             outcome = lifecycle.cancel_run(
                 record,
                 run_id=run_id,
                 pending_next_requests=self._pending_next_requests,
-                utc_now=_utc_now,
+                utc_now=self._now,
                 final_statuses=FINAL_STATUSES,
             )
+            self._journal_transition(record, "cancelled")
+            self._track_finished(record)
             record_snapshot = outcome.record_snapshot
             cancelled_next = outcome.cancelled_next
 
@@ -338,20 +490,28 @@ class RunStateService:
         node_id: str,
         dispatch_id: str,
     ) -> Optional[RunRecord]:
-        async with self._lock:
+        async with self._lock_for(run_id):
             record = self._runs.get(run_id)
             if not record:
                 return None
             if record.status in FINAL_STATUSES:
-                return copy.deepcopy(record)
-            outcome = lifecycle.reset_after_ack_timeout(
-                record,
-                node_id=node_id,
-                dispatch_id=dispatch_id,
-                find_node_by_dispatch=lookup.find_node_by_dispatch,
-            )
+                # Nothing re-dispatches a node of a finished run, so an unacked one is given up.
+                node_state, _frame_state = lookup.find_node_by_dispatch(record, dispatch_id)
+                if node_state is not None and node_state.node_id != node_id:
+                    node_state = None
+                outcome = self._settle_in_flight(record, node_state, status="cancelled")
+            else:
+                record.touch()
+                outcome = lifecycle.reset_after_ack_timeout(
+                    record,
+                    node_id=node_id,
+                    dispatch_id=dispatch_id,
+                    find_node_by_dispatch=lookup.find_node_by_dispatch,
+                )
             if not outcome:
-                return copy.deepcopy(record)
+                return record.snapshot()
+            self._journal_transition(record, "ack_timeout", {"node_id": node_id, "dispatch_id": dispatch_id})
+            self._track_finished(record)
             previous_status = outcome.previous_status
             record_snapshot = outcome.record_snapshot
             node_snapshot = outcome.node_snapshot
@@ -373,17 +533,16 @@ class RunStateService:
     ) -> Optional[RunRecord]:
         """Reset a node after a worker-side cancellation so it can be retried."""
 
-        async with self._lock:
-            record = self._runs.get(run_id) if run_id else None
-            if not record and task_id:
-                record = next(
-                    (candidate for candidate in self._runs.values() if candidate.task_id == task_id),
-                    None,
-                )
+        if not (run_id and run_id in self._runs) and task_id:
+            run_id = self._find_run_id_by_task(task_id)
+        if not run_id:
+            return None
+        async with self._lock_for(run_id):
+            record = self._runs.get(run_id)
             if not record:
                 return None
             if record.status in FINAL_STATUSES:
-                return copy.deepcopy(record)
+                return record.snapshot()
 
             node_state, _frame_state = lookup.resolve_node_state(
                 record,
@@ -391,13 +550,15 @@ class RunStateService:
                 task_id=task_id,
             )
             if not node_state:
-                return copy.deepcopy(record)
+                return record.snapshot()
 
+            record.touch()
             outcome = lifecycle.reset_after_worker_cancel(
                 record,
                 node_state,
                 pending_next_requests=self._pending_next_requests,
             )
+            self._journal_transition(record, "worker_cancel", {"node_id": node_id, "task_id": task_id})
             previous_status = outcome.previous_status
             record_snapshot = outcome.record_snapshot
             node_snapshot = outcome.node_snapshot
@@ -415,53 +576,94 @@ class RunStateService:
         run_id: str,
         payload: ExecResultPayload,
     ) -> tuple[Optional[RunRecord], List[DispatchRequest], List[Tuple[Optional[str], ExecMiddlewareNextResponse]]]:
-        async with self._lock:
+        if self._payload_store.enabled and payload.result and not self._replaying:
+            payload = await self._offload_result(run_id, payload)
+        memo_key, memo_node = self._memo_keys.pop(payload.task_id, (None, None))
+        if memo_key and not (payload.metadata or {}).get(MEMO_HIT_KEY):
+            payload = payload.model_copy(update={"metadata": {**(payload.metadata or {}), MEMO_KEY: memo_key}})
+        settled: Optional[lifecycle.SettleOutcome] = None
+        async with self._lock_for(run_id):
             record = self._runs.get(run_id)
             if not record:
                 return None, [], []
             if record.status in FINAL_STATUSES:
-                return copy.deepcopy(record), [], []
-            outcome = apply_record_result(
-                record,
-                payload,
-                resolve_node_state=lookup.resolve_node_state,
-                is_host_with_middleware=dispatch.is_host_with_middleware,
-                is_middleware_node=dispatch.is_middleware_node,
-                apply_edge_bindings=apply_edge_bindings,
-                apply_frame_edge_bindings=apply_frame_edge_bindings,
-                apply_middleware_output_bindings=apply_middleware_output_bindings,
-                release_dependents=lambda record, node_state, frame_state, ready, state_events=None: frames.release_dependents(
-                    record,
-                    node_state,
-                    frame_state,
-                    ready,
-                    state_events=state_events,
-                    is_container_node=dispatch.is_container_node,
-                    is_host_with_middleware=dispatch.is_host_with_middleware,
-                    should_auto_dispatch=dispatch.should_auto_dispatch,
-                    start_container_execution=self._start_container_execution,
-                    build_dispatch_request_for_node=dispatch.build_dispatch_request_for_node,
-                ),
-                complete_frame_if_needed=lambda record, frame: frames.complete_frame_if_needed(
+                settled = self._settle_late_result(record, payload)
+                if settled is None:
+                    return record.snapshot(), [], []
+            else:
+                record.touch()
+                memo = payload.metadata or {}
+                if memo.get(MEMO_HIT_KEY):
+                    record.memo_hits += 1
+                elif memo.get(MEMO_KEY):
+                    record.memo_misses += 1
+                outcome = apply_record_result(
                     record,
-                    frame,
-                    pending_next_requests=self._pending_next_requests,
+                    payload,
+                    resolve_node_state=lookup.resolve_node_state,
                     is_host_with_middleware=dispatch.is_host_with_middleware,
-                    get_parent_graph=lookup.get_parent_graph,
-                    pop_frame=pop_frame,
-                    build_dispatch_request_for_node=dispatch.build_dispatch_request_for_node,
-                    utc_now=_utc_now,
+                    is_middleware_node=dispatch.is_middleware_node,
+                    apply_edge_bindings=apply_edge_bindings,
+                    apply_frame_edge_bindings=apply_frame_edge_bindings,
+                    apply_middleware_output_bindings=apply_middleware_output_bindings,
+                    release_dependents=lambda record, node_state, frame_state, ready, state_events=None: frames.release_dependents(
+                        record,
+                        node_state,
+                        frame_state,
+                        ready,
+                        state_events=state_events,
+                        is_container_node=dispatch.is_container_node,
+                        is_host_with_middleware=dispatch.is_host_with_middleware,
+                        should_auto_dispatch=dispatch.should_auto_dispatch,
+                        start_container_execution=self._start_container_execution,
+                        build_dispatch_request_for_node=dispatch.build_dispatch_request_for_node,
+                    ),
+                    complete_frame_if_needed=lambda record, frame: frames.complete_frame_if_needed(
+                        record,
+                        frame,
+                        pending_next_requests=self._pending_next_requests,
+                        is_host_with_middleware=dispatch.is_host_with_middleware,
+                        get_parent_graph=lookup.get_parent_graph,
+                        pop_frame=pop_frame,
+                        build_dispatch_request_for_node=dispatch.build_dispatch_request_for_node,
+                        archive_frame=self._archive_frame,
+                        utc_now=self._now,
+                        final_statuses=FINAL_STATUSES,
+                    ),
+                    finalise_pending_next=lambda payload, node_state, status: finalise_pending_next_request(
+                        self._pending_next_requests,
+                        payload,
+                        node_state,
+                        status=status,
+                    ),
+                    utc_now=self._now,
+                    normalise_status=status.normalise_status,
                     final_statuses=FINAL_STATUSES,
-                ),
-                finalise_pending_next=lambda payload, node_state, status: finalise_pending_next_request(
-                    self._pending_next_requests,
-                    payload,
-                    node_state,
-                    status=status,
-                ),
-                utc_now=_utc_now,
-                normalise_status=status.normalise_status,
-                final_statuses=FINAL_STATUSES,
+                )
+            if self._journal.enabled:
+                self._journal_transition(record, "result", payload.model_dump(mode="json"))
+            self._track_finished(record)
+        if settled is not None:
+            await asyncio.gather(
+                *emit.build_node_state_tasks(
+                    self._emitter,
+                    settled.record_snapshot,
+                    settled.node_snapshot,
+                    previous_status=settled.previous_status,
+                )
+            )
+            return settled.record_snapshot, [], []
+        if memo_key and memo_node and payload.status.value == "SUCCEEDED" and not self._replaying:
+            package_name, package_version, node_type = memo_node
+            self._result_cache.append(
+                CachedResult(
+                    key=memo_key,
+                    package_name=package_name,
+                    package_version=package_version,
+                    node_type=node_type,
+                    result=payload.result or {},
+                    artifacts=[artifact.model_dump(mode="json", exclude_none=True) for artifact in payload.artifacts or []],
+                )
             )
         tasks = emit.build_record_result_tasks(
             self._emitter,
@@ -469,25 +671,170 @@ class RunStateService:
             final_statuses=FINAL_STATUSES,
         )
         await asyncio.gather(*tasks)
-        if outcome.ready and record:
-            self._apply_resource_bindings(outcome.ready, workflow_ids={record.run_id: record.workflow.id})
+        if outcome.ready and record and not self._replaying:
+            await self._apply_resource_bindings(outcome.ready, workflow_ids={record.run_id: record.workflow.id})
         return outcome.record_snapshot, outcome.ready, outcome.next_responses
 
+    def _settle_late_result(self, record: RunRecord, payload: ExecResultPayload) -> Optional[lifecycle.SettleOutcome]:
+        """Apply a result that arrives after its run finished, if its node was still in flight."""
+
+        node_state, _frame_state = lookup.resolve_node_state(record, node_id=None, task_id=payload.task_id)
+        error = None
+        if payload.error:
+            error = ListRuns200ResponseItemsInnerError(
+                code=payload.error.code,
+                message=payload.error.message,
+                details={"remediation": payload.error.remediation} if payload.error.remediation else None,
+            )
+        return self._settle_in_flight(
+            record,
+            node_state,
+            status=status.normalise_status(payload.status.value),
+            result=payload.result,
+            metadata=payload.metadata,
+            artifacts=[artifact.model_dump(exclude_none=True) for artifact in payload.artifacts or []],
+            error=error,
+        )
+
+    def _settle_in_flight(
+        self,
+        record: RunRecord,
+        node_state: Optional[NodeState],
+        *,
+        status: str,
+        **outcome: Any,
+    ) -> Optional[lifecycle.SettleOutcome]:
+        # Nodes of a finished run that still had a dispatch out are settled one by one,
+        # so the run is only archived and evicted once nothing is in flight.
+        if node_state is None or node_state.status != "running":
+            return None
+        record.touch()
+        return lifecycle.settle_in_flight_node(record, node_state, status=status, utc_now=self._now, **outcome)
+
+    async def _offload_result(self, run_id: str, payload: ExecResultPayload) -> ExecResultPayload:
+        """Swap large top-level result values for payload references before the result is applied.
+
+        Runs outside the run lock (storage I/O happens in a worker thread); edge
+        bindings are fixed once a run is planned, so reading them unlocked is safe.
+        Middleware and hosts with middleware keep their results inline because
+        those travel back to the calling middleware through ``next`` responses.
+        """
+
+        record = self._runs.get(run_id)
+        if not record or record.status in FINAL_STATUSES:
+            return payload
+        node_state, frame_state = lookup.resolve_node_state(record, node_id=None, task_id=payload.task_id)
+        if node_state is None or dispatch.is_middleware_node(node_state) or dispatch.is_host_with_middleware(node_state):
+            return payload
+        edge_bindings = frame_state.edge_bindings if frame_state else record.edge_bindings
+        pinned = {
+            binding.source_path[0]
+            for binding in edge_bindings.get(node_state.node_id, ())
+            if binding.source_root == "results" and len(binding.source_path) > 1
+        }
+        try:
+            result = await asyncio.to_thread(
+                self._payload_store.offload,
+                payload.result,
+                run_id=run_id,
+                node_id=node_state.node_id,
+                pinned=pinned,
+            )
+        except Exception:  # noqa: BLE001
+            LOGGER.exception("Failed to offload result of run %s task %s; keeping it inline", run_id, payload.task_id)
+            return payload
+        if result is None:
+            return payload
+        return payload.model_copy(update={"result": result})
+
+    async def complete_memoized(
+        self,
+        ready: List[DispatchRequest],
+    ) -> Tuple[List[DispatchRequest], List[Tuple[Optional[str], ExecMiddlewareNextResponse]]]:
+        """Complete memoizable nodes whose result is cached instead of dispatching them.
+
+        Hits go through :meth:`record_result`, so dependents they release are
+        checked in turn. Returns the requests that still need a worker and any
+        middleware ``next`` responses released by the completions.
+        """
+
+        if not self._result_cache.enabled or not ready:
+            return ready, []
+        remaining: List[DispatchRequest] = []
+        next_responses: List[Tuple[Optional[str], ExecMiddlewareNextResponse]] = []
+        pending = deque(ready)
+        while pending:
+            request = pending.popleft()
+            key = self._memo_key_for(request)
+            cached = await self._result_cache.fetch(key) if key else None
+            if cached is None:
+                if key:
+                    self._memo_keys[request.task_id] = (
+                        key,
+                        (request.package_name, request.package_version, request.node_type),
+                    )
+                remaining.append(request)
+                continue
+            _record, released, responses = await self.record_result(
+                request.run_id,
+                ExecResultPayload(
+                    run_id=request.run_id,
+                    task_id=request.task_id,
+                    status="SUCCEEDED",
+                    result=copy.deepcopy(cached.result),
+                    duration_ms=0,
+                    metadata={MEMO_HIT_KEY: True, MEMO_KEY: key},
+                    artifacts=copy.deepcopy(cached.artifacts) or None,
+                ),
+            )
+            pending.extend(released)
+            next_responses.extend(responses)
+        return remaining, next_responses
+
+    def _memo_key_for(self, request: DispatchRequest) -> Optional[str]:
+        if request.host_node_id or request.middleware_chain:
+            return None
+        node_ident = (request.package_name, request.package_version, request.node_type)
+        memoizable = self._memoizable.get(node_ident)
+        if memoizable is None:
+            memoizable = result_cache.node_is_memoizable(*node_ident)
+            if memoizable is None:
+                return None
+            self._memoizable[node_ident] = memoizable
+        if not memoizable:
+            return None
+        record = self._runs.get(request.run_id)
+        if not record or record.status in FINAL_STATUSES:
+            return None
+        node_state, _frame = lookup.resolve_node_state(record, node_id=None, task_id=request.task_id)
+        if node_state is None or dispatch.is_middleware_node(node_state) or dispatch.is_host_with_middleware(node_state):
+            return None
+        return result_cache.memo_key(request)
+
+    async def read_payload(self, resource_id: str) -> Any:
+        """Return the result value behind a payload reference (see :mod:`.payload_offload`)."""
+
+        return await asyncio.to_thread(self._payload_store.load, resource_id)
+
     async def record_feedback(
         self,
         payload: ExecFeedbackPayload,
     ) -> None:
-        async with self._lock:
+        async with self._lock_for(payload.run_id):
             record = self._runs.get(payload.run_id)
             if not record:
                 return
+            record.touch()
             outcome = apply_feedback(
                 record,
                 payload,
                 resolve_node_state=lookup.resolve_node_state,
                 merge_result_updates=_merge_result_updates,
-                utc_now=_utc_now,
+                utc_now=self._now,
             )
+            if self._journal.enabled and outcome.node_snapshot is not None:
+                self._checkpoint_feedback(record, outcome.node_snapshot)
+            self._track_finished(record)
         tasks = emit.build_feedback_tasks(self._emitter, outcome)
         if tasks:
             await asyncio.gather(*tasks)
@@ -499,10 +846,11 @@ class RunStateService:
         worker_name: Optional[str],
         worker_instance_id: Optional[str],
     ) -> Tuple[List[DispatchRequest], Optional[str]]:
-        async with self._lock:
+        async with self._lock_for(payload.runId):
             record = self._runs.get(payload.runId)
             if not record or record.status in FINAL_STATUSES:
                 return [], "next_run_finalised"
+            record.touch()
             outcome = process_next_request(
                 record=record,
                 payload=payload,
@@ -515,34 +863,53 @@ class RunStateService:
                 is_host_with_middleware=dispatch.is_host_with_middleware,
                 start_container_execution=self._start_container_execution,
                 build_dispatch_request=dispatch.build_dispatch_request,
-                utc_now=_utc_now,
+                utc_now=self._now,
                 final_statuses=FINAL_STATUSES,
             )
             if outcome.error_code:
                 return [], outcome.error_code
+            if self._journal.enabled:
+                self._journal_transition(
+                    record,
+                    "next",
+                    {
+                        "payload": payload.model_dump(mode="json"),
+                        "worker_name": worker_name,
+                        "worker_instance_id": worker_instance_id,
+                    },
+                )
+            self._track_finished(record)
         publish_tasks = emit.build_next_request_tasks(self._emitter, outcome)
         if publish_tasks:
             await asyncio.gather(*publish_tasks)
-        if outcome.ready and record:
-            self._apply_resource_bindings(outcome.ready, workflow_ids={record.run_id: record.workflow.id})
+        if outcome.ready and record and not self._replaying:
+            await self._apply_resource_bindings(outcome.ready, workflow_ids={record.run_id: record.workflow.id})
         return outcome.ready, None
 
     async def resolve_next_response_worker(self, request_id: str) -> Optional[str]:
-        async with self._lock:
-            return resolve_pending_next_worker(
-                self._pending_next_requests,
-                request_id,
-                utc_now=_utc_now,
-            )
+        entry = self._pending_next_requests.get(request_id)
+        record = self._runs.get(entry[0]) if entry else None
+        if record:
+            self._journal_transition(record, "next_resolved", {"request_id": request_id})
+        return resolve_pending_next_worker(
+            self._pending_next_requests,
+            request_id,
+            utc_now=self._now,
+        )
 
     async def collect_expired_next_requests(self) -> List[Tuple[str, str, str, Optional[str], Optional[str]]]:
-        async with self._lock:
-            expired, remaining = collect_pending_next_expired(
-                self._pending_next_requests,
-                utc_now=_utc_now,
-            )
-            self._pending_next_requests = remaining
-            return expired
+        expired = collect_pending_next_expired(
+            self._pending_next_requests,
+            utc_now=self._now,
+        )
+        expired_by_run: Dict[str, List[str]] = {}
+        for req_id, _worker, run_id, _node_id, _middleware_id in expired:
+            expired_by_run.setdefault(run_id, []).append(req_id)
+        for run_id, request_ids in expired_by_run.items():
+            record = self._runs.get(run_id)
+            if record:
+                self._journal_transition(record, "next_expired", {"request_ids": request_ids})
+        return expired
 
     async def record_command_error(
         self,
@@ -551,37 +918,66 @@ class RunStateService:
         run_id: Optional[str] = None,
         task_id: Optional[str] = None,
     ) -> tuple[Optional[RunRecord], List[DispatchRequest]]:
-        async with self._lock:
-            record = None
-            if run_id:
-                record = self._runs.get(run_id)
-            if not record and task_id:
-                record = next(
-                    (candidate for candidate in self._runs.values() if candidate.task_id == task_id),
-                    None,
-                )
+        if not (run_id and run_id in self._runs) and task_id:
+            run_id = self._find_run_id_by_task(task_id)
+        if not run_id:
+            return None, []
+        async with self._lock_for(run_id):
+            record = self._runs.get(run_id)
             if not record:
                 return None, []
+            settled: Optional[lifecycle.SettleOutcome] = None
             if record.status in FINAL_STATUSES:
-                return copy.deepcopy(record), []
-            outcome = apply_command_error(
-                record,
-                payload,
-                task_id=task_id,
-                resolve_node_state=lookup.resolve_node_state,
-                complete_frame_if_needed=lambda record, frame: frames.complete_frame_if_needed(
+                node_state = None
+                if task_id:
+                    node_state, _frame_state = lookup.resolve_node_state(record, node_id=None, task_id=task_id)
+                details = payload.context.details if payload.context and payload.context.details else None
+                settled = self._settle_in_flight(
                     record,
-                    frame,
-                    pending_next_requests=self._pending_next_requests,
-                    is_host_with_middleware=dispatch.is_host_with_middleware,
-                    get_parent_graph=lookup.get_parent_graph,
-                    pop_frame=pop_frame,
-                    build_dispatch_request_for_node=dispatch.build_dispatch_request_for_node,
-                    utc_now=_utc_now,
-                    final_statuses=FINAL_STATUSES,
-                ),
-                utc_now=_utc_now,
+                    node_state,
+                    status="failed",
+                    error=ListRuns200ResponseItemsInnerError(code=payload.code, message=payload.message, details=details),
+                )
+                if settled is None:
+                    return record.snapshot(), []
+            else:
+                record.touch()
+                outcome = apply_command_error(
+                    record,
+                    payload,
+                    task_id=task_id,
+                    resolve_node_state=lookup.resolve_node_state,
+                    complete_frame_if_needed=lambda record, frame: frames.complete_frame_if_needed(
+                        record,
+                        frame,
+                        pending_next_requests=self._pending_next_requests,
+                        is_host_with_middleware=dispatch.is_host_with_middleware,
+                        get_parent_graph=lookup.get_parent_graph,
+                        pop_frame=pop_frame,
+                        build_dispatch_request_for_node=dispatch.build_dispatch_request_for_node,
+                        archive_frame=self._archive_frame,
+                        utc_now=self._now,
+                        final_statuses=FINAL_STATUSES,
+                    ),
+                    utc_now=self._now,
+                )
+            if self._journal.enabled:
+                self._journal_transition(
+                    record,
+                    "command_error",
+                    {"payload": payload.model_dump(mode="json"), "task_id": task_id},
+                )
+            self._track_finished(record)
+        if settled is not None:
+            await asyncio.gather(
+                *emit.build_node_state_tasks(
+                    self._emitter,
+                    settled.record_snapshot,
+                    settled.node_snapshot,
+                    previous_status=settled.previous_status,
+                )
             )
+            return settled.record_snapshot, []
         tasks = emit.build_command_error_tasks(self._emitter, outcome)
         if tasks:
             await asyncio.gather(*tasks)
@@ -595,127 +991,396 @@ class RunStateService:
         status: Optional[str],
         client_id: Optional[str],
     ) -> ListRuns200Response:
-        runs = await self.snapshot()
-        runs.sort(key=lambda r: r.created_at)
-        filtered: Iterable[RunRecord] = runs
-        if status:
-            filtered = [r for r in filtered if r.status == status]
-        if client_id:
-            filtered = [r for r in filtered if r.client_id == client_id]
-        filtered_list = list(filtered)
-
-        start_index = 0
-        if cursor:
-            for idx, candidate in enumerate(filtered_list):
-                if candidate.run_id == cursor:
-                    start_index = idx + 1
-                    break
-
-        window = filtered_list[start_index : start_index + limit]
-        items = [r.to_summary() for r in window]
-        next_cursor = None
-        if start_index + len(window) < len(filtered_list):
-            next_cursor = filtered_list[start_index + len(window) - 1].run_id
+        # Keyset pagination on (created_at, run_id): the cursor is the last run
+        # id of the previous page, looked up in memory or in the archive.
+        after = await self._run_key(cursor) if cursor else None
+        candidates: List[Tuple[RunKey, Any]] = []
+        for run_id in self._list_index.page(after=after, limit=limit + 1, status=status, client_id=client_id):
+            record = self._runs.get(run_id)
+            if record is not None:
+                candidates.append(((record.created_at, run_id), record))
+        if self._run_archive.enabled:
+            # Finished runs still in memory are archived too; over-fetch so dropping them leaves a
+            # full page. Only those up to the last live candidate can shadow a row of this page.
+            until = candidates[-1][0] if len(candidates) > limit else None
+            resident_finished = sum(
+                self._list_index.count(after=after, until=until, status=final, client_id=client_id)
+                for final in ((status,) if status else FINAL_STATUSES)
+                if final in FINAL_STATUSES
+            )
+            archived = await self._run_archive.list(
+                after=after,
+                limit=limit + 1 + resident_finished,
+                status=status,
+                client_id=client_id,
+            )
+            live_ids = {key[1] for key, _record in candidates}
+            candidates = heapq.nsmallest(
+                limit + 1,
+                candidates
+                + [(run.key, run) for run in archived if run.run_id not in live_ids and run.run_id not in self._runs],
+                key=itemgetter(0),
+            )
+
+        window = candidates[:limit]
+        items = [entry.to_summary() for _key, entry in window]
+        next_cursor = window[-1][0][1] if len(candidates) > limit else None
         return ListRuns200Response(items=items, nextCursor=next_cursor)
 
-    def _apply_resource_bindings(
+    async def recover(self) -> List[DispatchRequest]:
+        """Rebuild in-flight runs from the journal and start journaling.
+
+        Returns dispatch requests for middleware hosts that were queued by a
+        ``next`` call before the restart; everything else is picked up by the
+        next ``collect_ready_nodes`` sweep.
+        """
+
+        entries_by_run = await self._journal.load()
+        ready: List[DispatchRequest] = []
+        self._replaying = True
+        emitter = self._emitter
+        self._emitter = emit.build_silent_emitter()
+        try:
+            for run_id, entries in entries_by_run.items():
+                if not entries or entries[0].kind != "created":
+                    LOGGER.warning("Skipping journal for run %s without a creation entry", run_id)
+                    continue
+                try:
+                    for entry in entries:
+                        self._replay_clock = entry.created_at
+                        await self._replay_entry(entry)
+                except Exception:  # noqa: BLE001
+                    LOGGER.exception("Failed to replay journal for run %s", run_id)
+                    continue
+                finally:
+                    self._replay_clock = None
+                record = self._runs.get(run_id)
+                if record:
+                    ready.extend(await self._settle_recovered(record))
+        finally:
+            self._replaying = False
+            self._emitter = emitter
+        await self._journal.start()
+        await self._frame_archive.start()
+        await self._run_archive.start()
+        await self._result_cache.start()
+        self._evict_finished()
+        if self._run_retention and not (self._retention_task and not self._retention_task.done()):
+            self._retention_task = asyncio.get_running_loop().create_task(
+                self._retention_sweeper(),
+                name="run-retention",
+            )
+        if entries_by_run:
+            LOGGER.info("Recovered %d run(s) from the run-state journal", len(self._runs))
+        return ready
+
+    async def close(self) -> None:
+        task, self._retention_task = self._retention_task, None
+        if task:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await self._emitter.flush()
+        await self._journal.stop()
+        await self._frame_archive.stop()
+        await self._run_archive.stop()
+        await self._result_cache.stop()
+
+    async def _run_key(self, run_id: str) -> Optional[RunKey]:
+        record = self._runs.get(run_id)
+        if record is not None:
+            return (record.created_at, record.run_id)
+        archived = await self._run_archive.fetch(run_id)
+        return archived.key if archived else None
+
+    def _track_finished(self, record: RunRecord) -> None:
+        """Archive a run once it finished with nothing in flight and queue it for eviction.
+
+        A failed run can still have dispatched nodes whose results are on their
+        way; it is held back until those settle. Changes after archiving write
+        the run again, replacing its archived row.
+        """
+
+        if not record.settled:
+            return
+        run_id = record.run_id
+        if self._archived_versions.get(run_id) == record.version:
+            return
+        self._archived_versions[run_id] = record.version
+        if self._run_archive.enabled:
+            self._run_archive.append(ArchivedRun.from_record(record))
+        if run_id not in self._finished:
+            self._finished[run_id] = self._now()
+            self._evict_finished()
+
+    def _touch_finished(self, run_id: str) -> None:
+        if run_id in self._finished:
+            self._finished[run_id] = self._now()
+            self._finished.move_to_end(run_id)
+
+    async def _retention_sweeper(self) -> None:
+        interval = min(self._run_retention.total_seconds(), RETENTION_SWEEP_SECONDS)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self._evict_finished()
+            except Exception:  # noqa: BLE001
+                LOGGER.exception("Run retention sweep failed")
+
+    def _evict_finished(self) -> None:
+        """Drop finished runs idle past the retention period or beyond the retained count."""
+
+        if self._replaying or not self._finished:
+            return
+        now = self._now()
+        evicted: List[str] = []
+        while self._finished:
+            run_id, last_used = next(iter(self._finished.items()))
+            over_limit = 0 < self._run_retention_max_finished < len(self._finished)
+            expired = bool(self._run_retention) and now - last_used >= self._run_retention
+            if not (over_limit or expired):
+                break
+            self._finished.popitem(last=False)
+            evicted.append(run_id)
+        if not evicted:
+            return
+        for run_id in evicted:
+            record = self._runs.pop(run_id, None)
+            self._archived_versions.pop(run_id, None)
+            self._list_index.remove(run_id)
+            if record is not None:
+                self._spill_frame_history(record)
+                for task_id in [*record.task_index, *record.frame_tasks]:
+                    if self._task_runs.get(task_id) == run_id:
+                        del self._task_runs[task_id]
+                    self._memo_keys.pop(task_id, None)
+            lock = self._run_locks.get(run_id)
+            if lock is not None and not lock.locked():
+                del self._run_locks[run_id]
+        gone = set(evicted)
+        self._run_index = tuple(run_id for run_id in self._run_index if run_id not in gone)
+        self._index_version += 1
+
+    def _archive_frame(
+        self,
+        record: RunRecord,
+        frame: FrameRuntimeState,
+        frame_nodes: Dict[str, NodeState],
+    ) -> None:
+        history = record.frame_history.get(frame.frame_id)
+        if history is None:
+            history = record.frame_history[frame.frame_id] = FrameHistory(
+                frame_id=frame.frame_id,
+                container_node_id=frame.container_node_id,
+                limit=self._frame_history_size,
+            )
+        for folded in history.record(frame, frame_nodes):
+            if self._frame_archive.enabled and not self._replaying:
+                self._frame_archive.append(
+                    record.run_id,
+                    frame.frame_id,
+                    folded.iteration,
+                    folded.to_detail(record),
+                )
+
+    def _spill_frame_history(self, record: RunRecord) -> None:
+        # Iterations still held in memory go to the frame archive with the evicted run;
+        # folded ones are there already.
+        if not self._frame_archive.enabled:
+            return
+        for frame_id, history in record.frame_history.items():
+            for recent in history.recent:
+                self._frame_archive.append(record.run_id, frame_id, recent.iteration, recent.to_detail(record))
+
+    async def get_frame_history(self, run_id: str, frame_id: str) -> Optional[Dict[str, Any]]:
+        """Summary of a frame's iterations, from the run archive once the run was evicted."""
+
+        if run_id in self._runs:
+            async with self._lock_for(run_id):
+                record = self._runs.get(run_id)
+                if record:
+                    history = record.frame_history.get(frame_id)
+                    return history.to_summary() if history else None
+        archived = await self._run_archive.fetch(run_id)
+        return archived.frame_history.get(frame_id) if archived else None
+
+    async def get_frame_iteration(self, run_id: str, frame_id: str, iteration: int) -> Optional[Dict[str, Any]]:
+        """Full node details of one iteration, from memory or from the archive once folded or evicted."""
+
+        record = None
+        if run_id in self._runs:
+            async with self._lock_for(run_id):
+                record = self._runs.get(run_id)
+                if record:
+                    history = record.frame_history.get(frame_id)
+                    if history is None or not 1 <= iteration <= history.iterations:
+                        return None
+                    recent = history.find(iteration)
+                    if recent is not None:
+                        return recent.to_detail(record)
+        if record is None:
+            summary = await self.get_frame_history(run_id, frame_id)
+            if summary is None or not 1 <= iteration <= summary["iterations"]:
+                return None
+        return await self._frame_archive.fetch(run_id, frame_id, iteration)
+
+    async def _replay_entry(self, entry: JournalEntry) -> None:
+        payload = entry.payload
+        run_id = entry.run_id
+        if entry.kind == "created":
+            await self.create_run(
+                run_id=run_id,
+                request=StartRunRequest.from_dict(payload["request"]),
+                tenant=payload["tenant"],
+                reused=payload.get("reused"),
+            )
+        elif entry.kind == "ready":
+            await self.collect_ready_nodes(run_id)
+        elif entry.kind == "dispatched":
+            ack_deadline = payload.get("ack_deadline")
+            await self.mark_dispatched(
+                run_id,
+                worker_name=payload["worker_name"],
+                task_id=payload["task_id"],
+                node_id=payload["node_id"],
+                node_type=payload["node_type"],
+                package_name=payload["package_name"],
+                package_version=payload["package_version"],
+                seq_used=payload["seq_used"],
+                resource_refs=payload.get("resource_refs"),
+                affinity=payload.get("affinity"),
+                dispatch_id=payload.get("dispatch_id"),
+                ack_deadline=datetime.fromisoformat(ack_deadline) if ack_deadline else None,
+            )
+        elif entry.kind == "acked":
+            await self.mark_acknowledged(run_id, node_id=payload["node_id"], dispatch_id=payload["dispatch_id"])
+        elif entry.kind == "ack_timeout":
+            await self.reset_after_ack_timeout(run_id, node_id=payload["node_id"], dispatch_id=payload["dispatch_id"])
+        elif entry.kind == "worker_cancel":
+            await self.reset_after_worker_cancel(run_id, node_id=payload.get("node_id"), task_id=payload.get("task_id"))
+        elif entry.kind == "cancelled":
+            await self.cancel_run(run_id)
+        elif entry.kind == "result":
+            await self.record_result(run_id, ExecResultPayload.model_validate(payload))
+        elif entry.kind == "feedback":
+            self._restore_feedback_checkpoint(run_id, payload)
+        elif entry.kind == "next":
+            await self.handle_next_request(
+                ExecMiddlewareNextRequest.model_validate(payload["payload"]),
+                worker_name=payload.get("worker_name"),
+                worker_instance_id=payload.get("worker_instance_id"),
+            )
+        elif entry.kind == "next_resolved":
+            self._pending_next_requests.pop(payload.get("request_id"), None)
+        elif entry.kind == "next_expired":
+            for request_id in payload.get("request_ids") or []:
+                self._pending_next_requests.pop(request_id, None)
+        elif entry.kind == "command_error":
+            await self.record_command_error(
+                ExecErrorPayload.model_validate(payload["payload"]),
+                run_id=run_id,
+                task_id=payload.get("task_id"),
+            )
+        else:
+            LOGGER.warning("Ignoring unknown journal entry kind %s for run %s", entry.kind, run_id)
+
+    def _checkpoint_feedback(self, record: RunRecord, node: NodeState) -> None:
+        if record.status in FINAL_STATUSES:
+            return
+        key = (record.run_id, node.task_id)
+        now = self._now()
+        last = self._feedback_checkpoints.get(key)
+        if last and (now - last).total_seconds() < self._feedback_checkpoint_seconds:
+            return
+        self._feedback_checkpoints[key] = now
+        self._journal_transition(
+            record,
+            "feedback",
+            {"task_id": node.task_id, "metadata": node.metadata, "result": node.result},
+        )
+
+    def _restore_feedback_checkpoint(self, run_id: str, payload: Dict[str, Any]) -> None:
+        record = self._runs.get(run_id)
+        if not record:
+            return
+        node_state, _frame_state = lookup.resolve_node_state(record, node_id=None, task_id=payload.get("task_id"))
+        if not node_state:
+            return
+        node_state.metadata = payload.get("metadata")
+        node_state.result = payload.get("result")
+
+    async def _settle_recovered(self, record: RunRecord) -> List[DispatchRequest]:
+        """Release work that was in flight inside this process when it stopped.
+
+        Pending acks and queued dispatches lived only in the orchestrator, so
+        those nodes are returned to the ready state to be dispatched again.
+        """
+
+        graphs = [record.nodes] + [frame.nodes for frame in record.active_frames.values()]
+        if record.status in FINAL_STATUSES:
+            # Nothing dispatches nodes of a finished run again, so unacked ones are given up.
+            for nodes in graphs:
+                for node in nodes.values():
+                    if node.pending_ack:
+                        self._settle_in_flight(record, node, status="cancelled")
+            self._track_finished(record)
+            return []
+        ready: List[DispatchRequest] = []
+        waiting_next = {
+            target_task_id
+            for (run_id, _worker_id, _worker, _deadline, _node_id, _mw_id, target_task_id) in self._pending_next_requests.values()
+            if run_id == record.run_id
+        }
+        for nodes in graphs:
+            for node in nodes.values():
+                if node.pending_ack:
+                    node.status = "queued"
+                    node.worker_name = None
+                    node.started_at = None
+                    node.seq = None
+                    node.pending_ack = False
+                    record.clear_dispatch(node)
+                    node.ack_deadline = None
+                    node.enqueued = False
+                elif node.status == "queued" and node.enqueued and not dispatch.is_container_node(node):
+                    node.enqueued = False
+                else:
+                    continue
+                if dispatch.is_host_with_middleware(node) and node.task_id in waiting_next:
+                    ready.append(dispatch.build_dispatch_request_for_node(record, node))
+        record.refresh_rollup()
+        record.touch()
+        if ready:
+            await self._apply_resource_bindings(ready, workflow_ids={record.run_id: record.workflow.id})
+        return ready
+
+    async def _apply_resource_bindings(
         self,
         requests: List[DispatchRequest],
         *,
         workflow_ids: Dict[str, str],
     ) -> None:
+        """Attach resource bindings to ready requests without blocking the event loop.
+
+        Cached lookups are served inline; if anything misses, the whole batch is
+        resolved in a worker thread, which fills the cache for the next one.
+        """
+
         if not requests:
             return
-        grant_store = get_resource_grant_store()
-        requirements_cache: Dict[Tuple[str, str], List[Any]] = {}
-        provider_cache: Dict[str, Any] = {}
-        resource_cache: Dict[str, Any] = {}
-        for request in requests:
-            workflow_id = workflow_ids.get(request.run_id)
-            if not workflow_id:
-                continue
-            requirements = _load_package_requirements(
-                request.package_name,
-                request.package_version,
-                requirements_cache,
+        cache = get_resource_binding_cache()
+        try:
+            resolved = resource_bindings.resolve_resource_bindings(
+                requests, workflow_ids=workflow_ids, cache=cache, load=False
             )
-            if not requirements:
-                continue
-            bindings: Dict[str, Any] = {}
-            errors: List[Dict[str, Any]] = []
-            for requirement in requirements:
-                resource_key = getattr(requirement, "key", None)
-                if not resource_key:
-                    continue
-                grant = _resolve_grant(
-                    grant_store,
-                    workflow_id=workflow_id,
-                    package_name=request.package_name,
-                    package_version=request.package_version,
-                    resource_key=str(resource_key),
-                )
-                if not grant:
-                    if _is_required(requirement):
-                        errors.append({"key": str(resource_key), "error": "missing_grant"})
-                    continue
-                resource_id = str(getattr(grant, "resource_id", "") or "")
-                if not resource_id:
-                    continue
-                try:
-                    stored = resource_cache.get(resource_id)
-                    if stored is None:
-                        provider = provider_cache.get(resource_id)
-                        if provider is None:
-                            provider = get_resource_provider_for(resource_id)
-                            provider_cache[resource_id] = provider
-                        stored = provider.get(resource_id)
-                        resource_cache[resource_id] = stored
-                except (ResourceNotFoundError, ValueError):
-                    errors.append(
-                        {"key": str(resource_key), "error": "resource_not_found", "resourceId": resource_id}
-                    )
-                    continue
-                binding: Dict[str, Any] = {
-                    "resourceId": stored.resource_id,
-                    "type": stored.type,
-                    "filename": stored.filename,
-                    "mimeType": stored.mime_type,
-                    "sizeBytes": stored.size_bytes,
-                    "metadata": stored.metadata or {},
-                }
-                if _should_inline_value(requirement):
-                    try:
-                        provider = provider_cache.get(stored.resource_id)
-                        if provider is None:
-                            provider = get_resource_provider_for(stored.resource_id)
-                            provider_cache[stored.resource_id] = provider
-                        value = _read_resource_value(provider, stored.resource_id)
-                    except (ResourceNotFoundError, ValueError):
-                        value = None
-                    if value is None:
-                        errors.append(
-                            {
-                                "key": str(resource_key),
-                                "error": "resource_value_unavailable",
-                                "resourceId": stored.resource_id,
-                            }
-                        )
-                    else:
-                        binding["value"] = value
-                bindings[str(resource_key)] = binding
-
-            if not bindings and not errors:
-                continue
-            request.parameters = copy.deepcopy(request.parameters) if request.parameters else {}
-            if bindings:
-                existing = request.parameters.get(RESOURCE_BINDINGS_KEY)
-                if isinstance(existing, dict):
-                    merged = {**existing, **bindings}
-                else:
-                    merged = bindings
-                request.parameters[RESOURCE_BINDINGS_KEY] = merged
-            if errors:
-                request.parameters[RESOURCE_BINDING_ERRORS_KEY] = errors
+        except resource_bindings.ResourceCacheMiss:
+            resolved = await asyncio.to_thread(
+                resource_bindings.resolve_resource_bindings,
+                requests,
+                workflow_ids=workflow_ids,
+                cache=cache,
+                load=True,
+            )
+        resource_bindings.apply_resource_bindings(resolved)
 
     def _collect_ready_for_record(
         self,
@@ -766,8 +1431,21 @@ class RunStateService:
             build_container_frames=build_container_frames,
             activate_frame=activate_frame,
             collect_ready_for_frame=self._collect_ready_for_frame,
-            utc_now=_utc_now,
+            utc_now=self._now,
             logger=LOGGER,
         )
 
-run_state_service = RunStateService()
+_settings = get_settings()
+run_state_service = RunStateService(
+    journal=build_run_journal(_settings),
+    feedback_checkpoint_seconds=_settings.run_journal_feedback_checkpoint_seconds,
+    event_coalesce_seconds=_settings.event_coalesce_window_ms / 1000,
+    plan_cache_size=_settings.plan_cache_size,
+    frame_history_size=_settings.frame_history_size,
+    frame_archive=build_frame_archive(_settings),
+    run_retention_seconds=_settings.run_retention_seconds,
+    run_retention_max_finished=_settings.run_retention_max_finished,
+    run_archive=build_run_archive(_settings),
+    payload_store=build_payload_store(_settings),
+    result_cache=build_result_cache(_settings),
+)
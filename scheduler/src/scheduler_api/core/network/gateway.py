@@ -48,54 +48,116 @@ class WorkerGateway:
         max_inflight: Optional[int] = None,
         max_latency_ms: Optional[int] = None,
     ) -> list[WorkerSession]:
-        sessions = list(self._manager.list_sessions().values())
-        if tenant is not None:
-            sessions = [session for session in sessions if session.tenant == tenant]
-        if worker_name is not None:
-            sessions = [session for session in sessions if session.worker_name == worker_name]
-        if worker_instance_id is not None:
-            sessions = [session for session in sessions if session.worker_instance_id == worker_instance_id]
-        if connected is not None:
-            sessions = [session for session in sessions if bool(session.transport) == connected]
-        if registered is not None:
-            sessions = [session for session in sessions if session.registered == registered]
+        if package_name or package_version:
+            if not package_name or not package_version:
+                return []
+            if package_status == PackageStatus.installed and tenant is not None:
+                sessions = self._manager.sessions_with_package(tenant, package_name, package_version)
+            else:
+                sessions = [
+                    session
+                    for session in self._manager.list_sessions().values()
+                    if self._supports_package(session, package_name, package_version, package_status)
+                ]
+        else:
+            sessions = list(self._manager.list_sessions().values())
+        accept = self._build_filter(
+            tenant=tenant,
+            worker_name=worker_name,
+            worker_instance_id=worker_instance_id,
+            connected=connected,
+            registered=registered,
+            require_healthy=require_healthy,
+            max_heartbeat_age_seconds=max_heartbeat_age_seconds,
+            max_inflight=max_inflight,
+            max_latency_ms=max_latency_ms,
+        )
+        return [session for session in sessions if accept(session)]
+
+    def select_least_loaded(
+        self,
+        *,
+        tenant: str,
+        package_name: str,
+        package_version: str,
+        worker_name: Optional[str] = None,
+        max_heartbeat_age_seconds: Optional[float] = None,
+        admit: Optional[Callable[[WorkerSession], bool]] = None,
+    ) -> Optional[WorkerSession]:
+        """Best connected, registered worker with the package installed.
+
+        Uses the manager's load-ordered package index, so the ordering matches
+        the default dispatch strategy without scoring every session.
+        ``admit`` can reject otherwise eligible sessions (e.g. ones without a
+        free concurrency slot).
+        """
+
+        eligible = self._build_filter(
+            worker_name=worker_name,
+            connected=True,
+            registered=True,
+            max_heartbeat_age_seconds=max_heartbeat_age_seconds,
+        )
+        if admit is None:
+            accept = eligible
+        else:
+            def accept(session: WorkerSession) -> bool:
+                return eligible(session) and admit(session)
+        return self._manager.select_least_loaded(tenant, package_name, package_version, accept)
+
+    def refresh_load(self, session: WorkerSession) -> None:
+        self._manager.refresh_load(session)
+
+    async def send_envelope(self, worker: WorkerSession | str, payload: dict | WsEnvelope) -> None:
+        await self._manager.send_envelope(worker, payload)
+
+    def _build_filter(
+        self,
+        *,
+        tenant: Optional[str] = None,
+        worker_name: Optional[str] = None,
+        worker_instance_id: Optional[str] = None,
+        connected: Optional[bool] = None,
+        registered: Optional[bool] = None,
+        require_healthy: Optional[bool] = None,
+        max_heartbeat_age_seconds: Optional[float] = None,
+        max_inflight: Optional[int] = None,
+        max_latency_ms: Optional[int] = None,
+    ) -> Callable[[WorkerSession], bool]:
         now = self._now()
-        for session in list(sessions):
+
+        def accept(session: WorkerSession) -> bool:
+            if tenant is not None and session.tenant != tenant:
+                return False
+            if worker_name is not None and session.worker_name != worker_name:
+                return False
+            if worker_instance_id is not None and session.worker_instance_id != worker_instance_id:
+                return False
+            if connected is not None and bool(session.transport) != connected:
+                return False
+            if registered is not None and session.registered != registered:
+                return False
+            heartbeat = session.heartbeat
             if require_healthy is not None:
-                heartbeat = session.heartbeat
                 if not heartbeat:
                     if require_healthy:
-                        sessions.remove(session)
-                    continue
-                if heartbeat.healthy != require_healthy:
-                    sessions.remove(session)
-                    continue
+                        return False
+                elif heartbeat.healthy != require_healthy:
+                    return False
             if max_heartbeat_age_seconds is not None:
-                age = (now - session.last_heartbeat).total_seconds()
-                if age > max_heartbeat_age_seconds:
-                    sessions.remove(session)
-                    continue
-            if package_name or package_version:
-                if not package_name or not package_version:
-                    sessions.remove(session)
-                    continue
-                if not self._supports_package(session, package_name, package_version, package_status):
-                    sessions.remove(session)
-                    continue
+                if (now - session.last_heartbeat).total_seconds() > max_heartbeat_age_seconds:
+                    return False
             if max_inflight is not None:
-                inflight = session.heartbeat.metrics.inflight if session.heartbeat else None
+                inflight = heartbeat.metrics.inflight if heartbeat else None
                 if inflight is None or inflight > max_inflight:
-                    sessions.remove(session)
-                    continue
+                    return False
             if max_latency_ms is not None:
-                latency = session.heartbeat.metrics.latency_ms if session.heartbeat else None
+                latency = heartbeat.metrics.latency_ms if heartbeat else None
                 if latency is None or latency > max_latency_ms:
-                    sessions.remove(session)
-                    continue
-        return sessions
+                    return False
+            return True
 
-    async def send_envelope(self, worker: WorkerSession | str, payload: dict | WsEnvelope) -> None:
-        await self._manager.send_envelope(worker, payload)
+        return accept
 
     @staticmethod
     def _supports_package(
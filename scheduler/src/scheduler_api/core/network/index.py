@@ -0,0 +1,158 @@
+"""Incremental package and load indexes over worker sessions."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
+
+from shared.models.session.register import Status as PackageStatus
+
+if TYPE_CHECKING:
+    from .manager import WorkerSession
+
+PackageKey = Tuple[str, str, str]  # (tenant, package name, package version)
+LoadScore = Tuple[int, int, int, float]
+
+_UNKNOWN = 1_000_000
+
+
+def load_score(session: "WorkerSession") -> LoadScore:
+    """Rank a session by health, inflight, latency, then heartbeat recency (lower is better).
+
+    Matches the ordering of the default dispatch strategy; using the heartbeat
+    timestamp instead of its age keeps the score stable between heartbeats.
+    """
+
+    heartbeat = session.heartbeat
+    if heartbeat is None:
+        health_rank = 1
+    elif heartbeat.healthy:
+        health_rank = 0
+    else:
+        health_rank = 2
+    inflight = heartbeat.metrics.inflight if heartbeat else _UNKNOWN
+    if session.reserved_slots:
+        # Dispatches sent since the last heartbeat are not in its inflight figure yet.
+        inflight = max(inflight, len(session.reserved_slots))
+    latency = (
+        heartbeat.metrics.latency_ms
+        if heartbeat and heartbeat.metrics.latency_ms is not None
+        else _UNKNOWN
+    )
+    return (health_rank, inflight, latency, -session.last_heartbeat.timestamp())
+
+
+@dataclass
+class _Bucket:
+    sessions: Dict[str, "WorkerSession"] = field(default_factory=dict)
+    # (score, token, key); entries whose token is no longer current are stale
+    heap: List[Tuple[LoadScore, int, str]] = field(default_factory=list)
+    tokens: Dict[str, int] = field(default_factory=dict)
+
+
+class WorkerIndex:
+    """Maps (tenant, package, version) to the sessions that have it installed.
+
+    Each bucket also keeps a min-heap of load scores so the least loaded
+    eligible session is found without scoring every candidate. Scores are
+    refreshed by :meth:`touch` whenever a heartbeat arrives; superseded heap
+    entries are dropped lazily.
+    """
+
+    def __init__(self, score: Callable[["WorkerSession"], LoadScore] = load_score) -> None:
+        self._score = score
+        self._buckets: Dict[PackageKey, _Bucket] = {}
+        self._memberships: Dict[str, Set[PackageKey]] = {}
+        self._sequence = itertools.count()
+
+    def update(self, key: str, session: "WorkerSession") -> None:
+        """(Re)index ``session`` after its tenant or package list changed."""
+
+        wanted = {
+            (session.tenant, package.name, package.version)
+            for package in session.packages
+            if package.status == PackageStatus.installed
+        }
+        current = self._memberships.get(key, set())
+        for package_key in current - wanted:
+            self._leave(package_key, key)
+        for package_key in wanted - current:
+            self._buckets.setdefault(package_key, _Bucket()).sessions[key] = session
+        if wanted:
+            self._memberships[key] = wanted
+        else:
+            self._memberships.pop(key, None)
+        self.touch(key, session)
+
+    def touch(self, key: str, session: "WorkerSession") -> None:
+        """Refresh the load score of ``session`` in every bucket it belongs to."""
+
+        memberships = self._memberships.get(key)
+        if not memberships:
+            return
+        score = self._score(session)
+        for package_key in memberships:
+            bucket = self._buckets[package_key]
+            bucket.sessions[key] = session
+            token = next(self._sequence)
+            bucket.tokens[key] = token
+            heapq.heappush(bucket.heap, (score, token, key))
+            if len(bucket.heap) > 2 * len(bucket.sessions) + 16:
+                bucket.heap = [entry for entry in bucket.heap if bucket.tokens.get(entry[2]) == entry[1]]
+                heapq.heapify(bucket.heap)
+
+    def park(self, key: str) -> None:
+        """Drop ``key`` from load ordering (e.g. while disconnected) but keep its packages indexed."""
+
+        for package_key in self._memberships.get(key, ()):
+            self._buckets[package_key].tokens.pop(key, None)
+
+    def remove(self, key: str) -> None:
+        for package_key in self._memberships.pop(key, set()):
+            self._leave(package_key, key)
+
+    def candidates(self, tenant: str, package_name: str, package_version: str) -> List["WorkerSession"]:
+        bucket = self._buckets.get((tenant, package_name, package_version))
+        return list(bucket.sessions.values()) if bucket else []
+
+    def best(
+        self,
+        tenant: str,
+        package_name: str,
+        package_version: str,
+        accept: Callable[["WorkerSession"], bool],
+    ) -> Optional["WorkerSession"]:
+        """Return the lowest-scored session in the bucket that ``accept`` allows."""
+
+        bucket = self._buckets.get((tenant, package_name, package_version))
+        if not bucket:
+            return None
+        skipped: List[Tuple[LoadScore, int, str]] = []
+        chosen: Optional["WorkerSession"] = None
+        while bucket.heap:
+            entry = heapq.heappop(bucket.heap)
+            _, token, key = entry
+            if bucket.tokens.get(key) != token:
+                continue
+            skipped.append(entry)
+            session = bucket.sessions[key]
+            if accept(session):
+                chosen = session
+                break
+        for entry in skipped:
+            heapq.heappush(bucket.heap, entry)
+        return chosen
+
+    def _leave(self, package_key: PackageKey, key: str) -> None:
+        bucket = self._buckets.get(package_key)
+        if not bucket:
+            return
+        bucket.sessions.pop(key, None)
+        bucket.tokens.pop(key, None)
+        if not bucket.sessions:
+            del self._buckets[package_key]
+
+
+__all__ = ["LoadScore", "PackageKey", "WorkerIndex", "load_score"]
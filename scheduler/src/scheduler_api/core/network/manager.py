@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
 from fastapi.encoders import jsonable_encoder
 
@@ -11,6 +11,7 @@ from shared.models.session import AckPayload, WsEnvelope, Capabilities, Heartbea
 from shared.models.session.register import Package, Manifest
 from shared.protocol.window import ReceiveWindow, is_seq_acked
 from scheduler_api.config.settings import get_settings
+from .index import WorkerIndex
 from .transport import BaseTransport
 
 
@@ -46,14 +47,22 @@ class WorkerSession:
     send_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     send_waiters: int = 0
     send_epoch: int = 0
+    # task_id -> node_type of dispatches occupying one of the advertised concurrency slots
+    reserved_slots: Dict[str, str] = field(default_factory=dict)
 
 
 class WorkerControlManager:
-    """Tracks active worker connections."""
+    """Tracks active worker connections.
+
+    Sessions are also indexed by installed package and ordered by load so
+    dispatch can pick a worker without scanning every session; the index is
+    kept current on register, heartbeat, disconnect and removal.
+    """
 
     def __init__(self, scheduler_id: str = "scheduler-control"):
         self.scheduler_id = scheduler_id
         self._sessions: Dict[str, WorkerSession] = {}
+        self._index = WorkerIndex()
         self._session_window_size = _session_window_size()
 
     @staticmethod
@@ -107,7 +116,10 @@ class WorkerControlManager:
         session.channels = []
         session.heartbeat = None
         session.last_heartbeat = datetime.now(timezone.utc)
+        # A fresh handshake means a new worker process; nothing it held is still running.
+        session.reserved_slots.clear()
         self._reset_session_state(session)
+        self._index.update(key, session)
         return session
 
     def _reset_session_state(self, session: WorkerSession) -> None:
@@ -128,6 +140,8 @@ class WorkerControlManager:
         session = self._sessions.pop(old_key, None)
         if session:
             self._sessions[new_key] = session
+            self._index.remove(old_key)
+            self._index.update(new_key, session)
 
     async def _assign_session_seq(self, session: WorkerSession, envelope: dict) -> Optional[int]:
         message_type = envelope.get("type") or ""
@@ -181,15 +195,20 @@ class WorkerControlManager:
             asyncio.create_task(session.transport.close(code=1011, reason="superseded session"))
         session.transport = transport
         session.last_heartbeat = datetime.now(timezone.utc)
+        self._index.touch(self._key(worker_instance_id, worker_name), session)
         return session
 
     def remove_session(self, worker_name: str, worker_instance_id: Optional[str] = None) -> None:
-        self._sessions.pop(self._key(worker_instance_id, worker_name), None)
+        key = self._key(worker_instance_id, worker_name)
+        self._sessions.pop(key, None)
+        self._index.remove(key)
 
     def mark_disconnected(self, worker_instance_id: Optional[str], worker_name: str) -> None:
-        session = self._sessions.get(self._key(worker_instance_id, worker_name))
+        key = self._key(worker_instance_id, worker_name)
+        session = self._sessions.get(key)
         if session:
             session.transport = None
+            self._index.park(key)
 
     def get_session(self, worker_instance_id: Optional[str], worker_name: Optional[str]) -> Optional[WorkerSession]:
         if not worker_instance_id:
@@ -215,6 +234,7 @@ class WorkerControlManager:
         session.packages = packages
         session.manifests = manifests
         session.channels = channels
+        self._index.update(self._key(worker_instance_id, worker_name), session)
 
     def mark_heartbeat(
         self,
@@ -229,6 +249,7 @@ class WorkerControlManager:
         session.last_heartbeat = datetime.now(timezone.utc)
         if heartbeat is not None:
             session.heartbeat = heartbeat
+        self._index.touch(self._key(worker_instance_id, worker_name), session)
 
     def select_session(self, *, tenant: str) -> Optional[WorkerSession]:
         for session in self._sessions.values():
@@ -256,5 +277,28 @@ class WorkerControlManager:
     def list_sessions(self) -> Dict[str, WorkerSession]:
         return dict(self._sessions)
 
+    def refresh_load(self, session: WorkerSession) -> None:
+        """Re-rank ``session`` after its reserved slots changed."""
+
+        key = self._key(session.worker_instance_id, session.worker_name)
+        if self._sessions.get(key) is session and session.transport is not None:
+            self._index.touch(key, session)
+
+    def sessions_with_package(self, tenant: str, package_name: str, package_version: str) -> list[WorkerSession]:
+        """Sessions of ``tenant`` with the package version installed."""
+
+        return self._index.candidates(tenant, package_name, package_version)
+
+    def select_least_loaded(
+        self,
+        tenant: str,
+        package_name: str,
+        package_version: str,
+        accept: Callable[[WorkerSession], bool],
+    ) -> Optional[WorkerSession]:
+        """Least loaded session with the package installed that ``accept`` allows."""
+
+        return self._index.best(tenant, package_name, package_version, accept)
+
 
 worker_manager = WorkerControlManager()
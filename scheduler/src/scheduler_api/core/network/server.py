@@ -92,6 +92,7 @@ class ControlPlaneServer:
             LOGGER.exception("Worker control-plane encountered an error; closing connection")
             await transport.close(code=1011, reason="internal error")
         finally:
+            await session_handler.close()
             for task in tasks:
                 task.cancel()
             if tasks:
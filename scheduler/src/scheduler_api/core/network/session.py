@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Callable, Optional
@@ -34,7 +35,13 @@ LOGGER = logging.getLogger(__name__)
 
 
 class ControlPlaneSession:
-    """Handles session-level control frames for a worker connection."""
+    """Handles session-level control frames for a worker connection.
+
+    Sequenced business frames are acknowledged cumulatively: one ack carrying
+    the receive window state (``ack_seq``/``ack_bitmap``) is sent at most every
+    ``session_ack_interval_ms`` and covers everything received since the last
+    one. Workers resolve their pending sends from the window state.
+    """
 
     def __init__(
         self,
@@ -54,6 +61,10 @@ class ControlPlaneSession:
         self._token_validator = token_validator
         self._session: Optional[WorkerSession] = None
         self._closing = False
+        self._ack_interval = float(getattr(self._settings, "session_ack_interval_ms", 0) or 0) / 1000.0
+        self._ack_task: Optional[asyncio.Task[None]] = None
+        # Set for every recorded frame; the ack task sends again if it is set after a send.
+        self._ack_dirty = False
 
     @property
     def session(self) -> Optional[WorkerSession]:
@@ -93,7 +104,7 @@ class ControlPlaneSession:
 
         if self._session and envelope.session_seq is not None and self._session.recv_window:
             ready, accepted = self._session.recv_window.record(envelope.session_seq, envelope)
-            await self._maybe_ack(envelope, session=self._session, force=True)
+            await self._ack_window(envelope)
             if not accepted:
                 offset = envelope.session_seq - self._session.recv_window.base_seq - 1
                 if envelope.session_seq in self._session.recv_window.buffer:
@@ -118,6 +129,50 @@ class ControlPlaneSession:
         await self._maybe_ack(envelope, session=self._session)
         return [envelope]
 
+    async def close(self) -> None:
+        """Drop a cumulative ack still waiting for its interval (the connection is gone)."""
+
+        task, self._ack_task = self._ack_task, None
+        if task and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _ack_window(self, envelope: WsEnvelope) -> None:
+        if self._ack_interval <= 0:
+            await self._maybe_ack(envelope, session=self._session, force=True)
+            return
+        self._ack_dirty = True
+        if self._ack_task is None or self._ack_task.done():
+            self._ack_task = asyncio.create_task(
+                self._send_cumulative_ack(envelope.tenant),
+                name="scheduler-session-ack",
+            )
+
+    async def _send_cumulative_ack(self, tenant: str) -> None:
+        while self._ack_dirty:
+            await asyncio.sleep(self._ack_interval)
+            session = self._session
+            if self._closing or not session or not session.recv_window:
+                return
+            # Frames recorded while the send below is in flight mark the window dirty again.
+            self._ack_dirty = False
+            base_seq, bitmap, window = session.recv_window.ack_state()
+            ack_envelope = WsEnvelope(
+                type="control.ack",
+                id=str(uuid4()),
+                ts=datetime.now(timezone.utc),
+                corr=None,
+                seq=None,
+                tenant=tenant,
+                sender=Sender(role=Role.scheduler, id=self._scheduler_id),
+                payload={"ok": True, "ack_seq": base_seq, "ack_bitmap": bitmap, "recv_window": window},
+            )
+            try:
+                await self._transport.send(ack_envelope)
+            except (ConnectionClosedOK, ConnectionClosedError):
+                LOGGER.debug("Cumulative ack skipped: websocket already closed ack_seq=%s", base_seq)
+                return
+
     async def _handle_resume(self, envelope: WsEnvelope) -> None:
         resume = SessionResumePayload.model_validate(envelope.payload)
         worker_instance_id = envelope.sender.id
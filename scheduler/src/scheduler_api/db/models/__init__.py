@@ -7,6 +7,10 @@ from .audit_event import AuditEventRecord
 from .resource_grant import ResourceGrantRecord
 from .resource import ResourceRecord
 from .resource_payload import ResourcePayloadRecord
+from .run_journal import RunJournalRecord
+from .run_frame_archive import RunFrameArchiveRecord
+from .run_archive import RunArchiveRecord
+from .node_result_cache import NodeResultCacheRecord
 
 __all__ = [
     "WorkflowRecord",
@@ -19,4 +23,8 @@ __all__ = [
     "ResourceGrantRecord",
     "ResourceRecord",
     "ResourcePayloadRecord",
+    "RunJournalRecord",
+    "RunFrameArchiveRecord",
+    "RunArchiveRecord",
+    "NodeResultCacheRecord",
 ]
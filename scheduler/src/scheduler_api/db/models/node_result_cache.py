@@ -0,0 +1,26 @@
+"""ORM model for memoized node results."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import Base
+
+
+class NodeResultCacheRecord(Base):
+    """Result of a memoizable node keyed by the hash of its package, type and inputs."""
+
+    __tablename__ = "node_result_cache"
+    __table_args__ = (Index("ix_node_result_cache_expires_at", "expires_at"),)
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    package_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    package_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    node_type: Mapped[str] = mapped_column(String(255), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # zlib-compressed JSON of the result, metadata and artifacts
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
@@ -0,0 +1,35 @@
+"""ORM model for finished runs evicted from scheduler memory."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, LargeBinary, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import Base
+
+
+class RunArchiveRecord(Base):
+    """Compact form of a finished run: filter columns plus a compressed summary."""
+
+    __tablename__ = "run_archive"
+    __table_args__ = (
+        Index("ix_run_archive_created_at_run_id", "created_at", "run_id"),
+        Index("ix_run_archive_status_created_at", "status", "created_at"),
+        Index("ix_run_archive_client_id_created_at", "client_id", "created_at"),
+    )
+
+    run_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    tenant: Mapped[str] = mapped_column(String(128), nullable=False)
+    client_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    definition_hash: Mapped[str] = mapped_column(String(128), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # zlib-compressed JSON of the run summary (nodes, artifacts, error)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    # JSON object of root node id -> definition fingerprint, for incremental re-runs
+    node_fingerprints: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # JSON object of frame id -> frame history summary, for the frames endpoint once evicted
+    frame_history: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -0,0 +1,38 @@
+"""ORM model for folded container frame iterations."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import Base
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class RunFrameArchiveRecord(Base):
+    """Full node details of a frame iteration evicted from the in-memory history."""
+
+    __tablename__ = "run_frame_archive"
+    __table_args__ = (
+        Index("ix_run_frame_archive_run_frame_iteration", "run_id", "frame_id", "iteration"),
+    )
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    run_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    frame_id: Mapped[str] = mapped_column(String(512), nullable=False)
+    iteration: Mapped[int] = mapped_column(Integer, nullable=False)
+    payload: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=_utcnow,
+        nullable=False,
+    )
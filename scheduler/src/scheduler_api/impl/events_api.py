@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Optional
+from functools import partial
+from typing import Any, Dict, Optional
 
 from fastapi import HTTPException, status
 from fastapi.responses import StreamingResponse
 
 from scheduler_api.apis.events_api_base import BaseEventsApi
-from scheduler_api.auth.roles import RUN_VIEW_ROLES, require_roles
+from scheduler_api.auth.roles import OPS_VIEW_ROLES, RUN_VIEW_ROLES, require_roles
+from scheduler_api.config.settings import get_settings
+from scheduler_api.core.biz.facade import biz_facade
 
 from scheduler_api.sse import (
     SseConnection,
@@ -33,10 +36,14 @@ class EventsApiImpl(BaseEventsApi):
             )
 
         subscription = SubscriptionFilter()
+        settings = get_settings()
         connection = SseConnection(
             tenant=self.tenant,
             client_session_id=client_session_id,
             filters=subscription,
+            max_queue=settings.sse_queue_size,
+            overflow_policy=settings.sse_overflow_policy,
+            resync=partial(biz_facade.run_snapshot_event, tenant=self.tenant),
         )
 
         replay_events = event_store.replay(self.tenant, last_event_id)
@@ -51,3 +58,7 @@ class EventsApiImpl(BaseEventsApi):
                 await connection.close()
 
         return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+    async def list_event_connections(self) -> Dict[str, Any]:
+        require_roles(*OPS_VIEW_ROLES)
+        return connection_registry.metrics()
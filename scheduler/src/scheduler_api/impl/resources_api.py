@@ -24,6 +24,7 @@ from scheduler_api.resources import (
     ResourceNotFoundError,
     StoredResource,
     StoredResourceGrant,
+    get_resource_binding_cache,
     get_resource_grant_store,
     get_resource_provider,
     get_resource_provider_for,
@@ -256,6 +257,7 @@ class ResourcesApiImpl(BaseResourcesApi):
         except ResourceNotFoundError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
         provider.delete(resourceId)
+        get_resource_binding_cache().invalidate_resource(resourceId)
         return None
 
     async def download_resource(self, resourceId: StrictStr) -> FileResponse:
@@ -348,6 +350,7 @@ class ResourcesApiImpl(BaseResourcesApi):
             created_by=token.sub if token else None,
             metadata=metadata if isinstance(metadata, dict) else None,
         )
+        get_resource_binding_cache().invalidate_grants()
         return _to_resource_grant_model(grant)
 
     async def get_resource_grant(self, grantId: StrictStr) -> ResourceGrant:
@@ -373,6 +376,7 @@ class ResourcesApiImpl(BaseResourcesApi):
         if not is_admin and grant.created_by != token.sub:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied.")
         store.delete(str(grantId))
+        get_resource_binding_cache().invalidate_grants()
         return None
 
 
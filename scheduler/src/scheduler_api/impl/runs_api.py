@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
 from uuid import uuid4
 
 from fastapi import HTTPException, status
@@ -23,6 +23,7 @@ from scheduler_api.models.workflow import Workflow
 
 from ..core.biz.facade import biz_facade
 from ..core.biz.engine import status as engine_status
+from ..core.biz.engine.rerun import REUSED_FROM_KEY
 
 LOGGER = logging.getLogger(__name__)
 
@@ -89,18 +90,67 @@ class RunsApiImpl(BaseRunsApi):
         )
         return record.to_start_response()
 
+    async def rerun_run(
+        self,
+        runId: str,
+        run_start_request: RunStartRequest,
+    ) -> StartRun202Response:
+        token = require_roles(*WORKFLOW_EDIT_ROLES)
+        if run_start_request is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="run_start_request body is required",
+            )
+
+        payload = run_start_request.model_dump(by_alias=True, exclude_none=True, mode="json")
+        start_run_request = StartRunRequest.from_dict(payload)
+
+        workflow = start_run_request.workflow
+        self._ensure_initial_node(workflow)
+
+        run_id = str(uuid4())
+        started = await biz_facade.rerun_run(
+            source_run_id=runId,
+            run_id=run_id,
+            request=start_run_request,
+            tenant=self.tenant,
+        )
+        if started is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Run {runId} not found",
+            )
+        record, ready = started
+        reused = sum(1 for node in record.nodes.values() if node.metadata and REUSED_FROM_KEY in node.metadata)
+        LOGGER.info(
+            "Run %s queued as a rerun of %s with %d reused and %d initial nodes", run_id, runId, reused, len(ready)
+        )
+        record_audit_event(
+            actor_id=token.sub if token else None,
+            action="run.rerun",
+            target_type="run",
+            target_id=run_id,
+            metadata={
+                "workflowId": getattr(workflow, "id", None),
+                "clientId": start_run_request.client_id,
+                "sourceRunId": runId,
+                "reusedNodes": reused,
+            },
+        )
+        return record.to_start_response()
+
     async def get_run(
         self,
         runId: str,
     ) -> ListRuns200ResponseItemsInner:
         require_roles(*RUN_VIEW_ROLES)
-        record = await biz_facade.get_run(runId)
-        if not record:
+        summary = await biz_facade.get_run(runId)
+        if not summary:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Run {runId} not found",
             )
-        return record.to_summary()
+        return summary
 
     async def cancel_run(
         self,
@@ -175,6 +225,21 @@ class RunsApiImpl(BaseRunsApi):
         # leaking internal BaseModel attributes (e.g. .schema method) into the payload.
         return Workflow.from_dict(workflow.to_dict())
 
+    async def get_run_frames(
+        self,
+        runId: str,
+        frame_id: str,
+        iteration: Optional[int],
+    ) -> Dict[str, Any]:
+        require_roles(*RUN_VIEW_ROLES)
+        frames = await biz_facade.get_run_frames(runId, frame_id, iteration)
+        if frames is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Frame {frame_id} of run {runId} not found",
+            )
+        return frames
+
     def _ensure_initial_node(self, workflow: StartRunRequestWorkflow) -> None:
         self._select_initial_node(workflow)
 
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
 from uuid import uuid4
 
 from fastapi import HTTPException, status
 
 from scheduler_api.apis.workers_api_base import BaseWorkersApi
-from scheduler_api.auth.roles import RUN_VIEW_ROLES, WORKFLOW_EDIT_ROLES, require_roles
+from scheduler_api.auth.roles import OPS_VIEW_ROLES, RUN_VIEW_ROLES, WORKFLOW_EDIT_ROLES, require_roles
+from scheduler_api.core.biz.facade import biz_facade
 from scheduler_api.core.network import WorkerSession, worker_gateway
 from scheduler_api.models.command_ref import CommandRef
 from scheduler_api.models.list_workers200_response import ListWorkers200Response
@@ -144,6 +145,10 @@ class WorkersApiImpl(BaseWorkersApi):
             accepted_at=datetime.now(timezone.utc),
         )
 
+    async def get_dispatch_metrics(self) -> Dict[str, Any]:
+        require_roles(*OPS_VIEW_ROLES)
+        return biz_facade.dispatch_metrics()
+
 
 def _session_to_worker(session: WorkerSession) -> Worker:
     packages = [
@@ -25,6 +25,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictStr, field_validator
 from typing import Any, ClassVar, Dict, List, Optional
 from scheduler_api.models.list_runs200_response_items_inner_artifacts_inner import ListRuns200ResponseItemsInnerArtifactsInner
 from scheduler_api.models.list_runs200_response_items_inner_error import ListRuns200ResponseItemsInnerError
+from scheduler_api.models.list_runs200_response_items_inner_memo import ListRuns200ResponseItemsInnerMemo
 from scheduler_api.models.list_runs200_response_items_inner_nodes_inner import ListRuns200ResponseItemsInnerNodesInner
 try:
     from typing import Self
@@ -44,7 +45,8 @@ class ListRuns200ResponseItemsInner(BaseModel):
     error: Optional[ListRuns200ResponseItemsInnerError] = None
     artifacts: Optional[List[ListRuns200ResponseItemsInnerArtifactsInner]] = None
     nodes: Optional[List[ListRuns200ResponseItemsInnerNodesInner]] = None
-    __properties: ClassVar[List[str]] = ["runId", "status", "definitionHash", "clientId", "startedAt", "finishedAt", "error", "artifacts", "nodes"]
+    memo: Optional[ListRuns200ResponseItemsInnerMemo] = None
+    __properties: ClassVar[List[str]] = ["runId", "status", "definitionHash", "clientId", "startedAt", "finishedAt", "error", "artifacts", "nodes", "memo"]
 
     @field_validator('status')
     def status_validate_enum(cls, value):
@@ -107,6 +109,9 @@ class ListRuns200ResponseItemsInner(BaseModel):
                 if _item:
                     _items.append(_item.to_dict())
             _dict['nodes'] = _items
+        # override the default output from pydantic by calling `to_dict()` of memo
+        if self.memo:
+            _dict['memo'] = self.memo.to_dict()
         return _dict
 
     @classmethod
@@ -127,7 +132,8 @@ class ListRuns200ResponseItemsInner(BaseModel):
             "finishedAt": obj.get("finishedAt"),
             "error": ListRuns200ResponseItemsInnerError.from_dict(obj.get("error")) if obj.get("error") is not None else None,
             "artifacts": [ListRuns200ResponseItemsInnerArtifactsInner.from_dict(_item) for _item in obj.get("artifacts")] if obj.get("artifacts") is not None else None,
-            "nodes": [ListRuns200ResponseItemsInnerNodesInner.from_dict(_item) for _item in obj.get("nodes")] if obj.get("nodes") is not None else None
+            "nodes": [ListRuns200ResponseItemsInnerNodesInner.from_dict(_item) for _item in obj.get("nodes")] if obj.get("nodes") is not None else None,
+            "memo": ListRuns200ResponseItemsInnerMemo.from_dict(obj.get("memo")) if obj.get("memo") is not None else None
         })
         return _obj
 
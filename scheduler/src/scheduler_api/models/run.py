@@ -25,6 +25,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from scheduler_api.models.result_error import ResultError
 from scheduler_api.models.run_artifact import RunArtifact
+from scheduler_api.models.run_memo_stats import RunMemoStats
 from scheduler_api.models.run_node_status import RunNodeStatus
 from scheduler_api.models.run_status import RunStatus
 try:
@@ -45,7 +46,8 @@ class Run(BaseModel):
     error: Optional[ResultError] = None
     artifacts: Optional[List[RunArtifact]] = None
     nodes: Optional[List[RunNodeStatus]] = None
-    __properties: ClassVar[List[str]] = ["runId", "status", "definitionHash", "clientId", "startedAt", "finishedAt", "error", "artifacts", "nodes"]
+    memo: Optional[RunMemoStats] = None
+    __properties: ClassVar[List[str]] = ["runId", "status", "definitionHash", "clientId", "startedAt", "finishedAt", "error", "artifacts", "nodes", "memo"]
 
     model_config = {
         "populate_by_name": True,
@@ -101,6 +103,9 @@ class Run(BaseModel):
                 if _item:
                     _items.append(_item.to_dict())
             _dict['nodes'] = _items
+        # override the default output from pydantic by calling `to_dict()` of memo
+        if self.memo:
+            _dict['memo'] = self.memo.to_dict()
         # set to None if started_at (nullable) is None
         # and model_fields_set contains the field
         if self.started_at is None and "started_at" in self.model_fields_set:
@@ -131,7 +136,8 @@ class Run(BaseModel):
             "finishedAt": obj.get("finishedAt"),
             "error": ResultError.from_dict(obj.get("error")) if obj.get("error") is not None else None,
             "artifacts": [RunArtifact.from_dict(_item) for _item in obj.get("artifacts")] if obj.get("artifacts") is not None else None,
-            "nodes": [RunNodeStatus.from_dict(_item) for _item in obj.get("nodes")] if obj.get("nodes") is not None else None
+            "nodes": [RunNodeStatus.from_dict(_item) for _item in obj.get("nodes")] if obj.get("nodes") is not None else None,
+            "memo": RunMemoStats.from_dict(obj.get("memo")) if obj.get("memo") is not None else None
         })
         return _obj
 
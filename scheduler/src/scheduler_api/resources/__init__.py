@@ -1,5 +1,6 @@
 """Resource upload/storage helpers."""
 
+from .binding_cache import ResourceBindingCache, get_resource_binding_cache
 from .grants import (
     ResourceGrantNotFoundError,
     StoredResourceGrant,
@@ -20,11 +21,13 @@ from .provider import (
 __all__ = [
     "DbResourceProvider",
     "LocalResourceProvider",
+    "ResourceBindingCache",
     "ResourceGrantNotFoundError",
     "ResourceNotFoundError",
     "ResourceProvider",
     "StoredResource",
     "StoredResourceGrant",
+    "get_resource_binding_cache",
     "get_resource_grant_store",
     "get_resource_provider",
     "get_resource_provider_for",
@@ -0,0 +1,83 @@
+"""TTL cache for the lookups behind dispatch resource bindings."""
+
+from __future__ import annotations
+
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from scheduler_api.config.settings import get_api_settings
+
+
+class ResourceBindingCache:
+    """Package requirements, selected grants, resources and inline values.
+
+    Keys are tuples whose first item names the kind of lookup (``requirements``,
+    ``grant``, ``resource`` or ``value``). Entries expire after ``ttl_seconds``
+    and are dropped explicitly when grants are created or deleted and when a
+    resource is deleted. Misses are filled from worker threads, so every fill
+    carries the generation it started in and is discarded if an invalidation
+    happened meanwhile; a slow lookup can never store data older than the
+    invalidation that raced it.
+    """
+
+    def __init__(self, ttl_seconds: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return ``(True, value)`` for a fresh entry, ``(False, None)`` otherwise."""
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            return False, None
+        return True, value
+
+    def store(self, key: Hashable, value: Any, *, generation: int) -> None:
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (self._clock() + self._ttl, value)
+
+    def invalidate_grants(self) -> None:
+        """Drop every selected grant; a new or deleted grant can change any selection."""
+
+        self._invalidate(lambda key: key[0] == "grant")
+
+    def invalidate_resource(self, resource_id: str) -> None:
+        self._invalidate(lambda key: key[0] in ("resource", "value") and key[1] == resource_id)
+
+    def clear(self) -> None:
+        self._invalidate(lambda key: True)
+
+    def _invalidate(self, predicate: Callable[[Tuple[Any, ...]], bool]) -> None:
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+
+@lru_cache()
+def get_resource_binding_cache() -> ResourceBindingCache:
+    return ResourceBindingCache(get_api_settings().resource_binding_cache_ttl_seconds)
+
+
+__all__ = ["ResourceBindingCache", "get_resource_binding_cache"]
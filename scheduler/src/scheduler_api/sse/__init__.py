@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from .connection import SseConnection, SubscriptionFilter
-from .models import UiEventEnvelope, UiEventScope, UiEventType
+from .connection import OverflowPolicy, SseConnection, SubscriptionFilter
+from .models import SseFrame, UiEventEnvelope, UiEventScope, UiEventType
 from .publisher import EventPublisher
 from .registry import ConnectionRegistry
 from .store import EventStore
 
 
 __all__ = [
+    "OverflowPolicy",
     "SseConnection",
+    "SseFrame",
     "SubscriptionFilter",
     "UiEventEnvelope",
     "UiEventScope",
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass, field
-from typing import AsyncIterator, Iterable, Optional, Set
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, Literal, Optional, Set, Tuple
 from uuid import uuid4
 
-from .models import UiEventEnvelope, UiEventScope, serialize_envelope
+from .models import SseFrame, UiEventEnvelope, UiEventScope, encode_frame
+
+LOGGER = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["snapshot", "disconnect", "coalesce"]
+ResyncProvider = Callable[[str], Awaitable[Optional[UiEventEnvelope]]]
 
 
 @dataclass(slots=True)
@@ -21,9 +30,23 @@ class SubscriptionFilter:
 
 
 class SseConnection:
-    """Represents an active SSE connection."""
+    """Represents an active SSE connection.
+
+    Frames wait in a queue bounded by ``max_queue``. When a slow consumer
+    fills it, ``overflow_policy`` decides what happens:
+
+    * ``snapshot`` drops the backlog and, for every run it touched, sends a
+      fresh ``run.snapshot`` (built by ``resync``) in its place; if a dropped
+      frame belongs to no run or a snapshot cannot be built it falls back to
+      ``disconnect``;
+    * ``coalesce`` discards queued state events superseded by newer ones for
+      the same subject and disconnects only if that frees nothing;
+    * ``disconnect`` closes the stream; the client reconnects with
+      ``Last-Event-ID`` and replays from the event store.
+
+    Publishing never waits on a connection: :meth:`offer` is synchronous.
+    """
 
-    _SENTINEL = object()
     _HEARTBEAT_COMMENT = b": heartbeat\n\n"
 
     def __init__(
@@ -33,14 +56,32 @@ class SseConnection:
         client_session_id: str,
         filters: Optional[SubscriptionFilter] = None,
         heartbeat_interval: float = 45.0,
+        max_queue: int = 1000,
+        overflow_policy: OverflowPolicy = "snapshot",
+        resync: Optional[ResyncProvider] = None,
     ) -> None:
         self.tenant = tenant
         self.client_session_id = client_session_id
         self.filters = filters or SubscriptionFilter()
-        self._queue: asyncio.Queue[object] = asyncio.Queue()
+        self._queue: Deque[Tuple[float, SseFrame]] = deque()
+        self._ready = asyncio.Event()
         self._closed = False
         self._id = uuid4().hex
         self._heartbeat_interval = heartbeat_interval
+        self._max_queue = max(max_queue, 1)
+        self._overflow_policy: OverflowPolicy = (
+            "disconnect" if overflow_policy == "snapshot" and resync is None else overflow_policy
+        )
+        self._resync = resync
+        # run_id -> id of the newest frame dropped for it; a snapshot goes out under that id
+        self._resync_runs: Dict[str, str] = {}
+        self._connected_at = datetime.now(timezone.utc)
+        self._sent = 0
+        self._dropped = 0
+        self._resyncs = 0
+        self._max_depth = 0
+        self._last_lag = 0.0
+        self.close_reason: Optional[str] = None
 
     def __hash__(self) -> int:  # pragma: no cover - used for registry bookkeeping
         return hash(self._id)
@@ -50,44 +91,151 @@ class SseConnection:
             return False
         return self._id == other._id
 
-    async def enqueue(self, envelope: UiEventEnvelope) -> None:
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def offer(self, frame: SseFrame) -> bool:
+        """Queue ``frame`` without waiting; returns ``False`` if it was not queued."""
+
         if self._closed:
-            return
-        await self._queue.put(envelope)
+            return False
+        if len(self._queue) >= self._max_queue and not self._make_room(frame):
+            return False
+        self._queue.append((time.monotonic(), frame))
+        self._max_depth = max(self._max_depth, len(self._queue))
+        self._ready.set()
+        return True
 
     async def close(self) -> None:
         if self._closed:
             return
         self._closed = True
+        self._ready.set()
+
+    def metrics(self) -> Dict[str, Any]:
+        oldest = self._queue[0][0] if self._queue else None
+        lag = time.monotonic() - oldest if oldest is not None else 0.0
+        return {
+            "id": self._id,
+            "tenant": self.tenant,
+            "clientSessionId": self.client_session_id,
+            "connectedAt": self._connected_at.isoformat(),
+            "overflowPolicy": self._overflow_policy,
+            "queueDepth": len(self._queue),
+            "maxQueueDepth": self._max_depth,
+            "queueCapacity": self._max_queue,
+            "sent": self._sent,
+            "dropped": self._dropped,
+            "resyncs": self._resyncs,
+            "lagMs": round(max(lag, self._last_lag) * 1000, 3),
+            "closed": self._closed,
+            "closeReason": self.close_reason,
+        }
+
+    def _make_room(self, frame: SseFrame) -> bool:
+        if self._overflow_policy == "coalesce" and self._coalesce():
+            return True
+        if self._overflow_policy == "snapshot":
+            dropped = [queued for _, queued in self._queue]
+            dropped.append(frame)
+            self._queue.clear()
+            self._dropped += len(dropped)
+            if any(item.scope.runId is None for item in dropped):
+                # No snapshot can stand in for a frame outside any run.
+                self._disconnect()
+                return False
+            for item in dropped:
+                run_id = item.scope.runId
+                self._resync_runs.pop(run_id, None)
+                self._resync_runs[run_id] = item.id
+            self._ready.set()
+            return False
+        self._dropped += 1
+        self._disconnect()
+        return False
+
+    def _disconnect(self) -> None:
+        """Close after losing frames; the client reconnects and replays with ``Last-Event-ID``."""
+
+        self._dropped += len(self._queue)
+        self._queue.clear()
+        self._resync_runs.clear()
+        self.close_reason = "overflow"
+        self._closed = True
+        self._ready.set()
+
+    def _coalesce(self) -> bool:
+        """Keep only the newest queued frame per coalesce key; ``True`` if room was freed."""
+
+        seen: Set[Tuple[Optional[str], ...]] = set()
+        kept: Deque[Tuple[float, SseFrame]] = deque()
+        for entry in reversed(self._queue):
+            key = entry[1].coalesce_key
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            kept.appendleft(entry)
+        removed = len(self._queue) - len(kept)
+        if not removed:
+            return False
+        self._dropped += removed
+        self._queue = kept
+        return len(self._queue) < self._max_queue
+
+    async def _resync_frame(self, run_id: str, event_id: str) -> Optional[SseFrame]:
+        if self._resync is None:
+            return None
         try:
-            self._queue.put_nowait(self._SENTINEL)
-        except asyncio.QueueFull:  # pragma: no cover - queue unbounded
-            await self._queue.put(self._SENTINEL)
+            envelope = await self._resync(run_id)
+        except Exception:  # noqa: BLE001
+            LOGGER.exception("Failed to build resync snapshot run=%s", run_id)
+            return None
+        if envelope is None:
+            return None
+        self._resyncs += 1
+        return encode_frame(envelope, event_id=event_id)
 
     async def iter_stream(
         self,
-        replay_events: Iterable[UiEventEnvelope],
+        replay_events: Iterable[SseFrame],
     ) -> AsyncIterator[bytes]:
         try:
-            for event in replay_events:
-                # Mark replayed deliveries explicitly
-                if event.replayed is not True:
-                    event = event.model_copy(update={"replayed": True})
-                yield serialize_envelope(event)
+            for frame in replay_events:
+                # Replayed deliveries use the precomputed variant flagged "replayed"
+                yield frame.replayed
 
             while True:
+                if self._resync_runs:
+                    # Everything still queued is newer than the dropped backlog.
+                    run_id = next(iter(self._resync_runs))
+                    event_id = self._resync_runs.pop(run_id)
+                    snapshot = await self._resync_frame(run_id, event_id)
+                    if snapshot is None:
+                        self._disconnect()
+                        break
+                    self._sent += 1
+                    yield snapshot.data
+                    continue
+                if self._queue:
+                    enqueued_at, frame = self._queue.popleft()
+                    self._last_lag = time.monotonic() - enqueued_at
+                    self._sent += 1
+                    yield frame.data
+                    continue
+                if self._closed:
+                    break
+                self._ready.clear()
                 try:
-                    item = await asyncio.wait_for(
-                        self._queue.get(), timeout=self._heartbeat_interval
-                    )
+                    await asyncio.wait_for(self._ready.wait(), timeout=self._heartbeat_interval)
                 except asyncio.TimeoutError:
                     if self._closed:
                         break
                     yield self._HEARTBEAT_COMMENT
-                    continue
-                if item is self._SENTINEL:
-                    break
-                envelope = item  # type: ignore[assignment]
-                yield serialize_envelope(envelope)
         finally:
             self._closed = True
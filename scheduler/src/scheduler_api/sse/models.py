@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -25,6 +26,18 @@ class UiEventType(str, Enum):
     WORKER_PACKAGE = "worker.package"
 
 
+# Event types where a newer event for the same subject replaces the older one.
+_SUPERSEDING_TYPES = frozenset(
+    {
+        UiEventType.RUN_STATUS,
+        UiEventType.RUN_SNAPSHOT,
+        UiEventType.NODE_STATE,
+        UiEventType.NODE_RESULT_SNAPSHOT,
+        UiEventType.WORKER_HEARTBEAT,
+    }
+)
+
+
 class UiEventScope(BaseModel):
     model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
@@ -49,9 +62,59 @@ class UiEventEnvelope(BaseModel):
     data: Dict[str, Any]
 
 
+@dataclass(frozen=True, slots=True)
+class SseFrame:
+    """An event serialized once into its SSE wire format.
+
+    ``data`` is the live frame and ``replayed`` the same event flagged with
+    ``"replayed": true``; both are shared by every connection and the replay
+    buffer, so nothing is re-serialized per subscriber. ``coalesce_key`` is set
+    for state-like events that a later event with the same key makes obsolete.
+    """
+
+    id: str
+    type: str
+    scope: UiEventScope
+    data: bytes
+    replayed: bytes
+    coalesce_key: Optional[Tuple[Optional[str], ...]] = None
+
+
 def serialize_envelope(envelope: UiEventEnvelope) -> bytes:
     """Serialize an envelope into an SSE frame."""
     payload = envelope.model_dump(by_alias=True, exclude_none=True, mode="json")
+    return _frame_bytes(payload)
+
+
+def encode_frame(envelope: UiEventEnvelope, *, event_id: Optional[str] = None) -> SseFrame:
+    """Serialize ``envelope`` once (optionally stamping ``event_id``) into an :class:`SseFrame`."""
+    payload = envelope.model_dump(by_alias=True, exclude_none=True, mode="json")
+    if event_id is not None:
+        payload["id"] = event_id
+    return SseFrame(
+        id=str(payload.get("id")),
+        type=str(payload.get("type")),
+        scope=envelope.scope,
+        data=_frame_bytes(payload),
+        replayed=_frame_bytes({**payload, "replayed": True}),
+        coalesce_key=_coalesce_key(envelope),
+    )
+
+
+def _coalesce_key(envelope: UiEventEnvelope) -> Optional[Tuple[Optional[str], ...]]:
+    if envelope.type not in _SUPERSEDING_TYPES:
+        return None
+    scope = envelope.scope
+    return (
+        envelope.type.value,
+        scope.clientSessionId,
+        scope.runId,
+        scope.workerName,
+        envelope.data.get("nodeId"),
+    )
+
+
+def _frame_bytes(payload: Dict[str, Any]) -> bytes:
     event_type = payload.get("type")
     event_id = payload.get("id")
     json_payload = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Iterable
-
-from .connection import SseConnection
-from .models import UiEventEnvelope
+from .models import UiEventEnvelope, encode_frame
 from .registry import ConnectionRegistry
 from .store import EventStore
 
 
 class EventPublisher:
-    """Dispatch UiEventEnvelope instances to interested SSE connections."""
+    """Dispatch UiEventEnvelope instances to interested SSE connections.
+
+    Each event is serialized exactly once; the resulting frame is stored for
+    replay and the same bytes are handed to every matching connection. Handing
+    a frame over never blocks: slow connections apply their overflow policy.
+    """
 
     def __init__(self, registry: ConnectionRegistry, store: EventStore) -> None:
         self._registry = registry
@@ -19,9 +20,8 @@ class EventPublisher:
     async def publish(self, envelope: UiEventEnvelope) -> None:
         scope = envelope.scope
         event_id = self._store.next_id(scope.tenant)
-        occurred_at = envelope.occurredAt or datetime.now(timezone.utc)
-        final_envelope = envelope.model_copy(update={"id": event_id, "occurredAt": occurred_at})
-        self._store.append(scope.tenant, final_envelope)
+        frame = encode_frame(envelope, event_id=event_id)
+        self._store.append(scope.tenant, frame)
         connections = await self._registry.match(scope)
         for connection in connections:
-            await connection.enqueue(final_envelope)
+            connection.offer(frame)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from typing import Dict, List, Set
+from typing import Any, Dict, List, Set
 
 from .connection import SseConnection, SubscriptionFilter
 from .models import UiEventScope
@@ -56,3 +56,23 @@ class ConnectionRegistry:
             if connection.filters.matches(scope):
                 matched.append(connection)
         return matched
+
+    def connections(self) -> List[SseConnection]:
+        """All registered connections (a point-in-time copy)."""
+        return [
+            connection
+            for tenant_connections in list(self._connections.values())
+            for session_connections in list(tenant_connections.values())
+            for connection in list(session_connections)
+        ]
+
+    def metrics(self) -> Dict[str, Any]:
+        items = [connection.metrics() for connection in self.connections()]
+        return {
+            "connections": len(items),
+            "queued": sum(item["queueDepth"] for item in items),
+            "dropped": sum(item["dropped"] for item in items),
+            "resyncs": sum(item["resyncs"] for item in items),
+            "maxLagMs": max((item["lagMs"] for item in items), default=0.0),
+            "items": items,
+        }
@@ -0,0 +1,101 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from scheduler_api.core.biz.dispatch import orchestrator as orchestrator_module
+from scheduler_api.core.biz.dispatch.orchestrator import RunOrchestrator
+from scheduler_api.core.biz.domain.models import DispatchRequest
+from scheduler_api.core.biz.engine.deadlines import DeadlineScheduler
+from scheduler_api.core.biz.engine.pending import build_pending_next_requests, collect_expired_next_requests
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _at(seconds: float) -> datetime:
+    return BASE + timedelta(seconds=seconds)
+
+
+def test_pop_expired_in_deadline_order_and_skips_cancelled():
+    now = {"value": _at(0)}
+    deadlines = DeadlineScheduler(lambda value: value, clock=lambda: now["value"])
+    deadlines["late"] = _at(30)
+    deadlines["first"] = _at(5)
+    deadlines["second"] = _at(10)
+    deadlines["cancelled"] = _at(1)
+    deadlines["open"] = None
+    deadlines["moved"] = _at(2)
+    deadlines["moved"] = _at(60)
+
+    assert deadlines.cancel("cancelled") == _at(1)
+    assert deadlines.next_deadline() == _at(5).timestamp()
+    assert deadlines.pop_expired() == []
+
+    now["value"] = _at(20)
+    assert [key for key, _ in deadlines.pop_expired()] == ["first", "second"]
+    assert set(deadlines) == {"late", "open", "moved"}
+
+
+def test_pending_next_requests_expire_from_heap():
+    now = {"value": _at(0)}
+    pending = build_pending_next_requests(utc_now=lambda: now["value"])
+    pending["req-1"] = ("run-1", "worker-a", None, _at(1), "node-1", "mw-1", "task-1")
+    pending["req-2"] = ("run-1", None, None, _at(1), "node-1", "mw-1", "task-2")
+    pending["req-3"] = ("run-1", "worker-a", None, _at(10), "node-1", "mw-1", "task-3")
+
+    now["value"] = _at(5)
+    expired = collect_expired_next_requests(pending, utc_now=lambda: now["value"])
+    assert expired == [("req-1", "worker-a", "run-1", "node-1", "mw-1")]
+    assert list(pending) == ["req-3"]
+
+
+@pytest.mark.asyncio
+async def test_ack_timeout_fires_once_from_single_scheduler(monkeypatch):
+    resets = []
+    retried = []
+
+    async def _reset(run_id, *, node_id, dispatch_id):
+        resets.append(dispatch_id)
+
+    orchestrator = RunOrchestrator(concurrency=1)
+
+    async def _retry(request, message):
+        retried.append((request.node_id, message))
+
+    monkeypatch.setattr(orchestrator_module.run_state_service, "reset_after_ack_timeout", _reset)
+    monkeypatch.setattr(orchestrator, "_handle_retry", _retry)
+
+    def _request(node_id: str, timeout: float) -> DispatchRequest:
+        return DispatchRequest(
+            run_id="run-1",
+            tenant="tenant",
+            node_id=node_id,
+            task_id=f"task-{node_id}",
+            node_type="type",
+            package_name="pkg",
+            package_version="1.0.0",
+            parameters={},
+            resource_refs=[],
+            affinity=None,
+            concurrency_key=node_id,
+            seq=1,
+            dispatch_id=f"dispatch-{node_id}",
+            ack_deadline=datetime.now(timezone.utc) + timedelta(seconds=timeout),
+        )
+
+    orchestrator.ensure_started()
+    try:
+        orchestrator._pending_acks["dispatch-acked"] = _request("acked", 0.05)  # noqa: SLF001
+        orchestrator._pending_acks["dispatch-slow"] = _request("slow", 0.05)  # noqa: SLF001
+        orchestrator._pending_acks["dispatch-later"] = _request("later", 60)  # noqa: SLF001
+        assert orchestrator._pending_acks.cancel("dispatch-acked") is not None  # noqa: SLF001
+
+        for _ in range(50):
+            if resets:
+                break
+            await asyncio.sleep(0.01)
+        assert resets == ["dispatch-slow"]
+        assert retried == [("slow", "ack timeout")]
+        assert orchestrator.metrics()["pendingAcks"] == 1
+    finally:
+        await orchestrator.stop()
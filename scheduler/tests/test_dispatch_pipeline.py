@@ -0,0 +1,283 @@
+import asyncio
+
+import pytest
+
+from scheduler_api.core.biz.dispatch import orchestrator as orchestrator_module
+from scheduler_api.core.biz.dispatch.lanes import DispatchLanes
+from scheduler_api.core.biz.dispatch.orchestrator import RunOrchestrator
+from scheduler_api.core.biz.dispatch.slots import WorkerSlots
+from scheduler_api.core.biz.domain.models import DispatchRequest
+from scheduler_api.core.network.gateway import WorkerGateway
+from scheduler_api.core.network.manager import WorkerControlManager
+from shared.models.session import Capabilities
+from shared.models.session.register import Package, Status
+
+
+def _request(node_id: str, *, run_id: str = "run-1", package: str = "pkg", tenant: str = "tenant") -> DispatchRequest:
+    return DispatchRequest(
+        run_id=run_id,
+        tenant=tenant,
+        node_id=node_id,
+        task_id=f"task-{node_id}",
+        node_type="type",
+        package_name=package,
+        package_version="1.0.0",
+        parameters={},
+        resource_refs=[],
+        affinity=None,
+        concurrency_key=node_id,
+        seq=1,
+    )
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lanes_round_robin_and_cap():
+    lanes = DispatchLanes(lane_concurrency=1)
+    for idx in range(3):
+        lanes.push(_request(f"a-{idx}", package="pkg-a"))
+    lanes.push(_request("b-0", package="pkg-b"))
+
+    first, _ = lanes.pop()
+    second, _ = lanes.pop()
+    assert [first.node_id, second.node_id] == ["a-0", "b-0"]
+    # pkg-a is at its in-flight cap until the first attempt completes.
+    assert lanes.pop() is None
+    assert lanes.complete(first) is True
+    third, _ = lanes.pop()
+    assert third.node_id == "a-1"
+    assert lanes.queued == 1
+
+
+def test_lanes_delay_heap_and_discard():
+    clock = _Clock()
+    lanes = DispatchLanes(clock=clock)
+    lanes.push_delayed(_request("late"), 5.0)
+    lanes.push_delayed(_request("soon"), 1.0)
+    lanes.push_delayed(_request("other", run_id="run-2"), 1.0)
+    assert lanes.next_due() == 1.0
+    assert lanes.release_due() == 0
+
+    clock.now = 2.0
+    assert lanes.release_due() == 2
+    assert lanes.delayed == 1 and lanes.queued == 2
+
+    assert lanes.discard_run("run-1") == 2
+    request, _ = lanes.pop()
+    assert request.run_id == "run-2"
+    assert lanes.pop() is None and lanes.delayed == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_backoff_does_not_stall_other_lanes(monkeypatch):
+    class _Record:
+        status = "running"
+
+    async def _get(run_id):
+        return _Record()
+
+    monkeypatch.setattr(orchestrator_module.run_state_service, "get", _get)
+
+    dispatched = []
+    orchestrator = RunOrchestrator(concurrency=1, base_retry_seconds=30.0)
+
+    async def _dispatch(request):
+        if request.package_name == "starved":
+            await orchestrator._handle_retry(request, "worker unavailable")  # noqa: SLF001
+            return
+        dispatched.append(request.node_id)
+
+    monkeypatch.setattr(orchestrator, "_dispatch", _dispatch)
+    try:
+        await orchestrator.enqueue([_request("stuck", package="starved")])
+        await orchestrator.enqueue([_request(f"ok-{idx}", package="healthy") for idx in range(3)])
+        for _ in range(50):
+            if len(dispatched) == 3:
+                break
+            await asyncio.sleep(0.01)
+        assert dispatched == ["ok-0", "ok-1", "ok-2"]
+
+        metrics = orchestrator.metrics()
+        assert metrics["delayed"] == 1
+        assert metrics["retries"] == 1
+        assert metrics["queued"] == 0
+        assert metrics["dispatchLatency"]["count"] == 4
+
+        await orchestrator.cancel_run("run-1")
+        assert orchestrator.metrics()["delayed"] == 0
+    finally:
+        await orchestrator.stop()
+
+
+class _Transport:
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        return None
+
+
+def _batching_gateway() -> WorkerGateway:
+    manager = WorkerControlManager()
+    session = manager.upsert_session(
+        worker_name="w1",
+        worker_instance_id="w1-id",
+        tenant="tenant",
+        version="1",
+        hostname="host",
+        transport=_Transport(),
+    )
+    manager.update_registration(
+        "w1-id",
+        "w1",
+        capabilities=Capabilities.model_validate(
+            {"concurrency": {"max_parallel": 10}, "runtimes": ["python"], "features": []}
+        ),
+        payload_types=["biz.exec.dispatch", "biz.exec.dispatch.batch"],
+        packages=[Package(name="pkg", version="1.0.0", status=Status.installed)],
+        manifests=[],
+        channels=[],
+    )
+    session.registered = True
+    return WorkerGateway(manager)
+
+
+@pytest.mark.asyncio
+async def test_dispatches_to_one_worker_share_a_batch_frame_and_ack(monkeypatch):
+    gateway = _batching_gateway()
+    sent = []
+    acknowledged = []
+
+    class _Record:
+        status = "running"
+
+    async def _send(target, envelope):
+        sent.append(envelope)
+
+    async def _get(run_id):
+        return _Record()
+
+    async def _mark_dispatched(run_id, **kwargs):
+        return _Record()
+
+    async def _mark_acknowledged(run_id, *, node_id, dispatch_id):
+        acknowledged.append(node_id)
+
+    monkeypatch.setattr(gateway, "send_envelope", _send)
+    monkeypatch.setattr(orchestrator_module, "worker_gateway", gateway)
+    monkeypatch.setattr(orchestrator_module.run_state_service, "get", _get)
+    monkeypatch.setattr(orchestrator_module.run_state_service, "mark_dispatched", _mark_dispatched)
+    monkeypatch.setattr(orchestrator_module.run_state_service, "mark_acknowledged", _mark_acknowledged)
+
+    orchestrator = RunOrchestrator(concurrency=4, batch_linger_seconds=0.05, batch_max_size=3)
+    orchestrator._slots = WorkerSlots(on_change=gateway.refresh_load)  # noqa: SLF001
+    try:
+        await orchestrator.enqueue([_request(f"n-{idx}") for idx in range(4)])
+        for _ in range(100):
+            if len(sent) == 2 and orchestrator.metrics()["pendingAcks"] == 4:
+                break
+            await asyncio.sleep(0.01)
+
+        # A full batch goes out at once; the straggler after the linger window as a plain dispatch.
+        batch, single = sent
+        assert batch["type"] == "biz.exec.dispatch.batch"
+        items = batch["payload"]["items"]
+        assert [item["dispatch"]["node_id"] for item in items] == ["n-0", "n-1", "n-2"]
+        assert single["type"] == "biz.exec.dispatch"
+        assert single["payload"]["node_id"] == "n-3"
+        assert orchestrator.metrics()["batches"] == 2
+
+        await orchestrator.register_ack(batch["id"])
+        assert sorted(acknowledged) == ["n-0", "n-1", "n-2"]
+        assert orchestrator.metrics()["pendingAcks"] == 1
+        assert orchestrator._batch_members == {} and orchestrator._batch_of == {}  # noqa: SLF001
+    finally:
+        await orchestrator.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_ack_arriving_before_members_are_tracked_is_applied(monkeypatch):
+    gateway = _batching_gateway()
+    orchestrator = RunOrchestrator(concurrency=4, batch_linger_seconds=0.05, batch_max_size=3)
+    orchestrator._slots = WorkerSlots(on_change=gateway.refresh_load)  # noqa: SLF001
+    acknowledged = []
+
+    class _Record:
+        status = "running"
+
+    async def _send(target, envelope):
+        # The worker acks on receipt, before the scheduler has marked any member dispatched.
+        await orchestrator.register_ack(envelope["id"])
+
+    async def _get(run_id):
+        return _Record()
+
+    async def _mark_dispatched(run_id, **kwargs):
+        await asyncio.sleep(0)
+        return _Record()
+
+    async def _mark_acknowledged(run_id, *, node_id, dispatch_id):
+        acknowledged.append(node_id)
+
+    monkeypatch.setattr(gateway, "send_envelope", _send)
+    monkeypatch.setattr(orchestrator_module, "worker_gateway", gateway)
+    monkeypatch.setattr(orchestrator_module.run_state_service, "get", _get)
+    monkeypatch.setattr(orchestrator_module.run_state_service, "mark_dispatched", _mark_dispatched)
+    monkeypatch.setattr(orchestrator_module.run_state_service, "mark_acknowledged", _mark_acknowledged)
+
+    try:
+        await orchestrator.enqueue([_request(f"n-{idx}") for idx in range(3)])
+        for _ in range(100):
+            if len(acknowledged) == 3:
+                break
+            await asyncio.sleep(0.01)
+
+        assert sorted(acknowledged) == ["n-0", "n-1", "n-2"]
+        assert orchestrator.metrics()["pendingAcks"] == 0
+        assert orchestrator._untracked == {}  # noqa: SLF001
+    finally:
+        await orchestrator.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_releases_slots_of_buffered_dispatches_and_requeues_them(monkeypatch):
+    gateway = _batching_gateway()
+
+    class _Record:
+        status = "running"
+
+    async def _get(run_id):
+        return _Record()
+
+    monkeypatch.setattr(orchestrator_module, "worker_gateway", gateway)
+    monkeypatch.setattr(orchestrator_module.run_state_service, "get", _get)
+
+    orchestrator = RunOrchestrator(concurrency=2, batch_linger_seconds=10.0, batch_max_size=8)
+    orchestrator._slots = WorkerSlots(on_change=gateway.refresh_load)  # noqa: SLF001
+    try:
+        await orchestrator.enqueue([_request(f"n-{idx}") for idx in range(2)])
+        for _ in range(100):
+            if orchestrator.metrics()["batched"] == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert orchestrator.metrics()["reservedSlots"] == 2
+
+        await orchestrator.stop()
+        metrics = orchestrator.metrics()
+        assert metrics["batched"] == 0 and metrics["reservedSlots"] == 0
+        assert metrics["queued"] == 2
+        (session,) = gateway.list_sessions().values()
+        assert session.reserved_slots == {}
+
+        # A later start picks the re-queued dispatches up again.
+        orchestrator.ensure_started()
+        for _ in range(100):
+            if orchestrator.metrics()["batched"] == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert orchestrator.metrics()["queued"] == 0
+    finally:
+        await orchestrator.stop()
@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+
+from scheduler_api.core.biz.domain.models import NodeState, RunRecord
+from scheduler_api.core.biz.events import emit
+from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
+
+
+def _make_record() -> RunRecord:
+    workflow = StartRunRequestWorkflow.from_dict(
+        {
+            "id": "wf-1",
+            "schemaVersion": "2025-10",
+            "metadata": {"name": "coalesce-tests"},
+            "nodes": [
+                {
+                    "id": "llm",
+                    "type": "example.pkg.llm",
+                    "package": {"name": "example.pkg", "version": "1.0.0"},
+                    "status": "published",
+                    "category": "test",
+                    "label": "LLM",
+                    "position": {"x": 0, "y": 0},
+                }
+            ],
+            "edges": [],
+        }
+    )
+    return RunRecord(
+        run_id="run-1",
+        definition_hash="hash",
+        client_id="client",
+        workflow=workflow,
+        tenant="tenant",
+        status="running",
+    )
+
+
+def _build_emitter(calls, *, window: float = 0.05) -> emit.RunRegistryEmitter:
+    async def publish_node_state(record, node):
+        calls.append(("state", node.node_id, (node.metadata or {}).get("progress")))
+
+    async def publish_node_snapshot(record, node, *, complete):
+        calls.append(("snapshot", node.node_id, complete))
+
+    async def publish_run_state(record):
+        calls.append(("run_state", record.status))
+
+    async def publish_run_snapshot(record):
+        calls.append(("run_snapshot",))
+
+    async def publish_node_result_delta(record, node, **kwargs):
+        calls.append(("delta", node.node_id, kwargs["path"], kwargs["sequence"], kwargs["payload"]))
+
+    return emit.RunRegistryEmitter(
+        publish_node_state=publish_node_state,
+        publish_node_snapshot=publish_node_snapshot,
+        publish_run_state=publish_run_state,
+        publish_run_snapshot=publish_run_snapshot,
+        publish_node_result_delta=publish_node_result_delta,
+        coalescer=emit.EventCoalescer(window_seconds=window),
+    )
+
+
+def _chunk(sequence: int, text: str, *, channel: str = "stdout", terminal: bool = False):
+    chunk = {"channel": channel, "text": text}
+    if terminal:
+        chunk["metadata"] = {"terminal": True}
+    return {"revision": 1, "sequence": sequence, "chunk": chunk}
+
+
+async def _feedback(emitter, record, node, chunks):
+    tasks = []
+    emitter.feedback.enqueue_node_state(tasks, record, node)
+    emitter.feedback.enqueue_chunk_result_deltas(tasks, record, node, chunks)
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_feedback_is_merged_within_window():
+    calls = []
+    emitter = _build_emitter(calls)
+    record = _make_record()
+
+    for progress in range(5):
+        node = NodeState(node_id="llm", task_id="task", status="running", metadata={"progress": progress})
+        await _feedback(emitter, record, node, [_chunk(progress, f"t{progress} ")])
+    assert calls == []
+
+    await asyncio.sleep(0.1)
+    assert calls == [
+        ("state", "llm", 4),
+        ("delta", "llm", "/channels/stdout", 4, {"text": "t0 t1 t2 t3 t4 "}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_terminal_chunk_flushes_immediately():
+    calls = []
+    emitter = _build_emitter(calls, window=60)
+    record = _make_record()
+    node = NodeState(node_id="llm", task_id="task", status="running")
+
+    await _feedback(emitter, record, node, [_chunk(1, "a"), _chunk(2, "b")])
+    await _feedback(emitter, record, node, [_chunk(3, "done", terminal=True)])
+
+    # The second state update supersedes the first and moves behind the merged chunk.
+    assert [call[0] for call in calls] == ["delta", "state", "delta"]
+    assert calls[0][4] == {"text": "ab"}
+    assert calls[2][3] == 3
+
+
+@pytest.mark.asyncio
+async def test_direct_events_publish_after_buffered_feedback():
+    calls = []
+    emitter = _build_emitter(calls, window=60)
+    record = _make_record()
+    running = NodeState(node_id="llm", task_id="task", status="running")
+
+    await _feedback(emitter, record, running, [_chunk(1, "x")])
+    await _feedback(emitter, record, running, [_chunk(1, "y", channel="stderr")])
+
+    record.status = "succeeded"
+    finished = NodeState(node_id="llm", task_id="task", status="succeeded")
+    tasks = []
+    emitter.enqueue_node_state_and_snapshot(tasks, record, finished, complete=True)
+    emitter.enqueue_run_state(tasks, record)
+    await asyncio.gather(*tasks)
+
+    assert calls == [
+        ("delta", "llm", "/channels/stdout", 1, {"text": "x"}),
+        ("state", "llm", None),
+        ("delta", "llm", "/channels/stderr", 1, {"text": "y"}),
+        ("state", "llm", None),
+        ("snapshot", "llm", True),
+        ("run_state", "succeeded"),
+    ]
@@ -28,3 +28,22 @@ def test_sse_global_events(client: TestClient):
     # uncomment below to assert the status code of the HTTP response
     #assert response.status_code == 200
 
+
+def test_list_event_connections(client: TestClient):
+    """Test case for list_event_connections
+
+    SSE connection metrics (admin)
+    """
+
+    headers = {
+        "Authorization": "Bearer special-key",
+    }
+    # uncomment below to make a request
+    #response = client.request(
+    #    "GET",
+    #    "/api/v1/events/connections",
+    #    headers=headers,
+    #)
+
+    # uncomment below to assert the status code of the HTTP response
+    #assert response.status_code == 200
@@ -0,0 +1,154 @@
+import hashlib
+from datetime import datetime, timezone
+
+import pytest
+
+from scheduler_api.core.biz.services.payload_offload import PayloadStore, PayloadUnavailableError
+from scheduler_api.core.biz.services.run_state_service import RunStateService
+from scheduler_api.models.start_run_request import StartRunRequest
+from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
+from scheduler_api.resources import ResourceNotFoundError, StoredResource
+from shared.models.biz.exec.result import ExecResultPayload
+from shared.protocol.payload_ref import payload_ref_id
+
+
+class _MemoryProvider:
+    name = "local"
+
+    def __init__(self, base_dir):
+        self._base_dir = base_dir
+        self.resources = {}
+
+    def save_bytes(self, *, filename, data, content_type=None, metadata=None, owner_id=None, visibility=None):
+        resource_id = f"res-{len(self.resources)}"
+        (self._base_dir / resource_id).write_bytes(data)
+        stored = StoredResource(
+            resource_id=resource_id,
+            provider=self.name,
+            type="file",
+            filename=filename,
+            mime_type=content_type,
+            size_bytes=len(data),
+            sha256=hashlib.sha256(data).hexdigest(),
+            created_at=datetime.now(timezone.utc),
+            metadata=metadata,
+        )
+        self.resources[resource_id] = stored
+        return stored
+
+    def find_by_sha256(self, sha256):
+        return next((stored for stored in self.resources.values() if stored.sha256 == sha256), None)
+
+    def open(self, resource_id):
+        stored = self.resources.get(resource_id)
+        if stored is None:
+            raise ResourceNotFoundError(resource_id)
+        return self._base_dir / resource_id, stored
+
+
+def _node(node_id: str, ui: dict) -> dict:
+    return {
+        "id": node_id,
+        "type": "example.pkg.task",
+        "package": {"name": "example.pkg", "version": "1.0.0"},
+        "status": "published",
+        "category": "test",
+        "label": node_id,
+        "position": {"x": 0, "y": 0},
+        "ui": ui,
+    }
+
+
+def _workflow() -> StartRunRequestWorkflow:
+    return StartRunRequestWorkflow.from_dict(
+        {
+            "id": "wf-offload",
+            "schemaVersion": "2025-10",
+            "metadata": {"name": "offload", "namespace": "default"},
+            "nodes": [
+                _node(
+                    "producer",
+                    {
+                        "outputPorts": [
+                            {"key": "rows", "label": "Rows", "binding": {"path": "/results/rows", "mode": "read"}},
+                            {"key": "count", "label": "Count", "binding": {"path": "/results/meta/count", "mode": "read"}},
+                        ]
+                    },
+                ),
+                _node(
+                    "consumer",
+                    {
+                        "inputPorts": [
+                            {"key": "rows", "label": "Rows", "binding": {"path": "/parameters/rows", "mode": "write"}},
+                            {"key": "count", "label": "Count", "binding": {"path": "/parameters/count", "mode": "write"}},
+                        ]
+                    },
+                ),
+            ],
+            "edges": [
+                {
+                    "id": "edge-rows",
+                    "source": {"node": "producer", "port": "rows"},
+                    "target": {"node": "consumer", "port": "rows"},
+                },
+                {
+                    "id": "edge-count",
+                    "source": {"node": "producer", "port": "count"},
+                    "target": {"node": "consumer", "port": "count"},
+                },
+            ],
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_large_results_are_passed_downstream_by_reference(tmp_path):
+    provider = _MemoryProvider(tmp_path)
+    store = PayloadStore(256, provider_factory=lambda: provider, provider_for=lambda _rid: provider)
+    registry = RunStateService(payload_store=store)
+    await registry.create_run(
+        run_id="run-offload",
+        request=StartRunRequest(workflow=_workflow(), client_id="client"),
+        tenant="t",
+    )
+    (producer,) = await registry.collect_ready_nodes("run-offload")
+
+    rows = [{"id": idx, "name": f"row-{idx}"} for idx in range(50)]
+    # ``meta`` is as large as ``rows`` but stays inline: an edge binding reads ``meta/count``.
+    meta = {"count": len(rows), "notes": "x" * 1024}
+    _, released, _ = await registry.record_result(
+        "run-offload",
+        ExecResultPayload(
+            run_id="run-offload",
+            task_id=producer.task_id,
+            status="SUCCEEDED",
+            result={"rows": rows, "meta": meta, "ok": True},
+        ),
+    )
+
+    (consumer,) = released
+    resource_id = payload_ref_id(consumer.parameters["rows"])
+    assert resource_id is not None
+    assert consumer.parameters["count"] == 50
+    record = await registry.get("run-offload")
+    assert record.nodes["producer"].result["meta"] == meta
+    assert record.nodes["producer"].result["ok"] is True
+    assert provider.resources[resource_id].metadata["kind"] == "payload"
+    assert await registry.read_payload(resource_id) == rows
+
+    # The same value offloaded again reuses the stored resource.
+    again = store.offload({"rows": rows}, run_id="run-offload", node_id="producer")
+    assert payload_ref_id(again["rows"]) == resource_id
+    assert len(provider.resources) == 1
+
+
+def test_only_payload_resources_are_served(tmp_path):
+    provider = _MemoryProvider(tmp_path)
+    store = PayloadStore(0, provider_factory=lambda: provider, provider_for=lambda _rid: provider)
+    assert store.offload({"big": "x" * 4096}, run_id="run", node_id="node") is None
+
+    secret = provider.save_bytes(filename="token.txt", data=b'"s3cret"', metadata={})
+    with pytest.raises(PayloadUnavailableError):
+        store.load(secret.resource_id)
+    with pytest.raises(PayloadUnavailableError):
+        store.load("missing")
@@ -0,0 +1,100 @@
+import importlib
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from scheduler_api.core.biz.domain.models import DispatchRequest
+from scheduler_api.core.biz.services import resource_bindings
+from scheduler_api.core.biz.services.resource_bindings import RESOURCE_BINDINGS_KEY
+from scheduler_api.core.biz.services.run_state_service import RunStateService
+from scheduler_api.resources import ResourceBindingCache
+
+# the package re-exports the service instance under the module's name
+run_state_module = importlib.import_module("scheduler_api.core.biz.services.run_state_service")
+
+
+def _request(run_id: str) -> DispatchRequest:
+    return DispatchRequest(
+        run_id=run_id,
+        tenant="t",
+        task_id=f"{run_id}-task",
+        node_id="node-1",
+        node_type="example.pkg.task",
+        package_name="example.pkg",
+        package_version="1.0.0",
+        parameters={},
+        constraints={},
+        concurrency_key="key",
+        resource_refs=[],
+        affinity=None,
+        seq=1,
+    )
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    cache = ResourceBindingCache(60)
+    calls = {"requirements": 0, "grant": 0, "resource": 0, "value": 0}
+    grant = SimpleNamespace(resource_id="res-1", package_version=None, created_at=datetime.now(timezone.utc))
+    stored = SimpleNamespace(
+        resource_id="res-1", type="secret", filename="token.txt", mime_type="text/plain", size_bytes=6, metadata={}
+    )
+
+    def count(kind, value):
+        def loader(*_args, **_kwargs):
+            calls[kind] += 1
+            return value
+
+        return loader
+
+    requirement = SimpleNamespace(key="token", type="secret", required=True, metadata={})
+    monkeypatch.setattr(resource_bindings, "_load_package_requirements", count("requirements", [requirement]))
+    monkeypatch.setattr(resource_bindings, "_resolve_grant", count("grant", grant))
+    monkeypatch.setattr(resource_bindings, "_get_resource", count("resource", stored))
+    monkeypatch.setattr(resource_bindings, "_get_resource_value", count("value", "s3cret"))
+    monkeypatch.setattr(resource_bindings, "get_resource_grant_store", lambda: None)
+    monkeypatch.setattr(run_state_module, "get_resource_binding_cache", lambda: cache)
+    return cache, calls
+
+
+@pytest.mark.asyncio
+async def test_resource_bindings_are_cached_until_invalidated(lookups):
+    cache, calls = lookups
+    registry = RunStateService()
+
+    first = [_request("run-a")]
+    await registry._apply_resource_bindings(first, workflow_ids={"run-a": "wf"})  # noqa: SLF001
+    binding = first[0].parameters[RESOURCE_BINDINGS_KEY]["token"]
+    assert binding["resourceId"] == "res-1" and binding["value"] == "s3cret"
+    assert calls == {"requirements": 1, "grant": 1, "resource": 1, "value": 1}
+
+    # A fully cached batch resolves inline, without touching the stores.
+    second = [_request("run-b")]
+    resolved = resource_bindings.resolve_resource_bindings(
+        second, workflow_ids={"run-b": "wf"}, cache=cache, load=False
+    )
+    assert [request for request, _bindings, _errors in resolved] == second
+    await registry._apply_resource_bindings(second, workflow_ids={"run-b": "wf"})  # noqa: SLF001
+    assert second[0].parameters[RESOURCE_BINDINGS_KEY]["token"]["value"] == "s3cret"
+    assert calls == {"requirements": 1, "grant": 1, "resource": 1, "value": 1}
+
+    cache.invalidate_grants()
+    cache.invalidate_resource("res-1")
+    await registry._apply_resource_bindings([_request("run-c")], workflow_ids={"run-c": "wf"})  # noqa: SLF001
+    assert calls == {"requirements": 1, "grant": 2, "resource": 2, "value": 2}
+
+
+def test_fill_racing_an_invalidation_is_dropped():
+    clock = [0.0]
+    cache = ResourceBindingCache(10, clock=lambda: clock[0])
+    generation = cache.generation
+    cache.invalidate_grants()
+    cache.store(("grant", "wf", "pkg", "1", "token"), "stale", generation=generation)
+    assert cache.lookup(("grant", "wf", "pkg", "1", "token")) == (False, None)
+
+    cache.store(("resource", "res-1"), "fresh", generation=cache.generation)
+    assert cache.lookup(("resource", "res-1")) == (True, "fresh")
+    clock[0] = 10
+    assert cache.lookup(("resource", "res-1")) == (False, None)
+    assert len(cache) == 0
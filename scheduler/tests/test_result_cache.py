@@ -0,0 +1,106 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import pytest
+
+from scheduler_api.core.biz.services import result_cache
+from scheduler_api.core.biz.services.result_cache import SqlResultCache
+from scheduler_api.core.biz.services.run_state_service import RunStateService
+from scheduler_api.db.models import NodeResultCacheRecord
+from scheduler_api.models.start_run_request import StartRunRequest
+from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
+from shared.models.biz.exec.result import ExecResultPayload
+
+
+def _session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    NodeResultCacheRecord.__table__.create(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def _node(node_id: str, ui: dict) -> dict:
+    return {
+        "id": node_id,
+        "type": "example.pkg.task",
+        "package": {"name": "example.pkg", "version": "1.0.0"},
+        "status": "published",
+        "category": "test",
+        "label": node_id,
+        "position": {"x": 0, "y": 0},
+        "parameters": {"seed": 7},
+        "ui": ui,
+    }
+
+
+def _workflow() -> StartRunRequestWorkflow:
+    return StartRunRequestWorkflow.from_dict(
+        {
+            "id": "wf-memo",
+            "schemaVersion": "2025-10",
+            "metadata": {"name": "memo", "namespace": "default"},
+            "nodes": [
+                _node(
+                    "producer",
+                    {"outputPorts": [{"key": "value", "label": "Value", "binding": {"path": "/results/value", "mode": "read"}}]},
+                ),
+                _node(
+                    "consumer",
+                    {"inputPorts": [{"key": "value", "label": "Value", "binding": {"path": "/parameters/value", "mode": "write"}}]},
+                ),
+            ],
+            "edges": [
+                {
+                    "id": "edge-value",
+                    "source": {"node": "producer", "port": "value"},
+                    "target": {"node": "consumer", "port": "value"},
+                }
+            ],
+        }
+    )
+
+
+async def _start(registry: RunStateService, run_id: str):
+    await registry.create_run(
+        run_id=run_id,
+        request=StartRunRequest(workflow=_workflow(), client_id="client"),
+        tenant="t",
+    )
+    return await registry.complete_memoized(await registry.collect_ready_nodes(run_id))
+
+
+@pytest.mark.asyncio
+async def test_memoized_nodes_complete_from_cache(monkeypatch):
+    monkeypatch.setattr(result_cache, "node_is_memoizable", lambda *_node: True)
+    cache = SqlResultCache(session_factory=_session_factory())
+    registry = RunStateService(result_cache=cache)
+
+    (producer,), _ = await _start(registry, "run-1")
+    _, released, _ = await registry.record_result(
+        "run-1",
+        ExecResultPayload(run_id="run-1", task_id=producer.task_id, status="SUCCEEDED", result={"value": 42}),
+    )
+    (consumer,), _ = await registry.complete_memoized(released)
+    assert consumer.parameters["value"] == 42
+    await registry.record_result(
+        "run-1",
+        ExecResultPayload(run_id="run-1", task_id=consumer.task_id, status="SUCCEEDED", result={"value": 43}),
+    )
+    await cache.flush()
+
+    summary = await registry.get_summary("run-1")
+    assert summary.status == "succeeded"
+    assert (summary.memo.hits, summary.memo.misses) == (0, 2)
+
+    # Same definition and parameters: both nodes complete without a dispatch.
+    remaining, next_responses = await _start(registry, "run-2")
+    assert remaining == [] and next_responses == []
+    record = await registry.get("run-2")
+    assert record.status == "succeeded"
+    assert record.nodes["consumer"].result == {"value": 43}
+    summary = await registry.get_summary("run-2")
+    assert (summary.memo.hits, summary.memo.misses) == (2, 0)
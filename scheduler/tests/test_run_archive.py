@@ -0,0 +1,210 @@
+import asyncio
+import sys
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from scheduler_api.core.biz.facade import ControlPlaneBizFacade
+from scheduler_api.core.biz.services.run_archive import SqlRunArchive
+from scheduler_api.core.biz.services.run_state_service import RunStateService
+from scheduler_api.db.models import RunArchiveRecord
+from scheduler_api.models.start_run_request import StartRunRequest
+from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
+from shared.models.biz.exec.result import ExecResultPayload
+
+
+def _workflow() -> StartRunRequestWorkflow:
+    return StartRunRequestWorkflow.from_dict(
+        {
+            "id": "wf-archive",
+            "schemaVersion": "2025-10",
+            "metadata": {"name": "archive", "namespace": "default"},
+            "nodes": [
+                {
+                    "id": "node-1",
+                    "type": "example.pkg.task",
+                    "package": {"name": "example.pkg", "version": "1.0.0"},
+                    "status": "published",
+                    "category": "test",
+                    "label": "Task",
+                    "position": {"x": 0, "y": 0},
+                }
+            ],
+            "edges": [],
+        }
+    )
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    RunArchiveRecord.__table__.create(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+async def _run(registry: RunStateService, run_id: str, *, client_id: str, finish: bool) -> None:
+    await registry.create_run(
+        run_id=run_id,
+        request=StartRunRequest(workflow=_workflow(), client_id=client_id),
+        tenant="t",
+    )
+    (ready,) = await registry.collect_ready_nodes(run_id)
+    if finish:
+        await registry.record_result(
+            run_id,
+            ExecResultPayload(run_id=run_id, task_id=ready.task_id, status="SUCCEEDED", result={"value": run_id}),
+        )
+
+
+@pytest.mark.asyncio
+async def test_finished_runs_are_evicted_and_read_through_archive(session_factory):
+    archive = SqlRunArchive(session_factory=session_factory)
+    registry = RunStateService(run_retention_max_finished=2, run_archive=archive)
+    for idx in range(6):
+        await _run(registry, f"run-{idx}", client_id="even" if idx % 2 == 0 else "odd", finish=idx != 3)
+
+    # Only the two most recently finished runs (and the running one) stay in memory.
+    assert sorted(registry._runs) == ["run-3", "run-4", "run-5"]  # noqa: SLF001
+    assert await registry.get("run-0") is None
+    await archive.flush()
+    with session_factory() as session:
+        assert session.execute(select(func.count()).select_from(RunArchiveRecord)).scalar_one() == 5
+
+    archived = await registry.get_summary("run-1")
+    assert archived is not None
+    assert archived.status == "succeeded"
+    assert [node.node_id for node in archived.nodes] == ["node-1"]
+
+    # SSE resyncs of evicted runs are rebuilt from the archived summary.
+    snapshot = await ControlPlaneBizFacade(coordinator=registry).run_snapshot_event("run-1", tenant="t")
+    assert snapshot is not None
+    assert snapshot.scope.runId == "run-1" and snapshot.scope.clientSessionId == "odd"
+    assert snapshot.data["run"]["status"] == "succeeded"
+
+    seen, cursor = [], None
+    while True:
+        page = await registry.to_list_response(limit=2, cursor=cursor, status=None, client_id=None)
+        seen.extend(item.run_id for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert seen == [f"run-{idx}" for idx in range(6)]
+
+    even = await registry.to_list_response(limit=10, cursor=None, status=None, client_id="even")
+    assert [item.run_id for item in even.items] == ["run-0", "run-2", "run-4"]
+    finished = await registry.to_list_response(limit=10, cursor="run-1", status="succeeded", client_id=None)
+    assert [item.run_id for item in finished.items] == ["run-2", "run-4", "run-5"]
+
+
+@pytest.mark.asyncio
+async def test_finished_runs_expire_after_retention(session_factory):
+    archive = SqlRunArchive(session_factory=session_factory)
+    registry = RunStateService(run_retention_seconds=60, run_archive=archive)
+    await _run(registry, "run-old", client_id="client", finish=True)
+    await _run(registry, "run-live", client_id="client", finish=False)
+
+    later = registry._now() + timedelta(seconds=61)  # noqa: SLF001
+    registry._now = lambda: later  # noqa: SLF001
+    await _run(registry, "run-new", client_id="client", finish=False)
+
+    assert sorted(registry._runs) == ["run-live", "run-new"]  # noqa: SLF001
+    summary = await registry.get_summary("run-old")
+    assert summary is not None and summary.status == "succeeded"
+    page = await registry.to_list_response(limit=10, cursor=None, status=None, client_id=None)
+    assert [item.run_id for item in page.items] == ["run-old", "run-live", "run-new"]
+
+
+def _parallel_workflow() -> StartRunRequestWorkflow:
+    node = _workflow().to_dict()["nodes"][0]
+    return StartRunRequestWorkflow.from_dict(
+        {
+            "id": "wf-parallel",
+            "schemaVersion": "2025-10",
+            "metadata": {"name": "parallel", "namespace": "default"},
+            "nodes": [{**node, "id": "node-a"}, {**node, "id": "node-b"}],
+            "edges": [],
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_run_is_kept_until_in_flight_nodes_settle(session_factory):
+    archive = SqlRunArchive(session_factory=session_factory)
+    registry = RunStateService(run_retention_max_finished=1, run_archive=archive)
+    await registry.create_run(
+        run_id="run-1",
+        request=StartRunRequest(workflow=_parallel_workflow(), client_id="client"),
+        tenant="t",
+    )
+    ready = await registry.collect_ready_nodes("run-1")
+    for idx, item in enumerate(ready):
+        await registry.mark_dispatched(
+            "run-1",
+            worker_name="worker",
+            task_id=item.task_id,
+            node_id=item.node_id,
+            node_type=item.node_type,
+            package_name=item.package_name,
+            package_version=item.package_version,
+            seq_used=item.seq,
+            dispatch_id=f"dispatch-{idx}",
+        )
+    first, second = ready
+    record, *_ = await registry.record_result(
+        "run-1",
+        ExecResultPayload(run_id="run-1", task_id=first.task_id, status="FAILED", result={}),
+    )
+    assert record.status == "failed"
+
+    # run-1 is not counted as finished while its second node is in flight, so run-2 stays resident.
+    await _run(registry, "run-2", client_id="client", finish=True)
+    assert sorted(registry._runs) == ["run-1", "run-2"]  # noqa: SLF001
+    assert await archive.fetch("run-1") is None
+
+    await registry.record_result(
+        "run-1",
+        ExecResultPayload(run_id="run-1", task_id=second.task_id, status="SUCCEEDED", result={}),
+    )
+    archived = await archive.fetch("run-1")
+    assert archived is not None
+    assert {node.node_id: node.status for node in archived.summary.nodes} == {
+        "node-a": "failed",
+        "node-b": "succeeded",
+    }
+
+    await _run(registry, "run-3", client_id="client", finish=True)
+    assert "run-1" not in registry._runs  # noqa: SLF001
+    summary = await registry.get_summary("run-1")
+    assert summary is not None and summary.status == "failed"
+    assert [node.status for node in summary.nodes] == ["failed", "succeeded"]
+
+
+@pytest.mark.asyncio
+async def test_idle_scheduler_evicts_expired_runs_in_the_background(session_factory, monkeypatch):
+    monkeypatch.setattr(sys.modules[RunStateService.__module__], "RETENTION_SWEEP_SECONDS", 0.01)
+    archive = SqlRunArchive(session_factory=session_factory)
+    registry = RunStateService(run_retention_seconds=60, run_archive=archive)
+    await registry.recover()
+    try:
+        await _run(registry, "run-old", client_id="client", finish=True)
+        assert "run-old" in registry._runs  # noqa: SLF001
+
+        later = registry._now() + timedelta(seconds=61)  # noqa: SLF001
+        registry._now = lambda: later  # noqa: SLF001
+        for _ in range(100):
+            if "run-old" not in registry._runs:  # noqa: SLF001
+                break
+            await asyncio.sleep(0.01)
+        assert "run-old" not in registry._runs  # noqa: SLF001
+        summary = await registry.get_summary("run-old")
+        assert summary is not None and summary.status == "succeeded"
+    finally:
+        await registry.close()
+    assert registry._retention_task is None  # noqa: SLF001
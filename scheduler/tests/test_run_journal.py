@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from scheduler_api.core.biz.services.run_journal import SqlRunJournal
+from scheduler_api.core.biz.services.run_state_service import RunStateService
+from scheduler_api.db.models import RunJournalRecord
+from scheduler_api.models.start_run_request import StartRunRequest
+from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
+from shared.models.biz.exec.result import ExecResultPayload
+
+
+def _chain_workflow() -> StartRunRequestWorkflow:
+    node = {
+        "type": "example.pkg.task",
+        "package": {"name": "example.pkg", "version": "1.0.0"},
+        "status": "published",
+        "category": "test",
+        "position": {"x": 0, "y": 0},
+    }
+    return StartRunRequestWorkflow.from_dict(
+        {
+            "id": "wf-journal",
+            "schemaVersion": "2025-10",
+            "metadata": {"name": "journal", "namespace": "default"},
+            "nodes": [
+                {**node, "id": "node-1", "label": "First"},
+                {**node, "id": "node-2", "label": "Second"},
+                {**node, "id": "node-3", "label": "Side"},
+            ],
+            "edges": [
+                {
+                    "id": "edge-1",
+                    "source": {"node": "node-1", "port": "out"},
+                    "target": {"node": "node-2", "port": "in"},
+                }
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    RunJournalRecord.__table__.create(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+async def _dispatch(registry: RunStateService, request, dispatch_id: str) -> None:
+    await registry.mark_dispatched(
+        "run-journal",
+        worker_name="worker-1",
+        task_id=request.task_id,
+        node_id=request.node_id,
+        node_type=request.node_type,
+        package_name=request.package_name,
+        package_version=request.package_version,
+        seq_used=request.seq,
+        dispatch_id=dispatch_id,
+        ack_deadline=datetime.now(timezone.utc) + timedelta(seconds=5),
+    )
+
+
+@pytest.mark.asyncio
+async def test_recover_rebuilds_in_flight_run(session_factory):
+    registry = RunStateService(journal=SqlRunJournal(session_factory=session_factory))
+    request = StartRunRequest(workflow=_chain_workflow(), client_id="client")
+    await registry.create_run(run_id="run-journal", request=request, tenant="t")
+
+    ready = {req.node_id: req for req in await registry.collect_ready_nodes("run-journal")}
+    assert set(ready) == {"node-1", "node-3"}
+    await _dispatch(registry, ready["node-1"], "dispatch-1")
+    await registry.mark_acknowledged("run-journal", node_id="node-1", dispatch_id="dispatch-1")
+    # node-3 is dispatched but never acknowledged before the "crash".
+    await _dispatch(registry, ready["node-3"], "dispatch-3")
+    _, released, _ = await registry.record_result(
+        "run-journal",
+        ExecResultPayload(
+            run_id="run-journal",
+            task_id=ready["node-1"].task_id,
+            status="SUCCEEDED",
+            result={"value": 1},
+        ),
+    )
+    assert [req.node_id for req in released] == ["node-2"]
+    original = await registry.get("run-journal")
+    await registry.journal.flush()
+
+    recovered = RunStateService(journal=SqlRunJournal(session_factory=session_factory))
+    await recovered.recover()
+    try:
+        record = await recovered.get("run-journal")
+        assert record is not None
+        assert record.created_at == original.created_at
+        assert record.nodes["node-1"].status == "succeeded"
+        assert record.nodes["node-1"].result == {"value": 1}
+        assert record.nodes["node-3"].status == "queued"
+        assert not record.nodes["node-3"].pending_ack
+
+        redispatch = await recovered.collect_ready_nodes("run-journal")
+        assert sorted(req.node_id for req in redispatch) == ["node-2", "node-3"]
+    finally:
+        await recovered.close()
+
+
+@pytest.mark.asyncio
+async def test_finished_runs_are_compacted(session_factory):
+    registry = RunStateService(journal=SqlRunJournal(session_factory=session_factory))
+    request = StartRunRequest(workflow=_chain_workflow(), client_id="client")
+    await registry.create_run(run_id="run-journal", request=request, tenant="t")
+    await registry.cancel_run("run-journal")
+    await registry.journal.flush()
+
+    with session_factory() as session:
+        count = session.execute(select(func.count()).select_from(RunJournalRecord)).scalar_one()
+    assert count == 0
+
+    recovered = RunStateService(journal=SqlRunJournal(session_factory=session_factory))
+    assert await recovered.recover() == []
+    assert await recovered.get("run-journal") is None
+    await recovered.close()
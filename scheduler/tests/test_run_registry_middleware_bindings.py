@@ -1,8 +1,12 @@
+from datetime import timedelta
+
 import pytest
 
 from scheduler_api.core.biz.domain.graph import build_edge_bindings_for_workflow
 from scheduler_api.core.biz.domain.middleware import extract_middleware_entries
 from scheduler_api.core.biz.domain.models import EdgeBinding, WorkflowScopeIndex
+from scheduler_api.core.biz.services.frame_archive import FrameArchive
+from scheduler_api.core.biz.services.run_archive import RunArchive
 from scheduler_api.core.biz.services.run_state_service import RunStateService
 from scheduler_api.models.start_run_request import StartRunRequest
 from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
@@ -499,7 +503,7 @@ async def test_next_request_recovers_stale_running_target():
     )
 
     # Simulate a stale host state where it is marked running without an active worker.
-    async with registry._lock:  # noqa: SLF001
+    async with registry._lock_for("run-stale"):  # noqa: SLF001
         host_state = registry._runs["run-stale"].nodes["host-single"]  # noqa: SLF001
         host_state.status = "running"
         host_state.worker_name = None
@@ -544,7 +548,7 @@ async def test_next_request_fails_when_target_not_ready():
     )
 
     # Simulate target host still marked running and enqueued so it is not ready.
-    async with registry._lock:  # noqa: SLF001
+    async with registry._lock_for("run-fail"):  # noqa: SLF001
         host_state = registry._runs["run-fail"].nodes["host-single"]  # noqa: SLF001
         host_state.status = "running"
         host_state.enqueued = True
@@ -571,3 +575,190 @@ async def test_next_request_fails_when_target_not_ready():
     assert snapshot.status == "running"
     assert snapshot.nodes["host-single"].status == "running"
 
+
+
+@pytest.mark.asyncio
+async def test_middleware_chain_index_built_with_graph():
+    registry = RunStateService()
+    request = StartRunRequest(workflow=_build_two_middleware_workflow(), client_id="client")
+    await registry.create_run(run_id="run-index", request=request, tenant="t")
+
+    record = registry._runs["run-index"]  # noqa: SLF001
+    assert record.middleware_chains == {
+        "mw-1": ("host", ("mw-1", "mw-2"), 0),
+        "mw-2": ("host", ("mw-1", "mw-2"), 1),
+    }
+    ready = await registry.collect_ready_nodes("run-index")
+    assert ready[0].host_node_id == "host"
+    assert ready[0].middleware_chain == ["mw-1", "mw-2"]
+    assert ready[0].chain_index == 0
+
+
+def test_frame_activations_clone_cached_template(monkeypatch):
+    from scheduler_api.core.biz.domain import frames as frame_helpers
+    from scheduler_api.core.biz.engine import initialise
+
+    request = StartRunRequest(workflow=_build_container_with_middleware_workflow(), client_id="client")
+    record = initialise.build_run_record(run_id="run-loop", request=request, tenant="t")
+    (frame,) = record.frames.values()
+
+    builds = []
+    build_frame_runtime = frame_helpers.build_frame_runtime
+
+    def _counting_build(run_id, definition):
+        builds.append(definition.frame_id)
+        return build_frame_runtime(run_id, definition)
+
+    monkeypatch.setattr(frame_helpers, "build_frame_runtime", _counting_build)
+
+    previous = None
+    for _ in range(25):
+        frame_state = frame_helpers.activate_frame(record, frame)
+        expected = build_frame_runtime(record.run_id, frame)
+        assert frame_state.nodes == expected.nodes
+        assert list(frame_state.task_index) == list(expected.task_index)
+        assert record.frame_tasks == {task_id: frame.frame_id for task_id in expected.task_index}
+        if previous is not None:
+            inner = frame_state.nodes[SUBGRAPH_INNER_NODE_ID]
+            assert inner is not previous.nodes[SUBGRAPH_INNER_NODE_ID]
+            assert inner.parameters is not previous.nodes[SUBGRAPH_INNER_NODE_ID].parameters
+        frame_state.nodes[SUBGRAPH_INNER_NODE_ID].status = "succeeded"
+        frame_helpers.pop_frame(record, frame.frame_id)
+        previous = frame_state
+
+    # The subgraph is parsed on the first activation only.
+    assert builds == [frame.frame_id]
+
+
+class _RecordingArchive(FrameArchive):
+    enabled = True
+
+    def __init__(self):
+        self.entries = {}
+
+    def append(self, run_id, frame_id, iteration, payload):
+        self.entries[(run_id, frame_id, iteration)] = payload
+
+    async def fetch(self, run_id, frame_id, iteration):
+        return self.entries.get((run_id, frame_id, iteration))
+
+
+@pytest.mark.asyncio
+async def test_loop_frame_history_is_bounded_and_spilled():
+    archive = _RecordingArchive()
+    registry = RunStateService(frame_history_size=2, frame_archive=archive)
+    request = StartRunRequest(workflow=_build_container_with_middleware_workflow(), client_id="client")
+    await registry.create_run(run_id="run-loop", request=request, tenant="t")
+    await registry.collect_ready_nodes("run-loop")
+
+    for iteration in range(1, 5):
+        next_req = ExecMiddlewareNextRequest(
+            requestId=f"req-{iteration}",
+            runId="run-loop",
+            nodeId="container",
+            middlewareId="mw-c",
+            chainIndex=0,
+        )
+        frame_ready, error = await registry.handle_next_request(
+            next_req,
+            worker_name="worker-1",
+            worker_instance_id="worker-1",
+        )
+        assert error is None
+        payload = ExecResultPayload(
+            run_id="run-loop",
+            task_id=frame_ready[0].task_id,
+            status=ExecStatus.SUCCEEDED,
+            result={"iteration": iteration},
+            metadata=None,
+            artifacts=None,
+            duration_ms=None,
+            error=None,
+        )
+        await registry.record_result("run-loop", payload)
+
+    record = registry._runs["run-loop"]  # noqa: SLF001
+    (frame_id,) = record.frame_history
+    summary = await registry.get_frame_history("run-loop", frame_id)
+    assert summary["iterations"] == 4
+    assert summary["foldedIterations"] == 2
+    assert summary["statusCounts"] == {"succeeded": 4}
+    assert [item["iteration"] for item in summary["recent"]] == [3, 4]
+    assert sorted(key[2] for key in archive.entries) == [1, 2]
+
+    folded = await registry.get_frame_iteration("run-loop", frame_id, 1)
+    assert folded["nodes"][0]["nodeId"] == SUBGRAPH_INNER_NODE_ID
+    latest = await registry.get_frame_iteration("run-loop", frame_id, 4)
+    assert latest["iteration"] == 4
+    assert await registry.get_frame_iteration("run-loop", frame_id, 5) is None
+
+
+class _MemoryRunArchive(RunArchive):
+    enabled = True
+
+    def __init__(self):
+        self.runs = {}
+
+    def append(self, run):
+        self.runs[run.run_id] = run
+
+    async def fetch(self, run_id):
+        return self.runs.get(run_id)
+
+
+@pytest.mark.asyncio
+async def test_frame_history_is_served_after_run_eviction():
+    frames = _RecordingArchive()
+    registry = RunStateService(
+        frame_history_size=2,
+        frame_archive=frames,
+        run_archive=_MemoryRunArchive(),
+        run_retention_seconds=60,
+    )
+    request = StartRunRequest(workflow=_build_container_with_middleware_workflow(), client_id="client")
+    await registry.create_run(run_id="run-loop", request=request, tenant="t")
+    (middleware,) = await registry.collect_ready_nodes("run-loop")
+
+    for iteration in range(1, 4):
+        next_req = ExecMiddlewareNextRequest(
+            requestId=f"req-{iteration}",
+            runId="run-loop",
+            nodeId="container",
+            middlewareId="mw-c",
+            chainIndex=0,
+        )
+        frame_ready, error = await registry.handle_next_request(
+            next_req,
+            worker_name="worker-1",
+            worker_instance_id="worker-1",
+        )
+        assert error is None
+        await registry.record_result(
+            "run-loop",
+            ExecResultPayload(
+                run_id="run-loop",
+                task_id=frame_ready[0].task_id,
+                status=ExecStatus.SUCCEEDED,
+                result={"iteration": iteration},
+            ),
+        )
+    (frame_id,) = registry._runs["run-loop"].frame_history  # noqa: SLF001
+    await registry.record_result(
+        "run-loop",
+        ExecResultPayload(run_id="run-loop", task_id=middleware.task_id, status=ExecStatus.SUCCEEDED, result={}),
+    )
+    later = registry._now() + timedelta(seconds=61)  # noqa: SLF001
+    registry._now = lambda: later  # noqa: SLF001
+    await registry.create_run(run_id="run-next", request=request, tenant="t")
+
+    assert "run-loop" not in registry._runs  # noqa: SLF001
+    summary = await registry.get_frame_history("run-loop", frame_id)
+    assert summary["iterations"] == 3
+    assert [item["iteration"] for item in summary["recent"]] == [2, 3]
+    # Folded and recent iterations alike are read back from the frame archive.
+    assert sorted(key[2] for key in frames.entries) == [1, 2, 3]
+    folded = await registry.get_frame_iteration("run-loop", frame_id, 1)
+    assert folded["nodes"][0]["nodeId"] == SUBGRAPH_INNER_NODE_ID
+    latest = await registry.get_frame_iteration("run-loop", frame_id, 3)
+    assert latest["iteration"] == 3
+    assert await registry.get_frame_iteration("run-loop", frame_id, 4) is None
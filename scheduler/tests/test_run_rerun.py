@@ -0,0 +1,107 @@
+import pytest
+
+from scheduler_api.core.biz.services.run_state_service import RunStateService
+from scheduler_api.models.start_run_request import StartRunRequest
+from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
+from shared.models.biz.exec.result import ExecResultPayload
+
+
+def _node(node_id: str, parameters: dict, ui: dict) -> dict:
+    return {
+        "id": node_id,
+        "type": "example.pkg.task",
+        "package": {"name": "example.pkg", "version": "1.0.0"},
+        "status": "published",
+        "category": "test",
+        "label": node_id,
+        "position": {"x": 0, "y": 0},
+        "parameters": parameters,
+        "ui": ui,
+    }
+
+
+_OUT = {"outputPorts": [{"key": "value", "label": "Value", "binding": {"path": "/results/value", "mode": "read"}}]}
+_IN = {"inputPorts": [{"key": "value", "label": "Value", "binding": {"path": "/parameters/value", "mode": "write"}}]}
+
+
+def _request(*, b_factor: int, label: str = "a") -> StartRunRequest:
+    # a -> b -> c, plus d -> c
+    nodes = [
+        _node("a", {"seed": 1}, _OUT),
+        _node("b", {"factor": b_factor}, {**_IN, **_OUT}),
+        _node("c", {}, _IN),
+        _node("d", {"seed": 2}, {}),
+    ]
+    nodes[0]["label"] = label
+    edges = [
+        {"id": "a-b", "source": {"node": "a", "port": "value"}, "target": {"node": "b", "port": "value"}},
+        {"id": "b-c", "source": {"node": "b", "port": "value"}, "target": {"node": "c", "port": "value"}},
+        {"id": "d-c", "source": {"node": "d", "port": "value"}, "target": {"node": "c", "port": "value"}},
+    ]
+    workflow = StartRunRequestWorkflow.from_dict(
+        {
+            "id": "wf-rerun",
+            "schemaVersion": "2025-10",
+            "metadata": {"name": "rerun", "namespace": "default"},
+            "nodes": nodes,
+            "edges": edges,
+        }
+    )
+    return StartRunRequest(workflow=workflow, client_id="client")
+
+
+async def _complete(registry: RunStateService, run_id: str, values: dict) -> None:
+    ready = await registry.collect_ready_nodes(run_id)
+    while ready:
+        request = ready.pop(0)
+        _, released, _ = await registry.record_result(
+            run_id,
+            ExecResultPayload(
+                run_id=run_id,
+                task_id=request.task_id,
+                status="SUCCEEDED",
+                result={"value": values[request.node_id]},
+            ),
+        )
+        ready.extend(released)
+
+
+@pytest.mark.asyncio
+async def test_rerun_dispatches_only_changed_nodes_and_descendants():
+    registry = RunStateService()
+    await registry.create_run(run_id="run-1", request=_request(b_factor=2), tenant="t")
+    await _complete(registry, "run-1", {"a": 10, "b": 20, "c": 30, "d": 40})
+
+    # Moving or relabelling a node does not invalidate it; changing b's parameters does.
+    record = await registry.rerun_run(
+        source_run_id="run-1",
+        run_id="run-2",
+        request=_request(b_factor=3, label="renamed"),
+        tenant="t",
+    )
+    assert {node_id for node_id, node in record.nodes.items() if node.status == "succeeded"} == {"a", "d"}
+    assert record.nodes["a"].metadata["reusedFrom"] == "run-1"
+    assert record.status == "running"
+
+    (b_request,) = await registry.collect_ready_nodes("run-2")
+    assert b_request.node_id == "b"
+    assert b_request.parameters["value"] == 10
+    _, released, _ = await registry.record_result(
+        "run-2",
+        ExecResultPayload(run_id="run-2", task_id=b_request.task_id, status="SUCCEEDED", result={"value": 21}),
+    )
+    (c_request,) = released
+    assert c_request.node_id == "c"
+
+    # Nothing changed: the rerun completes without dispatching anything.
+    unchanged = await registry.rerun_run(
+        source_run_id="run-1",
+        run_id="run-3",
+        request=_request(b_factor=2),
+        tenant="t",
+    )
+    assert unchanged.status == "succeeded"
+    assert unchanged.nodes["c"].result == {"value": 30}
+    assert await registry.collect_ready_nodes("run-3") == []
+
+    assert await registry.rerun_run(source_run_id="missing", run_id="run-4", request=_request(b_factor=2), tenant="t") is None
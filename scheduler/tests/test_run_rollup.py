@@ -0,0 +1,110 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from scheduler_api.core.biz.domain.models import FINAL_STATUSES, NodeState, RunRecord
+from scheduler_api.models.list_runs200_response_items_inner_error import ListRuns200ResponseItemsInnerError
+from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
+
+_STATUSES = ("queued", "running", "succeeded", "failed", "cancelled", "skipped")
+_BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _record(nodes) -> RunRecord:
+    workflow = StartRunRequestWorkflow.from_dict(
+        {
+            "id": "wf-rollup",
+            "schemaVersion": "2025-10",
+            "metadata": {"name": "rollup"},
+            "nodes": [
+                {
+                    "id": "n0",
+                    "type": "example.pkg.noop",
+                    "package": {"name": "example.pkg", "version": "1.0.0"},
+                    "status": "published",
+                    "category": "test",
+                    "label": "Node",
+                    "position": {"x": 0, "y": 0},
+                }
+            ],
+            "edges": [],
+        }
+    )
+    return RunRecord(
+        run_id="run-rollup",
+        definition_hash="hash",
+        client_id="client",
+        workflow=workflow,
+        tenant="tenant",
+        nodes=nodes,
+    )
+
+
+def _reference_rollup(nodes, expected) -> None:
+    """The full-scan rollup the incremental counters replace."""
+
+    statuses = {node.status for node in nodes.values()}
+    if "failed" in statuses:
+        status = "failed"
+    elif statuses.issubset({"queued"}):
+        status = "queued"
+    elif statuses.issubset({"succeeded"}):
+        status = "succeeded"
+    elif statuses.issubset(FINAL_STATUSES):
+        status = "cancelled" if statuses == {"cancelled"} else "succeeded"
+    else:
+        status = "running"
+    expected["status"] = status
+    started = [node.started_at for node in nodes.values() if node.started_at]
+    if started:
+        expected["started_at"] = min(started)
+    expected["finished"] = all(node.status in FINAL_STATUSES for node in nodes.values()) or status == "failed"
+    expected["artifacts"] = [artifact for node in nodes.values() for artifact in (node.artifacts or [])]
+    if status == "failed":
+        expected["error"] = next((node.error for node in nodes.values() if node.error), None)
+    elif status == "succeeded":
+        expected["error"] = None
+
+
+def _mutate(rng: random.Random, node: NodeState, counter) -> None:
+    field = rng.choice(("status", "started_at", "artifacts", "artifacts_in_place", "error"))
+    if field == "status":
+        node.status = rng.choice(_STATUSES)
+    elif field == "started_at":
+        node.started_at = None if rng.random() < 0.3 else _BASE + timedelta(seconds=rng.randint(0, 20))
+    elif field == "artifacts":
+        node.artifacts = [{"name": f"a{next(counter)}"} for _ in range(rng.randint(0, 2))]
+    elif field == "artifacts_in_place":
+        node.artifacts.append({"name": f"a{next(counter)}"})
+        node.artifacts = node.artifacts
+    elif rng.random() < 0.4:
+        node.error = None
+    else:
+        node.error = ListRuns200ResponseItemsInnerError(code=f"E{next(counter)}", message="boom")
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_incremental_rollup_matches_full_scan(seed):
+    rng = random.Random(seed)
+    counter = iter(range(1_000_000))
+    nodes = {f"n{index}": NodeState(node_id=f"n{index}", task_id=f"n{index}") for index in range(rng.randint(1, 8))}
+    record = _record(nodes)
+    expected = {"status": record.status, "started_at": None, "finished": False, "artifacts": [], "error": None}
+
+    for step in range(60):
+        if rng.random() < 0.1:
+            node_id = f"late{step}"
+            nodes_before = dict(record.nodes)
+            record.get_node(node_id)
+            assert list(record.nodes) == [*nodes_before, node_id]
+        for _ in range(rng.randint(1, 3)):
+            _mutate(rng, rng.choice(list(record.nodes.values())), counter)
+        record.refresh_rollup()
+        _reference_rollup(record.nodes, expected)
+
+        assert record.status == expected["status"]
+        assert record.started_at == expected["started_at"]
+        assert (record.finished_at is not None) == expected["finished"]
+        assert record.artifacts == expected["artifacts"]
+        assert record.error is expected["error"]
@@ -0,0 +1,240 @@
+import asyncio
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from scheduler_api.core.biz.domain.models import NodeState, RunRecord
+from scheduler_api.core.biz.engine import lookup
+from scheduler_api.core.biz.services.run_state_service import RunStateService
+from scheduler_api.models.start_run_request import StartRunRequest
+from scheduler_api.models.start_run_request_workflow import StartRunRequestWorkflow
+
+
+def _workflow(workflow_id: str = "wf-state") -> StartRunRequestWorkflow:
+    return StartRunRequestWorkflow.from_dict(
+        {
+            "id": workflow_id,
+            "schemaVersion": "2025-10",
+            "metadata": {"name": "run-state", "namespace": "default"},
+            "nodes": [
+                {
+                    "id": "node-1",
+                    "type": "example.pkg.source",
+                    "package": {"name": "example.pkg", "version": "1.0.0"},
+                    "status": "published",
+                    "category": "test",
+                    "label": "Source",
+                    "position": {"x": 0, "y": 0},
+                }
+            ],
+            "edges": [],
+        }
+    )
+
+
+async def _create(registry: RunStateService, run_id: str, client_id: str = "client") -> None:
+    request = StartRunRequest(workflow=_workflow(), client_id=client_id)
+    await registry.create_run(run_id=run_id, request=request, tenant="t")
+
+
+@pytest.mark.asyncio
+async def test_busy_run_does_not_block_other_runs():
+    registry = RunStateService()
+    await _create(registry, "run-busy")
+    await _create(registry, "run-free")
+
+    async with registry._lock_for("run-busy"):  # noqa: SLF001
+        ready = await asyncio.wait_for(registry.collect_ready_nodes("run-free"), timeout=1)
+        assert [req.node_id for req in ready] == ["node-1"]
+        snapshot = await asyncio.wait_for(registry.get("run-free"), timeout=1)
+        assert snapshot is not None
+        runs = await asyncio.wait_for(registry.snapshot(), timeout=1)
+        assert {run.run_id for run in runs} == {"run-busy", "run-free"}
+
+
+@pytest.mark.asyncio
+async def test_index_version_and_list_pagination():
+    registry = RunStateService()
+    assert registry.index_version == 0
+    for idx in range(5):
+        await _create(registry, f"run-{idx}", client_id="even" if idx % 2 == 0 else "odd")
+    assert registry.index_version == 5
+
+    page = await registry.to_list_response(limit=2, cursor=None, status=None, client_id=None)
+    assert [item.run_id for item in page.items] == ["run-0", "run-1"]
+    assert page.next_cursor == "run-1"
+
+    page = await registry.to_list_response(limit=2, cursor=page.next_cursor, status=None, client_id=None)
+    assert [item.run_id for item in page.items] == ["run-2", "run-3"]
+
+    filtered = await registry.to_list_response(limit=10, cursor=None, status=None, client_id="even")
+    assert [item.run_id for item in filtered.items] == ["run-0", "run-2", "run-4"]
+    assert filtered.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_list_index_follows_status_transitions():
+    registry = RunStateService()
+    for idx in range(4):
+        await _create(registry, f"run-{idx}", client_id="even" if idx % 2 == 0 else "odd")
+    await registry.cancel_run("run-1")
+    await registry.cancel_run("run-2")
+
+    cancelled = await registry.to_list_response(limit=10, cursor=None, status="cancelled", client_id=None)
+    assert [item.run_id for item in cancelled.items] == ["run-1", "run-2"]
+    queued_even = await registry.to_list_response(limit=10, cursor=None, status="queued", client_id="even")
+    assert [item.run_id for item in queued_even.items] == ["run-0"]
+
+    page = await registry.to_list_response(limit=1, cursor="run-0", status="queued", client_id=None)
+    assert [item.run_id for item in page.items] == ["run-3"]
+    assert page.next_cursor is None
+    # Snapshots are detached from the index, only the live record reports changes.
+    assert (await registry.get("run-3"))._list_index is None  # noqa: SLF001
+
+
+def test_snapshot_shares_unchanged_nodes():
+    record = RunRecord(
+        run_id="run-snap",
+        definition_hash="hash",
+        client_id="client",
+        workflow=_workflow(),
+        tenant="t",
+    )
+    record.nodes["a"] = NodeState(node_id="a", task_id="task-a", result={"value": 1})
+    record.nodes["b"] = NodeState(node_id="b", task_id="task-b")
+
+    first = record.snapshot()
+    record.nodes["a"].status = "running"
+    record.nodes["b"].result = {"value": 2}
+    record.nodes["b"].result["value"] = 3
+    record.nodes["b"].touch()
+    second = record.snapshot()
+
+    assert second.workflow is record.workflow
+    assert second.nodes["a"] is not first.nodes["a"]
+    assert second.nodes["a"].status == "running"
+    assert first.nodes["a"].status == "queued"
+    assert second.nodes["b"].result == {"value": 3}
+    assert record.snapshot().nodes["a"] is second.nodes["a"]
+
+    with pytest.raises(FrozenInstanceError):
+        second.nodes["a"].status = "failed"
+    with pytest.raises(FrozenInstanceError):
+        second.status = "failed"
+
+
+@pytest.mark.asyncio
+async def test_record_version_advances_per_transition():
+    registry = RunStateService()
+    await _create(registry, "run-version")
+    created = await registry.get("run-version")
+    assert created is not None
+
+    ready = await registry.collect_ready_nodes("run-version")
+    dispatched = await registry.mark_dispatched(
+        "run-version",
+        worker_name="worker-1",
+        task_id=ready[0].task_id,
+        node_id=ready[0].node_id,
+        node_type=ready[0].node_type,
+        package_name=ready[0].package_name,
+        package_version=ready[0].package_version,
+        seq_used=ready[0].seq,
+    )
+    assert dispatched is not None
+    assert dispatched.version > created.version
+    assert created.nodes["node-1"].status == "queued"
+    assert dispatched.nodes["node-1"].status == "running"
+
+
+@pytest.mark.asyncio
+async def test_task_and_dispatch_indexes_follow_dispatches():
+    registry = RunStateService()
+    for run_id in ("run-a", "run-b"):
+        await _create(registry, run_id)
+
+    async def dispatch(run_id: str, dispatch_id: str) -> None:
+        ready = await registry.collect_ready_nodes(run_id)
+        await registry.mark_dispatched(
+            run_id,
+            worker_name="worker-1",
+            task_id=ready[0].task_id,
+            node_id=ready[0].node_id,
+            node_type=ready[0].node_type,
+            package_name=ready[0].package_name,
+            package_version=ready[0].package_version,
+            seq_used=ready[0].seq,
+            dispatch_id=dispatch_id,
+        )
+
+    await dispatch("run-a", "d-a")
+    await dispatch("run-b", "d-b")
+    record = registry._runs["run-b"]  # noqa: SLF001
+    assert record.dispatch_index == {"d-b": (None, "node-1")}
+    # Both runs share the task id; the latest dispatch owns the run-less lookup.
+    assert (await registry.get_by_task("node-1")).run_id == "run-b"
+
+    acked = await registry.mark_acknowledged("run-b", node_id="node-1", dispatch_id="d-b")
+    assert acked is not None and not acked.nodes["node-1"].pending_ack
+    assert lookup.find_node_by_dispatch(record, "d-a") == (None, None)
+
+    reset = await registry.reset_after_worker_cancel(None, node_id=None, task_id="node-1")
+    assert reset.run_id == "run-b"
+    assert reset.nodes["node-1"].status == "queued"
+    assert record.dispatch_index == {}
+
+
+@pytest.mark.asyncio
+async def test_collect_rechecks_only_ready_candidates():
+    registry = RunStateService()
+    await _create(registry, "run-ready")
+    record = registry._runs["run-ready"]  # noqa: SLF001
+
+    ready = await registry.collect_ready_nodes()
+    assert [request.node_id for request in ready] == ["node-1"]
+    await registry.mark_dispatched(
+        "run-ready",
+        worker_name="worker-1",
+        task_id=ready[0].task_id,
+        node_id=ready[0].node_id,
+        node_type=ready[0].node_type,
+        package_name=ready[0].package_name,
+        package_version=ready[0].package_version,
+        seq_used=ready[0].seq,
+    )
+    assert await registry.collect_ready_nodes() == []
+    # Nothing changed since the last pass, so the idle run is skipped entirely.
+    version = record.version
+    assert len(record.ready) == 0
+    assert await registry.collect_ready_nodes() == []
+    assert record.version == version
+
+    await registry.reset_after_worker_cancel("run-ready", node_id="node-1", task_id=None)
+    assert len(record.ready) == 1
+    assert [request.node_id for request in await registry.collect_ready_nodes()] == ["node-1"]
+
+
+@pytest.mark.asyncio
+async def test_runs_of_one_definition_share_compiled_plan():
+    registry = RunStateService(plan_cache_size=1)
+    for run_id in ("run-p1", "run-p2"):
+        await _create(registry, run_id)
+    first = registry._runs["run-p1"]  # noqa: SLF001
+    second = registry._runs["run-p2"]  # noqa: SLF001
+
+    assert registry._plans.hits == 1 and registry._plans.misses == 1  # noqa: SLF001
+    assert first.definition_hash == second.definition_hash
+    assert first.scope_index is second.scope_index
+    assert first.edge_bindings is second.edge_bindings
+    # Node state stays per run.
+    assert first.nodes["node-1"] is not second.nodes["node-1"]
+    assert first.nodes["node-1"].parameters is not second.nodes["node-1"].parameters
+    assert second.nodes["node-1"].concurrency_key == "run-p2:node-1"
+
+    await registry.collect_ready_nodes("run-p1")
+    assert first.nodes["node-1"].enqueued
+    assert not second.nodes["node-1"].enqueued
+
+    request = StartRunRequest(workflow=_workflow("wf-other"), client_id="client")
+    await registry.create_run(run_id="run-p3", request=request, tenant="tenant")
+    assert len(registry._plans) == 1  # noqa: SLF001
@@ -125,3 +125,46 @@ def test_get_run_definition(client: TestClient):
     # uncomment below to assert the status code of the HTTP response
     #assert response.status_code == 200
 
+
+
+def test_get_run_frames(client: TestClient):
+    """Test case for get_run_frames
+
+    Completed iterations of a container frame
+    """
+    params = [("frameId", 'frame_id_example'),     ("iteration", 56)]
+    headers = {
+        "Authorization": "Bearer special-key",
+    }
+    # uncomment below to make a request
+    #response = client.request(
+    #    "GET",
+    #    "/api/v1/runs/{runId}/frames".format(runId='run_id_example'),
+    #    headers=headers,
+    #    params=params,
+    #)
+
+    # uncomment below to assert the status code of the HTTP response
+    #assert response.status_code == 200
+
+
+def test_rerun_run(client: TestClient):
+    """Test case for rerun_run
+
+    Start a run that reuses unchanged results of a previous run
+    """
+    run_start_request = {"clientId":"clientId","workflow":{"id":"wf-1","schemaVersion":"2025-10","metadata":{"name":"workflow","namespace":"default"},"nodes":[],"edges":[]}}
+
+    headers = {
+        "Authorization": "Bearer special-key",
+    }
+    # uncomment below to make a request
+    #response = client.request(
+    #    "POST",
+    #    "/api/v1/runs/{runId}/rerun".format(runId='run_id_example'),
+    #    headers=headers,
+    #    json=run_start_request,
+    #)
+
+    # uncomment below to assert the status code of the HTTP response
+    #assert response.status_code == 202
@@ -0,0 +1,112 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from scheduler_api.config.settings import get_settings
+from scheduler_api.core.network.manager import WorkerControlManager
+from scheduler_api.core.network.session import ControlPlaneSession
+from shared.models.session import Ack, Role, Sender, WsEnvelope
+from shared.protocol.window import ReceiveWindow
+
+
+class _Transport:
+    def __init__(self) -> None:
+        self.sent = []
+
+    async def send(self, envelope) -> None:
+        self.sent.append(envelope)
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        return None
+
+
+def _result_frame(session_seq: int) -> WsEnvelope:
+    return WsEnvelope(
+        type="biz.exec.result",
+        id=f"result-{session_seq}",
+        ts=datetime.now(timezone.utc),
+        session_seq=session_seq,
+        tenant="t",
+        sender=Sender(role=Role.worker, id="w1-id"),
+        ack=Ack(request=True),
+        payload={},
+    )
+
+
+@pytest.mark.asyncio
+async def test_sequenced_frames_share_one_cumulative_ack():
+    manager = WorkerControlManager()
+    transport = _Transport()
+    session = manager.upsert_session(
+        worker_name="w1",
+        worker_instance_id="w1-id",
+        tenant="t",
+        version="1",
+        hostname="host",
+        transport=transport,
+    )
+    session.recv_window = ReceiveWindow(size=64)
+    handler = ControlPlaneSession(
+        transport=transport,
+        manager=manager,
+        settings=get_settings().model_copy(update={"session_ack_interval_ms": 20}),
+    )
+    handler._session = session  # noqa: SLF001
+
+    ready = []
+    for session_seq in (1, 2, 4, 3, 5):
+        ready.extend(await handler.handle_envelope(_result_frame(session_seq)))
+    assert [envelope.session_seq for envelope in ready] == [1, 2, 3, 4, 5]
+    assert transport.sent == []
+
+    await asyncio.sleep(0.05)
+    (ack,) = transport.sent
+    assert ack.type == "control.ack" and ack.ack is None
+    assert ack.payload["ack_seq"] == 5 and ack.payload["ack_bitmap"] == 0
+
+    await handler.handle_envelope(_result_frame(6))
+    await handler.close()
+    await asyncio.sleep(0.05)
+    assert len(transport.sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_frame_recorded_during_ack_send_is_acked():
+    manager = WorkerControlManager()
+    release = asyncio.Event()
+
+    class _SlowTransport(_Transport):
+        async def send(self, envelope) -> None:
+            if not self.sent:
+                await release.wait()
+            self.sent.append(envelope)
+
+    transport = _SlowTransport()
+    session = manager.upsert_session(
+        worker_name="w1",
+        worker_instance_id="w1-id",
+        tenant="t",
+        version="1",
+        hostname="host",
+        transport=transport,
+    )
+    session.recv_window = ReceiveWindow(size=64)
+    handler = ControlPlaneSession(
+        transport=transport,
+        manager=manager,
+        settings=get_settings().model_copy(update={"session_ack_interval_ms": 10}),
+    )
+    handler._session = session  # noqa: SLF001
+
+    await handler.handle_envelope(_result_frame(1))
+    await asyncio.sleep(0.03)
+    # The first ack (covering seq 1) is blocked in the transport when seq 2 arrives.
+    await handler.handle_envelope(_result_frame(2))
+    release.set()
+    await asyncio.sleep(0.05)
+
+    first, second = transport.sent
+    assert first.payload["ack_seq"] == 1
+    assert second.payload["ack_seq"] == 2
+    await handler.close()
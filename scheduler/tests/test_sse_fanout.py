@@ -0,0 +1,182 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from scheduler_api.sse import ConnectionRegistry, EventStore, SseConnection
+from scheduler_api.sse.mappers import (
+    node_result_delta_envelope,
+    run_snapshot_envelope,
+    run_state_envelope,
+    worker_heartbeat_envelope,
+)
+from scheduler_api.sse.models import encode_frame
+from scheduler_api.sse.publisher import EventPublisher
+
+
+def _decode(frame: bytes) -> dict:
+    data_line = next(line for line in frame.decode().splitlines() if line.startswith("data: "))
+    return json.loads(data_line[len("data: ") :])
+
+
+async def _next_frame(stream) -> bytes:
+    return await asyncio.wait_for(stream.__anext__(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_publish_serializes_once_and_shares_bytes():
+    registry = ConnectionRegistry()
+    store = EventStore(max_events_per_tenant=10)
+    publisher = EventPublisher(registry, store)
+    connections = [SseConnection(tenant="t", client_session_id="c") for _ in range(3)]
+    for connection in connections:
+        await registry.add(connection)
+    streams = [connection.iter_stream([]) for connection in connections]
+
+    await publisher.publish(
+        run_state_envelope(tenant="t", client_session_id="c", run_id="run-1", status="running")
+    )
+
+    frames = [await _next_frame(stream) for stream in streams]
+    assert all(frame is frames[0] for frame in frames)
+    payload = _decode(frames[0])
+    assert payload["id"] == "1"
+    assert payload["data"]["status"] == "running"
+    assert "replayed" not in payload
+
+    replay = list(store.replay("t", None))
+    assert replay[0].data is frames[0]
+    late = SseConnection(tenant="t", client_session_id="c")
+    replayed = await _next_frame(late.iter_stream(replay))
+    assert _decode(replayed) == {**payload, "replayed": True}
+
+    for connection in connections:
+        await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_replay_resumes_after_last_event_id():
+    store = EventStore(max_events_per_tenant=2)
+    publisher = EventPublisher(ConnectionRegistry(), store)
+    for status in ("queued", "running", "succeeded"):
+        await publisher.publish(
+            run_state_envelope(tenant="t", client_session_id="c", run_id="run-1", status=status)
+        )
+
+    assert [frame.id for frame in store.replay("t", None)] == ["2", "3"]
+    assert [frame.id for frame in store.replay("t", "2")] == ["3"]
+    assert [frame.id for frame in store.replay("t", "unknown")] == ["2", "3"]
+
+
+def _frames(statuses, *, run_id="run-1"):
+    return [
+        encode_frame(
+            run_state_envelope(tenant="t", client_session_id="c", run_id=run_id, status=status),
+            event_id=str(index),
+        )
+        for index, status in enumerate(statuses, start=1)
+    ]
+
+
+def _delta(event_id: str, run_id: str = "run-1"):
+    return encode_frame(
+        node_result_delta_envelope(
+            tenant="t",
+            client_session_id="c",
+            run_id=run_id,
+            node_id="n",
+            revision=1,
+            sequence=int(event_id),
+            operation="append",
+            path="/channels/log",
+            payload={"text": event_id},
+            chunk_meta=None,
+        ),
+        event_id=event_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_overflow_drops_backlog_for_fresh_snapshot():
+    requested = []
+
+    async def resync(run_id):
+        requested.append(run_id)
+        return run_snapshot_envelope(tenant="t", client_session_id="c", run={"runId": run_id, "status": "running"})
+
+    connection = SseConnection(tenant="t", client_session_id="c", max_queue=2, resync=resync)
+    assert all(connection.offer(frame) for frame in [_delta("1"), _delta("2", run_id="run-2")])
+    assert connection.offer(_delta("3")) is False
+    assert connection.offer(_delta("4")) is True
+
+    stream = connection.iter_stream([])
+    delivered = [_decode(await _next_frame(stream)) for _ in range(3)]
+    # One snapshot per affected run, in the order of their newest dropped event.
+    assert requested == ["run-2", "run-1"]
+    assert [(event["type"], event["id"]) for event in delivered] == [
+        ("run.snapshot", "2"),
+        ("run.snapshot", "3"),
+        ("node.result.delta", "4"),
+    ]
+    metrics = connection.metrics()
+    assert metrics["dropped"] == 3
+    assert metrics["resyncs"] == 2
+    assert metrics["queueDepth"] == 0
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_overflow_disconnects_when_no_snapshot_can_replace_the_backlog():
+    async def resync(run_id):
+        return None
+
+    connection = SseConnection(tenant="t", client_session_id="c", max_queue=1, resync=resync)
+    assert connection.offer(_delta("1"))
+    assert connection.offer(_delta("2")) is False
+    stream = connection.iter_stream([])
+    with pytest.raises(StopAsyncIteration):
+        await _next_frame(stream)
+    assert connection.closed and connection.close_reason == "overflow"
+
+    # A dropped frame outside any run cannot be resynchronised either.
+    connection = SseConnection(tenant="t", client_session_id="c", max_queue=1, resync=resync)
+    heartbeat = worker_heartbeat_envelope(tenant="t", worker_name="w1", at=datetime.now(timezone.utc))
+    assert connection.offer(encode_frame(heartbeat, event_id="1"))
+    assert connection.offer(_delta("2")) is False
+    assert connection.closed and connection.close_reason == "overflow"
+    assert connection.metrics()["dropped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_overflow_coalesces_superseded_state_then_disconnects():
+    connection = SseConnection(tenant="t", client_session_id="c", max_queue=3, overflow_policy="coalesce")
+    for frame in _frames(["queued", "running", "running"]):
+        assert connection.offer(frame)
+    assert connection.offer(_delta("4"))
+    assert connection.depth == 2
+    assert connection.offer(_delta("5"))
+    assert connection.offer(_delta("6")) is False
+    assert connection.closed
+    assert connection.close_reason == "overflow"
+
+    stream = connection.iter_stream([])
+    with pytest.raises(StopAsyncIteration):
+        await _next_frame(stream)
+
+
+@pytest.mark.asyncio
+async def test_registry_reports_connection_metrics():
+    registry = ConnectionRegistry()
+    publisher = EventPublisher(registry, EventStore())
+    slow = SseConnection(tenant="t", client_session_id="c", max_queue=1, overflow_policy="disconnect")
+    await registry.add(slow)
+    for status in ("queued", "running"):
+        await publisher.publish(
+            run_state_envelope(tenant="t", client_session_id="c", run_id="run-1", status=status)
+        )
+
+    metrics = registry.metrics()
+    assert metrics["connections"] == 1
+    assert metrics["dropped"] == 2
+    assert metrics["items"][0]["closeReason"] == "overflow"
@@ -0,0 +1,96 @@
+import pytest
+
+from scheduler_api.core.network.gateway import WorkerGateway
+from scheduler_api.core.network.manager import WorkerControlManager
+from shared.models.session import Capabilities, HeartbeatPayload
+from shared.models.session.register import Package, Status
+
+
+class _Transport:
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        return None
+
+
+def _connect(manager: WorkerControlManager, name: str, packages, *, tenant: str = "t"):
+    session = manager.upsert_session(
+        worker_name=name,
+        worker_instance_id=f"{name}-id",
+        tenant=tenant,
+        version="1",
+        hostname="host",
+        transport=_Transport(),
+    )
+    _register(manager, session, packages)
+    session.registered = True
+    return session
+
+
+def _register(manager: WorkerControlManager, session, packages) -> None:
+    manager.update_registration(
+        session.worker_instance_id,
+        session.worker_name,
+        capabilities=Capabilities.model_validate(
+            {"concurrency": {"max_parallel": 4}, "runtimes": ["python"], "features": []}
+        ),
+        payload_types=[],
+        packages=[Package(name=pkg, version=version, status=Status.installed) for pkg, version in packages],
+        manifests=[],
+        channels=[],
+    )
+
+
+def _heartbeat(manager: WorkerControlManager, session, *, inflight: int, healthy: bool = True) -> None:
+    manager.mark_heartbeat(
+        session.worker_instance_id,
+        session.worker_name,
+        heartbeat=HeartbeatPayload(healthy=healthy, metrics={"inflight": inflight}),
+    )
+
+
+@pytest.fixture
+def manager() -> WorkerControlManager:
+    return WorkerControlManager()
+
+
+def test_query_uses_package_index(manager):
+    gateway = WorkerGateway(manager)
+    w1 = _connect(manager, "w1", [("pkg", "1.0.0"), ("other", "2.0.0")])
+    _connect(manager, "w2", [("pkg", "1.0.0")])
+    _connect(manager, "w3", [("pkg", "1.0.0")], tenant="other-tenant")
+
+    names = {s.worker_name for s in gateway.query(tenant="t", package_name="pkg", package_version="1.0.0")}
+    assert names == {"w1", "w2"}
+    assert [s.worker_name for s in gateway.query(tenant="t", package_name="other", package_version="2.0.0")] == ["w1"]
+    assert gateway.query(tenant="t", package_name="pkg", package_version="9.9.9") == []
+
+    # Re-registering without the package drops the session from that bucket.
+    _register(manager, w1, [("other", "2.0.0")])
+    names = {s.worker_name for s in gateway.query(tenant="t", package_name="pkg", package_version="1.0.0")}
+    assert names == {"w2"}
+
+
+def test_select_least_loaded_tracks_heartbeats_and_disconnects(manager):
+    gateway = WorkerGateway(manager)
+    w1 = _connect(manager, "w1", [("pkg", "1.0.0")])
+    w2 = _connect(manager, "w2", [("pkg", "1.0.0")])
+    _heartbeat(manager, w1, inflight=5)
+    _heartbeat(manager, w2, inflight=1)
+
+    def best():
+        session = gateway.select_least_loaded(tenant="t", package_name="pkg", package_version="1.0.0")
+        return session.worker_name if session else None
+
+    assert best() == "w2"
+    _heartbeat(manager, w2, inflight=9)
+    assert best() == "w1"
+    _heartbeat(manager, w1, inflight=0, healthy=False)
+    assert best() == "w2"
+
+    manager.mark_disconnected(w2.worker_instance_id, w2.worker_name)
+    assert best() == "w1"
+    assert gateway.select_least_loaded(
+        tenant="t", package_name="pkg", package_version="1.0.0", worker_name="w2"
+    ) is None
+
+    manager.remove_session("w1", w1.worker_instance_id)
+    assert best() is None
@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from scheduler_api.core.biz.dispatch import orchestrator as orchestrator_module
+from scheduler_api.core.biz.dispatch.orchestrator import RunOrchestrator
+from scheduler_api.core.biz.dispatch.slots import WorkerSlots, has_free_slot, occupies_slot
+from scheduler_api.core.biz.domain.models import DispatchRequest
+from scheduler_api.core.network.gateway import WorkerGateway
+from scheduler_api.core.network.manager import WorkerControlManager
+from shared.models.session import Capabilities
+from shared.models.session.register import Package, Status
+
+
+class _Transport:
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        return None
+
+
+def _request(node_id: str, *, node_type: str = "pkg.task", **overrides) -> DispatchRequest:
+    base = dict(
+        run_id="run-1",
+        tenant="t",
+        node_id=node_id,
+        task_id=f"task-{node_id}",
+        node_type=node_type,
+        package_name="pkg",
+        package_version="1.0.0",
+        parameters={},
+        resource_refs=[],
+        affinity=None,
+        concurrency_key=node_id,
+        seq=1,
+    )
+    base.update(overrides)
+    return DispatchRequest(**base)
+
+
+def _worker(manager: WorkerControlManager, *, max_parallel: int, per_node_limits=None):
+    session = manager.upsert_session(
+        worker_name="w1",
+        worker_instance_id="w1-id",
+        tenant="t",
+        version="1",
+        hostname="host",
+        transport=_Transport(),
+    )
+    manager.update_registration(
+        "w1-id",
+        "w1",
+        capabilities=Capabilities.model_validate(
+            {
+                "concurrency": {"max_parallel": max_parallel, "per_node_limits": per_node_limits},
+                "runtimes": ["python"],
+                "features": [],
+            }
+        ),
+        payload_types=[],
+        packages=[Package(name="pkg", version="1.0.0", status=Status.installed)],
+        manifests=[],
+        channels=[],
+    )
+    session.registered = True
+    return session
+
+
+def test_slot_accounting_honours_advertised_limits():
+    session = _worker(WorkerControlManager(), max_parallel=3, per_node_limits={"pkg.browser": 1})
+    slots = WorkerSlots()
+
+    slots.reserve(session, _request("a", node_type="pkg.browser"))
+    assert not has_free_slot(session, "pkg.browser")
+    assert has_free_slot(session, "pkg.task")
+    slots.reserve(session, _request("b"))
+    slots.reserve(session, _request("c"))
+    assert not has_free_slot(session, "pkg.task")
+
+    slots.bind_dispatch("task-b", "dispatch-b")
+    assert slots.release("dispatch-b") is session
+    assert slots.release("task-b") is None
+    assert has_free_slot(session, "pkg.task")
+    assert len(slots.release_run("run-1")) == 2
+    assert session.reserved_slots == {}
+
+
+def test_middleware_next_targets_share_the_caller_slot():
+    chain = dict(host_node_id="host", middleware_chain=["mw-1", "mw-2"])
+    assert occupies_slot(_request("plain"))
+    assert occupies_slot(_request("mw-1", chain_index=0, **chain))
+    assert not occupies_slot(_request("mw-2", chain_index=1, **chain))
+    assert not occupies_slot(_request("host", **chain))
+
+
+@pytest.mark.asyncio
+async def test_full_worker_parks_dispatch_until_slot_frees(monkeypatch):
+    manager = WorkerControlManager()
+    _worker(manager, max_parallel=1)
+    gateway = WorkerGateway(manager)
+    sent = []
+
+    async def _send(session, envelope):
+        sent.append(envelope["payload"]["node_id"])
+
+    class _Record:
+        status = "running"
+
+    async def _get(run_id):
+        return _Record()
+
+    async def _mark_dispatched(run_id, **kwargs):
+        return _Record()
+
+    monkeypatch.setattr(gateway, "send_envelope", _send)
+    monkeypatch.setattr(orchestrator_module, "worker_gateway", gateway)
+    monkeypatch.setattr(orchestrator_module.run_state_service, "get", _get)
+    monkeypatch.setattr(orchestrator_module.run_state_service, "mark_dispatched", _mark_dispatched)
+
+    orchestrator = RunOrchestrator(concurrency=2)
+    orchestrator._slots = WorkerSlots(on_change=gateway.refresh_load)  # noqa: SLF001
+
+    async def _wait_for(predicate):
+        for _ in range(100):
+            if predicate():
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError("condition not reached")
+
+    try:
+        await orchestrator.enqueue([_request("first"), _request("second")])
+        await _wait_for(lambda: orchestrator.metrics()["parked"] == 1)
+        assert sent == ["first"]
+        assert orchestrator.metrics()["retries"] == 0
+
+        orchestrator.release_slot("task-first")
+        await _wait_for(lambda: sent == ["first", "second"])
+        assert orchestrator.metrics()["parked"] == 0
+        assert orchestrator.metrics()["reservedSlots"] == 1
+    finally:
+        await orchestrator.stop()
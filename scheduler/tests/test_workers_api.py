@@ -78,3 +78,23 @@ def test_send_worker_command(client: TestClient):
     # uncomment below to assert the status code of the HTTP response
     #assert response.status_code == 200
 
+
+
+def test_get_dispatch_metrics(client: TestClient):
+    """Test case for get_dispatch_metrics
+
+    Dispatch pipeline metrics (admin)
+    """
+
+    headers = {
+        "Authorization": "Bearer special-key",
+    }
+    # uncomment below to make a request
+    #response = client.request(
+    #    "GET",
+    #    "/api/v1/dispatch/metrics",
+    #    headers=headers,
+    #)
+
+    # uncomment below to assert the status code of the HTTP response
+    #assert response.status_code == 200
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  exec.dispatch_batch.schema.json
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, conint, constr
+
+from .dispatch import ExecDispatchPayload
+
+
+class ExecDispatchBatchItem(BaseModel):
+    model_config = ConfigDict(
+        extra='forbid',
+    )
+    dispatch_id: constr(min_length=1) = Field(
+        ...,
+        description='Stands in for the envelope id of an individual dispatch; echoed as corr on results and errors.',
+    )
+    corr: Optional[constr(min_length=1)] = None
+    seq: Optional[conint(ge=0)] = None
+    dispatch: ExecDispatchPayload
+
+
+class ExecDispatchBatchPayload(BaseModel):
+    model_config = ConfigDict(
+        extra='forbid',
+    )
+    items: List[ExecDispatchBatchItem] = Field(..., min_length=1)
@@ -0,0 +1 @@
+"""Generated package."""
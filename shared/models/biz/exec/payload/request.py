@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  exec.payload.request.schema.json
+
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, constr
+
+
+class ExecPayloadRequest(BaseModel):
+    model_config = ConfigDict(
+        extra='forbid',
+    )
+    requestId: constr(min_length=1)
+    runId: constr(min_length=1)
+    taskId: Optional[constr(min_length=1)] = None
+    resourceId: constr(min_length=1) = Field(
+        ...,
+        description='Resource id taken from a __payloadRef handle in the dispatch parameters.',
+    )
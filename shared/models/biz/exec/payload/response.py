@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  exec.payload.response.schema.json
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, constr
+
+
+class ExecPayloadResponse(BaseModel):
+    model_config = ConfigDict(
+        extra='forbid',
+    )
+    requestId: constr(min_length=1)
+    runId: constr(min_length=1)
+    resourceId: constr(min_length=1)
+    value: Optional[Any] = Field(
+        None, description='The stored result value the reference stands for.'
+    )
+    error: Optional[Dict[str, Any]] = Field(
+        None, description='Structured error when the payload cannot be served.'
+    )
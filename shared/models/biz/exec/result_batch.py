@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  exec.result_batch.schema.json
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, conint, constr
+
+from .result import ExecResultPayload
+
+
+class ExecResultBatchItem(BaseModel):
+    model_config = ConfigDict(
+        extra='forbid',
+    )
+    corr: Optional[constr(min_length=1)] = Field(
+        None,
+        description='Dispatch id the result answers, as carried in corr of a standalone biz.exec.result.',
+    )
+    seq: Optional[conint(ge=0)] = None
+    result: ExecResultPayload
+
+
+class ExecResultBatchPayload(BaseModel):
+    model_config = ConfigDict(
+        extra='forbid',
+    )
+    items: List[ExecResultBatchItem] = Field(..., min_length=1)
@@ -1,3 +1,4 @@
+from .payload_ref import PAYLOAD_REF_KEY, is_payload_ref, make_payload_ref, payload_ref_id
 from .session import (
     build_ack_for,
     build_envelope,
@@ -9,6 +10,7 @@ from .session import (
 from .window import ReceiveWindow, is_seq_acked
 
 __all__ = [
+    "PAYLOAD_REF_KEY",
     "build_ack_for",
     "build_envelope",
     "make_handshake_payload",
@@ -17,4 +19,7 @@ __all__ = [
     "parse_envelope",
     "ReceiveWindow",
     "is_seq_acked",
+    "is_payload_ref",
+    "make_payload_ref",
+    "payload_ref_id",
 ]
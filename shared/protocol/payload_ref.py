@@ -0,0 +1,33 @@
+"""Typed references to node-result values stored out of band."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+PAYLOAD_REF_KEY = "__payloadRef"
+
+
+def make_payload_ref(resource_id: str, *, size_bytes: int, mime_type: str = "application/json") -> Dict[str, Any]:
+    return {
+        PAYLOAD_REF_KEY: {
+            "resourceId": resource_id,
+            "sizeBytes": size_bytes,
+            "mimeType": mime_type,
+        }
+    }
+
+
+def payload_ref_id(value: Any) -> Optional[str]:
+    """Return the resource id when ``value`` is a payload reference, ``None`` otherwise."""
+
+    if not isinstance(value, dict) or len(value) != 1:
+        return None
+    ref = value.get(PAYLOAD_REF_KEY)
+    if not isinstance(ref, dict):
+        return None
+    resource_id = ref.get("resourceId")
+    return resource_id if isinstance(resource_id, str) and resource_id else None
+
+
+def is_payload_ref(value: Any) -> bool:
+    return payload_ref_id(value) is not None
@@ -7,11 +7,13 @@ import logging
 from typing import Type
 
 from worker.packages import AdapterRegistry, PackageManager
-from worker.execution.runtime import ResourceRegistry
+from worker.execution.runtime import ConcurrencyGuard, ResourceRegistry
 from worker.execution import Runner
 from worker.config import get_settings
 from worker.handlers.next_handler import NextHandler
+from worker.handlers.payload_handler import PayloadHandler
 from worker.handlers.dispatch_handler import DispatchHandler
+from worker.handlers.result_publisher import ResultPublisher
 from worker.network.client import NetworkClient
 from worker.network.transport.base import BaseTransport
 from worker.network.transport.dummy import DummyTransport
@@ -55,6 +57,7 @@ async def setup() -> None:
         resource_registry=resource_registry,
         package_inventory=package_inventory,
         package_manifests=package_manifests,
+        concurrency_guard=ConcurrencyGuard.from_settings(settings),
     )
 
     connection._ensure_layers()
@@ -62,6 +65,10 @@ async def setup() -> None:
         send_biz=connection.send_biz,
         next_message_id=connection.next_message_id,
     )
+    payload_handler = PayloadHandler(
+        send_biz=connection.send_biz,
+        next_message_id=connection.next_message_id,
+    )
     dispatch_handler = DispatchHandler(
         settings=settings,
         send_biz=connection.send_biz,
@@ -69,15 +76,28 @@ async def setup() -> None:
         concurrency_guard=connection.concurrency_guard,
         runner=runner,
         resource_registry=resource_registry,
+        payload_handler=payload_handler,
+        result_publisher=ResultPublisher(
+            send_biz=connection.send_biz,
+            linger_seconds=settings.result_batch_linger_ms / 1000.0,
+            max_size=settings.result_batch_max_size,
+        ),
     )
     connection.register_handler("biz.exec.dispatch", dispatch_handler.handle)
+    connection.register_handler("biz.exec.dispatch.batch", dispatch_handler.handle_batch)
     connection.register_handler("biz.exec.next.response", next_handler.handle_next_response)
+    connection.register_handler("biz.exec.payload.response", payload_handler.handle_payload_response)
 
     async def _cleanup() -> None:
         await dispatch_handler.cancel_dispatch_tasks()
         next_handler.cancel_pending_next()
+        payload_handler.cancel_pending()
+
+    def _on_disconnect(exc=None) -> None:
+        next_handler.cancel_pending_next()
+        payload_handler.cancel_pending()
 
-    connection.add_disconnect_hook(lambda exc=None: next_handler.cancel_pending_next())
+    connection.add_disconnect_hook(_on_disconnect)
     connection.add_stop_hook(_cleanup)
 
     async def _pkg_install(envelope):
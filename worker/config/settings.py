@@ -175,10 +175,18 @@ class WorkerSettings(BaseSettings):
         default=0,
         description="Cooldown window after dispatch failure threshold is exceeded.",
     )
+    result_batch_linger_ms: conint(ge=0) = Field(
+        default=2,
+        description="Window (milliseconds) for coalescing task results into one biz.exec.result.batch frame (0 = one frame per result).",
+    )
+    result_batch_max_size: PositiveInt = Field(
+        default=64,
+        description="Max results per batch frame; a full batch is sent without waiting out the linger window.",
+    )
 
     concurrency_max_parallel: PositiveInt = Field(
-        default=1,
-        description="Maximum parallel tasks the worker is willing to accept.",
+        default=8,
+        description="Maximum parallel tasks the worker executes; extra dispatches queue for a slot.",
     )
     concurrency_per_node_limits: Dict[str, PositiveInt] | None = Field(
         default=None,
@@ -199,11 +207,15 @@ class WorkerSettings(BaseSettings):
     payload_types: list[str] = Field(
         default_factory=lambda: [
             "biz.exec.dispatch",
+            "biz.exec.dispatch.batch",
             "biz.exec.result",
+            "biz.exec.result.batch",
             "biz.exec.feedback",
             "biz.exec.error",
             "biz.exec.next.request",
             "biz.exec.next.response",
+            "biz.exec.payload.request",
+            "biz.exec.payload.response",
             "biz.pkg.install",
             "biz.pkg.uninstall",
             "biz.pkg.event",
@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, TYPE_CHECKING
 
 from shared.models.biz.exec.dispatch import ExecDispatchPayload
+from shared.protocol.payload_ref import payload_ref_id
 
 from worker.execution.runtime import FeedbackPublisher, ResourceRegistry
 from worker.handlers.next_handler import NextHandler
+from worker.handlers.payload_handler import PayloadHandler
 from worker.config import WorkerSettings
 
 if TYPE_CHECKING:
@@ -53,6 +55,48 @@ class ExecutionContext:
             Awaitable[Dict[str, Any]],
         ]
     ] = None
+    payload_resolver: Optional[Callable[..., Awaitable[Any]]] = None
+    _payloads: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    async def resolve(self, value: Any) -> Any:
+        """Return ``value``, or the stored value when it is a payload reference.
+
+        Large upstream results reach the node as ``__payloadRef`` handles; each one
+        is fetched from the scheduler the first time it is resolved and cached for
+        the rest of the task.
+        """
+
+        resource_id = payload_ref_id(value)
+        if resource_id is None:
+            return value
+        if resource_id not in self._payloads:
+            if not self.payload_resolver:
+                raise RuntimeError("payload references cannot be resolved in this context")
+            self._payloads[resource_id] = await self.payload_resolver(
+                self.run_id, resource_id, task_id=self.task_id
+            )
+        return self._payloads[resource_id]
+
+    async def param(self, name: str, default: Any = None) -> Any:
+        """Read a parameter, fetching it first if it was passed by reference."""
+
+        if name not in self.params:
+            return default
+        return await self.resolve(self.params[name])
+
+    async def resolve_params(self) -> None:
+        """Replace every payload reference in ``params`` (at any depth) by its value."""
+
+        self.params = await self._resolve_nested(self.params)
+
+    async def _resolve_nested(self, value: Any) -> Any:
+        if payload_ref_id(value) is not None:
+            return await self.resolve(value)
+        if isinstance(value, dict):
+            return {key: await self._resolve_nested(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [await self._resolve_nested(item) for item in value]
+        return value
 
     async def next(
         self,
@@ -74,6 +118,7 @@ class ExecutionContextFactory:
     settings: WorkerSettings
     next_handler: NextHandler
     resource_registry: Optional[ResourceRegistry] = None
+    payload_handler: Optional[PayloadHandler] = None
 
     def build(self, dispatch: ExecDispatchPayload, *, feedback_sender: FeedbackSender) -> ExecutionContext:
         run_id = dispatch.run_id
@@ -107,6 +152,8 @@ class ExecutionContextFactory:
             feedback=FeedbackPublisher(feedback_sender, run_id=run_id, task_id=task_id),
         )
         context.next_handler = self.next_handler.middleware_next
+        if self.payload_handler:
+            context.payload_resolver = self.payload_handler.fetch
         return context
 
     def _build_metadata(self, dispatch: ExecDispatchPayload) -> dict[str, Any]:
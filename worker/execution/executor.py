@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 from dataclasses import dataclass
 from typing import Optional, Protocol
@@ -55,6 +56,18 @@ def build_exec_error(
     )
 
 
+def runs_inside_middleware_chain(dispatch: ExecDispatchPayload) -> bool:
+    """True for dispatches issued by ``next()`` (the host or a later middleware).
+
+    These execute while the calling middleware still holds its slot, so making
+    them wait for another slot could deadlock the chain.
+    """
+
+    if not dispatch.middleware_chain or not dispatch.host_node_id:
+        return False
+    return dispatch.node_id == dispatch.host_node_id or (dispatch.chain_index or 0) > 0
+
+
 @dataclass
 class DispatchExecutor:
     settings: WorkerSettings
@@ -87,14 +100,20 @@ class DispatchExecutor:
                         where="worker.concurrency",
                     )
                 )
+            slot = (
+                contextlib.nullcontext()
+                if runs_inside_middleware_chain(dispatch)
+                else self.concurrency_guard.slot(handler_key)
+            )
             try:
-                if self.resource_registry:
-                    leased_resources = self._lease_resources(dispatch)
-                    context.leased_resources = leased_resources
-                loop = asyncio.get_running_loop()
-                start = loop.time()
-                result = await self.runner.execute(context, handler_key, corr=corr, seq=seq)
-                duration_ms = int((loop.time() - start) * 1000)
+                async with slot:
+                    if self.resource_registry:
+                        leased_resources = self._lease_resources(dispatch)
+                        context.leased_resources = leased_resources
+                    loop = asyncio.get_running_loop()
+                    start = loop.time()
+                    result = await self.runner.execute(context, handler_key, corr=corr, seq=seq)
+                    duration_ms = int((loop.time() - start) * 1000)
                 return DispatchOutcome(
                     result=self.result_builder.build(context, result, duration_ms=duration_ms),
                 )
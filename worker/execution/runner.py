@@ -26,6 +26,8 @@ class NodeExecutionResult:
 EXEC_MODE_AUTO = "auto"
 EXEC_MODE_INLINE = "inline"
 EXEC_MODE_THREAD = "thread"
+PAYLOAD_REFS_EAGER = "eager"
+PAYLOAD_REFS_LAZY = "lazy"
 EXEC_MODE_ALIASES = {
     "async": EXEC_MODE_INLINE,
     "event_loop": EXEC_MODE_INLINE,
@@ -51,6 +53,9 @@ class Runner:
         descriptor = self._registry.resolve(context.package_name, context.package_version, handler_key)
         handler_callable = descriptor.callable
         exec_mode = self._resolve_exec_mode(descriptor.metadata)
+        if self._resolve_payload_refs(descriptor.metadata) != PAYLOAD_REFS_LAZY:
+            # Handlers opting into "lazy" fetch referenced payloads themselves via context.resolve().
+            await context.resolve_params()
         LOGGER.debug(
             "Executing handler %s for run=%s task=%s",
             handler_key,
@@ -94,6 +99,18 @@ class Runner:
             or self._default_exec_mode
         )
 
+    @staticmethod
+    def _resolve_payload_refs(metadata: Dict[str, Any]) -> str:
+        if not isinstance(metadata, dict):
+            return PAYLOAD_REFS_EAGER
+        config = metadata.get("config")
+        value = config.get("payload_refs") if isinstance(config, dict) else None
+        if value is None:
+            value = metadata.get("payload_refs")
+        if isinstance(value, str) and value.strip().lower() == PAYLOAD_REFS_LAZY:
+            return PAYLOAD_REFS_LAZY
+        return PAYLOAD_REFS_EAGER
+
     @staticmethod
     def _normalize_exec_mode(value: Any) -> Optional[str]:
         if not isinstance(value, str):
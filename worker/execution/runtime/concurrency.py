@@ -1,18 +1,47 @@
-"""Lightweight concurrency guard to enforce single-flight execution."""
+"""Concurrency guard: single-flight keys plus admission slots."""
 
 from __future__ import annotations
 
 import asyncio
-from contextlib import asynccontextmanager
-from typing import AsyncIterator, Set
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Mapping, Optional, Set
+
+if TYPE_CHECKING:
+    from worker.config import WorkerSettings
 
 
 class ConcurrencyGuard:
-    """Tracks in-flight keys and prevents duplicate execution."""
+    """Tracks in-flight keys and enforces the advertised parallelism.
+
+    ``acquire`` prevents duplicate execution of a concurrency key. ``slot``
+    admits a task once both the worker-wide ``max_parallel`` pool and the
+    pool for its node type (``per_node_limits``) have room; callers beyond
+    the limit wait in FIFO order. ``max_parallel=0`` disables the worker-wide
+    pool.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_parallel: int = 0,
+        per_node_limits: Optional[Mapping[str, int]] = None,
+    ) -> None:
         self._inflight: Set[str] = set()
         self._lock = asyncio.Lock()
+        self._max_parallel = max_parallel
+        self._per_node_limits: Dict[str, int] = dict(per_node_limits or {})
+        self._global_slots: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(max_parallel) if max_parallel > 0 else None
+        )
+        self._node_slots: Dict[str, asyncio.Semaphore] = {}
+        self._running = 0
+        self._queued = 0
+
+    @classmethod
+    def from_settings(cls, settings: "WorkerSettings") -> "ConcurrencyGuard":
+        return cls(
+            max_parallel=settings.concurrency_max_parallel,
+            per_node_limits=settings.concurrency_per_node_limits,
+        )
 
     @asynccontextmanager
     async def acquire(self, key: str) -> AsyncIterator[bool]:
@@ -30,7 +59,54 @@ class ConcurrencyGuard:
             async with self._lock:
                 self._inflight.discard(key)
 
+    @asynccontextmanager
+    async def slot(self, node_type: str) -> AsyncIterator[None]:
+        """Hold an execution slot for ``node_type`` for the duration of the block."""
+
+        async with AsyncExitStack() as stack:
+            self._queued += 1
+            try:
+                # Node-type pool first so a waiting task never pins a worker-wide slot.
+                node_slots = self._node_slots_for(node_type)
+                if node_slots is not None:
+                    await stack.enter_async_context(node_slots)
+                if self._global_slots is not None:
+                    await stack.enter_async_context(self._global_slots)
+            finally:
+                self._queued -= 1
+            self._running += 1
+            try:
+                yield
+            finally:
+                self._running -= 1
+
     def inflight(self) -> int:
         """Return the current number of in-flight concurrency keys."""
 
         return len(self._inflight)
+
+    def running(self) -> int:
+        """Return the number of tasks currently holding a slot."""
+
+        return self._running
+
+    def queued(self) -> int:
+        """Return the number of tasks waiting for a slot."""
+
+        return self._queued
+
+    def available(self) -> Optional[int]:
+        """Free worker-wide slots, or ``None`` when unbounded."""
+
+        if self._max_parallel <= 0:
+            return None
+        return max(self._max_parallel - self._running, 0)
+
+    def _node_slots_for(self, node_type: str) -> Optional[asyncio.Semaphore]:
+        limit = self._per_node_limits.get(node_type)
+        if not limit:
+            return None
+        semaphore = self._node_slots.get(node_type)
+        if semaphore is None:
+            semaphore = self._node_slots[node_type] = asyncio.Semaphore(limit)
+        return semaphore
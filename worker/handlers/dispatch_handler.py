@@ -1,4 +1,4 @@
-"""Dispatch command handling (biz.exec.dispatch)."""
+"""Dispatch command handling (biz.exec.dispatch, biz.exec.dispatch.batch)."""
 
 from __future__ import annotations
 
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable, Optional
 
 from shared.models.biz.exec.dispatch import ExecDispatchPayload
+from shared.models.biz.exec.dispatch_batch import ExecDispatchBatchPayload
 from shared.models.biz.exec.error import ExecErrorPayload
 from shared.models.biz.exec.result import ExecResultPayload
 from shared.models.session import WsEnvelope
@@ -23,6 +24,8 @@ from worker.execution import (
 from worker.execution.runtime import ResourceRegistry
 from worker.execution import Runner
 from worker.handlers.next_handler import NextHandler
+from worker.handlers.payload_handler import PayloadHandler
+from worker.handlers.result_publisher import ResultPublisher
 from worker.config import WorkerSettings
 
 LOGGER = logging.getLogger(__name__)
@@ -36,6 +39,8 @@ class DispatchHandler:
     concurrency_guard: ConcurrencyGuard
     runner: Optional[Runner] = None
     resource_registry: Optional[ResourceRegistry] = None
+    payload_handler: Optional[PayloadHandler] = None
+    result_publisher: Optional[ResultPublisher] = None
 
     _dispatch_tasks: set[asyncio.Task[None]] = field(default_factory=set, init=False, repr=False)
     _executor: Optional[DispatchExecutor] = field(default=None, init=False, repr=False)
@@ -53,6 +58,7 @@ class DispatchHandler:
                 settings=self.settings,
                 next_handler=self.next_handler,
                 resource_registry=self.resource_registry,
+                payload_handler=self.payload_handler,
             ),
             result_builder=ExecutionResultBuilder(),
         )
@@ -78,6 +84,29 @@ class DispatchHandler:
 
         task.add_done_callback(_finalise)
 
+    async def handle_batch(self, envelope: WsEnvelope) -> None:
+        """Unpack a dispatch batch into one dispatch task per item.
+
+        Each item is handled as if it arrived in its own envelope whose id is
+        the item's dispatch id, so results and errors correlate per dispatch.
+        The session layer already acked the batch frame as a whole.
+        """
+
+        batch = ExecDispatchBatchPayload.model_validate(envelope.payload)
+        LOGGER.info("Received dispatch batch id=%s size=%s", envelope.id, len(batch.items))
+        for item in batch.items:
+            await self.handle(
+                envelope.model_copy(
+                    update={
+                        "type": "biz.exec.dispatch",
+                        "id": item.dispatch_id,
+                        "corr": item.corr,
+                        "seq": item.seq,
+                        "payload": item.dispatch.model_dump(exclude_none=True, by_alias=True),
+                    }
+                )
+            )
+
     async def _process_dispatch(self, envelope: WsEnvelope) -> None:
         try:
             if not self.runner:
@@ -182,4 +211,7 @@ class DispatchHandler:
         corr: Optional[str] = None,
         seq: Optional[int] = None,
     ) -> None:
+        if self.result_publisher:
+            await self.result_publisher.publish(payload, corr=corr, seq=seq)
+            return
         await self.send_biz("biz.exec.result", payload, require_ack=True, corr=corr, seq=seq)
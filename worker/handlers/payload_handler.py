@@ -0,0 +1,68 @@
+"""Fetch node-result values that the scheduler passes by reference."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from shared.models.biz.exec.payload.request import ExecPayloadRequest
+from shared.models.biz.exec.payload.response import ExecPayloadResponse
+from shared.models.session import WsEnvelope
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PayloadFetchError(RuntimeError):
+    """Raised when the scheduler cannot serve a referenced payload."""
+
+    def __init__(self, message: str, *, code: Optional[str] = None) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+@dataclass
+class PayloadHandler:
+    send_biz: Callable[..., Awaitable[None]]
+    next_message_id: Callable[[str], str]
+    timeout_seconds: float = 120.0
+
+    _pending: Dict[str, asyncio.Future] = field(default_factory=dict)
+
+    async def fetch(self, run_id: str, resource_id: str, *, task_id: Optional[str] = None) -> Any:
+        request_id = self.next_message_id("payload")
+        request = ExecPayloadRequest(requestId=request_id, runId=run_id, taskId=task_id, resourceId=resource_id)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self.send_biz("biz.exec.payload.request", request, require_ack=True, corr=task_id)
+            return await asyncio.wait_for(future, timeout=self.timeout_seconds)
+        except asyncio.TimeoutError as exc:
+            raise PayloadFetchError(f"payload {resource_id} timed out", code="payload_timeout") from exc
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def handle_payload_response(self, envelope: WsEnvelope) -> None:
+        payload = ExecPayloadResponse.model_validate(envelope.payload)
+        future = self._pending.pop(payload.requestId, None)
+        if future is None:
+            LOGGER.debug("Ignored payload response with no pending waiter req=%s", payload.requestId)
+            return
+        if future.done():
+            return
+        if payload.error:
+            future.set_exception(
+                PayloadFetchError(
+                    payload.error.get("message") or f"payload {payload.resourceId} unavailable",
+                    code=payload.error.get("code"),
+                )
+            )
+            return
+        future.set_result(payload.value)
+
+    def cancel_pending(self) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
@@ -0,0 +1,103 @@
+"""Coalesce task results into biz.exec.result.batch frames."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from shared.models.biz.exec.result import ExecResultPayload
+from shared.models.biz.exec.result_batch import ExecResultBatchItem, ExecResultBatchPayload
+
+LOGGER = logging.getLogger(__name__)
+
+_PendingResult = Tuple[ExecResultPayload, Optional[str], Optional[int], asyncio.Future]
+
+
+@dataclass
+class ResultPublisher:
+    """Sends results of finished tasks, batching those that finish close together.
+
+    The first result opens a ``linger_seconds`` window; everything published in
+    it (up to ``max_size``) goes out as one ``biz.exec.result.batch`` frame,
+    which takes one send credit and one ack. A lone result is sent as a plain
+    ``biz.exec.result``. ``publish`` returns once its frame was handed to the
+    session and raises if sending it failed.
+    """
+
+    send_biz: Callable[..., Awaitable[None]]
+    linger_seconds: float = 0.0
+    max_size: int = 64
+
+    _pending: List[_PendingResult] = field(default_factory=list, init=False, repr=False)
+    _timer: Optional[asyncio.TimerHandle] = field(default=None, init=False, repr=False)
+    _flush_tasks: set[asyncio.Task[None]] = field(default_factory=set, init=False, repr=False)
+
+    @property
+    def batching(self) -> bool:
+        return self.linger_seconds > 0 and self.max_size > 1
+
+    async def publish(
+        self,
+        payload: ExecResultPayload,
+        *,
+        corr: Optional[str] = None,
+        seq: Optional[int] = None,
+    ) -> None:
+        if not self.batching:
+            await self.send_biz("biz.exec.result", payload, require_ack=True, corr=corr, seq=seq)
+            return
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((payload, corr, seq, future))
+        if len(self._pending) >= self.max_size:
+            self._schedule_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger_seconds, self._schedule_flush)
+        await future
+
+    async def flush(self) -> None:
+        """Send buffered results now instead of at the end of the linger window."""
+
+        self._schedule_flush()
+        if self._flush_tasks:
+            await asyncio.gather(*list(self._flush_tasks), return_exceptions=True)
+
+    def _schedule_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._send(batch), name="worker-result-batch")
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _send(self, batch: List[_PendingResult]) -> None:
+        try:
+            if len(batch) == 1:
+                payload, corr, seq, _ = batch[0]
+                await self.send_biz("biz.exec.result", payload, require_ack=True, corr=corr, seq=seq)
+            else:
+                LOGGER.debug("Sending result batch size=%s", len(batch))
+                await self.send_biz(
+                    "biz.exec.result.batch",
+                    ExecResultBatchPayload(
+                        items=[ExecResultBatchItem(corr=corr, seq=seq, result=payload) for payload, corr, seq, _ in batch]
+                    ),
+                    require_ack=True,
+                )
+        except asyncio.CancelledError:
+            for *_, future in batch:
+                future.cancel()
+            raise
+        except Exception as exc:  # noqa: BLE001
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for *_, future in batch:
+            if not future.done():
+                future.set_result(None)
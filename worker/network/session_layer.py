@@ -117,6 +117,7 @@ class SessionLayer:
     def build_heartbeat_payload(self) -> HeartbeatPayload:
         metrics_payload: dict[str, Any] = {
             "inflight": self.concurrency_guard.inflight(),
+            "queued": self.concurrency_guard.queued(),
         }
         if self.resource_registry:
             handles = self.resource_registry.list()
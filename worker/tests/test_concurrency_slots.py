@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from worker.execution.runtime import ConcurrencyGuard
+
+
+@pytest.mark.asyncio
+async def test_slots_enforce_max_parallel_and_per_node_limits():
+    guard = ConcurrencyGuard(max_parallel=2, per_node_limits={"browser.open": 1})
+    release = asyncio.Event()
+    started: list[str] = []
+
+    async def _task(name: str, node_type: str) -> None:
+        async with guard.slot(node_type):
+            started.append(name)
+            await release.wait()
+
+    tasks = [
+        asyncio.create_task(_task("b1", "browser.open")),
+        asyncio.create_task(_task("b2", "browser.open")),
+        asyncio.create_task(_task("c1", "compute")),
+        asyncio.create_task(_task("c2", "compute")),
+    ]
+    await asyncio.sleep(0.01)
+    # b2 waits on the node-type pool, c2 on the worker-wide pool.
+    assert sorted(started) == ["b1", "c1"]
+    assert guard.running() == 2
+    assert guard.queued() == 2
+    assert guard.available() == 0
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert sorted(started) == ["b1", "b2", "c1", "c2"]
+    assert guard.running() == 0 and guard.queued() == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_releases_its_place():
+    guard = ConcurrencyGuard(max_parallel=1)
+    hold = asyncio.Event()
+
+    async def _holder() -> None:
+        async with guard.slot("t"):
+            await hold.wait()
+
+    holder = asyncio.create_task(_holder())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_holder())
+    await asyncio.sleep(0.01)
+    assert guard.queued() == 1
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert guard.queued() == 0
+
+    hold.set()
+    await holder
+    assert guard.available() == 1
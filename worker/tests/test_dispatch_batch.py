@@ -0,0 +1,71 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from shared.models.biz.exec.dispatch import Constraints, ExecDispatchPayload
+from shared.models.biz.exec.dispatch_batch import ExecDispatchBatchItem, ExecDispatchBatchPayload
+from shared.models.session import Role, Sender, WsEnvelope
+from worker.config import WorkerSettings
+from worker.handlers.dispatch_handler import DispatchHandler
+from worker.handlers.next_handler import NextHandler
+from worker.network.client import NetworkClient
+from worker.network.transport.dummy import DummyTransport
+
+
+def _dispatch(task_id: str) -> ExecDispatchPayload:
+    return ExecDispatchPayload(
+        run_id="run-1",
+        task_id=task_id,
+        node_id=task_id,
+        node_type="node-type",
+        package_name="pkg",
+        package_version="1.0.0",
+        parameters={"task": task_id},
+        constraints=Constraints(),
+        concurrency_key=task_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_is_unpacked_into_individual_dispatches(monkeypatch):
+    settings = WorkerSettings()
+    conn = NetworkClient(settings=settings, transport_factory=lambda _: DummyTransport(settings))
+    conn._ensure_layers()  # noqa: SLF001
+    next_handler = NextHandler(send_biz=conn.send_biz, next_message_id=conn.next_message_id)
+    dispatch_handler = DispatchHandler(
+        settings=settings,
+        send_biz=conn.send_biz,
+        next_handler=next_handler,
+        concurrency_guard=conn.concurrency_guard,
+        runner=object(),
+    )
+    handled = []
+
+    async def _handle(envelope, dispatch):
+        handled.append((envelope.type, envelope.id, envelope.corr, envelope.seq, dispatch.parameters["task"]))
+
+    monkeypatch.setattr(dispatch_handler, "_default_command_handler", _handle)
+
+    batch = ExecDispatchBatchPayload(
+        items=[
+            ExecDispatchBatchItem(dispatch_id=f"dispatch-{idx}", corr=f"task-{idx}", seq=idx, dispatch=_dispatch(f"task-{idx}"))
+            for idx in range(3)
+        ]
+    )
+    envelope = WsEnvelope(
+        type="biz.exec.dispatch.batch",
+        id="batch-1",
+        ts=datetime.now(timezone.utc),
+        tenant=settings.tenant,
+        sender=Sender(role=Role.scheduler, id="scheduler-1"),
+        payload=batch.model_dump(by_alias=True, exclude_none=True),
+    )
+
+    await dispatch_handler.handle_batch(envelope)
+    await asyncio.gather(*dispatch_handler._dispatch_tasks)  # noqa: SLF001
+
+    assert sorted(handled) == [
+        ("biz.exec.dispatch", f"dispatch-{idx}", f"task-{idx}", idx, f"task-{idx}") for idx in range(3)
+    ]
+    assert "biz.exec.dispatch.batch" in settings.payload_types
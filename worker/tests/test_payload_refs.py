@@ -0,0 +1,68 @@
+import asyncio
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from shared.models.session import Role, Sender, WsEnvelope
+from shared.protocol.payload_ref import make_payload_ref
+from worker.execution.context import ExecutionContext
+from worker.handlers.payload_handler import PayloadFetchError, PayloadHandler
+
+STORED = {"res-rows": [1, 2, 3]}
+
+
+def _handler() -> tuple[PayloadHandler, list[str]]:
+    requested: list[str] = []
+    handler: PayloadHandler
+
+    async def _send_biz(message_type, payload, *, require_ack=False, corr=None):
+        assert message_type == "biz.exec.payload.request"
+        requested.append(payload.resourceId)
+        response = {"requestId": payload.requestId, "runId": payload.runId, "resourceId": payload.resourceId}
+        if payload.resourceId in STORED:
+            response["value"] = STORED[payload.resourceId]
+        else:
+            response["error"] = {"code": "payload_not_found", "message": "gone"}
+        envelope = WsEnvelope(
+            type="biz.exec.payload.response",
+            id="env-1",
+            ts=datetime.now(timezone.utc),
+            corr=payload.requestId,
+            seq=None,
+            tenant="t",
+            sender=Sender(role=Role.scheduler, id="scheduler"),
+            payload=response,
+        )
+        asyncio.get_running_loop().call_soon(asyncio.ensure_future, handler.handle_payload_response(envelope))
+
+    counter = iter(range(1000))
+    handler = PayloadHandler(send_biz=_send_biz, next_message_id=lambda prefix: f"{prefix}-{next(counter)}")
+    return handler, requested
+
+
+@pytest.mark.asyncio
+async def test_context_fetches_each_reference_once(tmp_path: Path):
+    handler, requested = _handler()
+    ref = make_payload_ref("res-rows", size_bytes=7)
+    context = ExecutionContext(
+        run_id="run-1",
+        task_id="task-1",
+        node_id="node-1",
+        package_name="pkg",
+        package_version="1.0.0",
+        params={"rows": ref, "nested": {"items": [ref]}, "plain": 1},
+        data_dir=tmp_path,
+        tenant="t",
+        payload_resolver=handler.fetch,
+    )
+
+    assert await context.param("rows") == [1, 2, 3]
+    await context.resolve_params()
+    assert context.params == {"rows": [1, 2, 3], "nested": {"items": [[1, 2, 3]]}, "plain": 1}
+    assert requested == ["res-rows"]
+
+    with pytest.raises(PayloadFetchError) as excinfo:
+        await context.resolve(make_payload_ref("res-missing", size_bytes=1))
+    assert excinfo.value.code == "payload_not_found"
+    assert handler._pending == {}  # noqa: SLF001
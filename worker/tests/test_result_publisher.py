@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from shared.models.biz.exec.result import ExecResultPayload
+from shared.models.biz.exec.result_batch import ExecResultBatchPayload
+from worker.handlers.result_publisher import ResultPublisher
+
+
+def _result(task_id: str) -> ExecResultPayload:
+    return ExecResultPayload(run_id="run-1", task_id=task_id, status="SUCCEEDED", result={"task": task_id})
+
+
+@pytest.mark.asyncio
+async def test_results_finishing_together_share_a_frame():
+    sent = []
+
+    async def _send_biz(message_type, payload, *, require_ack=False, corr=None, seq=None):
+        sent.append((message_type, payload, require_ack, corr))
+
+    publisher = ResultPublisher(send_biz=_send_biz, linger_seconds=0.02, max_size=3)
+
+    await asyncio.gather(*(publisher.publish(_result(f"task-{idx}"), corr=f"dispatch-{idx}", seq=idx) for idx in range(4)))
+    (full_type, full, full_ack, _), (single_type, single, _, single_corr) = sent
+    assert (full_type, full_ack) == ("biz.exec.result.batch", True)
+    assert isinstance(full, ExecResultBatchPayload)
+    assert [(item.corr, item.result.task_id) for item in full.items] == [
+        ("dispatch-0", "task-0"),
+        ("dispatch-1", "task-1"),
+        ("dispatch-2", "task-2"),
+    ]
+    assert (single_type, single.task_id, single_corr) == ("biz.exec.result", "task-3", "dispatch-3")
+
+
+@pytest.mark.asyncio
+async def test_send_failure_reaches_every_publisher():
+    async def _send_biz(message_type, payload, *, require_ack=False, corr=None, seq=None):
+        raise ConnectionError("transport closed")
+
+    publisher = ResultPublisher(send_biz=_send_biz, linger_seconds=0.01, max_size=8)
+    outcomes = await asyncio.gather(
+        publisher.publish(_result("task-a"), corr="dispatch-a"),
+        publisher.publish(_result("task-b"), corr="dispatch-b"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(outcome, ConnectionError) for outcome in outcomes)